@@ -0,0 +1,28 @@
+"""add content hash to aggregated object view
+
+Revision ID: 5c1f0e7a9d42
+Revises: fa3f0bdbdd1f
+Create Date: 2026-10-18 10:12:41.218305
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5c1f0e7a9d42"
+down_revision = "fa3f0bdbdd1f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # existing aggregates get their hash when next saved
+    op.add_column(
+        "wis_aggregated_obj_view",
+        sa.Column("content_hash", sa.String(length=32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("wis_aggregated_obj_view", "content_hash")
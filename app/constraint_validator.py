@@ -4,9 +4,10 @@ Module holding a ConstraintValidator class.
 
 import base64
 import mimetypes
+import operator
 import re
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Iterable
 
 import magic
 from fastapi import HTTPException
@@ -334,7 +335,8 @@ class ConstraintValidator:
         elif attribute_type == AttributeType.FILE:
             self._validate_file(action)
 
-    def _find_comparison_condition(self, condition):
+    @staticmethod
+    def _find_comparison_condition(condition):
         """
         Performs extracting operators from constraints.
 
@@ -347,17 +349,275 @@ class ConstraintValidator:
             for key, value in condition.items():
                 if key in ["lt", "le", "eq", "ge", "gt"]:
                     return {key: value}
-                result = self._find_comparison_condition(value)
+                result = ConstraintValidator._find_comparison_condition(value)
                 if result is not None:
                     key_res = list(result.keys())[0]
                     val_res = result[list(result.keys())[0]]
                     return key_res, val_res
         elif isinstance(condition, list):
             for item in condition:
-                result = self._find_comparison_condition(item)
+                result = ConstraintValidator._find_comparison_condition(item)
                 if result is not None:
                     key_res = list(result.keys())[0]
                     val_res = result[list(result.keys())[0]]
                     return key_res, val_res
 
         return None, None
+
+
+# condition operators, applied as `operator(condition value, value)`
+CONDITION_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "lt": operator.gt,
+    "le": operator.ge,
+    "eq": operator.eq,
+    "ge": operator.le,
+    "gt": operator.lt,
+}
+
+Check = Callable[[Any], None]
+
+
+class CompiledConstraintValidator:
+    """
+    Validates values against the constraints of a column, compiled once.
+
+    Constraint JSON is walked a single time: comparison operators,
+    date bounds and formats, and regular expressions are resolved up
+    front into a list of checks, so validating a value is a loop over
+    plain callables. Errors are the same as `ConstraintValidator`'s.
+    Constraints which cannot be compiled, and file constraints, are
+    delegated to `ConstraintValidator`.
+    """
+
+    def __init__(self, constraints: list[dict], column: ColumnDef):
+        """
+        Compiles the constraints of a column.
+
+        Args:
+            constraints (list[dict]): The constraints of the column
+                view.
+            column (ColumnDef): The column the constraints apply to.
+        """
+        self.column = column
+        self.column_name = str(column.name)
+        self.checks: list[Check] = []
+        for constraint in constraints:
+            self.checks.extend(self._compile_constraint(constraint))
+
+    def validate(self, value: Any) -> None:
+        """
+        Validates a single value.
+
+        Raises:
+            ConstraintValidationException: The value does not fulfill
+                the constraints.
+        """
+        for check in self.checks:
+            check(value)
+
+    def validate_many(self, values: Iterable[Any]) -> None:
+        """
+        Validates a batch of values for the column, stopping at the
+        first invalid one.
+
+        Raises:
+            ConstraintValidationException: A value does not fulfill the
+                constraints.
+        """
+        checks = self.checks
+        for value in values:
+            for check in checks:
+                check(value)
+
+    def _raise_error(self, value, action, condition):
+        raise ConstraintValidationException(
+            message=(
+                f"Value for {self.column_name} does not fulfill constraints."
+            ),
+            column_name=self.column_name,
+            value=value,
+            condition=condition,
+            action=action,
+        )
+
+    def _interpreted(self, constraint: dict) -> Check:
+        def check(value):
+            ConstraintValidator(
+                constraints=[constraint], value=value, column=self.column
+            ).validate()
+
+        return check
+
+    def _compile_constraint(self, constraint: dict) -> list[Check]:
+        checks = []
+        try:
+            conditions = constraint["conditions"]
+            if conditions:
+                checks.append(self._compile_conditions(conditions))
+            for action in constraint["actions"]:
+                checks.extend(self._compile_action(action))
+        except (KeyError, TypeError, ValueError, AttributeError, re.error):
+            # malformed constraint: keep the interpreter's behavior,
+            # errors included, at validation time
+            return [self._interpreted(constraint)]
+
+        return checks
+
+    def _compile_conditions(self, conditions: list) -> Check:
+        comparisons = []
+        for condition in conditions:
+            key, condition_value = (
+                ConstraintValidator._find_comparison_condition(
+                    condition["set"]
+                )
+            )
+            comparisons.append((CONDITION_OPERATORS.get(key), condition_value))
+
+        def check(value):
+            for compare, condition_value in comparisons:
+                if compare is None or compare(condition_value, value):
+                    return
+            self._raise_error(value, None, conditions)
+
+        return check
+
+    def _compile_action(self, action: dict) -> list[Check]:
+        checks = []
+        action_set = action["set"]
+        required = action_set.get("required")
+        if required is not None and required is not False:
+            checks.append(self._compile_required(action, required))
+        attribute_type = self.column.attribute_type
+        if attribute_type == AttributeType.DATETIME:
+            checks.append(self._compile_datetime(action))
+        elif attribute_type in [AttributeType.INT, AttributeType.FLOAT]:
+            checks.append(self._compile_number(action))
+        elif attribute_type == AttributeType.TEXT:
+            checks.append(self._compile_text(action))
+        elif attribute_type == AttributeType.FILE:
+            checks.append(
+                self._interpreted({"conditions": [], "actions": [action]})
+            )
+
+        return checks
+
+    def _compile_required(self, action: dict, required: Any) -> Check:
+        def check(value):
+            if not (required is True and value):
+                self._raise_error(value, action, None)
+
+        return check
+
+    @staticmethod
+    def _compile_date_bound(constraint: str | None) -> Callable | None:
+        """
+        Returns a callable giving the date bound, parsed once unless it
+        depends on the current date.
+        """
+        if constraint is None:
+            return None
+        if constraint == "{currentDate}":
+            return lambda: datetime.fromisoformat(
+                datetime.now().isoformat() + "Z"
+            )
+        bound = datetime.fromisoformat(constraint)
+        return lambda: bound
+
+    def _compile_datetime(self, action: dict) -> Check:
+        action_set = action["set"]
+        get_min = self._compile_date_bound(action_set.get("min"))
+        get_max = self._compile_date_bound(action_set.get("max"))
+        dform = action_set.get("format")
+        column_name = self.column_name
+
+        def check(value):
+            if dform:
+                try:
+                    date_value = datetime.strptime(value, dform)
+                except ValueError:
+                    self._raise_error(value, action, None)
+            else:
+                try:
+                    date_value = datetime.fromisoformat(value)
+                except ValueError as exc:
+                    raise HTTPException(
+                        status_code=422,
+                        detail={
+                            column_name: (
+                                f"datetime {value} is not a valid"
+                                " isoformat string"
+                            )
+                        },
+                    ) from exc
+                if not date_value.tzinfo:
+                    date_value = date_value.replace(tzinfo=timezone.utc)
+            is_valid = True
+            if get_min is not None:
+                is_valid = is_valid and get_min() <= date_value
+            if get_max is not None:
+                is_valid = is_valid and date_value <= get_max()
+            if not is_valid:
+                self._raise_error(value, action, None)
+
+        return check
+
+    def _compile_number(self, action: dict) -> Check:
+        action_set = action["set"]
+        min_value = action_set.get("min")
+        max_value = action_set.get("max")
+        column_name = self.column_name
+
+        def check(value):
+            if value is None:
+                return
+            if not isinstance(value, (int, float)):
+                raise HTTPException(
+                    status_code=422,
+                    detail={
+                        column_name: (
+                            f"Invalid data type {type(value).__name__} in"
+                            f" {column_name} for comparison."
+                            " Must be an number."
+                        )
+                    },
+                )
+            if (min_value is not None and not min_value <= value) or (
+                max_value is not None and not value <= max_value
+            ):
+                self._raise_error(value, action, None)
+
+        return check
+
+    def _compile_text(self, action: dict) -> Check:
+        action_set = action["set"]
+        min_value = action_set.get("min")
+        max_value = action_set.get("max")
+        format_value = action_set.get("format")
+        pattern = (
+            re.compile(format_value) if format_value is not None else None
+        )
+        column_name = self.column_name
+
+        def check(value):
+            if value is None:
+                return
+            if not isinstance(value, str):
+                raise HTTPException(
+                    status_code=422,
+                    detail={
+                        column_name: (
+                            f"Invalid data type {type(value).__name__}"
+                            f" in {column_name} for comparison."
+                            " Must be a string"
+                        )
+                    },
+                )
+            value_length = len(value)
+            if (
+                (pattern is not None and pattern.match(value) is None)
+                or (min_value is not None and not min_value <= value_length)
+                or (max_value is not None and not value_length <= max_value)
+            ):
+                self._raise_error(value, action, None)
+
+        return check
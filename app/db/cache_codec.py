@@ -0,0 +1,66 @@
+"""
+Binary codec for large documents cached in Redis.
+
+Payloads are a fixed header, holding a magic marker and the codec
+version, followed by zstd-compressed orjson. Entries written by another
+version of the codec, or as plain JSON before it existed, decode to
+None and are treated as cache misses.
+"""
+
+import threading
+from typing import Any
+
+import orjson
+import zstandard
+
+from app import settings
+
+MAGIC = b"\xc1W"
+# 1: zlib, 2: zstd
+VERSION = 2
+HEADER = MAGIC + bytes([VERSION])
+
+# decompression contexts are reused, but not shared across threads
+_local = threading.local()
+
+
+def _decompressor() -> zstandard.ZstdDecompressor:
+    if not hasattr(_local, "decompressor"):
+        _local.decompressor = zstandard.ZstdDecompressor()
+    return _local.decompressor
+
+
+def encode(data: Any, level: int | None = None) -> bytes:
+    """
+    Encodes a JSON-serializable document.
+
+    Args:
+        data (Any): The document; must be serializable by orjson.
+        level (int | None): zstd compression level. Defaults to
+            `settings.cache.compression_level`.
+
+    Returns:
+        bytes: The versioned, compressed payload.
+    """
+    if level is None:
+        level = settings.cache.compression_level
+    return HEADER + zstandard.compress(orjson.dumps(data), level)
+
+
+def decode(payload: bytes) -> Any | None:
+    """
+    Decodes a payload written by `encode`.
+
+    Args:
+        payload (bytes): The cached payload.
+
+    Returns:
+        Any | None: The document, or None if the payload was written
+            by another codec version, or is corrupted.
+    """
+    if not payload.startswith(HEADER):
+        return None
+    try:
+        return orjson.loads(_decompressor().decompress(payload[len(HEADER) :]))
+    except (zstandard.ZstdError, orjson.JSONDecodeError):
+        return None
@@ -1,12 +1,17 @@
 """Database"""
 
+import asyncio
 import enum
 from asyncio import current_task
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from time import perf_counter
+from typing import AsyncIterator
 
-from sqlalchemy import event
+from sqlalchemy import event, text
 from sqlalchemy.dialects.postgresql.base import PGDDLCompiler
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_scoped_session,
     async_sessionmaker,
@@ -16,8 +21,9 @@ from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.sql.ddl import DropTable
 
-from app import settings
+from app import instrumentation, settings
 from app.loggers import get_nzdpu_logger
+from app.settings import PostgresSettings
 
 logger = get_nzdpu_logger()
 
@@ -27,15 +33,38 @@ class DBHost(str, enum.Enum):
     FOLLOWER = "follower"
 
 
-leader_engine = create_async_engine(
-    settings.db.main.uri,
-    max_overflow=15,
-    pool_size=35,
-    connect_args={"timeout": 120.0},
-    **settings.db.main.sqla_extra,
-)
+def create_node_engine(node: PostgresSettings) -> AsyncEngine:
+    """
+    Creates the engine of a database node, with the pool settings, which
+    take precedence over the same options in the node's `sqla_extra`.
+
+    Args:
+        node (PostgresSettings): The node's settings.
+
+    Returns:
+        AsyncEngine: The engine.
+    """
+    pool = settings.db.pool
+    options = node.sqla_extra | {
+        "pool_size": pool.size,
+        "max_overflow": pool.max_overflow,
+        "pool_timeout": pool.timeout,
+        "pool_recycle": pool.recycle,
+        "pool_pre_ping": pool.pre_ping,
+        "connect_args": node.sqla_extra.get("connect_args", {})
+        | {
+            "timeout": pool.connect_timeout,
+            "prepared_statement_cache_size": (
+                pool.prepared_statement_cache_size
+            ),
+        },
+    }
+    return create_async_engine(node.uri, **options)
+
+
+leader_engine = create_node_engine(settings.db.main)
 follower_engines = (
-    [create_async_engine(s.uri) for s in settings.db.secondary]
+    [create_node_engine(s) for s in settings.db.secondary]
     if settings.db.secondary
     else None
 )
@@ -65,11 +94,147 @@ sessionmakers = {
 }
 
 
+# replication lag of a follower, 0 when it replayed all it received
+FOLLOWER_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery()"
+    " OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+
+
+class FollowerPool:
+    """
+    Sessionmakers of the follower engines, with periodic health checks.
+
+    Sessions are bound to the least loaded healthy follower, ties going
+    round-robin. A follower is unhealthy when it cannot be queried, or
+    lags behind the leader by more than `max_lag` seconds; with no
+    healthy follower, reads fall back to the leader.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        check_interval: int,
+        max_lag: float,
+    ):
+        """
+        Inits the instance of this class.
+
+        Args:
+            engines (list[AsyncEngine]): The follower engines.
+            check_interval (int): Seconds between health checks.
+            max_lag (float): Max seconds of replication lag of a healthy
+                follower.
+        """
+        self.engines = engines
+        self.check_interval = check_interval
+        self.max_lag = max_lag
+        self.sessionmakers = [
+            async_sessionmaker[AsyncSession](
+                bind=engine, **common_session_params
+            )
+            for engine in engines
+        ]
+        self.healthy = [True] * len(engines)
+        self._next = 0
+        self._task: asyncio.Task | None = None
+
+    def available(self) -> bool:
+        """
+        Tells whether any follower is healthy.
+        """
+        return any(self.healthy)
+
+    def choose(self) -> async_sessionmaker[AsyncSession] | None:
+        """
+        Returns the sessionmaker of the least loaded healthy follower.
+
+        Returns:
+            async_sessionmaker[AsyncSession] | None: The sessionmaker, or
+                None if no follower is healthy.
+        """
+        candidates = [i for i, healthy in enumerate(self.healthy) if healthy]
+        if not candidates:
+            return None
+        self._next = (self._next + 1) % len(self.engines)
+        chosen = min(
+            candidates,
+            key=lambda i: (
+                self.engines[i].pool.checkedout(),
+                (i - self._next) % len(self.engines),
+            ),
+        )
+        return self.sessionmakers[chosen]
+
+    async def check(self) -> None:
+        """
+        Checks the health of every follower.
+        """
+        for i, engine in enumerate(self.engines):
+            try:
+                async with asyncio.timeout(self.check_interval):
+                    async with engine.connect() as conn:
+                        lag = await conn.scalar(FOLLOWER_LAG_QUERY)
+                healthy = float(lag or 0) <= self.max_lag
+                reason = f"replication lag {lag}s"
+            except Exception as exc:
+                healthy = False
+                reason = repr(exc)
+            if healthy != self.healthy[i]:
+                log = logger.info if healthy else logger.warning
+                log(
+                    f"Follower {engine.url.host} is"
+                    f" {'back' if healthy else 'out'} of rotation: {reason}"
+                )
+            self.healthy[i] = healthy
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        """
+        Starts the periodic health check task, if there are followers.
+        """
+        if self.engines and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the periodic health check task.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+follower_pool = FollowerPool(
+    engines=follower_engines or [],
+    check_interval=settings.db.follower_check_interval,
+    max_lag=settings.db.follower_max_lag,
+)
+
+
+def _get_host_sessionmaker(host: DBHost) -> async_sessionmaker[AsyncSession]:
+    if host == DBHost.FOLLOWER:
+        # fall back to the leader with no healthy follower
+        return follower_pool.choose() or sessionmakers[DBHost.LEADER]
+    return sessionmakers[host]
+
+
 class DBManager:
     def __init__(self, host: DBHost = DBHost.LEADER):
         self.host = host
         self.scoped_session = async_scoped_session(
-            session_factory=sessionmakers[host],
+            session_factory=_get_host_sessionmaker(host),
             scopefunc=_get_current_task_id,
         )
 
@@ -79,11 +244,157 @@ class DBManager:
         return session
 
 
-@event.listens_for(leader_engine.sync_engine, "before_cursor_execute")
+class AdhocSessions:
+    """
+    Caps the sessions opened outside of the scoped sessions of requests,
+    e.g. to load the submissions of a search in parallel, so that a single
+    export cannot check out every connection of the pool.
+
+    Sessions opened while the current task already holds one reuse the
+    parent's session, taking turns on it: nested loads neither open
+    connections beyond the cap nor wait on slots held by their own
+    callers.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Inits the instance of this class.
+
+        Args:
+            limit (int): Max sessions open at once.
+        """
+        self.limit = limit
+        self.in_use = 0
+        self.waiting = 0
+        self.waits = 0
+        self._slots = asyncio.Semaphore(limit)
+        self._held: ContextVar[tuple[AsyncSession, asyncio.Lock] | None] = (
+            ContextVar("held_adhoc_session", default=None)
+        )
+
+    @asynccontextmanager
+    async def session(self, bind: AsyncEngine) -> AsyncIterator[AsyncSession]:
+        """
+        Opens a session once a slot is free, or yields the session held
+        by the current task once the nested sessions before it are done
+        with it.
+
+        Args:
+            bind (AsyncEngine): The engine of the session.
+
+        Yields:
+            AsyncSession: The session, closed on exit unless nested.
+        """
+        held = self._held.get()
+        if held is not None:
+            session, lock = held
+            async with lock:
+                yield session
+            return
+        if self._slots.locked():
+            self.waits += 1
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        self.in_use += 1
+        try:
+            async with AsyncSession(bind) as session:
+                token = self._held.set((session, asyncio.Lock()))
+                try:
+                    yield session
+                finally:
+                    self._held.reset(token)
+        finally:
+            self.in_use -= 1
+            self._slots.release()
+
+
+adhoc_sessions = AdhocSessions(settings.db.pool.adhoc_session_limit)
+
+
+def render_pool_metrics() -> str:
+    """
+    Returns the saturation of the connection pools, and of the ad-hoc
+    sessions, in the Prometheus text exposition format.
+    """
+    engines = {"leader": leader_engine} | {
+        f"follower{i}": engine
+        for i, engine in enumerate(follower_engines or [])
+    }
+    capacity = settings.db.pool.size + settings.db.pool.max_overflow
+    gauges = {
+        "nzdpu_db_pool_size": (
+            "Connections kept open by the pool.",
+            lambda pool: pool.size(),
+        ),
+        "nzdpu_db_pool_checked_out": (
+            "Connections in use.",
+            lambda pool: pool.checkedout(),
+        ),
+        "nzdpu_db_pool_overflow": (
+            "Connections open beyond the pool size.",
+            lambda pool: max(pool.overflow(), 0),
+        ),
+        "nzdpu_db_pool_saturation": (
+            "Connections in use over the most the pool can open.",
+            lambda pool: pool.checkedout() / capacity if capacity else 0,
+        ),
+    }
+    lines = []
+    for metric, (help_text, value) in gauges.items():
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} gauge")
+        for node, engine in engines.items():
+            lines.append(f'{metric}{{node="{node}"}} {value(engine.pool):g}')
+    for metric, kind, help_text, value in [
+        (
+            "nzdpu_db_adhoc_sessions_in_use",
+            "gauge",
+            "Ad-hoc sessions open.",
+            adhoc_sessions.in_use,
+        ),
+        (
+            "nzdpu_db_adhoc_sessions_waiting",
+            "gauge",
+            "Ad-hoc sessions waiting for a slot.",
+            adhoc_sessions.waiting,
+        ),
+        (
+            "nzdpu_db_adhoc_session_waits_total",
+            "counter",
+            "Ad-hoc sessions which waited for a slot.",
+            adhoc_sessions.waits,
+        ),
+    ]:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        lines.append(f"{metric} {value:g}")
+    return "\n".join(lines) + "\n"
+
+
 def bef_exc(conn, cursor, statement, parameters, context, executemany):
     conn.info.setdefault("query_start_time", []).append(perf_counter())
 
 
+def aft_exc(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    instrumentation.record_query(statement, perf_counter() - started)
+
+
+def exc_error(exception_context):
+    # the failed statement never reaches after_cursor_execute
+    if exception_context.connection is not None:
+        exception_context.connection.info.pop("query_start_time", None)
+
+
+for _engine in [leader_engine, *(follower_engines or [])]:
+    event.listen(_engine.sync_engine, "before_cursor_execute", bef_exc)
+    event.listen(_engine.sync_engine, "after_cursor_execute", aft_exc)
+    event.listen(_engine.sync_engine, "handle_error", exc_error)
+
+
 #
 # # base class for DB models
 # class Base(AsyncAttrs, DeclarativeBase):
@@ -0,0 +1,119 @@
+"""
+In-process tier of the Redis cache.
+
+`RedisClient` keeps the values it reads in a `LocalCache`, keyed by the
+same full Redis key, so that repeated reads of hot keys skip the network
+hop. Entries are short-lived, and are evicted on every worker when keys
+are invalidated, through the client's pub/sub invalidation channel.
+"""
+
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Iterable
+
+
+class LocalCache:
+    """
+    LRU cache with a TTL, bounded by entries and by size of the values.
+    """
+
+    def __init__(self, ttl: int, max_entries: int, max_bytes: int):
+        """
+        Inits the instance of this class.
+
+        Args:
+            ttl (int): Seconds an entry is kept for; 0 disables caching.
+            max_entries (int): Max number of entries.
+            max_bytes (int): Max total length of the cached values.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, str | bytes]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | bytes | None:
+        """
+        Returns the cached value of a key, if not expired.
+
+        Args:
+            key (str): The full Redis key.
+
+        Returns:
+            str | bytes | None: The value, if cached.
+        """
+        if self.ttl <= 0:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._pop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, value: str | bytes) -> None:
+        """
+        Caches the value of a key, evicting the least recently used
+        entries beyond the bounds.
+
+        Args:
+            key (str): The full Redis key.
+            value (str | bytes): The value read from Redis.
+        """
+        if self.ttl <= 0 or len(value) > self.max_bytes:
+            return
+        self._pop(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._bytes += len(value)
+        while (
+            len(self._entries) > self.max_entries
+            or self._bytes > self.max_bytes
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """
+        Evicts the given keys.
+        """
+        for key in keys:
+            self._pop(key)
+
+    def discard_matching(self, pattern: str) -> None:
+        """
+        Evicts the keys matching a Redis glob pattern.
+        """
+        self.discard(
+            [key for key in self._entries if fnmatchcase(key, pattern)]
+        )
+
+    def clear(self) -> None:
+        """
+        Evicts all entries.
+        """
+        self._entries.clear()
+        self._bytes = 0
+
+    def metrics(self) -> dict:
+        """
+        Returns the tier's usage counters.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
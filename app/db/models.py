@@ -288,6 +288,8 @@ class AggregatedObjectView(Base):
         Integer, ForeignKey("wis_obj.id", ondelete="CASCADE")
     )
     data: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    # blake2b of the canonical JSON of `data`, see `content_hash`
+    content_hash: Mapped[str | None] = mapped_column(String(32))
     created_on: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, nullable=False
     )
@@ -2,15 +2,31 @@
 Holds the RedisClient class.
 """
 
-from typing import Any
+import asyncio
+from itertools import islice
+from typing import Any, Callable, Iterable
+from uuid import uuid4
 
+import orjson
 import redis.asyncio as redis
 import structlog
+from redis.client import NEVER_DECODE
+from redis.exceptions import RedisError
 
 import app.settings as settings
+from app import instrumentation
+from app.db.local_cache import LocalCache
 
 log: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
+# deletes a lease only if it still holds the releasing client's token
+RELEASE_LEASE_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
 # lots to disable because we get problems from parent
 # pylint: disable = abstract-method, too-many-ancestors
 # pylint: disable = invalid-overridden-method, arguments-renamed
@@ -20,6 +36,24 @@ log: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 class WisKeys:
     submission: str = "submission:"
     forms: str = "loaded_forms:"
+    submissions_total: str = "submissions_total"
+    firebase_token: str = "fb_token:"
+    tag: str = "tag:"
+    invalidation_channel: str = "invalidation"
+    lease: str = "lease:"
+    recent_write: str = "recent_write:"
+
+    @staticmethod
+    def submission_tag(submission_id: int) -> str:
+        return f"submission:{submission_id}"
+
+    @staticmethod
+    def nz_id_tag(nz_id: int) -> str:
+        return f"nz_id:{nz_id}"
+
+    @staticmethod
+    def view_tag(view_id: int) -> str:
+        return f"view:{view_id}"
 
 
 class RedisClient(redis.Redis):
@@ -47,6 +81,17 @@ class RedisClient(redis.Redis):
         )
         self._cache_control = None
         self.key_prefix = "cached:"
+        self.local = LocalCache(
+            ttl=settings.cache.local_ttl,
+            max_entries=settings.cache.local_max_entries,
+            max_bytes=settings.cache.local_max_bytes,
+        )
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self._instance_id = uuid4().hex
+        self._listener: asyncio.Task | None = None
+        self._invalidation_handlers: list[Callable[[dict], None]] = []
+        self._release_lease_script = self.register_script(RELEASE_LEASE_SCRIPT)
 
     @property
     def cache_control(self):
@@ -60,8 +105,18 @@ class RedisClient(redis.Redis):
         """
         Close the Redis connection
         """
+        await self.stop_invalidation_listener()
         await self.connection_pool.disconnect()
 
+    def metrics(self) -> dict:
+        """
+        Returns hits and misses of both cache tiers.
+        """
+        return {
+            "local": self.local.metrics(),
+            "redis": {"hits": self.redis_hits, "misses": self.redis_misses},
+        }
+
     async def get(self, key: str) -> Any:
         """
         Get value of specified key.
@@ -72,54 +127,410 @@ class RedisClient(redis.Redis):
         Returns:
             dict: The stored value, if any.
         """
+        if await self._bypass(key):
+            return None
+
+        key = self.key_prefix + key
+        cached = self.local.get(key)
+        if isinstance(cached, str):
+            instrumentation.record_cache_read(hit=True, local=True)
+        else:
+            cached = await super().get(key)
+            self._cache_read(key, cached)
+        if cached:
+            return cached
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """
+        Get the raw value of specified key, without decoding it, as
+        needed for binary payloads (see `app.db.cache_codec`).
+
+        Args:
+            key (str): The key in the Redis DB to get the value from.
+
+        Returns:
+            bytes | None: The stored value, if any.
+        """
+        if await self._bypass(key):
+            return None
+
+        key = self.key_prefix + key
+        cached = self.local.get(key)
+        if isinstance(cached, bytes):
+            instrumentation.record_cache_read(hit=True, local=True)
+            return cached
+        cached = await self.execute_command("GET", key, **{NEVER_DECODE: []})
+        self._cache_read(key, cached)
+        return cached
+
+    def _cache_read(self, key: str, value: str | bytes | None) -> None:
+        """
+        Counts a read from Redis, keeping hits in the local tier.
+        """
+        instrumentation.record_cache_read(hit=value is not None)
+        if value is None:
+            self.redis_misses += 1
+            return
+        self.redis_hits += 1
+        self.local.set(key, value)
+
+    async def _bypass(self, key: str) -> bool:
+        """
+        Tells whether a read must skip the cache.
+        """
         # always return None if redis not enabled
         if not bool(settings.cache.enabled):
-            return None
+            return True
         # check value of Cache-Control header
         # and return None on specific values
         match self.cache_control:
             case "no-cache":
-                return None
+                return True
             case "max-age=0":
-                await self.del_pattern(key)
-                return None
-
-        key = self.key_prefix + key
-        cached = await super().get(key)
-        if cached:
-            return cached
+                await self.invalidate_keys(key)
+                return True
+        return False
 
     async def set(
-        self, key: str, data: str, ttl: int = settings.cache.ttl
+        self,
+        key: str,
+        data: str | bytes,
+        ttl: int = settings.cache.ttl,
+        tags: Iterable[str] = (),
     ) -> bool | None:
         """
-        Set a value for the specified key, with a TTL.
+        Set a value for the specified key, with a TTL, and evict the
+        previous value from the local tier of all workers.
 
         Args:
             key (str): The key where to store the value.
-            data (dict): The data to store.
+            data (str | bytes): The data to store.
             ttl (int, optional): The TTL, after which the key will
                 expire. Defaults to settings.REDIS_TTL.
+            tags (Iterable[str], optional): Tags to register the key
+                under, for `invalidate_tags`. See `WisKeys.*_tag`.
 
         Returns:
             bool | None: True if successful.
         """
         key = self.key_prefix + key
-        return await super().set(key, data, ex=ttl)
+        async with self.pipeline(transaction=False) as pipe:
+            pipe.set(key, data, ex=ttl)
+            for tag in tags:
+                tag_key = self.key_prefix + self.wis_keys.tag + tag
+                pipe.sadd(tag_key, key)
+                # outlive the keys of the tag; stale members are harmless
+                pipe.expire(tag_key, max(ttl, settings.cache.ttl))
+            if self.local.ttl > 0:
+                # published with the write, so that no worker reads the
+                # previous value back from Redis once it is evicted
+                pipe.publish(
+                    self.key_prefix + self.wis_keys.invalidation_channel,
+                    orjson.dumps(self._invalidation_message(keys=[key])),
+                )
+            results = await pipe.execute()
+        self.local.discard([key])
+        return results[0]
 
-    async def del_pattern(self, pattern: str) -> None:
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Deletes all keys registered under any of the given tags, and
+        the tags themselves, without scanning the keyspace.
+
+        Args:
+            tags (str): The tags to invalidate.
+
+        Returns:
+            int: The number of keys deleted.
+        """
+        tag_keys = [self.key_prefix + self.wis_keys.tag + tag for tag in tags]
+        if not tag_keys:
+            return 0
+        async with self.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+        keys = set(tag_keys).union(*members)
+        await self._broadcast_invalidation(keys=list(keys))
+        return await self._unlink_many(keys)
+
+    async def invalidate_keys(self, *keys: str) -> int:
+        """
+        Deletes the given keys, from Redis and from the local tier of
+        all workers.
+
+        Args:
+            keys (str): The keys, without prefix.
+
+        Returns:
+            int: The number of keys deleted.
+        """
+        keys = [self.key_prefix + key for key in keys]
+        if not keys:
+            return 0
+        await self._broadcast_invalidation(keys=keys)
+        return await self.unlink(*keys)
+
+    async def invalidate_submission(
+        self, submission_id: int, nz_id: int | None = None
+    ) -> int:
+        """
+        Deletes the cached submission and every entry tagged with it
+        or, if given, with its company.
+
+        Args:
+            submission_id (int): The submission ID.
+            nz_id (int | None): The NZ ID of the submission's company.
+
+        Returns:
+            int: The number of keys deleted.
+        """
+        return await self.invalidate_submissions([(submission_id, nz_id)])
+
+    async def invalidate_submissions(
+        self, submissions: Iterable[tuple[int, int | None]]
+    ) -> int:
+        """
+        Batched version of `invalidate_submission`, deleting the entries
+        of many submissions with a single round of commands.
+
+        Args:
+            submissions (Iterable[tuple[int, int | None]]): The IDs of
+                the submissions, with the NZ IDs of their companies.
+
+        Returns:
+            int: The number of keys deleted.
+        """
+        keys = []
+        tags = set()
+        for submission_id, nz_id in submissions:
+            keys.append(self.wis_keys.submission + str(submission_id))
+            tags.add(self.wis_keys.submission_tag(submission_id))
+            if nz_id is not None:
+                tags.add(self.wis_keys.nz_id_tag(nz_id))
+        deleted = await self.invalidate_keys(*keys)
+        return deleted + await self.invalidate_tags(*tags)
+
+    async def del_pattern(self, pattern: str, batch_size: int = 1000) -> int:
         """
         Deletes all keys matching against a pattern.
 
+        Walks the keyspace with SCAN, so prefer `invalidate_tags` for
+        anything that can be tagged on write.
+
         Args:
             pattern (str): The key pattern to match.
+            batch_size (int): Keys scanned and deleted per round trip.
+
+        Returns:
+            int: The number of keys deleted.
         """
-        # add key prefix and trailing glob to pattern
+        if not any(char in pattern for char in "*?["):
+            return await self.invalidate_keys(pattern)
+        # add key prefix to pattern
         pattern = self.key_prefix + pattern
-        keys: list[str] = await self.keys(pattern)
-        for key in keys:
-            await self.delete(key)
+        await self._broadcast_invalidation(pattern=pattern)
+        return await self._unlink_many(
+            self.scan_iter(match=pattern, count=batch_size), batch_size
+        )
+
+    async def acquire_lease(self, key: str, ttl: int) -> str | None:
+        """
+        Takes the lease on computing the value of a key, unless another
+        client holds it.
+
+        Args:
+            key (str): The key whose value is to be computed.
+            ttl (int): Seconds after which the lease expires, should it
+                not be released.
+
+        Returns:
+            str | None: The token of the lease if it was taken, to
+                release it with.
+        """
+        token = uuid4().hex
+        leased = await super().set(
+            self.key_prefix + self.wis_keys.lease + key,
+            token,
+            nx=True,
+            ex=ttl,
+        )
+        return token if leased else None
+
+    async def lease_held(self, key: str) -> bool:
+        """
+        Tells whether any client holds the lease on a key.
+        """
+        return bool(
+            await self.exists(self.key_prefix + self.wis_keys.lease + key)
+        )
+
+    async def release_lease(self, key: str, token: str) -> bool:
+        """
+        Releases the lease on a key, if still held with the given token:
+        a lease which expired and was taken by another client is left
+        to it.
+
+        Args:
+            key (str): The key whose value was computed.
+            token (str): The token returned by `acquire_lease`.
+
+        Returns:
+            bool: True if the lease was released.
+        """
+        return bool(
+            await self._release_lease_script(
+                keys=[self.key_prefix + self.wis_keys.lease + key],
+                args=[token],
+            )
+        )
+
+    async def _unlink_many(self, keys, batch_size: int = 1000) -> int:
+        """
+        UNLINKs keys from a sync or async iterable, in batches.
+        """
+        deleted = 0
+        batch: list[str] = []
+        if hasattr(keys, "__aiter__"):
+            async for key in keys:
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.unlink(*batch)
+                    batch = []
+        else:
+            keys = iter(keys)
+            while batch := list(islice(keys, batch_size)):
+                deleted += await self.unlink(*batch)
+            batch = []
+        if batch:
+            deleted += await self.unlink(*batch)
+        return deleted
 
     async def flushdb(self, asynchronous: bool = False):
         log.debug(f"Calling flushdb with asynchronous={asynchronous}")
+        await self._broadcast_invalidation(flush=True)
         return await super().flushdb(asynchronous=asynchronous)
+
+    def add_invalidation_handler(self, handler: Callable[[dict], None]):
+        """
+        Registers a handler of the invalidations of a process cache other
+        than the local tier, e.g. the principal cache. Handlers are
+        called with every invalidation message, published by this worker
+        or by the others; a message with `flush` asks to drop everything.
+
+        Args:
+            handler (Callable[[dict], None]): The handler.
+        """
+        self._invalidation_handlers.append(handler)
+
+    async def publish_invalidation(self, **fields: Any) -> None:
+        """
+        Applies an invalidation for the handlers of this worker, and
+        publishes it to the other workers.
+
+        Args:
+            fields (Any): The fields of the message, read by handlers.
+        """
+        await self._broadcast_invalidation(**fields)
+
+    async def _broadcast_invalidation(
+        self,
+        keys: list[str] | None = None,
+        pattern: str | None = None,
+        flush: bool = False,
+        **fields: Any,
+    ) -> None:
+        """
+        Evicts keys from the local tier, and publishes the eviction to
+        the other workers.
+
+        Args:
+            keys (list[str] | None): Full keys to evict.
+            pattern (str | None): Glob pattern of full keys to evict.
+            flush (bool): Whether to evict all keys.
+            fields (Any): Other fields, for the invalidation handlers.
+        """
+        message = self._invalidation_message(keys, pattern, flush, **fields)
+        self._apply_invalidation(message)
+        try:
+            await self.publish(
+                self.key_prefix + self.wis_keys.invalidation_channel,
+                orjson.dumps(message),
+            )
+        except RedisError as exc:
+            log.warning(f"Failed to publish cache invalidation: {exc}")
+
+    def _invalidation_message(
+        self,
+        keys: list[str] | None = None,
+        pattern: str | None = None,
+        flush: bool = False,
+        **fields: Any,
+    ) -> dict:
+        return {
+            **fields,
+            "sender": self._instance_id,
+            "keys": keys or [],
+            "pattern": pattern,
+            "flush": flush,
+        }
+
+    def _apply_invalidation(self, message: dict) -> None:
+        for handler in self._invalidation_handlers:
+            handler(message)
+        if message["flush"]:
+            self.local.clear()
+            return
+        self.local.discard(message["keys"])
+        if message["pattern"]:
+            self.local.discard_matching(message["pattern"])
+
+    def start_invalidation_listener(self) -> None:
+        """
+        Starts listening to the invalidations published by other
+        workers, if the local tier is enabled or handlers are registered.
+        """
+        if self._listener is None and (
+            self.local.ttl > 0 or self._invalidation_handlers
+        ):
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop_invalidation_listener(self) -> None:
+        """
+        Stops listening to invalidations.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    def _receive_invalidation(self, data: bytes) -> None:
+        # a malformed message, or a failing handler, must not stop the
+        # listener, which would leave every local copy stale
+        try:
+            message = orjson.loads(data)
+            if message["sender"] != self._instance_id:
+                self._apply_invalidation(message)
+        except Exception as exc:
+            log.warning(f"Failed to apply cache invalidation {data!r}: {exc}")
+
+    async def _listen(self) -> None:
+        channel = self.key_prefix + self.wis_keys.invalidation_channel
+        while True:
+            try:
+                async with self.pubsub() as pubsub:
+                    await pubsub.subscribe(channel)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        self._receive_invalidation(message["data"])
+            except RedisError as exc:
+                log.warning(f"Cache invalidation listener failed: {exc}")
+            # invalidations may have been missed while disconnected
+            self._apply_invalidation(
+                {"keys": [], "pattern": None, "flush": True}
+            )
+            await asyncio.sleep(1)
@@ -28,8 +28,14 @@ from app.service.firebase_rest_api_client import FirebaseRESTAPIClient
 from app.service.firebase_rest_api_client.errors import (
     FirebaseRESTAPIClientException,
 )
+from app.service.principal_cache import (
+    api_key_principal_key,
+    principal_cache,
+    token_principal_key,
+)
+from app.service.read_your_writes import wrote_recently
 
-from .db.database import DBHost, DBManager
+from .db.database import DBHost, DBManager, follower_pool
 from .db.models import AuthMode, AuthRole, User
 from .db.redis import RedisClient
 from .loggers import get_nzdpu_logger
@@ -73,11 +79,21 @@ class GRPCErrorMappingEnum(Enum):
     DEADLINE_EXCEEDED = 504
 
 
-def initialize_firebase_rest_api_client() -> FirebaseRESTAPIClient:
+def initialize_firebase_rest_api_client(
+    request: Request = None,
+) -> FirebaseRESTAPIClient:
     """
     Initialize Firebase REST API client.
+
+    When `settings.fb.token_cache_redis` is set, verified tokens are
+    also shared across workers through the app's Redis client.
     """
-    return FirebaseRESTAPIClient(api_key=settings.fb.api_key)
+    redis_cache = None
+    if settings.fb.token_cache_redis and request is not None:
+        redis_cache = getattr(request.app.state, "redis_client", None)
+    return FirebaseRESTAPIClient(
+        api_key=settings.fb.api_key, redis_cache=redis_cache
+    )
 
 
 @contextmanager
@@ -192,11 +208,6 @@ class DBHostAdapter:
 
 DbManager = Annotated[DBManager, Depends(get_db_manager)]
 
-# use follower db for read operations only
-DbFollowerManager = Annotated[
-    DBManager, Depends(DBHostAdapter(DBHost.FOLLOWER))
-]
-
 
 def get_email_verification_link(
     email: str,
@@ -278,7 +289,7 @@ async def verify_token(
                 user_info = await verify_local_token(token, _session)
             else:
                 # Firebase token verification
-                user_info = pb.get_account_info(token)
+                user_info = await pb.get_account_info_async(token)
             return user_info, token
         except (
             auth.InvalidIdTokenError,
@@ -317,13 +328,22 @@ async def get_current_user(
             else:
                 # Firebase token verification
                 try:
-                    user_info = pb.get_account_info(token)
+                    user_info = await pb.get_account_info_async(token)
                 except Exception as ex:
                     raise HTTPException(
                         status_code=401, detail={"token": INVALID_TOKEN}
                     ) from ex
                 ext_id = user_info.users[0].local_id
                 if ext_id:
+                    token_iat = jwt.decode(
+                        token, options={"verify_signature": False}
+                    )["iat"]
+                    principal_key = token_principal_key(
+                        AuthMode.FIREBASE, ext_id, token_iat
+                    )
+                    current_user = principal_cache.get(principal_key)
+                    if current_user:
+                        return current_user
                     # load user from DB
                     current_user = await _session.scalar(
                         select(User)
@@ -332,16 +352,13 @@ async def get_current_user(
                     )
                     if not current_user:
                         return None
-                    iat = datetime.fromtimestamp(
-                        jwt.decode(token, options={"verify_signature": False})[
-                            "iat"
-                        ]
-                    )
+                    iat = datetime.fromtimestamp(token_iat)
                     if current_user.token_iat != iat:
                         raise HTTPException(
                             status_code=status.HTTP_401_UNAUTHORIZED,
                             detail={"token": "Invalid token"},
                         )
+                    principal_cache.set(principal_key, current_user)
         except (
             auth.InvalidIdTokenError,
             HTTPError,
@@ -380,6 +397,10 @@ async def get_current_user_or_none(
 async def get_current_user_from_api_key(
     db_manager: DbManager, api_key_header: str = Depends(api_key)
 ):
+    principal_key = api_key_principal_key(api_key_header)
+    user = principal_cache.get(principal_key)
+    if user:
+        return user
     async with db_manager.get_session() as _session:
         # load user from DB
         result = await _session.execute(
@@ -393,6 +414,7 @@ async def get_current_user_from_api_key(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail={"api_key": "The access_key is no longer valid"},
             )
+    principal_cache.set(principal_key, user)
     return user
 
 
@@ -553,16 +575,28 @@ class RoleAuthorizationForMultipleAuth(RoleAuthorization):
         return user
 
 
+def create_cache() -> RedisClient:
+    """
+    Creates the Redis client of the app, listening to the invalidations
+    published by the other workers for its local tier and for the
+    principal cache.
+    """
+    redis_client = RedisClient(
+        host=settings.cache.host,
+        port=settings.cache.port,
+        password=settings.cache.password,
+    )
+    principal_cache.bind(redis_client)
+    redis_client.start_invalidation_listener()
+    return redis_client
+
+
 async def get_cache(request: Request) -> RedisClient:
     """
     Get Redis connected instance.
     """
     if not hasattr(request.app.state, "redis_client"):
-        request.app.state.redis_client = RedisClient(
-            host=settings.cache.host,
-            port=settings.cache.port,
-            password=settings.cache.password,
-        )
+        request.app.state.redis_client = create_cache()
     request.app.state.redis_client.cache_control = request.headers.get(
         "Cache-Control"
     )
@@ -578,3 +612,29 @@ async def get_static_cache(request: Request) -> CoreMemoryCache:
 
 Cache = Annotated[RedisClient, Depends(get_cache)]
 StaticCache = Annotated[CoreMemoryCache, Depends(get_static_cache)]
+
+
+async def get_db_follower_manager(
+    request: Request, db_manager: DbManager, cache: Cache
+) -> AsyncIterator[DBManager]:
+    """
+    Get follower database manager, for read operations only.
+
+    Falls back to the leader database manager when no follower is
+    healthy, or when the caller wrote recently and could otherwise miss
+    its own writes on a lagging follower.
+    """
+    if not follower_pool.available() or await wrote_recently(request, cache):
+        yield db_manager
+        return
+    follower_manager = init_db_manager(DBHost.FOLLOWER)
+    try:
+        yield follower_manager
+    except SQLAlchemyError as err:
+        logger.error(err)
+    finally:
+        await close_all_sessions(follower_manager)
+
+
+# use follower db for read operations only
+DbFollowerManager = Annotated[DBManager, Depends(get_db_follower_manager)]
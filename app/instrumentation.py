@@ -0,0 +1,210 @@
+"""
+Per-request instrumentation.
+
+The request middleware binds a `RequestMetrics` to the request's context;
+the database engines, the Redis client and the cache fill coalescing
+record into it through the module functions below, which are no-ops
+outside of a request. Once the response is ready, the request's metrics
+are logged, returned in a `Server-Timing` header, and aggregated by route
+in `runtime_metrics`, exposed at `/metrics/runtime`.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+
+# longest statement kept as a request's slowest
+MAX_STATEMENT_LENGTH = 500
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Time spent by a request, and what it was spent on.
+    """
+
+    started: float = field(default_factory=perf_counter)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    slowest_query_seconds: float = 0.0
+    slowest_query: str | None = None
+    local_hits: int = 0
+    redis_hits: int = 0
+    redis_misses: int = 0
+    lock_wait_seconds: float = 0.0
+
+    def elapsed(self) -> float:
+        """
+        Returns the seconds since the request started.
+        """
+        return perf_counter() - self.started
+
+    def server_timing(self, seconds: float) -> str:
+        """
+        Returns the value of the `Server-Timing` header.
+
+        Args:
+            seconds (float): The request's total time.
+
+        Returns:
+            str: The header value, durations in milliseconds.
+        """
+        cache_reads = self.local_hits + self.redis_hits + self.redis_misses
+        return ", ".join(
+            [
+                f"total;dur={seconds * 1000:.1f}",
+                f'db;dur={self.db_seconds * 1000:.1f};desc="{self.db_queries} queries"',
+                f"db-slowest;dur={self.slowest_query_seconds * 1000:.1f}",
+                f'cache;desc="{cache_reads} reads, {self.local_hits} local hits,'
+                f' {self.redis_hits} redis hits, {self.redis_misses} misses"',
+                f"cache-lock;dur={self.lock_wait_seconds * 1000:.1f}",
+            ]
+        )
+
+
+_request_metrics: ContextVar[RequestMetrics | None] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+def start_request() -> RequestMetrics:
+    """
+    Binds new metrics to the current request's context.
+
+    Returns:
+        RequestMetrics: The request's metrics.
+    """
+    metrics = RequestMetrics()
+    _request_metrics.set(metrics)
+    return metrics
+
+
+def record_query(statement: str, seconds: float) -> None:
+    """
+    Records an executed SQL statement.
+
+    Args:
+        statement (str): The statement.
+        seconds (float): Time spent executing it.
+    """
+    metrics = _request_metrics.get()
+    if metrics is None:
+        return
+    metrics.db_queries += 1
+    metrics.db_seconds += seconds
+    if seconds > metrics.slowest_query_seconds:
+        metrics.slowest_query_seconds = seconds
+        metrics.slowest_query = statement[:MAX_STATEMENT_LENGTH]
+
+
+def record_cache_read(hit: bool, local: bool = False) -> None:
+    """
+    Records a read of the cache.
+
+    Args:
+        hit (bool): Whether the key was found.
+        local (bool): Whether it was found in the in-process tier.
+    """
+    metrics = _request_metrics.get()
+    if metrics is None:
+        return
+    if local:
+        metrics.local_hits += 1
+    elif hit:
+        metrics.redis_hits += 1
+    else:
+        metrics.redis_misses += 1
+
+
+def record_lock_wait(seconds: float) -> None:
+    """
+    Records time spent waiting for another caller to fill a cache entry.
+
+    Args:
+        seconds (float): Time spent waiting.
+    """
+    metrics = _request_metrics.get()
+    if metrics is not None:
+        metrics.lock_wait_seconds += seconds
+
+
+class RuntimeMetrics:
+    """
+    Request metrics of this worker process, aggregated by route.
+    """
+
+    # counters, in Prometheus exposition order, with their help text
+    COUNTERS = {
+        "requests": "Requests handled.",
+        "request_seconds": "Time spent handling requests.",
+        "db_queries": "SQL statements executed.",
+        "db_seconds": "Time spent executing SQL statements.",
+        "cache_local_hits": "Reads served by the in-process cache tier.",
+        "cache_redis_hits": "Reads served by Redis.",
+        "cache_redis_misses": "Reads of keys missing from the cache.",
+        "cache_lock_wait_seconds": "Time spent waiting for cache fills.",
+    }
+
+    def __init__(self):
+        """
+        Inits the instance of this class.
+        """
+        self._routes: dict[tuple[str, str], dict[str, float]] = {}
+
+    def observe(
+        self, method: str, route: str, metrics: RequestMetrics, seconds: float
+    ) -> None:
+        """
+        Adds a request's metrics to its route's.
+
+        Args:
+            method (str): The request's method.
+            route (str): The path template of the matched route.
+            metrics (RequestMetrics): The request's metrics.
+            seconds (float): The request's total time.
+        """
+        counters = self._routes.setdefault(
+            (method, route),
+            {name: 0 for name in self.COUNTERS} | {"slowest_query_seconds": 0},
+        )
+        counters["requests"] += 1
+        counters["request_seconds"] += seconds
+        counters["db_queries"] += metrics.db_queries
+        counters["db_seconds"] += metrics.db_seconds
+        counters["cache_local_hits"] += metrics.local_hits
+        counters["cache_redis_hits"] += metrics.redis_hits
+        counters["cache_redis_misses"] += metrics.redis_misses
+        counters["cache_lock_wait_seconds"] += metrics.lock_wait_seconds
+        counters["slowest_query_seconds"] = max(
+            counters["slowest_query_seconds"], metrics.slowest_query_seconds
+        )
+
+    def render(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        metrics = [
+            (f"nzdpu_{name}_total", "counter", name, help_text)
+            for name, help_text in self.COUNTERS.items()
+        ] + [
+            (
+                "nzdpu_slowest_query_seconds",
+                "gauge",
+                "slowest_query_seconds",
+                "Longest SQL statement execution of a request.",
+            )
+        ]
+        for metric, kind, name, help_text in metrics:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for (method, route), counters in sorted(self._routes.items()):
+                route = route.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(
+                    f'{metric}{{method="{method}",route="{route}"}}'
+                    f" {counters[name]:g}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+runtime_metrics = RuntimeMetrics()
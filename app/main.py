@@ -2,7 +2,6 @@
 
 from contextlib import asynccontextmanager
 from datetime import datetime
-from time import perf_counter
 from typing import Annotated, Any, AsyncGenerator, Dict
 from uuid import uuid4
 
@@ -19,18 +18,22 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.db.database import DBManager
+from app.db.database import DBManager, follower_pool
 from app.schemas.validation_exception_handler import (
     validation_exception_handler,
 )
 from app.service.core.cache import CoreMemoryCache
+from app.service.executors import shutdown_executors
 from app.service.firebase_rest_api_client import (
     FirebaseRESTAPIClient,
     FirebaseRESTAPIClientException,
     UnhandledFirebaseRESTAPIClientException,
 )
+from app.service.principal_cache import last_access_recorder, principal_cache
+from app.service.read_your_writes import mark_write
+from app.service.usage_tracker import usage_tracker
 
-from . import settings
+from . import instrumentation, settings
 from .api_specs_utils import RouteViewer
 from .constraint_validator import ConstraintValidationException
 from .db.extensions import create_postgres_extensions
@@ -41,6 +44,7 @@ from .db.models import (
 from .db.types import CompositeTypeInjector, NullTypeState
 from .dependencies import (
     DbManager,
+    create_cache,
     get_current_user_or_none,
     initialize_firebase_rest_api_client,
 )
@@ -74,7 +78,7 @@ from .schemas.token import (
 )
 from .utils import (
     LocalTokenVerificationError,
-    check_password,
+    check_password_async,
     create_access_token,
     create_refresh_token,
     increment_login_attempts_and_get_error_message,
@@ -111,8 +115,19 @@ async def application_startup_handler(
 
         app.state.static_cache = static_cache
 
+    # listen to other workers' invalidations before serving requests
+    app.state.redis_client = create_cache()
+    last_access_recorder.start()
+    usage_tracker.start()
+    follower_pool.start()
+
     yield
 
+    await last_access_recorder.stop()
+    await usage_tracker.stop()
+    await follower_pool.stop()
+    await FirebaseRESTAPIClient.aclose()
+    shutdown_executors()
     if hasattr(app.state, "redis_client"):  # type: ignore
         await app.state.redis_client.disconnect()  # type: ignore
 
@@ -138,11 +153,52 @@ app = FastAPI(
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
     """
-    Middleware to log request response time.
+    Middleware to log request response time, with the time spent on DB
+    queries and cache reads, also returned in a Server-Timing header and
+    aggregated by route for /metrics/runtime.
+    """
+    metrics = instrumentation.start_request()
+    response = await call_next(request)
+    response_time = metrics.elapsed()
+    route = request.scope.get("route")
+    # unmatched paths are not labelled, to keep the metrics bounded
+    route_path = route.path if route is not None else "unmatched"
+    instrumentation.runtime_metrics.observe(
+        request.method, route_path, metrics, response_time
+    )
+    if settings.application.server_timing:
+        response.headers["Server-Timing"] = metrics.server_timing(
+            response_time
+        )
+    logger.info(
+        f"Request {request.url} response time: {response_time}",
+        method=request.method,
+        route=route_path,
+        status_code=response.status_code,
+        response_time=response_time,
+        db_queries=metrics.db_queries,
+        db_time=metrics.db_seconds,
+        slowest_query_time=metrics.slowest_query_seconds,
+        slowest_query=metrics.slowest_query,
+        cache_local_hits=metrics.local_hits,
+        cache_redis_hits=metrics.redis_hits,
+        cache_redis_misses=metrics.redis_misses,
+        cache_lock_wait=metrics.lock_wait_seconds,
+    )
+    return response
+
+
+@app.middleware("http")
+async def mark_writes_for_follower_reads(request: Request, call_next):
+    """
+    Middleware to route the reads of a caller to the leader for a while
+    after its writes, as followers may not have replicated them yet.
     """
-    s = perf_counter()
     response = await call_next(request)
-    logger.info(f"Request {request.url} response time: {perf_counter() - s}")
+    if hasattr(request.app.state, "redis_client"):
+        await mark_write(
+            request, response.status_code, request.app.state.redis_client
+        )
     return response
 
 
@@ -303,7 +359,9 @@ async def token(
 
         if user.auth_mode == AuthMode.LOCAL:
             # check user password
-            valid = check_password(form_data.password, user.password)
+            valid = await check_password_async(
+                form_data.password, user.password
+            )
             if not valid:
                 error_message = (
                     await increment_login_attempts_and_get_error_message(
@@ -384,7 +442,9 @@ async def token(
                 raise
             else:
                 access_token = fb_user.id_token
-                fb_user_info = pb.get_account_info(token=access_token)
+                fb_user_info = await pb.get_account_info_async(
+                    token=access_token
+                )
                 email_verified = fb_user_info.users[0].email_verified
                 user.token_iat = datetime.fromtimestamp(
                     jwt.decode(
@@ -404,6 +464,8 @@ async def token(
         user.email_verified = email_verified
         _session.add(user)
         await _session.commit()
+        # tokens issued before this login are no longer valid
+        await principal_cache.invalidate_user(user.id)
 
         # block log in if email not verified
         if not email_verified:
@@ -470,6 +532,7 @@ async def refresh_token(
             user.token_iat = datetime.fromtimestamp(decoded["iat"])
             _session.add(user)
             await _session.commit()
+            await principal_cache.invalidate_user(user.id)
 
         return Token(
             access_token=access_token,
@@ -498,6 +561,7 @@ async def refresh_token(
         )
         _session.add(user)
         await _session.commit()
+        await principal_cache.invalidate_user(user.id)
 
         r_exp = iat + settings.jwt.refresh_exp_delta
         refresh_token = create_refresh_token(
@@ -18,6 +18,7 @@ from fastapi import (
     Depends,
     HTTPException,
     Request,
+    Response,
     status,
 )
 from fastapi.encoders import jsonable_encoder
@@ -41,6 +42,7 @@ from app.service.organization_service import OrganizationService
 from app.service.query_helpers import get_order_by
 from app.service.restatement_service import RestatementService
 from app.service.schema_service import SchemaService
+from app.service.single_flight import single_flight
 from app.utilities.utils_string import consistent_hash
 
 from ..db.models import (
@@ -56,7 +58,7 @@ from ..db.models import (
 from ..db.types import NullTypeState
 from ..dependencies import (
     Cache,
-    DbManager,
+    DbFollowerManager,
     RoleAuthorizationForMultipleAuth,
     StaticCache,
     get_current_user_or_none,
@@ -65,8 +67,11 @@ from ..forms.form_meta import FormMeta
 from ..loggers import get_nzdpu_logger
 from ..routers.utils import (
     create_cache_key,
+    etag_matches,
+    get_aggregates_etag,
     get_restated_fields_data_source,
     normalize_text,
+    not_modified_response,
 )
 from ..schemas.companies import (
     AbsoluteDataModel,
@@ -105,6 +110,7 @@ from ..schemas.restatements import (
 from ..schemas.submission import DisclosureDetailsResponse, SubmissionGet
 from ..schemas.tracking import TrackingUrls
 from ..service.exports.utils import get_attribute_prompt_from_path
+from ..service.route_limiter import route_limiters
 from ..service.utils import format_units
 
 router = APIRouter(
@@ -511,7 +517,7 @@ async def list_companies(
     cache: Cache,
     static_cache: StaticCache,
     request: Request,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     current_user: User = Depends(get_current_user_or_none),
     # NOTE: this parameters are not used in the function, but are needed for right FE typing
     jurisdiction: str | None = None,
@@ -559,73 +565,94 @@ async def list_companies(
                 )
                 return companies_list
             except ValidationError as err:  # the cache is invalid
-                background_tasks.add_task(cache.delete, redis_key)
+                background_tasks.add_task(cache.invalidate_keys, redis_key)
                 logger.error(err)
 
-    async with db_manager.get_session() as _session:
-        query = CompanySearchQuery.from_request(request)
-        stmt = await companies_query_sub_string_match(static_cache, query)
-        total = 0
-
+    async def read_cached() -> CompaniesSpecificCriteriaList | None:
+        cached = await cache.get(redis_key)
+        if cached is None:
+            return None
         try:
-            db_organizations = (await _session.execute(stmt)).mappings().all()
+            return CompaniesSpecificCriteriaList(**orjson.loads(cached))
+        except ValidationError:
+            return None
 
-            # if there are not matches for sub string match, then use fuzzy matching
-            if len(db_organizations) == 0:
-                stmt = await companies_query_fuzzy_match(static_cache, query)
+    async def compute() -> CompaniesSpecificCriteriaList:
+        async with db_manager.get_session() as _session:
+            query = CompanySearchQuery.from_request(request)
+            stmt = await companies_query_sub_string_match(static_cache, query)
+            total = 0
+
+            try:
                 db_organizations = (
                     (await _session.execute(stmt)).mappings().all()
                 )
 
-            count_stmt = select(func.count()).select_from(
-                stmt.limit(None).offset(None).subquery()
-            )
-            total = (await _session.execute(count_stmt)).scalar()
-        except SQLAlchemyError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={"error": f"Database error: {exc}"},
-            ) from exc
+                # if there are not matches for sub string match, then use fuzzy matching
+                if len(db_organizations) == 0:
+                    stmt = await companies_query_fuzzy_match(
+                        static_cache, query
+                    )
+                    db_organizations = (
+                        (await _session.execute(stmt)).mappings().all()
+                    )
 
-        organizations = (
-            [
-                get_validated_company_item(o, current_user)
-                for o in db_organizations
-            ]
-            if not query.free
-            else [
-                get_correct_company_item_type(
-                    {
-                        **get_company_item(o, current_user),
-                        "alias": o.get("aliases")[0],
-                        "is_alias_match": o.get("match_types")[0] == "alias",
-                    },
-                    current_user,
+                count_stmt = select(func.count()).select_from(
+                    stmt.limit(None).offset(None).subquery()
                 )
-                for o in db_organizations
-            ]
+                total = (await _session.execute(count_stmt)).scalar()
+            except SQLAlchemyError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail={"error": f"Database error: {exc}"},
+                ) from exc
+
+            organizations = (
+                [
+                    get_validated_company_item(o, current_user)
+                    for o in db_organizations
+                ]
+                if not query.free
+                else [
+                    get_correct_company_item_type(
+                        {
+                            **get_company_item(o, current_user),
+                            "alias": o.get("aliases")[0],
+                            "is_alias_match": o.get("match_types")[0]
+                            == "alias",
+                        },
+                        current_user,
+                    )
+                    for o in db_organizations
+                ]
+            )
+
+        page_size = min(len(db_organizations), query.limit)
+        response = CompaniesSpecificCriteriaList(
+            start=query.start,
+            end=query.start + page_size,
+            total=total or 0,
+            items=organizations,
         )
 
-    page_size = min(len(db_organizations), query.limit)
-    response = CompaniesSpecificCriteriaList(
-        start=query.start,
-        end=query.start + page_size,
-        total=total or 0,
-        items=organizations,
-    )
+        # add the response to the cache, before waiting callers read it
+        await cache.set(redis_key, orjson.dumps(jsonable_encoder(response)))
+        return response
 
-    # add the response to the cache
-    background_tasks.add_task(
-        cache.set, redis_key, orjson.dumps(jsonable_encoder(response))
-    )
+    # a single caller across workers queries a missing page
+    response = await single_flight.fill(cache, redis_key, compute, read_cached)
 
     return response
 
 
-@router.get("/download", response_class=FileResponse)
+@router.get(
+    "/download",
+    response_class=FileResponse,
+    dependencies=[Depends(route_limiters["companies_download"])],
+)
 async def download_companies(
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     jurisdiction: str | None = None,
     name: str | None = None,
     latest_reported_year: str | None = None,
@@ -770,7 +797,7 @@ async def get_most_recent_reporting_year(
     background_tasks: BackgroundTasks,
     cache: Cache,
     request: Request,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     static_cache: StaticCache,
 ):
     """
@@ -806,7 +833,7 @@ async def get_sources(
     background_tasks: BackgroundTasks,
     static_cache: StaticCache,
     cache: Cache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     request: Request,
     nz_id: int | None = None,
 ) -> DataSourcesResponse:
@@ -840,7 +867,7 @@ async def get_sources(
 @router.get("/jurisdictions", response_model=JurisdictionsResponse)
 async def get_jurisdictions(
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     request: Request,
     cache: Cache,
     background_tasks: BackgroundTasks,
@@ -872,7 +899,7 @@ async def get_jurisdictions(
 @router.get("/reporting-years", response_model=ReportingYearsResponse)
 async def get_reporting_years(
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     request: Request,
     cache: Cache,
     background_tasks: BackgroundTasks,
@@ -904,7 +931,7 @@ async def get_reporting_years(
 @router.get("/{nz_id}/reporting-years", response_model=ReportingYearsResponse)
 async def get_reporting_years_by_nz_id(
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     request: Request,
     cache: Cache,
@@ -941,7 +968,7 @@ async def get_reporting_years_by_nz_id(
 @router.get("/data-models", response_model=DataModelsResponse)
 async def get_data_models(
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     request: Request,
     cache: Cache,
     background_tasks: BackgroundTasks,
@@ -977,9 +1004,11 @@ async def get_data_models(
 
 @router.get("/{nz_id}/history", response_model=CompanyEmissions)
 async def get_company_emissions(
+    request: Request,
+    response: Response,
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     model: str | None = None,
     year_from: int | None = None,
@@ -1029,72 +1058,99 @@ async def get_company_emissions(
         result = await _session.execute(stmt)
         obj_ids = [row[0] for row in result]
 
-        # get result
-        aggregate_stmt = select(AggregatedObjectView).where(
-            AggregatedObjectView.obj_id.in_(obj_ids)
+        etag = await get_aggregates_etag(
+            _session, obj_ids, nz_id, model, year_from, year_to, source
         )
-        # keep the order of the obj_ids in aggregate query
-        for obj_id in obj_ids:
-            aggregate_stmt = aggregate_stmt.order_by(
-                text(f"obj_id={obj_id} DESC")
-            )
-        submission_objs = (await _session.scalars(aggregate_stmt)).all()
-        history = []
-        # submissions values must be gathered from different forms
-        # and sub-forms
-        for submission_obj in submission_objs:
-            # so for each submission we found, we query its forms
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+
+        async def load_history() -> list[dict]:
+            # get result
+            aggregate_stmt = select(AggregatedObjectView).where(
+                AggregatedObjectView.obj_id.in_(obj_ids)
+            )
+            # keep the order of the obj_ids in aggregate query
+            for obj_id in obj_ids:
+                aggregate_stmt = aggregate_stmt.order_by(
+                    text(f"obj_id={obj_id} DESC")
+                )
+            submission_objs = (await _session.scalars(aggregate_stmt)).all()
+            history = []
+            # submissions values must be gathered from different forms
             # and sub-forms
-            submission = submission_obj.data
-            if isinstance(submission, str):
-                submission = orjson.loads(submission)
-            submission_values = submission.get("values", {})
+            for submission_obj in submission_objs:
+                # so for each submission we found, we query its forms
+                # and sub-forms
+                submission = submission_obj.data
+                if isinstance(submission, str):
+                    submission = orjson.loads(submission)
+                submission_values = submission.get("values", {})
 
-            reporting_year = submission_values.get("reporting_year")
+                reporting_year = submission_values.get("reporting_year")
 
-            try:
-                orgs = await static_cache.organizations()
-                orgs[submission.get("nz_id", None)]
-            except KeyError as exc:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail={"nz_id": f"No company found for given{nz_id=!r}"},
-                ) from exc
+                try:
+                    orgs = await static_cache.organizations()
+                    orgs[submission.get("nz_id", None)]
+                except KeyError as exc:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail={
+                            "nz_id": f"No company found for given{nz_id=!r}"
+                        },
+                    ) from exc
 
-            restated_fields_data_source = (
-                await get_restated_fields_data_source(
-                    submission.get("name"), _session
+                restated_fields_data_source = (
+                    await get_restated_fields_data_source(
+                        submission.get("name"), _session
+                    )
                 )
-            )
-            submission_data = {
-                "id": submission.get("id"),
-                "nz_id": nz_id,
-                "name": submission.get("name"),
-                "lei": submission.get("lei"),
-                "user_id": submission.get("user_id"),
-                "submitted_by": submission.get("submitted_by"),
-                "table_view_id": submission.get("table_view_id"),
-                "permissions_set_id": submission.get("permission_set_id"),
-                "revision": submission.get("revision"),
-                "data_source": submission.get("data_source"),
-                "restated_fields_data_source": restated_fields_data_source,
-                "status": submission.get("status"),
-                "values": submission_values,
-                "units": submission.get("units"),
-            }
-            submission = SubmissionGet(**submission_data)
-            history.append(
-                {
-                    "reporting_year": reporting_year,
-                    "submission": submission,
+                submission_data = {
+                    "id": submission.get("id"),
+                    "nz_id": nz_id,
+                    "name": submission.get("name"),
+                    "lei": submission.get("lei"),
+                    "user_id": submission.get("user_id"),
+                    "submitted_by": submission.get("submitted_by"),
+                    "table_view_id": submission.get("table_view_id"),
+                    "permissions_set_id": submission.get("permission_set_id"),
+                    "revision": submission.get("revision"),
+                    "data_source": submission.get("data_source"),
+                    "restated_fields_data_source": restated_fields_data_source,
+                    "status": submission.get("status"),
+                    "values": submission_values,
+                    "units": submission.get("units"),
                 }
-            )
+                submission = SubmissionGet(**submission_data)
+                history.append(
+                    {
+                        "reporting_year": reporting_year,
+                        "submission": submission,
+                    }
+                )
+
+            history_service = HistoryService()
+            history_service.group_form_items(forms_group_by, history)
+            return history
 
-        history_service = HistoryService()
-        history_service.group_form_items(forms_group_by, history)
+        # concurrent requests for the same history share one load; its
+        # result is only read
+        history = await single_flight.run(
+            (
+                "company_emissions",
+                nz_id,
+                model,
+                year_from,
+                year_to,
+                source,
+                etag,
+            ),
+            load_history,
+        )
 
     logger.debug(f"Total time: {perf_counter() - s}")
 
+    if etag:
+        response.headers["ETag"] = etag
     return CompanyEmissions(
         **{
             "nz_id": nz_id,
@@ -1105,10 +1161,14 @@ async def get_company_emissions(
     )
 
 
-@router.get("/lei={lei}/history/download", response_class=FileResponse)
+@router.get(
+    "/lei={lei}/history/download",
+    response_class=FileResponse,
+    dependencies=[Depends(route_limiters["companies_download"])],
+)
 @track_api_usage(api_endpoint=TrackingUrls.COMPANIES_HISTORY.value)
 async def download_companies_history_by_lei(
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     lei: str,
     current_user=Depends(
         RoleAuthorizationForMultipleAuth(
@@ -1138,10 +1198,14 @@ async def download_companies_history_by_lei(
     )
 
 
-@router.get("/{nz_id}/history/download", response_class=FileResponse)
+@router.get(
+    "/{nz_id}/history/download",
+    response_class=FileResponse,
+    dependencies=[Depends(route_limiters["companies_download"])],
+)
 @track_api_usage(api_endpoint=TrackingUrls.COMPANIES_HISTORY.value)
 async def download_companies_history(
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     current_user=Depends(
         RoleAuthorizationForMultipleAuth(
@@ -1186,7 +1250,7 @@ async def download_companies_history(
 
 @router.get("/{nz_id}/disclosures", response_model=CompanyDisclosures)
 async def get_company_disclosures(
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     static_cache: StaticCache,
     nz_id: int,
     model: str | None = None,
@@ -1289,9 +1353,11 @@ async def get_company_disclosures(
     "/{nz_id}/disclosure-details", response_model=DisclosureDetailsResponse
 )
 async def get_disclosure_details(
+    request: Request,
+    response: Response,
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     year: int,
     model: str | None = None,
@@ -1365,6 +1431,13 @@ async def get_disclosure_details(
                 },
             )
 
+        # restatements of the disclosure live on its other revisions
+        etag = await get_aggregates_etag(
+            _session, all_obj_ids, active_obj_ids, model, source
+        )
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+
         loader = SubmissionLoader(_session, static_cache, cache)
 
         results: list[SubmissionGet] = [
@@ -1416,6 +1489,8 @@ async def get_disclosure_details(
             await get_restated_fields_data_source(submission.name, _session)
         )
 
+        if etag:
+            response.headers["ETag"] = etag
         return submission
 
 
@@ -1423,7 +1498,7 @@ async def get_disclosure_details(
 async def list_restatements(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     attribute: str,
     year: int,
@@ -1556,7 +1631,7 @@ async def list_restatements(
     "/{nz_id}/targets", tags=["companies"], response_model=TargetsResponse
 )
 async def get_targets(
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     static_cache: StaticCache,
     cache: Cache,
     background_tasks: BackgroundTasks,
@@ -1673,6 +1748,7 @@ async def get_targets(
         cache.set,
         redis_key,
         orjson.dumps(jsonable_encoder(final_result)),
+        tags=[cache.wis_keys.nz_id_tag(nz_id)],
     )
 
     return final_result
@@ -1686,7 +1762,7 @@ async def get_targets(
 async def get_targets_progress(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     model: str | None = None,
     year_start: int | None = None,
@@ -1768,7 +1844,6 @@ async def get_targets_progress(
                                 target_abs,
                                 submission.data_source,
                                 "tgt_abs_id_progress",
-                                _session,
                                 static_cache,
                                 last_updated,
                             )
@@ -1786,7 +1861,6 @@ async def get_targets_progress(
                                 target_int,
                                 submission.data_source,
                                 "tgt_int_id_progress",
-                                _session,
                                 static_cache,
                                 last_updated,
                             )
@@ -1821,7 +1895,7 @@ async def get_targets_progress(
 async def get_target_progress_by_id(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     background_tasks: BackgroundTasks,
     request: Request,
     nz_id: int,
@@ -1852,7 +1926,7 @@ async def get_target_progress_by_id(
             )
             return target_progress
         except ValidationError as err:  # the cache is invalid
-            background_tasks.add_task(cache.delete, redis_key)
+            background_tasks.add_task(cache.invalidate_keys, redis_key)
             logger.error(err)
     try:
         company_service = CompanyService(db_manager, static_cache)
@@ -1878,6 +1952,7 @@ async def get_target_progress_by_id(
         cache.set,
         redis_key,
         json.dumps(jsonable_encoder(target_progress_data)),
+        tags=[cache.wis_keys.nz_id_tag(nz_id)],
     )
     return target_progress_data
 
@@ -1890,7 +1965,7 @@ async def get_target_progress_by_id(
 async def get_targets_by_id(
     static_cache: StaticCache,
     cache: Cache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     tgt_id: str,
     data_source: str | None = None,
@@ -2016,7 +2091,7 @@ async def get_targets_by_id(
             )
             # format units and dynamic units
             full_data_units[key] = await format_units(
-                result_data, key, _session, static_cache
+                result_data, key, static_cache
             )
         # Create an instance of GetTargetById and set its attributes
         response_model = GetTargetById(
@@ -2091,7 +2166,7 @@ def build_validation_dict(
 async def get_target_validation_by_company(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     nz_id: int,
     tgt_id: str,
     data_source: str | None = None,
@@ -2321,7 +2396,10 @@ async def get_target_validation_by_company(
     response_model=CompanyRestatementsResponseModel,
 )
 async def get_restated_fields(
-    db_manager: DbManager, static_cache: StaticCache, nz_id: int, year: int
+    db_manager: DbFollowerManager,
+    static_cache: StaticCache,
+    nz_id: int,
+    year: int,
 ) -> CompanyRestatementsResponseModel:
     async with db_manager.get_session() as _session:
         form_table = await static_cache.get_form_table()
@@ -11,6 +11,7 @@ from starlette import status
 from app.db.models import AuthRole, Group, user_group
 from app.dependencies import DbManager, RoleAuthorization, oauth2_scheme
 from app.schemas import group as group_schema
+from app.service.principal_cache import principal_cache
 
 from .utils import (
     check_admin_access_rights,
@@ -233,6 +234,8 @@ async def update_group(
         # save updated group
         _session.add(db_group)
         await _session.commit()
+        # cached users embed their groups
+        await principal_cache.clear()
 
     return db_group
 
@@ -283,6 +286,7 @@ async def add_user_to_group(
                 user_group.insert().values(user_id=user_id, group_id=group_id)
             )
             await _session.commit()
+            await principal_cache.invalidate_user(user_id)
             return group_schema.UserGroupResponse(success=True)
         except IntegrityError as exc:
             raise HTTPException(
@@ -348,4 +352,5 @@ async def remove_user_from_group(
             )
 
         await _session.commit()
+        await principal_cache.invalidate_user(user_id)
     return group_schema.UserGroupResponse(success=True)
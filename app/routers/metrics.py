@@ -5,11 +5,24 @@ Metric endpoints
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import func, select
 
+from ..db.database import render_pool_metrics
 from ..db.models import AuthRole, User
-from ..dependencies import DbManager, RoleAuthorization
-from ..schemas.metrics import ActiveUsersMetricResponse
+from ..dependencies import Cache, DbManager, RoleAuthorization
+from ..instrumentation import runtime_metrics
+from ..schemas.metrics import (
+    ActiveUsersMetricResponse,
+    CacheMetricResponse,
+    ExecutorMetrics,
+    ExecutorsMetricResponse,
+    RouteLimiterMetrics,
+    RouteLimitersMetricResponse,
+)
+from ..service.executors import executors
+from ..service.route_limiter import route_limiters
+from ..service.single_flight import single_flight
 
 router = APIRouter(
     prefix="/metrics",
@@ -44,7 +57,9 @@ async def get_metrics(
 
     async with db_manager.get_session() as session:
         users = select(User)
-        total_query = select(func.count()).select_from(users)  # pylint: disable=not-callable
+        total_query = select(func.count()).select_from(
+            users
+        )  # pylint: disable=not-callable
         # pylint: disable=not-callable
         active_users_query = select(func.count()).select_from(
             users.filter(User.last_access >= lookup_period)
@@ -57,3 +72,148 @@ async def get_metrics(
             total=total_count_result.scalar_one(),
             days=days,
         )
+
+
+@router.get(
+    "/executors",
+    response_model=ExecutorsMetricResponse,
+    include_in_schema=False,
+)
+async def get_executors_metrics(
+    _=Depends(RoleAuthorization([AuthRole.ADMIN])),
+):
+    """
+    Retrieve queue depth and time spent by the CPU-bound work executors
+    of this worker process.
+
+    :return: dict
+        Executors metrics in the following format:
+        {
+            "executors": [
+                {
+                    "name": str,
+                    "waiting": int,
+                    "in_flight": int,
+                    "wait_seconds": float,
+                    "run_seconds": float,
+                    ...
+                }
+            ]
+        }
+    """
+    return ExecutorsMetricResponse(
+        executors=[
+            ExecutorMetrics(**executor.metrics()) for executor in executors
+        ]
+    )
+
+
+@router.get(
+    "/limiters",
+    response_model=RouteLimitersMetricResponse,
+    include_in_schema=False,
+)
+async def get_limiters_metrics(
+    _=Depends(RoleAuthorization([AuthRole.ADMIN])),
+):
+    """
+    Retrieve queue depth and rejected requests of the concurrency
+    limiters of heavy routes, in this worker process.
+
+    :return: dict
+        Limiters metrics in the following format:
+        {
+            "limiters": [
+                {
+                    "name": str,
+                    "waiting": int,
+                    "in_flight": int,
+                    "rejected_queue_full": int,
+                    "rejected_timeout": int,
+                    ...
+                }
+            ]
+        }
+    """
+    return RouteLimitersMetricResponse(
+        limiters=[
+            RouteLimiterMetrics(**limiter.metrics())
+            for limiter in route_limiters.values()
+        ]
+    )
+
+
+def _with_hit_ratio(counters: dict) -> dict:
+    lookups = counters["hits"] + counters["misses"]
+    return {
+        **counters,
+        "hit_ratio": counters["hits"] / lookups if lookups else 0.0,
+    }
+
+
+@router.get(
+    "/cache",
+    response_model=CacheMetricResponse,
+    include_in_schema=False,
+)
+async def get_cache_metrics(
+    cache: Cache,
+    _=Depends(RoleAuthorization([AuthRole.ADMIN])),
+):
+    """
+    Retrieve hits and misses of the in-process and Redis cache tiers of
+    this worker process, and how many computations of missing entries
+    were coalesced. Redis is only read on a miss of the in-process tier.
+
+    :return: dict
+        Cache metrics in the following format:
+        {
+            "local": {
+                "hits": int,
+                "misses": int,
+                "hit_ratio": float,
+                "entries": int,
+                "bytes": int
+            },
+            "redis": {
+                "hits": int,
+                "misses": int,
+                "hit_ratio": float
+            },
+            "single_flight": {
+                "in_flight": int,
+                "computed": int,
+                "coalesced": int,
+                "lease_waits": int
+            }
+        }
+    """
+    metrics = cache.metrics()
+    return CacheMetricResponse(
+        local=_with_hit_ratio(metrics["local"]),
+        redis=_with_hit_ratio(metrics["redis"]),
+        single_flight=single_flight.metrics(),
+    )
+
+
+@router.get(
+    "/runtime",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+)
+async def get_runtime_metrics(
+    _=Depends(RoleAuthorization([AuthRole.ADMIN])),
+):
+    """
+    Retrieve request counts and time spent on requests, DB queries and
+    cache reads, by route, since this worker process started, and the
+    saturation of the database connection pools.
+
+    :return: str
+        Metrics in the Prometheus text exposition format, e.g.:
+        nzdpu_db_queries_total{method="GET",route="/companies"} 42
+    """
+    return PlainTextResponse(
+        runtime_metrics.render() + render_pool_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -24,7 +24,7 @@ from app.schemas.user import (
     UserIdOnly,
     UserLoginDataModel,
 )
-from app.utils import encrypt_password
+from app.utils import encrypt_password_async
 
 from ..utils import (
     get_updated_user_name_if_same_with_mail,
@@ -125,7 +125,7 @@ async def register_user(
         # Commit user to retrieve its id.
         await _session.commit()
 
-        history_pass = encrypt_password(user.password)
+        history_pass = await encrypt_password_async(user.password)
         new_history_entry = PasswordHistory(
             user_id=new_user.id, encrypted_password=history_pass
         )
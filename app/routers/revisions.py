@@ -15,7 +15,6 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import (
-    AggregatedObjectView,
     AuthRole,
     Restatement,
     SubmissionObj,
@@ -35,7 +34,7 @@ from app.schemas.submission import (
 )
 from app.service.access_manager import AccessType
 from app.service.core.errors import SubmissionError
-from app.service.core.loaders import FormBatchLoader, SubmissionLoader
+from app.service.core.loaders import SubmissionLoader
 from app.service.core.managers import RevisionManager, SubmissionManager
 
 from .utils import (
@@ -44,7 +43,6 @@ from .utils import (
 )
 from ..loggers import get_nzdpu_logger
 from ..schemas.restatements import RestatementGetSimple
-from ..service.core.forms import FormValuesGetter
 from ..service.core.utils import strip_none
 
 logger = get_nzdpu_logger()
@@ -58,6 +56,18 @@ router = APIRouter(
 )
 
 
+def _revision_metadata(submission: SubmissionObj) -> tuple:
+    """
+    The fields of a revision flipped when another one is created.
+    """
+    return (
+        submission.active,
+        submission.checked_out,
+        submission.checked_out_on,
+        submission.user_id,
+    )
+
+
 @router.get("/{submission_name}", response_model=SubmissionRevisionList)
 async def list_revisions(
     cache: Cache,
@@ -412,6 +422,9 @@ async def create_submission_revision(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail={"global": SubmissionError.SUBMISSION_USER_CANT_EDIT},
             )
+        previous_metadata = {
+            sub.id: _revision_metadata(sub) for sub in all_revisions
+        }
         revision_manager = RevisionManager(
             session=_session,
             core_cache=static_cache,
@@ -448,76 +461,30 @@ async def create_submission_revision(
 
         await _session.flush(all_revisions)
 
-        submissions_full: dict[int, SubmissionObj | SubmissionGet] = {
-            sub.id: sub for sub in all_revisions
-        }
+        # only the new revision's values changed; of the previous ones,
+        # usually just the formerly active one had its metadata flipped
+        changed_revisions = [
+            sub
+            for sub in all_revisions[1:]
+            if _revision_metadata(sub) != previous_metadata[sub.id]
+        ]
 
         try:
-            for sub in submissions_full:
-                submission = SubmissionGet.model_validate(
-                    submissions_full.get(sub)
-                )
-                await cache.del_pattern(
-                    cache.wis_keys.submission + str(submission.id)
-                )
-
-                form_loader = FormBatchLoader(
-                    _session, static_cache, cache, submission.id
-                )
-                form_data = await form_loader.fetch_form_row_data()
-                primary_table_def = await form_loader.primary_form_table_def
-                form_manager = FormValuesGetter(
-                    static_cache,
-                    cache,
-                    form_rows=form_data,
-                    primary_form=primary_table_def,
-                )
-                (
-                    submission_values,
-                    submission_units,
-                ) = await form_manager.get_values()
-                submission.values = (
-                    submission_values[0] if submission_values else {}
-                )
-                submission.units = (
-                    submission_units[0] if submission_units else {}
-                )
-                submissions_full[sub] = submission
-
-            rel_aggregates = (
-                await _session.execute(
-                    select(
-                        AggregatedObjectView.obj_id, AggregatedObjectView
-                    ).where(
-                        AggregatedObjectView.obj_id.in_(
-                            rev.id for rev in all_revisions
-                        )
-                    )
-                )
-            ).all()
+            for sub in [updated_submission, *changed_revisions]:
+                await cache.invalidate_submission(sub.id, sub.nz_id)
 
-            aggregates_map = dict(
-                kv for kv in (r._tuple() for r in rel_aggregates)
+            aggregate = await revision_manager.save_aggregate(
+                updated_submission.id,
+                SubmissionGet.model_validate(updated_submission).model_dump(
+                    mode="json"
+                ),
+            )
+            await revision_manager.patch_aggregate_metadata(
+                changed_revisions, flush=True
             )
-            for sub_id, sub in submissions_full.items():
-                new_data = sub.model_dump(mode="json")
-                if aggregates_map.get(sub_id, False):
-                    aggregates_map[sub_id].data = new_data
-                else:
-                    aggregates_map[sub_id] = AggregatedObjectView(
-                        obj_id=sub_id,
-                        data=submissions_full.get(sub_id).model_dump(
-                            mode="json"
-                        ),
-                    )
-                _session.add(aggregates_map[sub_id])
-
-            await _session.flush(aggregates_map.values())
             await _session.commit()
 
-            last_sub = SubmissionGet.model_validate(
-                aggregates_map.get(updated_submission.id).data
-            )
+            last_sub = SubmissionGet.model_validate(aggregate.data)
             last_sub.values = strip_none(last_sub.values)  # type: ignore
             return last_sub.model_dump(mode="json")
 
@@ -573,8 +540,6 @@ async def set_edit_mode(
             .order_by(SubmissionObj.revision.desc())
         )
         submission: SubmissionObj = await _session.scalar(stmt)
-        loader = SubmissionLoader(_session, static_cache, cache)
-        manager = SubmissionManager(_session, static_cache, cache)
         # check if already checked out
         if submission is None:
             raise HTTPException(
@@ -586,8 +551,7 @@ async def set_edit_mode(
                 },
             )
         # invalidate cache for this submission
-        redis_key = cache.wis_keys.submission + str(submission.id)
-        await cache.del_pattern(redis_key)
+        await cache.invalidate_submission(submission.id, submission.nz_id)
         if submission.checked_out:
             if not force:  # revision checked out and force set to False
                 raise HTTPException(
@@ -620,18 +584,20 @@ async def set_edit_mode(
         await _session.commit()
 
     async with db_manager.get_session() as _session:
-        updated_submission = await loader.load(submission.id, db_only=True)
+        manager = SubmissionManager(_session, static_cache, cache)
         try:
-            await manager.save_aggregate(
-                submission.id,
-                updated_submission.model_dump(mode="json"),
-                commit=True,
+            # values did not change, only the checkout fields
+            aggregates = await manager.patch_aggregate_metadata(
+                [submission], commit=True
             )
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={"error": e},
             ) from e
+        updated_submission = SubmissionGet.model_validate(
+            aggregates[submission.id].data
+        )
 
     return updated_submission.model_dump(mode="json")
 
@@ -713,14 +679,8 @@ async def clear_edit_mode(
         await _session.commit()
 
         async with db_manager.get_session() as _session:
-            loader = SubmissionLoader(_session, static_cache, cache)
             manager = SubmissionManager(_session, static_cache, cache)
-            await manager.save_aggregate(
-                submission.id,
-                (await loader.load(submission.id, db_only=True)).model_dump(
-                    mode="json"
-                ),
-            )
+            await manager.patch_aggregate_metadata([submission], commit=True)
 
         return submission
 
@@ -767,9 +727,6 @@ async def rollback_submission(
         rollback_active_submission = None
 
         async for submission in all_submissions:
-            # invalidate cache for this submission
-            redis_key = cache.wis_keys.submission + str(submission.id)
-            background_tasks.add_task(cache.del_pattern, redis_key)
             if submission.active and not active_submission:
                 active_submission = submission
             elif (
@@ -807,16 +764,17 @@ async def rollback_submission(
                 },
             )
 
+    # only the active flag of the two revisions changed
+    for submission in [active_submission, rollback_active_submission]:
+        # invalidate cache for this submission
+        background_tasks.add_task(
+            cache.invalidate_submission, submission.id, submission.nz_id
+        )
     async with db_manager.get_session() as _session:
-        loader = SubmissionLoader(_session, static_cache, cache)
         manager = SubmissionManager(_session, static_cache, cache)
-        for submission in [active_submission, rollback_active_submission]:
-            await manager.save_aggregate(
-                submission.id,
-                (await loader.load(submission.id, db_only=True)).model_dump(
-                    mode="json"
-                ),
-            )
+        await manager.patch_aggregate_metadata(
+            [active_submission, rollback_active_submission], commit=True
+        )
 
     response = SubmissionRollback(
         active_id=(
@@ -898,8 +856,9 @@ async def save_submission_draft(
         )
 
         # invalidate cache for this submission
-        redis_key = cache.wis_keys.submission + str(last_revision.id)
-        background_tasks.add_task(cache.del_pattern, redis_key)
+        background_tasks.add_task(
+            cache.invalidate_submission, last_revision.id, last_revision.nz_id
+        )
 
         revision_manager = RevisionManager(
             session=_session,
@@ -998,8 +957,9 @@ async def publish_submission_draft(
             )
 
         # invalidate cache for this submission
-        redis_key = cache.wis_keys.submission + str(last_revision.id)
-        background_tasks.add_task(cache.del_pattern, redis_key)
+        background_tasks.add_task(
+            cache.invalidate_submission, last_revision.id, last_revision.nz_id
+        )
 
         last_revision.status = SubmissionObjStatusEnum.PUBLISHED
         _session.add(last_revision)
@@ -1023,14 +983,9 @@ async def publish_submission_draft(
             )
 
         response.restatements = restatements
-        loader = SubmissionLoader(_session, static_cache, cache)
+        # the draft's values are already aggregated, only its status
+        # changed
         manager = SubmissionManager(_session, static_cache, cache)
-        await manager.save_aggregate(
-            last_revision.id,
-            (await loader.load(last_revision.id, db_only=True)).model_dump(
-                mode="json"
-            ),
-            commit=True,
-        )
+        await manager.patch_aggregate_metadata([last_revision], commit=True)
 
         return response
@@ -24,7 +24,7 @@ from ..db.models import (
 )
 from ..dependencies import (
     Cache,
-    DbManager,
+    DbFollowerManager,
     RoleAuthorizationForMultipleAuth,
     StaticCache,
 )
@@ -36,6 +36,8 @@ from ..schemas.search import (
 )
 from ..schemas.tracking import TrackingUrls
 from ..service.exports.search_download import SearchExportManager
+from ..service.read_your_writes import read_only_route
+from ..service.route_limiter import route_limiters
 from .utils import (
     ErrorMessage,
     check_fields_limit,
@@ -52,11 +54,18 @@ router = APIRouter(
 )
 
 
-@router.post("", response_model=SearchResponse)
+@router.post(
+    "",
+    response_model=SearchResponse,
+    dependencies=[
+        Depends(route_limiters["search"]),
+        Depends(read_only_route),
+    ],
+)
 async def search(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     query: SearchQuery,
     view_id: int,
     start: int = 0,
@@ -120,12 +129,16 @@ async def search(
 @router.post(
     "/download",
     response_model=None,  # This is done because FileResponse is not a pydantic model and we can't use Union to both FileResponse and DownloadExceedResponse
+    dependencies=[
+        Depends(route_limiters["search_download"]),
+        Depends(read_only_route),
+    ],
 )
 @track_api_usage(api_endpoint=TrackingUrls.SEARCH_DOWNLOAD.value)
 async def download(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     query: SearchQuery,
     view_id: int,
     current_user: User = Depends(
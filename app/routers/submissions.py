@@ -1,9 +1,20 @@
 """Submissions router."""
 
 from time import perf_counter
-
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from sqlalchemy import column, delete, func, select, table
+from typing import Annotated
+
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import column, delete, select, table
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db.models import (
@@ -19,6 +30,7 @@ from app.db.models import (
 )
 from app.dependencies import (
     Cache,
+    DbFollowerManager,
     DbManager,
     RoleAuthorization,
     StaticCache,
@@ -26,6 +38,7 @@ from app.dependencies import (
 )
 from app.schemas.submission import (
     AggregatedValidationResponse,
+    BulkSubmissionResponse,
     LatestReportingYearResponse,
     SubmissionCreate,
     SubmissionDelete,
@@ -36,10 +49,14 @@ from app.schemas.submission import (
 from app.service.access_manager import AccessManager, AccessType
 from app.service.core.errors import SubmissionError
 from app.service.core.loaders import SubmissionLoader
-from app.service.core.managers import SubmissionManager
-from app.service.core.utils import strip_none
+from app.service.core.managers import (
+    BulkSubmissionManager,
+    SubmissionManager,
+)
+from app.service.core.utils import iter_ndjson, strip_none
 from app.service.core.validator import AggregatedObjectViewValidator
 from app.service.organization_service import OrganizationService
+from app.service.route_limiter import route_limiters
 from app.service.validator_service import ValidatorService
 
 from ..forms.form_meta import FormMeta
@@ -48,6 +65,10 @@ from ..utils import reflect_form_table
 from .utils import (
     ErrorMessage,
     check_access_rights,
+    etag_matches,
+    get_aggregates_etag,
+    get_submissions_total,
+    not_modified_response,
     update_user_data_last_accessed,
 )
 
@@ -73,7 +94,7 @@ router = APIRouter(
 async def validate_aggregated(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     offset: int = 0,
     limit: int = 10,
     _: User = Depends(
@@ -92,21 +113,34 @@ async def validate_aggregated(
         return await validator.validate_all(offset=offset, limit=limit)
 
 
-@router.get("", response_model=SubmissionList)
+@router.get(
+    "",
+    response_model=SubmissionList,
+    dependencies=[Depends(route_limiters["submissions"])],
+)
 async def list_submissions(
     cache: Cache,
     static_cache: StaticCache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     start: int = 0,
-    limit: int = 100,
+    limit: Annotated[int, Query(gt=0, le=1000)] = 100,
+    cursor: int | None = None,
     current_user: User = Depends(get_current_user_or_none),
 ):
     """
-    Return the list of all submissions.
+    Return the list of all submissions, ordered by ID.
+
+    Parameters
+    ----------
+        start - offset of the page, ignored if a cursor is given
+        limit - size of the page
+        cursor - ID of the last submission of the previous page, as
+            returned in `next_cursor`
 
     Returns
     -------
-        dict with start, end, total and items keys
+        dict with start, end, total, next_cursor and items keys; total
+        is cached for a short time and may lag behind
     """
     s = perf_counter()
     async with db_manager.get_session() as _session:
@@ -117,31 +151,46 @@ async def list_submissions(
             )
 
     async with db_manager.get_session() as _session:
-        # init data structure
+        # the whole page with its aggregates, in one query
+        stmt = (
+            select(SubmissionObj.id, AggregatedObjectView.data)
+            .outerjoin(
+                AggregatedObjectView,
+                AggregatedObjectView.obj_id == SubmissionObj.id,
+            )
+            .order_by(SubmissionObj.id)
+            .limit(limit)
+        )
+        if cursor is not None:
+            stmt = stmt.where(SubmissionObj.id > cursor)
+        else:
+            stmt = stmt.offset(start)
+        rows = (await _session.execute(stmt)).all()
+
         submission_loader = SubmissionLoader(_session, static_cache, cache)
         submissions: list[SubmissionGet] = []
-        # submissions values must be gathered from different
-        #  forms and sub-forms
-        async for submission in await _session.stream_scalars(
-            select(SubmissionObj).offset(start).limit(limit)
-        ):
-            # so for each submission we found, we query its forms
-            #  and sub-forms
-            submissions.append(
-                await submission_loader.load(submission.id, use_aggregate=True)
-            )
+        for submission_id, data in rows:
+            if isinstance(data, str):
+                data = orjson.loads(data)
+            if data:
+                submissions.append(SubmissionGet(**data))
+            else:
+                # no aggregate yet: assemble from forms and sub-forms
+                submissions.append(
+                    await submission_loader.load(
+                        submission_id, use_aggregate=True
+                    )
+                )
 
-        # Get total number of records
-        total_stmt = select(func.count()).select_from(SubmissionObj)
-        total_result = await _session.execute(total_stmt)
-        total = total_result.scalar_one()
+        total = await get_submissions_total(_session, cache)
     for submission in submissions:
         submission.values = strip_none(submission.values)
 
     response = {
-        "start": start,
-        "end": start + len(submissions),
+        "start": start if cursor is None else None,
+        "end": start + len(submissions) if cursor is None else None,
         "total": total,
+        "next_cursor": rows[-1][0] if len(rows) == limit else None,
         "items": submissions,
     }
 
@@ -156,7 +205,7 @@ async def list_submissions(
 async def get_submission_by_lei(
     lei: str,
     reported_year: int,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     static_cache: StaticCache,
     cache: Cache,
     current_user: User = Depends(
@@ -205,9 +254,11 @@ async def get_submission_by_lei(
 @router.get("/{submission_id}", response_model=SubmissionGet)
 async def get_submission(
     submission_id: int,
+    request: Request,
+    response: Response,
     static_cache: StaticCache,
     cache: Cache,
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     current_user: User = Depends(
         RoleAuthorization(
             [
@@ -242,6 +293,10 @@ async def get_submission(
     logger.debug(f"Time elapsed before submission load: {perf_counter() - s}")
     sl = perf_counter()
     async with db_manager.get_session() as _session:
+        # revalidation only needs the aggregate's content hash
+        etag = await get_aggregates_etag(_session, [submission_id])
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
         submission_loader = SubmissionLoader(_session, static_cache, cache)
         submission = await submission_loader.load(
             submission_id, use_aggregate=True
@@ -264,6 +319,8 @@ async def get_submission(
         "values": submission.values,
     }
     submission = SubmissionGet(**submission_data)
+    if etag:
+        response.headers["ETag"] = etag
     logger.debug(f"Execution time: {perf_counter() - s}")
     return submission
 
@@ -328,6 +385,7 @@ async def delete_submission(
             # Delete records from the associated form tables for each submission_obj
             for submission_obj in submission_objs:
                 obj_id = submission_obj.id
+                nz_id = submission_obj.nz_id
                 for form_name in all_names:
                     form_table = table(form_name)
                     delete_stmt = delete(form_table).where(
@@ -342,9 +400,7 @@ async def delete_submission(
                 deleted_revisions += (
                     1  # Increment the counter for each deleted revision
                 )
-                await cache.del_pattern(
-                    cache.wis_keys.submission + str(obj_id)
-                )
+                await cache.invalidate_submission(obj_id, nz_id)
             await _session.commit()
 
         except Exception as e:
@@ -593,8 +649,8 @@ async def create_submission(
             )
 
             # delete cache for this submission
-            await cache.del_pattern(
-                cache.wis_keys.submission + str(submission_obj.id)
+            await cache.invalidate_submission(
+                submission_obj.id, submission_obj.nz_id
             )
 
             submission_loaded = await submission_loader.load(
@@ -646,6 +702,55 @@ async def create_submission(
         ) from e
 
 
+@router.post("/bulk", response_model=BulkSubmissionResponse)
+async def create_submissions_bulk(
+    request: Request,
+    static_cache: StaticCache,
+    cache: Cache,
+    db_manager: DbManager,
+    batch_size: Annotated[int, Query(gt=0, le=1000)] = 50,
+    current_user: User = Depends(
+        RoleAuthorization(
+            [AuthRole.DATA_PUBLISHER, AuthRole.ADMIN, AuthRole.SCHEMA_EDITOR]
+        )
+    ),
+):
+    """
+    Creates submissions from a newline-delimited JSON body, one
+    submission payload per line
+
+    Parameters
+    ----------
+        batch_size - number of rows validated and stored in a single
+            transaction
+
+    Returns
+    -------
+        the status of every row of the body
+    """
+    async with db_manager.get_session() as _session:
+        # Update user.data_last_accessed for keeping track of inactivity
+        await update_user_data_last_accessed(
+            session=_session, current_user=current_user
+        )
+        bulk_manager = BulkSubmissionManager(
+            _session,
+            static_cache,
+            cache,
+            current_user=current_user,
+            batch_size=batch_size,
+        )
+        response = await bulk_manager.ingest(iter_ndjson(request.stream()))
+
+    logger.info(
+        "Bulk submissions ingest",
+        total=response.total,
+        created=response.created,
+        failed=response.failed,
+    )
+    return response
+
+
 @router.patch("/{submission_id}", response_model=SubmissionGet)
 async def update_submission(
     submission_id: int,
@@ -717,7 +822,7 @@ async def update_submission(
     response_model=LatestReportingYearResponse,
 )
 async def get_latest_reporting_year(
-    db_manager: DbManager,
+    db_manager: DbFollowerManager,
     current_user: User = Depends(
         RoleAuthorization(
             [
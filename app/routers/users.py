@@ -44,6 +44,7 @@ from app.dependencies import (
 )
 from app.routers.utils import is_valid_password, update_user_data_last_accessed
 from app.schemas import user as user_schema
+from app.service.principal_cache import principal_cache
 from app.service.user_service import UserService
 
 from ..loggers import get_nzdpu_logger
@@ -52,7 +53,7 @@ from ..schemas.user import (
     UserDeleteResponse,
     UserListResponse,
 )
-from ..utils import check_password, encrypt_password
+from ..utils import check_password_async, encrypt_password_async
 from .utils import (
     ErrorMessage,
     check_admin_access_rights,
@@ -177,7 +178,7 @@ async def update_user_password(
     """
     if db_user.auth_mode == AuthMode.LOCAL:
         # check current password matches with stored hash
-        if not check_password(
+        if not await check_password_async(
             pwd=current_password, hashed_pwd=db_user.password
         ):
             raise HTTPException(
@@ -187,7 +188,9 @@ async def update_user_password(
                 },
             )
         # hash new password
-        new_hashed_pass = encrypt_password(new_password.get_secret_value())
+        new_hashed_pass = await encrypt_password_async(
+            new_password.get_secret_value()
+        )
         # save new hashed password to user db
         db_user.password = new_hashed_pass
     elif db_user.auth_mode == AuthMode.FIREBASE:
@@ -540,6 +543,7 @@ async def revoke_access_key(
 
             _session.add(db_user)
             await _session.commit()
+            await principal_cache.invalidate_user(db_user.id)
         api_key_str = "" if db_user.api_key is None else db_user.api_key
     return user_schema.UserApiKeyUpdate(access_key=api_key_str)
 
@@ -580,6 +584,7 @@ async def notifications_signup(
         db_user.notifications = True
         _session.add(db_user)
         await _session.commit()
+        await principal_cache.invalidate_user(db_user.id)
         return NotificationSignupResponse(
             user_id=db_user.id, notifications=db_user.notifications
         )
@@ -640,6 +645,7 @@ async def revoke_notifications_signup(
         _session.add(db_user)
         # commit changes
         await _session.commit()
+        await principal_cache.invalidate_user(db_user.id)
         return NotificationSignupResponse(
             user_id=db_user.id, notifications=db_user.notifications
         )
@@ -888,7 +894,7 @@ async def create_user(
                 # assign role to user
                 new_user.groups.append(group)
         new_user.auth_mode = AuthMode.FIREBASE
-        history_pass = encrypt_password(str(new_user.password))
+        history_pass = await encrypt_password_async(str(new_user.password))
         # we don't need storing password for Firebase users
         new_user.password = None
         _session.add(new_user)
@@ -983,7 +989,7 @@ async def update_current_user(
         # check current password matches with stored hash
 
         if user_data.current_password is not None:
-            if not check_password(
+            if not await check_password_async(
                 pwd=user_data.current_password, hashed_pwd=db_user.password
             ):
                 raise HTTPException(
@@ -1077,6 +1083,7 @@ async def update_current_user(
     async with db_manager.get_session() as _session:
         _session.add(db_user)
         await _session.commit()
+        await principal_cache.invalidate_user(db_user.id)
         if db_user.organization_id:
             # load linked company to set lei in response
             organization = await _session.scalar(
@@ -1164,7 +1171,7 @@ async def update_user(
         # check current password matches with stored hash
 
         if user_data.current_password is not None:
-            if not check_password(
+            if not await check_password_async(
                 pwd=user_data.current_password, hashed_pwd=db_user.password
             ):
                 raise HTTPException(
@@ -1258,6 +1265,7 @@ async def update_user(
     async with db_manager.get_session() as _session:
         _session.add(db_user)
         await _session.commit()
+        await principal_cache.invalidate_user(db_user.id)
         if db_user.organization_id:
             # load linked company to set lei in response
             organization = await _session.scalar(
@@ -1444,6 +1452,7 @@ async def vanish_from_existence(
         # Update the user in the database
         _session.add(db_user)
         await _session.commit()
+        await principal_cache.invalidate_user(db_user.id)
         # Return the updated deleted user info
         response_data: dict[str, int | bool] = {
             "id": db_user.id,
@@ -1512,6 +1521,7 @@ async def delete_user(
         # Update the user in the database
         _session.add(db_user)
         await _session.commit()
+        await principal_cache.invalidate_user(db_user.id)
         # Return the updated deleted user info
         response_data: dict[str, int | bool] = {
             "id": db_user.id,
@@ -1613,6 +1623,7 @@ async def admin_grant(
             user = set_user_group(user, admin_group)
             _session.add(user)
             await _session.commit()
+            await principal_cache.invalidate_user(user.id)
             updated_user_ids.append(user.id)
 
         else:
@@ -1656,6 +1667,7 @@ async def admin_revoke(
                     .values(group_id=3)
                 )
                 await _session.commit()
+                await principal_cache.invalidate_user(us_id)
 
             else:
                 raise HTTPException(
@@ -5,18 +5,20 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from functools import wraps
-from typing import Any
+from typing import Any, Iterable
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from unidecode import unidecode
 
-from app.service.core.cache import CoreMemoryCache
+from app import settings
+from app.db.redis import RedisClient
 from app.service.core.loaders import SubmissionLoader
 
 from ..db.models import (
+    AggregatedObjectView,
     Choice,
     ColumnDef,
     ColumnView,
@@ -30,10 +32,9 @@ from ..db.models import (
     SubmissionObj,
     TableDef,
     TableView,
-    Tracking,
     User,
 )
-from ..dependencies import DbManager, get_current_user
+from ..dependencies import get_current_user
 from ..forms.form_meta import FormMeta
 from ..loggers import get_nzdpu_logger
 from ..schemas.restatements import (
@@ -43,8 +44,14 @@ from ..schemas.restatements import (
 )
 from ..schemas.tracking import TrackingCreate, TrackingUrls
 from ..service.access_manager import AccessManager
-from ..service.utils import format_units, load_column_units
-from ..utils import check_password, encrypt_password, reflect_form_table
+from ..service.core.utils import content_hash
+from ..service.principal_cache import last_access_recorder
+from ..service.usage_tracker import usage_tracker
+from ..service.utils import format_units
+from ..utils import (
+    check_password_async,
+    encrypt_password_async,
+)
 
 logger = get_nzdpu_logger()
 
@@ -206,166 +213,6 @@ async def get_value_from_computed_units(attribute: str, computed_units: dict):
     return None
 
 
-async def process_other_unit(
-    sub_form: str,
-    obj_id: int,
-    field_id: int,
-    field: str,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
-):
-    """
-    Given params, returns the corresponding record from the
-    DB.
-
-    Parameters
-    ----------
-        sub_form - sub-form from field
-        comparison - field for comparison of sub form
-        field - field of sub form
-        where - field for select where
-
-    Returns
-    -------
-        choice value from unit
-    """
-    sub_form_field_other = await reflect_form_table(
-        session, f"{sub_form}.{field}_other"
-    )
-    sub_form_table = await static_cache.get_form_table(sub_form)
-    sql_select_query = select(sub_form_field_other).where(
-        sub_form_table.c.obj_id == obj_id, sub_form_table.c.id == field_id
-    )
-
-    query_select_form = await session.execute(sql_select_query)
-    dynamic_units = query_select_form.scalars().first()
-    unit = (
-        await get_choice_value(dynamic_units, session, static_cache)
-        if isinstance(dynamic_units, int)
-        else dynamic_units
-    )
-    return unit
-
-
-async def load_dynamic_units(
-    obj_id: int,
-    field_id: int,
-    field: str,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
-) -> str | None:
-    """
-    Given sub_form and id, returns the corresponding record from the
-    DB.
-
-    Parameters
-    ----------
-        comparison - field for comparison of sub form
-        field - field of sub form
-        where - field for select where
-
-    Returns
-    -------
-        choice value from unit
-    """
-    not_computed_unit = None
-    if not field.endswith("}"):
-        if "/" in field:
-            not_computed_unit = field.rsplit("}")[-1]
-            field = field.replace(not_computed_unit, "")
-        else:
-            not_computed_unit = field.rsplit("}")[-1]
-            field = field.rsplit(" ")[0]
-    pattern = r"\{([^\}]+)\}"
-
-    field_names = re.findall(pattern, field)
-
-    if len(field_names) == 1:
-        column_defs = await static_cache.column_defs_by_name()
-        result = column_defs.get(field[1:-1])
-        sub_form = result.table_def.name
-        if sub_form is not None and sub_form != "nzdpu_form":
-            sub_form += "_heritable"
-        sub_form_table = await static_cache.get_form_table(sub_form)
-        sql_query = select(getattr(sub_form_table.c, field[1:-1])).where(
-            sub_form_table.c.obj_id == obj_id,
-        )
-        if sub_form != "nzdpu_form":
-            sql_query = sql_query.where(sub_form_table.c.id == field_id)
-        query_select_form = await session.execute(sql_query)
-        dynamic_units = query_select_form.scalars().first()
-        if dynamic_units is None:
-            sql_query = select(getattr(sub_form_table.c, field[1:-1])).where(
-                sub_form_table.c.obj_id == obj_id,
-            )
-            query_select_form = await session.execute(sql_query)
-            dynamic_units = query_select_form.scalars().first()
-        unit = (
-            await get_choice_value(dynamic_units, session, static_cache)
-            if isinstance(dynamic_units, int)
-            else dynamic_units
-        )
-        if unit == "Other not listed":
-            unit = await process_other_unit(
-                sub_form, obj_id, field_id, field[1:-1], session, static_cache
-            )
-        if not_computed_unit and isinstance(unit, str):
-            unit += not_computed_unit
-        return unit
-    else:
-        unit_list = []
-        for f in field_names:
-            result = await session.execute(
-                select(TableDef.name)
-                .join(ColumnDef, ColumnDef.table_def_id == TableDef.id)
-                .filter(ColumnDef.name == f)
-            )
-            sub_form = result.scalars().first()
-            if sub_form is not None and sub_form != "nzdpu_form":
-                sub_form += "_heritable"
-            sub_form_table = await reflect_form_table(session, sub_form)
-            sql_query = select(getattr(sub_form_table.c, f)).where(
-                sub_form_table.c.obj_id == obj_id,
-            )
-            if sub_form != "nzdpu_form":
-                sql_query = sql_query.where(sub_form_table.c.id == field_id)
-            query_select_form = await session.execute(sql_query)
-
-            dynamic_units = query_select_form.scalars().first()
-            if dynamic_units is None:
-                sql_select_query = select(getattr(sub_form_table.c, f)).where(
-                    sub_form_table.c.obj_id == obj_id
-                )
-                query_select_form = await session.execute(sql_select_query)
-                dynamic_units = query_select_form.scalars().first()
-            unit = (
-                await get_choice_value(dynamic_units, session, static_cache)
-                if isinstance(dynamic_units, int)
-                else dynamic_units
-            )
-            if unit == "Other not listed":
-                unit = await process_other_unit(
-                    sub_form, obj_id, field_id, f, session, static_cache
-                )
-            unit_list.append(str(unit))
-        if len(field_names) == 3:
-            unit_res = (
-                " / ".join(unit_list[:2]) + " " + " ".join(unit_list[2:])
-            )
-        else:
-            if "/" in field:
-                unit_res = " / ".join(unit_list)
-            else:
-                unit_res = " ".join(unit_list)
-        if not_computed_unit:
-            unit_res += not_computed_unit
-        if "None / None" in unit_res:
-            unit_res = unit_res.replace("None / None", "").strip()
-            if unit_res == "":
-                return None
-        return unit_res
-
-
 async def load_choice_values_from_set_id(
     set_id, session: AsyncSession
 ) -> list[str]:
@@ -729,14 +576,17 @@ async def update_user_data_last_accessed(
 ):
     """
     Updates current user's "data_last_accessed" obj
+    The write is deferred to the next batched flush of
+    `last_access_recorder`, so `session` is left untouched.
     :param current_user: current user
     :return: the updated current user
     """
     if current_user is None:
         return None
     current_user.data_last_accessed = datetime.now()
-    session.add(current_user)
-    await session.commit()
+    last_access_recorder.record(
+        current_user.id, current_user.data_last_accessed
+    )
     return current_user.data_last_accessed
 
 
@@ -918,7 +768,9 @@ async def check_password_history(
 
     # Check if the new password matches any of the recent passwords.
     for history_entry in password_history_list:
-        if check_password(new_password, history_entry.encrypted_password):
+        if await check_password_async(
+            new_password, history_entry.encrypted_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -946,7 +798,7 @@ async def update_password_history(
         )
         await session.delete(oldest_password_entry)
     # hash new password
-    new_hashed_pass = encrypt_password(new_password)
+    new_hashed_pass = await encrypt_password_async(new_password)
     # Add the new password to the history
     new_history_entry = PasswordHistory(
         user_id=user_id, encrypted_password=new_hashed_pass
@@ -982,122 +834,6 @@ def names_of_matched(obj, name):
     return None
 
 
-async def transform_computed_units(
-    original, session, static_cache, value_transformer=lambda x: x
-):
-    """
-    Recursively process a dictionary to create a new one with specific modifications:
-    - Exclude certain keys (like id, obj_id, value_id, and keys ending with 'prompt')
-    - Apply a transformation function to the values (default is to keep them unchanged)
-    :param original: The original dictionary to be processed
-    :param session: Session
-    :param value_transformer: A function to apply to each value
-    :return: A new dictionary with the specified modifications
-    """
-    if isinstance(original, dict):
-        new_dict = {}
-        key_id = original.get("id", None)
-        key_obj_id = original.get("obj_id", None)
-        for key, value in original.items():
-            if not key.endswith("prompt") and key not in [
-                "id",
-                "obj_id",
-                "value_id",
-            ]:
-                if isinstance(value, list):
-                    transformed_list = [
-                        await transform_computed_units(
-                            item, session=session, static_cache=static_cache
-                        )
-                        for item in value
-                        if not isinstance(item, int)
-                    ]
-                    if transformed_list and not all(
-                        isinstance(item, int) for item in transformed_list
-                    ):
-                        if all(
-                            isinstance(item, str) for item in transformed_list
-                        ):
-                            v_unit = await load_column_units(
-                                key, session, static_cache
-                            )
-                            units = None
-                            if v_unit and isinstance(v_unit, list):
-                                try:
-                                    first_item = v_unit[0]
-                                    if "actions" in first_item and isinstance(
-                                        first_item["actions"], list
-                                    ):
-                                        first_action = first_item["actions"][0]
-                                        if (
-                                            "set" in first_action
-                                            and isinstance(
-                                                first_action["set"], dict
-                                            )
-                                        ):
-                                            if "units" in first_action["set"]:
-                                                units = first_action["set"][
-                                                    "units"
-                                                ]
-                                                if units.startswith("{"):
-                                                    units = await load_dynamic_units(
-                                                        key_obj_id,
-                                                        key_id,
-                                                        units,
-                                                        session,
-                                                        static_cache,
-                                                    )
-                                except (IndexError, KeyError):
-                                    pass
-                            new_dict[key] = units
-                        else:
-                            new_dict[key] = transformed_list
-                elif isinstance(value, dict):
-                    transformed_dict = await transform_computed_units(
-                        value, session=session, static_cache=static_cache
-                    )
-                    if transformed_dict:
-                        new_dict[key] = transformed_dict
-                else:
-                    v_unit = await load_column_units(
-                        key, session, static_cache
-                    )
-                    units = None
-                    if v_unit and isinstance(v_unit, list):
-                        try:
-                            first_item = v_unit[0]
-                            if "actions" in first_item and isinstance(
-                                first_item["actions"], list
-                            ):
-                                first_action = first_item["actions"][0]
-                                if "set" in first_action and isinstance(
-                                    first_action["set"], dict
-                                ):
-                                    if "units" in first_action["set"]:
-                                        units = first_action["set"]["units"]
-                                        if units.startswith("{"):
-                                            units = await load_dynamic_units(
-                                                key_obj_id,
-                                                key_id,
-                                                units,
-                                                session,
-                                                static_cache,
-                                            )
-                        except (IndexError, KeyError):
-                            pass
-                    new_dict[key] = units
-        return new_dict
-    if isinstance(original, list):
-        return [
-            await transform_computed_units(
-                item, session=session, static_cache=static_cache
-            )
-            for item in original
-            if not isinstance(item, int)
-        ]
-    return value_transformer(original)
-
-
 async def get_restated_fields_data_source(
     submission_name: str, session: AsyncSession
 ) -> dict[str, int]:
@@ -1251,7 +987,6 @@ async def process_target_progress_categories(
     progres_values,
     data_source,
     target_key,
-    session,
     static_cache,
     last_updated=None,
     attribute_name_last_update_dict=None,
@@ -1298,7 +1033,7 @@ async def process_target_progress_categories(
                     else v
                 )
                 progress_dict_units[k] = await format_units(
-                    targets_root, k, session, static_cache
+                    targets_root, k, static_cache
                 )
             except Exception as e:
                 logger.error(
@@ -1315,7 +1050,6 @@ def track_api_usage(api_endpoint: str):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             results = await func(*args, **kwargs)
-            db_manager: DbManager = kwargs.get("db_manager")
             current_user: User = kwargs.get("current_user")
             nz_id: int | None = kwargs.get("nz_id", None)
             api_endpoint_format = None
@@ -1329,8 +1063,9 @@ def track_api_usage(api_endpoint: str):
                 api_endpoint_format = TrackingUrls.COMPANIES_HISTORY.format(
                     nz_id=nz_id
                 )
-            async with db_manager.get_session() as _session:
-                tracking_schema = TrackingCreate(
+            # written in batches by a background task
+            await usage_tracker.record(
+                TrackingCreate(
                     user_email=(
                         current_user.email if current_user.email else ""
                     ),
@@ -1342,17 +1077,99 @@ def track_api_usage(api_endpoint: str):
                     source=SourceEnum.WEB.value,
                     result=status.HTTP_200_OK,
                 )
-                new_tracking = Tracking(**tracking_schema.model_dump())
-                _session.add(new_tracking)
-                await _session.commit()
+            )
 
-                return results
+            return results
 
         return wrapper
 
     return decorator
 
 
+async def get_aggregates_etag(
+    session: AsyncSession, obj_ids: Iterable[int], *parts: Any
+) -> str | None:
+    """
+    Builds an ETag for a response computed from the aggregates of the
+    given submissions, from their stored content hashes only.
+
+    Args:
+        session (AsyncSession): The database session.
+        obj_ids (Iterable[int]): The submissions the response is built
+            from, in response order.
+        parts (Any): Anything else the response depends on, e.g. the
+            query parameters.
+
+    Returns:
+        str | None: The quoted ETag, or None if an aggregate has no
+            content hash yet.
+    """
+    obj_ids = list(obj_ids)
+    if not obj_ids:
+        return None
+    hashes = dict(
+        (
+            await session.execute(
+                select(
+                    AggregatedObjectView.obj_id,
+                    AggregatedObjectView.content_hash,
+                ).where(AggregatedObjectView.obj_id.in_(obj_ids))
+            )
+        ).all()
+    )
+    content_hashes = [hashes.get(obj_id) for obj_id in obj_ids]
+    if None in content_hashes:
+        return None
+
+    return f'"{content_hash([content_hashes, *parts])}"'
+
+
+def etag_matches(request: Request, etag: str | None) -> bool:
+    """
+    Whether the request's If-None-Match header matches the ETag.
+    """
+    if etag is None:
+        return False
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Empty 304 response for a matching ETag.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+    )
+
+
+async def get_submissions_total(
+    session: AsyncSession, cache: RedisClient
+) -> int:
+    """
+    Total number of submissions, cached for `settings.cache.count_ttl`
+    seconds so that paging does not count the table on every request.
+    """
+    cached_total = await cache.get(cache.wis_keys.submissions_total)
+    if cached_total is not None:
+        return int(cached_total)
+    total = await session.scalar(
+        select(func.count()).select_from(SubmissionObj)
+    )
+    await cache.set(
+        cache.wis_keys.submissions_total,
+        str(total),
+        ttl=settings.cache.count_ttl,
+    )
+    return total
+
+
 def scientific_to_float(sci_str: Any) -> str:
     """
     Converts a string in scientific notation or regular numeric form to a floating-point number using `Decimal`.
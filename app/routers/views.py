@@ -306,6 +306,7 @@ async def update_view_revision(
     revision: int,
     payload: TableViewRevisionUpdatePayload,
     db_manager: DbManager,
+    cache: Cache,
     current_user=Depends(
         RoleAuthorization(
             [
@@ -440,6 +441,14 @@ async def update_view_revision(
                 table_view_revision.active = False
 
         await _session.commit()
+        # drop cached schemas and submissions of all affected revisions
+        await cache.invalidate_tags(
+            cache.wis_keys.view_tag(table_view.id),
+            *(
+                cache.wis_keys.view_tag(table_view_revision.id)
+                for table_view_revision in other_revisions
+            ),
+        )
 
         return TableViewRevisionUpdateResponse(
             added=added,
@@ -455,6 +464,7 @@ async def update_view(
     table_view_id: int,
     table_view_data: table_view_schema.TableViewUpdate,
     db_manager: DbManager,
+    cache: Cache,
     current_user=Depends(
         RoleAuthorization(
             [
@@ -504,6 +514,7 @@ async def update_view(
         # save updated table view
         _session.add(db_table_view)
         await _session.commit()
+    await cache.invalidate_tags(cache.wis_keys.view_tag(table_view_id))
 
     return db_table_view
 
@@ -608,7 +619,10 @@ async def get_view_schema(
             view_schema.attribute_views = attr_views_schema
         # Serialize the schema to JSON and store it in Redis for future requests
         background_tasks.add_task(
-            cache.set, redis_key, json.dumps(jsonable_encoder(view_schema))
+            cache.set,
+            redis_key,
+            json.dumps(jsonable_encoder(view_schema)),
+            tags=[cache.wis_keys.view_tag(view_schema.id)],
         )
 
     return view_schema
@@ -33,6 +33,15 @@ class SubmissionObjStatusEnum(StrEnum):
     BLANK = "blank"
 
 
+class BulkSubmissionRowStatusEnum(StrEnum):
+    """
+    Outcome of a single row of a bulk submissions ingest.
+    """
+
+    CREATED = "created"
+    FAILED = "failed"
+
+
 class SICSSectorEnum(StrEnum):
     TECHNOLOGY_COMMUNICATIONS = "Technology & Communications"
     FOOD_BEVERAGE = "Food & Beverage"
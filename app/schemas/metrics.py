@@ -11,3 +11,93 @@ class ActiveUsersMetricResponse(BaseModel):
     active_users: int
     days: int
     total: int
+
+
+class ExecutorMetrics(BaseModel):
+    """
+    Usage counters of a CPU-bound work executor
+    """
+
+    name: str
+    max_workers: int
+    max_queue: int
+    waiting: int
+    in_flight: int
+    peak_depth: int
+    submitted: int
+    completed: int
+    failed: int
+    wait_seconds: float
+    run_seconds: float
+
+
+class ExecutorsMetricResponse(BaseModel):
+    """
+    Response for /metrics/executors endpoint
+    """
+
+    executors: list[ExecutorMetrics]
+
+
+class RouteLimiterMetrics(BaseModel):
+    """
+    Queue depth and rejections of a route concurrency limiter
+    """
+
+    name: str
+    max_concurrent: int
+    max_queue: int
+    waiting: int
+    in_flight: int
+    peak_depth: int
+    admitted: int
+    rejected_queue_full: int
+    rejected_timeout: int
+
+
+class RouteLimitersMetricResponse(BaseModel):
+    """
+    Response for /metrics/limiters endpoint
+    """
+
+    limiters: list[RouteLimiterMetrics]
+
+
+class CacheTierMetrics(BaseModel):
+    """
+    Hits and misses of a cache tier
+    """
+
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class LocalCacheTierMetrics(CacheTierMetrics):
+    """
+    Hits, misses and size of the in-process cache tier
+    """
+
+    entries: int
+    bytes: int
+
+
+class SingleFlightMetrics(BaseModel):
+    """
+    Counters of coalesced cache fills
+    """
+
+    in_flight: int
+    computed: int
+    coalesced: int
+    lease_waits: int
+
+
+class CacheMetricResponse(BaseModel):
+    """
+    Response for /metrics/cache endpoint
+    """
+
+    local: LocalCacheTierMetrics
+    redis: CacheTierMetrics
+    single_flight: SingleFlightMetrics
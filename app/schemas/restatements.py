@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Optional
 
 from fastapi import HTTPException, status
 from pydantic import BaseModel, ConfigDict, Field
 
 # pylint: disable = too-few-public-methods, unsupported-binary-operation
 
+# max distinct field paths kept parsed by `parse_field_path`
+FIELD_PATH_CACHE_SIZE = 4096
+
 
 class RestatementsBase(BaseModel):
     """
@@ -54,6 +58,10 @@ class AttributePathsModel(BaseModel):
     attribute: str
     sub_path: Optional[AttributePathsModel] = None
 
+    choice_class: ClassVar[type[AttributePathChoiceSection]] = (
+        AttributePathChoiceSection
+    )
+
     def clone(self, attribute: str = ""):
         path = None
         if self.sub_path is not None:
@@ -73,6 +81,23 @@ class AttributePathsModel(BaseModel):
 
         return path
 
+    @staticmethod
+    def parse_field_path(field_path: str) -> FrozenAttributePathsModel:
+        """
+        Memoized `unpack_field_path`, for paths which are only read.
+
+        The returned path is immutable, and shared by all callers parsing
+        the same field path: use `unpack_field_path` for a path to
+        update, e.g. with a row ID.
+
+        Args:
+            field_path (str): The path, see `unpack_field_path`.
+
+        Returns:
+            FrozenAttributePathsModel: The parsed path.
+        """
+        return _parse_field_path(field_path)
+
     @classmethod
     def unpack_field_path(cls, field_path: str) -> AttributePathsModel:
         """
@@ -137,13 +162,13 @@ class AttributePathsModel(BaseModel):
                     index = int(index)
                 path = cls(
                     form=form,
-                    choice=AttributePathChoiceSection(
+                    choice=cls.choice_class(
                         field=field, value=choice, index=index
                     ),
                     attribute=attribute,
+                    # set sub_path as the path stored in previous iteration
+                    sub_path=sub_path,
                 )
-                # set sub_path as the path stored in previous iteration
-                path.sub_path = sub_path
                 # store the defined path object to use it as sub_path
                 # in the next iterations
                 sub_path = path
@@ -200,6 +225,34 @@ class AttributePathsModel(BaseModel):
 AttributePathsModel.model_rebuild()
 
 
+class FrozenAttributePathChoiceSection(AttributePathChoiceSection):
+    """
+    Immutable choice section of a parsed attribute path
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenAttributePathsModel(AttributePathsModel):
+    """
+    Immutable attribute path, as cached by `parse_field_path`
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    choice_class: ClassVar[type[AttributePathChoiceSection]] = (
+        FrozenAttributePathChoiceSection
+    )
+
+    # equal to mutable paths with the same string representation
+    __hash__ = AttributePathsModel.__hash__
+
+
+@lru_cache(maxsize=FIELD_PATH_CACHE_SIZE)
+def _parse_field_path(field_path: str) -> FrozenAttributePathsModel:
+    return FrozenAttributePathsModel.unpack_field_path(field_path)
+
+
 class RestatementList(BaseModel):
     """
     List schema for Restatement
@@ -10,7 +10,7 @@ from pydantic import (
     field_serializer,
 )
 
-from .enums import SubmissionObjStatusEnum
+from .enums import BulkSubmissionRowStatusEnum, SubmissionObjStatusEnum
 from .restatements import RestatementCreate, RestatementGetSimple
 
 # pylint: disable = too-few-public-methods, unsupported-binary-operation
@@ -168,9 +168,34 @@ class SubmissionList(BaseModel):
     start: Optional[int] = None
     end: Optional[int] = None
     total: Optional[int] = None
+    next_cursor: Optional[int] = None
     items: list[SubmissionGet]
 
 
+class BulkSubmissionRowStatus(BaseModel):
+    """
+    Schema for the status of a single row of a bulk submissions ingest.
+    """
+
+    line: int
+    status: BulkSubmissionRowStatusEnum
+    id: Optional[int] = None
+    name: Optional[str] = None
+    lei: Optional[str] = None
+    errors: Optional[dict] = None
+
+
+class BulkSubmissionResponse(BaseModel):
+    """
+    Schema for the bulk submissions ingest response.
+    """
+
+    total: int
+    created: int
+    failed: int
+    items: list[BulkSubmissionRowStatus]
+
+
 class SubmissionRevisionList(BaseModel):
     """
     Schema for list Submissions.
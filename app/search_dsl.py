@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.database import Base
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.loaders import SubmissionLoader
+from app.service.core.projection import compile_fields
 
 from .db.models import (
     Choice,
@@ -37,7 +38,6 @@ from .schemas.search import (
     SearchQuery,
 )
 from .service.core.types import ColumnDefsDataByName
-from .service.core.utils import strip_none
 
 logger = get_nzdpu_logger()
 
@@ -302,7 +302,7 @@ class SearchDSL:
         for sort_element in self.query.sort:
             assert isinstance(sort_element, dict)
             sort_field, values = list(sort_element.items())[0]
-            path = AttributePathsModel.unpack_field_path(sort_field)
+            path = AttributePathsModel.parse_field_path(sort_field)
             order = values.order.upper()
             column = columns.get(path.attribute)
             if column is None:
@@ -478,32 +478,32 @@ class SearchDSL:
                 submission_name=submission.name, session=self.session
             )
         )
-        for restated, value in restated_fields_data_source.items():
-            if not restated.endswith("scope_1_greenhouse_gas"):
-                path = await submission_loader.unpack_restatement_path_for_restated_col(
-                    submission_id=submission.id, restatement_path=restated
-                )
-                submission.values = (
-                    submission_loader.update_values_for_restated_columns(
-                        path=path, values=submission.values, value=value
-                    )
+        paths = await submission_loader.resolve_restatement_paths(
+            submission_id=submission.id,
+            restatement_paths=[
+                restated
+                for restated in restated_fields_data_source
+                if not restated.endswith("scope_1_greenhouse_gas")
+            ],
+        )
+        for restated, path in paths.items():
+            submission.values = (
+                submission_loader.update_values_for_restated_columns(
+                    path=path,
+                    values=submission.values,
+                    value=restated_fields_data_source[restated],
                 )
+            )
 
     async def _strip_submission_fields(
         self, submission: Any, submission_loader: SubmissionLoader
     ) -> None:
         """Strip fields from submission values based on query fields."""
-        if self.query.fields:
-            submission.values = submission_loader._strip_fields(
-                submission.values,
-                [
-                    AttributePathsModel.unpack_field_path(field)
-                    for field in self.query.fields
-                ],
-                raise_exception=False,
-            )
-        else:
-            submission.values = strip_none(submission.values)
+        submission.values = submission_loader.project_values(
+            submission.values,
+            compile_fields(tuple(self.query.fields)),
+            raise_exception=False,
+        )
 
     def _add_additional_fields_to_submission(
         self, submission: Any, result: dict[str, Any]
@@ -514,7 +514,6 @@ class CompanyService:
                             targets,
                             sub_obj.data_source,
                             f"{tgt_form_id}_progress",
-                            self._session,
                             self.static_cache,
                             sub_obj.values.get("reporting_datetime"),
                             attribute_name_last_update_dict,
@@ -7,6 +7,7 @@ from sqlalchemy import Table, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
+from app.constraint_validator import CompiledConstraintValidator
 from app.db.models import (
     AttributePrompt,
     Base,
@@ -17,6 +18,7 @@ from app.db.models import (
     TableDef,
     TableView,
 )
+from app.service.core.units import column_unit_template
 
 
 @dataclass
@@ -30,6 +32,10 @@ class CacheData:
     column_defs_by_id: dict[int, ColumnDef] = field(default_factory=dict)
     choices: dict[int, Choice] = field(default_factory=dict)
     prompts: dict[int, AttributePrompt] = field(default_factory=dict)
+    constraint_validators: dict[int, CompiledConstraintValidator] = field(
+        default_factory=dict
+    )
+    unit_templates: dict[str, str] = field(default_factory=dict)
 
 
 class CoreMemoryCache:
@@ -62,6 +68,21 @@ class CoreMemoryCache:
     def set_prompts(self, prompts: Sequence[AttributePrompt]):
         self.cache_data.prompts = {prompt.id: prompt for prompt in prompts}
 
+    def set_constraint_validators(self, column_defs: Sequence[ColumnDef]):
+        self.cache_data.constraint_validators = {
+            view.id: CompiledConstraintValidator(view.constraint_value, cd)
+            for cd in column_defs
+            for view in cd.views
+            if view.constraint_value
+        }
+
+    def set_unit_templates(self, column_defs: Sequence[ColumnDef]):
+        self.cache_data.unit_templates = {
+            cd.name: template
+            for cd in column_defs
+            if (template := column_unit_template(cd))
+        }
+
     async def get_form_data_tables(self):
         async with self.session.bind.begin() as conn:
             with warnings.catch_warnings(action="ignore"):
@@ -138,6 +159,8 @@ class CoreMemoryCache:
             self.set_column_defs(columns)
             self.set_choices(choices)
             self.set_prompts(prompts)
+            self.set_constraint_validators(columns)
+            self.set_unit_templates(columns)
 
         finally:
             self.lock.release()
@@ -182,5 +205,15 @@ class CoreMemoryCache:
         async with self.lock:
             return self.cache_data.prompts
 
+    async def constraint_validators(
+        self,
+    ) -> dict[int, CompiledConstraintValidator]:
+        async with self.lock:
+            return self.cache_data.constraint_validators
+
+    async def unit_templates(self) -> dict[str, str]:
+        async with self.lock:
+            return self.cache_data.unit_templates
+
     async def refresh_values(self):
         await self.load_data()
@@ -4,7 +4,10 @@ Checker class module.
 Contains methods concerning validation in submissions.
 """
 
-from app.constraint_validator import ConstraintValidator
+from app.constraint_validator import (
+    CompiledConstraintValidator,
+    ConstraintValidator,
+)
 from app.db.models import ColumnDef, ColumnView
 from app.loggers import get_nzdpu_logger
 
@@ -13,7 +16,12 @@ logger = get_nzdpu_logger()
 
 class Checker:
     @classmethod
-    def _validate_constraints(cls, column: ColumnDef, value) -> None:
+    def _validate_constraints(
+        cls,
+        column: ColumnDef,
+        value,
+        validators: dict[int, CompiledConstraintValidator] | None = None,
+    ) -> None:
         """
         Calls validate() method of ConstraintValidator to validate the
         value of a field being inserted.
@@ -21,12 +29,19 @@ class Checker:
         Args:
             column (ColumnDef): The ColumnDef for the field.
             value (_type_): The value of the field.
+            validators (dict[int, CompiledConstraintValidator] | None):
+                Constraints compiled at cache load, by column view ID.
+                Used instead of interpreting the constraints, if the
+                column view has an entry.
         """
         try:
             column_view: ColumnView = column.views[0]
         except IndexError:
             logger.warning(f"No column views for column '{column.name}'")
         else:
+            if validators and column_view.id in validators:
+                validators[column_view.id].validate(value)
+                return
             constraints = column_view.constraint_value
             if constraints:
                 constraint_validator = ConstraintValidator(
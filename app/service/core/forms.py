@@ -21,7 +21,7 @@ from app.schemas.column_view import (
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.converter import Converter
 from app.service.core.mixins import CacheMixin
-from app.service.utils import format_units
+from app.service.core.units import UnitResolver
 
 ID_FIELDS = {"id", "obj_id", "value_id"}
 logger = get_nzdpu_logger()
@@ -31,6 +31,7 @@ logger = get_nzdpu_logger()
 class BaseForm:
     static_cache: CoreMemoryCache
     form_storage: dict[str, DataFrame]
+    unit_resolver: UnitResolver
 
 
 @dataclass(slots=True)
@@ -47,6 +48,7 @@ class Form(BaseForm):
                 values=row,
                 static_cache=self.static_cache,
                 form_storage=self.form_storage,
+                unit_resolver=self.unit_resolver,
             )
             for row in self.form_storage[self.name]["form_values"]
             if row.get("value_id") == self.value_id
@@ -135,6 +137,7 @@ class FormRow(BaseForm):
             value_id=value,
             static_cache=self.static_cache,
             form_storage=self.form_storage,
+            unit_resolver=self.unit_resolver,
         )
         if not form.rows:
             return None, None
@@ -177,13 +180,7 @@ class FormRow(BaseForm):
             parent_values = await self.get_root_form(field=field)
         else:
             parent_values = self.parent.values if self.parent else None
-        units = await format_units(
-            self.values,
-            field,
-            self.static_cache.session,
-            self.static_cache,
-            parent_values,
-        )
+        units = self.unit_resolver.resolve(field, self.values, parent_values)
         return value, units
 
     def _get_other_choice_field(
@@ -362,6 +359,7 @@ class FormValuesGetter(CacheMixin):
             static_cache=self.static_cache,
             name=self.primary_form.name,
             form_storage=self.storage,
+            unit_resolver=await UnitResolver.from_cache(self.static_cache),
         )
         values, units = await form.get_values()
         return values, units
@@ -1,4 +1,5 @@
 import asyncio
+from datetime import datetime
 from typing import Any, Generator, Iterable, Tuple
 
 import orjson
@@ -8,6 +9,8 @@ from fastapi import HTTPException, status
 from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db import cache_codec
+from app.db.database import adhoc_sessions
 from app.db.models import (
     AggregatedObjectView,
     SubmissionObj,
@@ -16,10 +19,12 @@ from app.db.models import (
 )
 from app.db.redis import RedisClient
 from app.schemas.column_def import AttributeType
+from app.schemas.enums import SubmissionObjStatusEnum
 from app.schemas.submission import SubmissionGet
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.forms import FormValuesGetter
 from app.service.core.mixins import CacheMixin, GetterMixin, SessionMixin
+from app.service.single_flight import single_flight
 
 log: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
@@ -86,22 +91,24 @@ class FormBatchLoader(CacheMixin, SessionMixin):
 
         return table_defs.get(table_def_id, {})
 
-    @async_cached_property
-    async def subform_table_defs(self) -> list[TableDef]:
+    @staticmethod
+    def collect_subform_table_defs(
+        primary_td: TableDef, table_defs: dict[int, TableDef]
+    ) -> list[TableDef]:
         """
-        Recursively walk through subforms in table definition
-        and return them from static cache.
+        Recursively walk through subforms in a table definition.
+
+        Args:
+            primary_td (TableDef): primary table definition
+            table_defs (dict[int, TableDef]): table definitions by id
 
         Returns:
             list[TableDef]: subform table defs
         """
 
-        primary_td = await self.primary_form_table_def
-        table_defs = await self.static_cache.table_defs()
         sub_table_defs = []
 
         def walk_subforms(td: TableDef):
-            nonlocal table_defs
             for col in td.columns:
                 if col.attribute_type in (
                     AttributeType.FORM,
@@ -114,6 +121,35 @@ class FormBatchLoader(CacheMixin, SessionMixin):
 
         walk_subforms(primary_td)
 
+        return sub_table_defs
+
+    @staticmethod
+    def get_form_table_name(table_def: TableDef) -> str:
+        """
+        Name of the data table of a form, considering inheritance.
+        """
+        return (
+            table_def.name + "_heritable"
+            if table_def.heritable
+            else table_def.name
+        )
+
+    @async_cached_property
+    async def subform_table_defs(self) -> list[TableDef]:
+        """
+        Recursively walk through subforms in table definition
+        and return them from static cache.
+
+        Returns:
+            list[TableDef]: subform table defs
+        """
+
+        primary_td = await self.primary_form_table_def
+        table_defs = await self.static_cache.table_defs()
+        sub_table_defs = self.collect_subform_table_defs(
+            primary_td, table_defs
+        )
+
         return [
             table_defs.get(id, {}) for id in [td.id for td in sub_table_defs]
         ]
@@ -123,24 +159,20 @@ class FormBatchLoader(CacheMixin, SessionMixin):
         primary_table_def = await self.primary_form_table_def
         subform_table_defs = await self.subform_table_defs
         return [
-            (
-                table_def.name + "_heritable"
-                if table_def.heritable
-                else table_def.name
-            )
+            self.get_form_table_name(table_def)
             for table_def in [primary_table_def] + subform_table_defs
         ]
 
     async def fetch_batch(
         self,
-        session: AsyncSession,
         tables: list[str],
         statements: list[Select[Any]],
     ) -> None:
         """
         Coroutine for fetching batch of queries.
 
-        Runs in a multiple tasks and stores
+        Runs in a multiple tasks, each in its own ad-hoc session, or one
+        after another in the ad-hoc session of a parent load, and stores
         the result in `self.form_row_data` attribute.
         Note that tables and statements are sorted respecting each other.
 
@@ -148,7 +180,7 @@ class FormBatchLoader(CacheMixin, SessionMixin):
             tables (list[str]): tables name to fetch
             statements (list[str]): queries to fetch
         """
-        async with session as session:
+        async with adhoc_sessions.session(self.session.bind) as session:
             for i, query in enumerate(statements):
                 result = (await session.execute(query)).fetchall()
                 self.form_row_data[tables[i]] = [
@@ -241,8 +273,7 @@ class FormBatchLoader(CacheMixin, SessionMixin):
         for tables, statements in self.batch_split(
             table_statement_pairs, self.batch_size
         ):
-            session = AsyncSession(self.session.bind)
-            tasks.append(self.fetch_batch(session, tables, statements))
+            tasks.append(self.fetch_batch(tables, statements))
 
         await asyncio.gather(*tasks)
 
@@ -259,6 +290,9 @@ class FormBatchLoader(CacheMixin, SessionMixin):
 
 
 class SubmissionLoader(GetterMixin):
+    # fields of SubmissionGet which its JSON dump turns into strings
+    CACHED_DATETIME_FIELDS = ("created_on", "activated_on", "checked_out_on")
+
     def __init__(
         self,
         session: AsyncSession,
@@ -267,22 +301,121 @@ class SubmissionLoader(GetterMixin):
     ):
         super().__init__(session, core_cache, redis_cache)
 
+    @classmethod
+    def submission_from_cache(cls, data: dict[str, Any]) -> SubmissionGet:
+        """
+        Rebuilds a submission from the dump `save_submission_in_cache`
+        wrote. The dump comes from a validated model, so validation is
+        skipped, and only the fields its JSON dump turned into strings
+        are parsed back.
+
+        Args:
+            data (dict[str, Any]): The decoded cache entry, which is
+                modified in place.
+
+        Returns:
+            SubmissionGet: The submission.
+        """
+        for field in cls.CACHED_DATETIME_FIELDS:
+            if data.get(field) is not None:
+                data[field] = datetime.fromisoformat(data[field])
+        if data.get("status") is not None:
+            data["status"] = SubmissionObjStatusEnum(data["status"])
+        return SubmissionGet.model_construct(**data)
+
     async def get_submission_from_cache(
         self, submission_id
     ) -> SubmissionGet | None:
         redis_key = self.redis_cache.wis_keys.submission + str(submission_id)
-        submission = await self.redis_cache.get(redis_key)
-        if submission is not None:
-            return SubmissionGet(**orjson.loads(submission))
+        payload = await self.redis_cache.get_bytes(redis_key)
+        if payload is None:
+            return None
+        submission_dict = cache_codec.decode(payload)
+        if submission_dict is not None:
+            return self.submission_from_cache(submission_dict)
 
     async def save_submission_in_cache(
         self, key: str, submission: SubmissionGet
-    ):
+    ) -> bytes:
         submission_dict = submission.model_dump(mode="json")
+        wis_keys = self.redis_cache.wis_keys
+        payload = cache_codec.encode(submission_dict)
         await self.redis_cache.set(
             key,
-            orjson.dumps(submission_dict),  # pylint: disable=maybe-no-member
+            payload,
+            tags=[
+                wis_keys.submission_tag(submission.id),
+                wis_keys.nz_id_tag(submission.nz_id),
+                wis_keys.view_tag(submission.table_view_id),
+            ],
+        )
+        return payload
+
+    async def load_from_db(self, submission_id: int) -> SubmissionGet:
+        """
+        Loads a submission with its values from the form tables.
+
+        Args:
+            submission_id (int): The submission ID.
+
+        Returns:
+            SubmissionGet: The submission.
+        """
+        submission_obj: SubmissionObj = await self.session.scalar(
+            select(SubmissionObj).where(SubmissionObj.id == submission_id)
+        )
+        if not submission_obj:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Submission not found: {submission_id}",
+            )
+        submission_obj.values = {}
+        submission = SubmissionGet.model_validate(submission_obj)
+        form_loader = FormBatchLoader(
+            self.session, self.static_cache, self.redis_cache, submission_id
+        )
+        form_data = await form_loader.fetch_form_row_data()
+        primary_table_def = form_loader.primary_form_table_def
+        form_manager = FormValuesGetter(
+            self.static_cache,
+            self.redis_cache,
+            form_rows=form_data,
+            primary_form=primary_table_def,
+        )
+        submission_values, submission_units = await form_manager.get_values()
+        submission.values = submission_values[0] if submission_values else {}
+        submission.units = submission_units[0] if submission_units else {}
+        return submission
+
+    async def load_and_cache(self, submission_id: int) -> SubmissionGet:
+        """
+        Loads a submission from the form tables and caches it, once
+        across concurrent callers; see `SingleFlight.fill`.
+
+        Args:
+            submission_id (int): The submission ID.
+
+        Returns:
+            SubmissionGet: The submission, as a copy owned by the caller.
+        """
+        redis_key = self.redis_cache.wis_keys.submission + str(submission_id)
+
+        async def compute() -> bytes:
+            submission = await self.load_from_db(submission_id)
+            return await self.save_submission_in_cache(redis_key, submission)
+
+        # callers share the payload, and each decode their own copy
+        payload = await single_flight.fill(
+            self.redis_cache,
+            redis_key,
+            compute,
+            lambda: self.redis_cache.get_bytes(redis_key),
         )
+        submission_dict = cache_codec.decode(payload)
+        if submission_dict is None:
+            # written by another codec version meanwhile
+            return await self.load_from_db(submission_id)
+        return self.submission_from_cache(submission_dict)
 
     async def load_from_aggregate(
         self, submission_id: int
@@ -317,36 +450,9 @@ class SubmissionLoader(GetterMixin):
                 if aggregate:
                     return aggregate
 
-        submission_obj: SubmissionObj = await self.session.scalar(
-            select(SubmissionObj).where(SubmissionObj.id == submission_id)
-        )
-        if not submission_obj:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Submission not found: {submission_id}",
-            )
-        submission_obj.values = {}
-        submission = SubmissionGet.model_validate(submission_obj)
-        form_loader = FormBatchLoader(
-            self.session, self.static_cache, self.redis_cache, submission_id
-        )
-        form_data = await form_loader.fetch_form_row_data()
-        primary_table_def = form_loader.primary_form_table_def
-        form_manager = FormValuesGetter(
-            self.static_cache,
-            self.redis_cache,
-            form_rows=form_data,
-            primary_form=primary_table_def,
-        )
-        submission_values, submission_units = await form_manager.get_values()
-        submission.values = submission_values[0] if submission_values else {}
-        submission.units = submission_units[0] if submission_units else {}
-        if not db_only:
-            await self.save_submission_in_cache(
-                self.redis_cache.wis_keys.submission + str(submission_id),
-                submission,
-            )
-        return submission
+        if db_only:
+            return await self.load_from_db(submission_id)
+        return await self.load_and_cache(submission_id)
 
     async def load_by_lei_and_year(
         self,
@@ -392,33 +498,6 @@ class SubmissionLoader(GetterMixin):
                 if aggregate:
                     return aggregate
 
-        submission_obj: SubmissionObj = await self.session.scalar(
-            select(SubmissionObj).where(SubmissionObj.id == submission_id)
-        )
-        if not submission_obj:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Submission not found: {submission_id}",
-            )
-        submission_obj.values = {}
-        submission = SubmissionGet.model_validate(submission_obj)
-        form_loader = FormBatchLoader(
-            self.session, self.static_cache, self.redis_cache, submission_id
-        )
-        form_data = await form_loader.fetch_form_row_data()
-        primary_table_def = form_loader.primary_form_table_def
-        form_manager = FormValuesGetter(
-            self.static_cache,
-            self.redis_cache,
-            form_rows=form_data,
-            primary_form=primary_table_def,
-        )
-        submission_values, submission_units = await form_manager.get_values()
-        submission.values = submission_values[0] if submission_values else {}
-        submission.units = submission_units[0] if submission_units else {}
-        if not db_only:
-            await self.save_submission_in_cache(
-                self.redis_cache.wis_keys.submission + str(submission_id),
-                submission,
-            )
-        return submission
+        if db_only:
+            return await self.load_from_db(submission_id)
+        return await self.load_and_cache(submission_id)
@@ -1,28 +1,38 @@
 import random
 import string
+from dataclasses import dataclass, field
 from datetime import datetime
 from time import time_ns
-from typing import Any, Sequence
+from typing import Any, AsyncIterable, Sequence
 
+import orjson
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 from sqlalchemy import (
+    Table,
     bindparam,
     func,
     insert,
     literal_column,
     select,
     text,
+    tuple_,
     update,
 )
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.constraint_validator import ConstraintValidationException
 from app.db.models import (
     AggregatedObjectView,
     ColumnDef,
     Organization,
+    Permission,
     Restatement,
     SubmissionObj,
     TableDef,
+    TableView,
+    User,
 )
 from app.db.redis import RedisClient
 from app.db.types import (
@@ -38,14 +48,20 @@ from app.db.types import (
 from app.forms.form_meta import FormMeta
 from app.loggers import get_nzdpu_logger
 from app.schemas.column_def import AttributeType
-from app.schemas.enums import SubmissionObjStatusEnum
+from app.schemas.enums import (
+    BulkSubmissionRowStatusEnum,
+    SubmissionObjStatusEnum,
+)
 from app.schemas.restatements import AttributePathsModel, RestatementCreate
 from app.schemas.submission import (
+    BulkSubmissionResponse,
+    BulkSubmissionRowStatus,
     RevisionUpdate,
     SubmissionCreate,
     SubmissionGet,
     SubmissionUpdate,
 )
+from app.service.access_manager import AccessManager, AccessType
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.checker import Checker
 from app.service.core.converter import Converter
@@ -54,10 +70,31 @@ from app.service.core.forms import FormValuesGetter
 from app.service.core.loaders import FormBatchLoader, SubmissionLoader
 from app.service.core.mixins import GetterMixin
 from app.service.core.types import RecurseAttributeTypes
-from app.service.core.utils import strip_none
+from app.service.core.utils import content_hash, strip_none
+from app.service.validator_service import ValidatorService
 
 logger = get_nzdpu_logger()
 
+# composite type for each nullable SQL column type
+COMPOSITE_TYPES_BY_SQL_TYPE = {
+    IntOrNullType: PostgresCustomType.INT_OR_NULL,
+    TextOrNullType: PostgresCustomType.TEXT_OR_NULL,
+    BoolOrNullType: PostgresCustomType.BOOL_OR_NULL,
+    FloatOrNullType: PostgresCustomType.FLOAT_OR_NULL,
+    FormOrNullType: PostgresCustomType.FORM_OR_NULL,
+    FileOrNullType: PostgresCustomType.FILE_OR_NULL,
+}
+
+# fields of an aggregated submission which revision operations change
+# without touching its values
+REVISION_METADATA_FIELDS = {
+    "active",
+    "checked_out",
+    "checked_out_on",
+    "user_id",
+    "status",
+}
+
 
 def get_required_constraint_value(column: ColumnDef):
     if len(column.views) == 0:
@@ -394,7 +431,11 @@ class SubmissionManager(GetterMixin):
                 )
                 columns = await self.static_cache.column_defs_by_name()
                 column = columns[field_name]
-                Checker._validate_constraints(column=column, value=v)
+                Checker._validate_constraints(
+                    column=column,
+                    value=v,
+                    validators=await self.static_cache.constraint_validators(),
+                )
                 if column.attribute_type in RecurseAttributeTypes:
                     if v in NullTypeState.values():
                         row[field_name] = v
@@ -456,9 +497,26 @@ class SubmissionManager(GetterMixin):
 
         return values_to_insert
 
-    def get_bind_param_for_null_type_attribute(
-        self, k: str, value: Any, composite_type: str
-    ):
+    @staticmethod
+    def _cast_null_type_value(
+        k: str, value: Any, composite_type: str
+    ) -> tuple[Any, str | None]:
+        """
+        Splits a value for a nullable composite type column into its
+        value and null state parts, casting the value to the type
+        stored in the database.
+
+        Args:
+            k (str): The column name, used for error reporting.
+            value (Any): The value to split.
+            composite_type (str): The composite type of the column.
+
+        Raises:
+            HTTPException: If the value cannot be cast.
+
+        Returns:
+            tuple[Any, str | None]: The value and the null state.
+        """
         value_to_inset = None
         state = None
         # if value is inserted as null
@@ -491,9 +549,18 @@ class SubmissionManager(GetterMixin):
                     detail=error_detail,
                 ) from exc
 
+        return value_to_inset, state
+
+    def get_bind_param_for_null_type_attribute(
+        self, k: str, value: Any, composite_type: str, suffix: str = ""
+    ):
+        value_to_inset, state = self._cast_null_type_value(
+            k, value, composite_type
+        )
+
         # every bind param should have its own variable naming
-        value_var_name = f"value_{k}"
-        state_var_name = f"state_{k}"
+        value_var_name = f"value_{k}{suffix}"
+        state_var_name = f"state_{k}{suffix}"
 
         params = {}
         params[value_var_name] = value_to_inset
@@ -526,6 +593,7 @@ class SubmissionManager(GetterMixin):
             )
 
     async def _verify_required_missing_fields(self):
+        validators = await self.static_cache.constraint_validators()
         for key in self.columns_by_name_required_constraint_value.keys():
             if key in self.required_columns_in_submission:
                 # if the field exists in submission then skip the validation
@@ -535,7 +603,65 @@ class SubmissionManager(GetterMixin):
                 Checker._validate_constraints(
                     column=self.columns_by_name_required_constraint_value[key],
                     value=None,
+                    validators=validators,
+                )
+
+    @staticmethod
+    def _get_typed_value(
+        k: str, v: Any, column_defs: dict[str, ColumnDef]
+    ) -> tuple[Any, Any]:
+        """
+        Returns the SQL type of a form column and the value converted
+        for insertion in it.
+        """
+        if k not in {"obj_id", "value_id"}:
+            attribute_type = column_defs[k].attribute_type
+        else:
+            attribute_type = AttributeType.INT
+        # convert datetime as str to datetime type
+        if attribute_type == AttributeType.DATETIME and isinstance(v, str):
+            if v.endswith("Z"):
+                v = v[:-1]  # remove zulu
+            v = datetime.fromisoformat(v)
+
+        return FormMeta.get_column_type(attribute_type), v
+
+    def _get_insert_params(
+        self,
+        row: dict[str, Any],
+        column_defs: dict[str, ColumnDef],
+        suffix: str = "",
+    ) -> dict[str, Any]:
+        """
+        Converts a row of form values to the bind parameters used to
+        insert it in its form table.
+
+        Args:
+            row (dict[str, Any]): The row values, by column name.
+            column_defs (dict[str, ColumnDef]): The column definitions,
+                by name.
+            suffix (str, optional): Suffix for composite types bind
+                parameter names, needed to keep them unique when
+                several rows are inserted in the same statement.
+                Defaults to "".
+
+        Returns:
+            dict[str, Any]: The insert parameters, by column name.
+        """
+        params = {}
+        for k, v in row.items():
+            sql_type, v = self._get_typed_value(k, v, column_defs)
+            composite_type = COMPOSITE_TYPES_BY_SQL_TYPE.get(sql_type)
+            if composite_type:
+                params[k] = self.get_bind_param_for_null_type_attribute(
+                    k, v, composite_type, suffix=suffix
                 )
+            else:
+                params[k] = bindparam(
+                    key=f"{k}{suffix}", value=v, type_=sql_type
+                )  # type: ignore
+
+        return params
 
     async def _insert(self, submission: SubmissionGet) -> None:
         """
@@ -564,69 +690,12 @@ class SubmissionManager(GetterMixin):
         )
         await self._verify_required_missing_fields()
 
-        row_count = 0
         for table in values_to_insert:
             rows: list[dict[str, Any]]
             for form_name, rows in table.items():
                 form_table = await self.static_cache.get_form_table(form_name)
                 for row in rows:
-                    row_count += 1
-                    params = {}
-                    for k, v in row.items():
-                        if k not in {"obj_id", "value_id"}:
-                            attribute_type = column_defs[k].attribute_type
-                        else:
-                            attribute_type = AttributeType.INT
-                        # convert datetime as str to datetime type
-                        if (
-                            attribute_type == AttributeType.DATETIME
-                            and isinstance(v, str)
-                        ):
-                            if v.endswith("Z"):
-                                v = v[:-1]  # remove zulu
-                            v = datetime.fromisoformat(v)
-                        sql_type = FormMeta.get_column_type(attribute_type)
-                        if sql_type is IntOrNullType:
-                            params[k] = (
-                                self.get_bind_param_for_null_type_attribute(
-                                    k, v, PostgresCustomType.INT_OR_NULL
-                                )
-                            )
-                        elif sql_type is TextOrNullType:
-                            params[k] = (
-                                self.get_bind_param_for_null_type_attribute(
-                                    k, v, PostgresCustomType.TEXT_OR_NULL
-                                )
-                            )
-                        elif sql_type is BoolOrNullType:
-                            params[k] = (
-                                self.get_bind_param_for_null_type_attribute(
-                                    k, v, PostgresCustomType.BOOL_OR_NULL
-                                )
-                            )
-                        elif sql_type is FloatOrNullType:
-                            params[k] = (
-                                self.get_bind_param_for_null_type_attribute(
-                                    k, v, PostgresCustomType.FLOAT_OR_NULL
-                                )
-                            )
-                        elif sql_type is FormOrNullType:
-                            params[k] = (
-                                self.get_bind_param_for_null_type_attribute(
-                                    k, v, PostgresCustomType.FORM_OR_NULL
-                                )
-                            )
-                        elif sql_type is FileOrNullType:
-                            params[k] = (
-                                self.get_bind_param_for_null_type_attribute(
-                                    k, v, PostgresCustomType.FILE_OR_NULL
-                                )
-                            )
-                        else:
-                            params[k] = bindparam(
-                                key=k, value=v, type_=sql_type
-                            )  # type: ignore
-
+                    params = self._get_insert_params(row, column_defs)
                     stmt = insert(form_table).values(params)
                     await self.session.execute(stmt)
 
@@ -636,7 +705,7 @@ class SubmissionManager(GetterMixin):
         submission_data: dict[str, Any],
         commit: bool = False,
         flush: bool = False,
-    ) -> None:
+    ) -> AggregatedObjectView:
         form_loader = FormBatchLoader(
             self.session, self.static_cache, self.redis_cache, obj_id
         )
@@ -671,12 +740,14 @@ class SubmissionManager(GetterMixin):
             aggregate = AggregatedObjectView(
                 obj_id=obj_id,
                 data=aggregate_data,
+                content_hash=content_hash(aggregate_data),
             )
             self.session.add(aggregate)
 
         else:
             try:
                 aggregate.data = aggregate_data
+                aggregate.content_hash = content_hash(aggregate_data)
             except Exception as e:
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -687,6 +758,66 @@ class SubmissionManager(GetterMixin):
             await self.session.flush()
         if commit:
             await self.session.commit()
+        return aggregate
+
+    async def patch_aggregate_metadata(
+        self,
+        submissions: Sequence[SubmissionObj],
+        commit: bool = False,
+        flush: bool = False,
+    ) -> dict[int, AggregatedObjectView]:
+        """
+        Copies the revision metadata of submissions (see
+        `REVISION_METADATA_FIELDS`) into their existing aggregates,
+        without reloading their values from the form tables.
+        Submissions without an aggregate get a full one.
+
+        Args:
+            submissions (Sequence[SubmissionObj]): The submissions whose
+                metadata changed.
+            commit (bool): Whether to commit the session.
+            flush (bool): Whether to flush the session.
+
+        Returns:
+            dict[int, AggregatedObjectView]: The updated aggregates, by
+                submission ID.
+        """
+        submissions_by_id = {
+            submission.id: submission for submission in submissions
+        }
+        aggregates = {
+            aggregate.obj_id: aggregate
+            for aggregate in await self.session.scalars(
+                select(AggregatedObjectView).where(
+                    AggregatedObjectView.obj_id.in_(submissions_by_id)
+                )
+            )
+        }
+        for obj_id, submission in submissions_by_id.items():
+            metadata = SubmissionGet.model_validate(submission).model_dump(
+                mode="json", include=REVISION_METADATA_FIELDS
+            )
+            aggregate = aggregates.get(obj_id)
+            if aggregate is None or not aggregate.data:
+                aggregates[obj_id] = await self.save_aggregate(
+                    obj_id,
+                    SubmissionGet.model_validate(submission).model_dump(
+                        mode="json"
+                    ),
+                )
+                continue
+            data = aggregate.data
+            if isinstance(data, str):
+                data = orjson.loads(data)
+            aggregate_data = {**data, **metadata}
+            aggregate.data = aggregate_data
+            aggregate.content_hash = content_hash(aggregate_data)
+
+        if flush:
+            await self.session.flush()
+        if commit:
+            await self.session.commit()
+        return aggregates
 
     async def update(
         self,
@@ -1092,11 +1223,14 @@ class RevisionManager(SubmissionManager):
                 stored restatements.
         """
         restatement_history: list[Restatement] = []
+        paths = await self.resolve_restatement_paths(
+            submission_id=obj_id,
+            restatement_paths=[
+                restatement.path for restatement in restatements
+            ],
+        )
         for restatement in restatements:
-            path = await self._unpack_restatement_path(
-                submission_id=obj_id,
-                restatement_path=restatement.path,
-            )
+            path = paths[restatement.path]
 
             if create_submission is False:
                 # If we are not creating a new submission we need to update the old one.
@@ -1168,3 +1302,618 @@ class RevisionManager(SubmissionManager):
             # Execute the update statement and commit the transaction
             await self.session.execute(stmt, {"row_id": path.row_id})
             await self.session.commit()
+
+
+@dataclass(slots=True)
+class BulkSubmissionRow:
+    """
+    State of a single row of a bulk submissions ingest.
+    """
+
+    line: int
+    submission: SubmissionCreate | None = None
+    errors: dict | None = None
+    table_view: TableView | None = None
+    values_to_insert: list[dict[str, list[dict[str, Any]]]] = field(
+        default_factory=list
+    )
+    submission_obj: SubmissionObj | None = None
+
+    def fail(self, errors: dict) -> None:
+        self.errors = errors
+
+    @property
+    def status(self) -> BulkSubmissionRowStatus:
+        submission_obj = self.submission_obj
+        lei = (
+            self.submission.values.get("legal_entity_identifier")
+            if self.submission
+            else None
+        )
+        if self.errors or submission_obj is None:
+            return BulkSubmissionRowStatus(
+                line=self.line,
+                status=BulkSubmissionRowStatusEnum.FAILED,
+                lei=lei,
+                errors=self.errors,
+            )
+        return BulkSubmissionRowStatus(
+            line=self.line,
+            status=BulkSubmissionRowStatusEnum.CREATED,
+            id=submission_obj.id,
+            name=submission_obj.name,
+            lei=lei,
+        )
+
+
+class BulkSubmissionManager(SubmissionManager):
+    """
+    Creates submissions in batches from a stream of payloads.
+
+    The rows of a batch are validated against the constraints loaded
+    once for the whole ingest, then inserted in a single transaction
+    with multi-row statements. Aggregates are built from the in-memory
+    values, without reloading the inserted rows, and the cache entries
+    of the batch's submissions and companies are invalidated once it is
+    committed.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        core_cache: CoreMemoryCache,
+        redis_cache: RedisClient,
+        current_user: User,
+        batch_size: int = 50,
+        insert_chunk_size: int = 500,
+    ):
+        super().__init__(session, core_cache, redis_cache)
+        self.current_user = current_user
+        self.batch_size = batch_size
+        self.insert_chunk_size = insert_chunk_size
+        self.statuses: list[BulkSubmissionRowStatus] = []
+        # memoized lookups, shared by all batches
+        self._user_nz_id: int | None = None
+        self._write_access: dict[int | None, bool] = {}
+
+    async def ingest(
+        self, documents: AsyncIterable[tuple[int, Any]]
+    ) -> BulkSubmissionResponse:
+        """
+        Validates and stores a stream of submission payloads.
+
+        Args:
+            documents (AsyncIterable[tuple[int, Any]]): Line numbers
+                and parsed payloads, as yielded by `iter_ndjson`.
+
+        Returns:
+            BulkSubmissionResponse: The per-row status report.
+        """
+        await self._init_column_required_column()
+        batch: list[BulkSubmissionRow] = []
+        async for line, document in documents:
+            batch.append(self._parse_row(line, document))
+            if len(batch) >= self.batch_size:
+                await self._process_batch(batch)
+                batch = []
+        if batch:
+            await self._process_batch(batch)
+
+        return self._get_response()
+
+    def _get_response(self) -> BulkSubmissionResponse:
+        """
+        The per-row status report of the rows processed so far.
+        """
+        created = sum(
+            1
+            for row_status in self.statuses
+            if row_status.status == BulkSubmissionRowStatusEnum.CREATED
+        )
+        return BulkSubmissionResponse(
+            total=len(self.statuses),
+            created=created,
+            failed=len(self.statuses) - created,
+            items=self.statuses,
+        )
+
+    @staticmethod
+    def _parse_row(line: int, document: Any) -> BulkSubmissionRow:
+        row = BulkSubmissionRow(line=line)
+        if isinstance(document, Exception):
+            row.fail({"global": f"Invalid JSON: {document}"})
+            return row
+        try:
+            row.submission = SubmissionCreate.model_validate(document)
+        except ValidationError as exc:
+            row.fail(
+                {
+                    ".".join(str(loc) for loc in error["loc"]): error["msg"]
+                    for error in exc.errors()
+                }
+            )
+
+        return row
+
+    async def _process_batch(self, batch: list[BulkSubmissionRow]) -> None:
+        """
+        Validates a batch of rows, then stores the valid ones in a single
+        transaction. A database error fails every row of the batch.
+        """
+        rows = [row for row in batch if not row.errors]
+        await self._resolve_nz_ids(rows)
+        await self._check_permissions(rows)
+        await self._check_duplicates(rows)
+        form_ids = await self._get_batch_form_ids(rows)
+        for row in rows:
+            if not row.errors:
+                await self._prepare_row(row, form_ids)
+        valid_rows = [row for row in rows if not row.errors]
+        if valid_rows:
+            try:
+                await self._insert_batch(valid_rows)
+                await self.session.commit()
+            except (SQLAlchemyError, HTTPException) as exc:
+                await self.session.rollback()
+                logger.error(
+                    "Bulk submissions batch failed",
+                    first_line=valid_rows[0].line,
+                    error=str(exc),
+                )
+                for row in valid_rows:
+                    row.submission_obj = None
+                    row.fail(
+                        {"global": f"Could not store submissions batch: {exc}"}
+                    )
+            else:
+                await self.redis_cache.invalidate_submissions(
+                    (row.submission_obj.id, row.submission_obj.nz_id)
+                    for row in valid_rows
+                    if not row.errors
+                )
+
+        self.statuses.extend(row.status for row in batch)
+
+    async def _get_user_nz_id(self) -> int | None:
+        if self._user_nz_id is None:
+            self._user_nz_id = await self.session.scalar(
+                select(Organization.nz_id).where(
+                    Organization.id == self.current_user.organization_id
+                )
+            )
+        return self._user_nz_id
+
+    async def _resolve_nz_ids(self, rows: list[BulkSubmissionRow]) -> None:
+        """
+        Sets the `nz_id` of every row, as the single submission API
+        does, looking up all the LEIs of the batch in one query.
+        """
+        is_admin = AccessManager.is_admin(self.current_user)
+        for row in rows:
+            submission = row.submission
+            if is_admin and "legal_entity_identifier" in submission.values:
+                continue
+            user_nz_id = await self._get_user_nz_id()
+            if not user_nz_id:
+                row.fail({"lei": "No nz_id for the associated user!"})
+            elif not submission.nz_id:
+                submission.nz_id = user_nz_id
+
+        missing = [
+            row
+            for row in rows
+            if not row.errors and row.submission.nz_id is None
+        ]
+        if not missing:
+            return
+        leis = {
+            row.submission.values.get("legal_entity_identifier")
+            for row in missing
+        }
+        nz_ids_by_lei = dict(
+            (
+                await self.session.execute(
+                    select(Organization.lei, Organization.nz_id).where(
+                        Organization.lei.in_(leis)
+                    )
+                )
+            ).all()
+        )
+        for row in missing:
+            lei = row.submission.values.get("legal_entity_identifier")
+            if lei not in nz_ids_by_lei:
+                row.fail(
+                    {
+                        "legal_entity_identifier": (
+                            "Organization does not exist for this legal"
+                            " entity identifier."
+                        )
+                    }
+                )
+                continue
+            row.submission.nz_id = nz_ids_by_lei[lei]
+
+    async def _check_permissions(self, rows: list[BulkSubmissionRow]) -> None:
+        """
+        Checks permission sets exist and grant write access, once per
+        permission set for the whole batch.
+        """
+        set_ids = {
+            row.submission.permissions_set_id
+            for row in rows
+            if not row.errors and row.submission.permissions_set_id is not None
+        }
+        existing_set_ids = set()
+        if set_ids:
+            existing_set_ids = set(
+                await self.session.scalars(
+                    select(Permission.set_id)
+                    .where(Permission.set_id.in_(set_ids))
+                    .distinct()
+                )
+            )
+        access_manager = AccessManager(self.session)
+        for row in rows:
+            if row.errors:
+                continue
+            set_id = row.submission.permissions_set_id
+            if set_id is not None and set_id not in existing_set_ids:
+                row.fail(
+                    {
+                        "submission.permissions_set_id": (
+                            "Invalid permission_set_id, select existent"
+                            " permission_set_id"
+                        )
+                    }
+                )
+                continue
+            if set_id not in self._write_access:
+                self._write_access[set_id] = (
+                    await access_manager.can_read_write(
+                        entity=row.submission,
+                        user=self.current_user,
+                        access_type=AccessType.WRITE,
+                    )
+                )
+            if not self._write_access[set_id]:
+                row.fail({"global": SubmissionError.SUBMISSION_CANT_WRITE})
+
+    async def _check_duplicates(self, rows: list[BulkSubmissionRow]) -> None:
+        """
+        Batched version of `check_duplicate_submission`: a single query
+        for all the companies and reporting years of the batch, plus
+        duplicates within the batch itself.
+        """
+        rows_by_key: dict[tuple[int, int], list[BulkSubmissionRow]] = {}
+        for row in rows:
+            if row.errors:
+                continue
+            reporting_year = row.submission.values.get(
+                FormMeta.f_reporting_year
+            )
+            if reporting_year:
+                rows_by_key.setdefault(
+                    (row.submission.nz_id, reporting_year), []
+                ).append(row)
+        if not rows_by_key:
+            return
+
+        f = await self.static_cache.get_form_table()
+        result = await self.session.execute(
+            select(SubmissionObj.nz_id, f.c[FormMeta.f_reporting_year])
+            .join(SubmissionObj, f.c[FormMeta.f_obj_id] == SubmissionObj.id)
+            .where(
+                tuple_(
+                    SubmissionObj.nz_id, f.c[FormMeta.f_reporting_year]
+                ).in_(list(rows_by_key))
+            )
+        )
+        existing_keys = {tuple(key) for key in result.all()}
+        for key, key_rows in rows_by_key.items():
+            duplicates = key_rows if key in existing_keys else key_rows[1:]
+            for row in duplicates:
+                row.fail(
+                    {"submissions": SubmissionError.SUBMISSION_ALREADY_EXISTS}
+                )
+
+    async def _get_batch_form_ids(
+        self, rows: list[BulkSubmissionRow]
+    ) -> dict[int, int]:
+        """
+        Next available form ID for every table view used in the batch.
+        Sub-form rows are always loaded by `obj_id`, so submissions of
+        the same batch can safely share the starting form ID.
+        """
+        table_views = await self.static_cache.table_views()
+        form_ids = {}
+        for row in rows:
+            table_view_id = row.submission.table_view_id
+            if row.errors or table_view_id in form_ids:
+                continue
+            table_view = table_views.get(table_view_id)
+            if table_view is None:
+                continue
+            form_ids[table_view_id] = await self._get_max_form_type_ids(
+                table_view.table_def.name, table_view.table_def.columns
+            )
+
+        return form_ids
+
+    async def _prepare_row(
+        self, row: BulkSubmissionRow, form_ids: dict[int, int]
+    ) -> None:
+        """
+        Validates a row against the schema and its constraints and
+        builds its form rows, from the static cache only.
+        """
+        submission = row.submission
+        table_views = await self.static_cache.table_views()
+        table_view = table_views.get(submission.table_view_id)
+        if table_view is None:
+            row.fail({"table_view_id": "Table view not found."})
+            return
+        if not table_view.active:
+            row.fail(
+                {
+                    "submission.table_view_id": (
+                        "Cannot accept a submission on a non-active view."
+                    )
+                }
+            )
+            return
+        row.table_view = table_view
+
+        invalid_attributes = await ValidatorService(
+            static_cache=self.static_cache
+        ).validate_submission_values(submission.values)
+        if invalid_attributes:
+            row.fail(
+                {
+                    "error": (
+                        "The following attributes are not valid"
+                        " attributes from schema:"
+                        f" {', '.join(invalid_attributes)}"
+                    )
+                }
+            )
+            return
+
+        # make sure we have consistent data_source across all
+        # submission data
+        data_source = submission.data_source or submission.values.get(
+            "disclosure_source"
+        )
+        submission.data_source = data_source
+        submission.values["disclosure_source"] = data_source
+
+        if not set(submission.values.keys()) - {
+            "legal_entity_identifier",
+            "disclosure_source",
+        }:
+            # empty submission, nothing to insert in forms
+            return
+
+        # every row tracks its own required fields
+        row_manager = SubmissionManager(
+            self.session, self.static_cache, self.redis_cache
+        )
+        row_manager.columns_by_name_required_constraint_value = (
+            self.columns_by_name_required_constraint_value
+        )
+        try:
+            # obj_id is set once the submission object is inserted
+            row.values_to_insert = await row_manager._create_insert_data(
+                submission_id=0,
+                form_name=table_view.table_def.name,
+                form_id=form_ids[submission.table_view_id],
+                values=submission.values,
+            )
+            await row_manager._verify_required_missing_fields()
+        except HTTPException as exc:
+            row.fail(
+                exc.detail
+                if isinstance(exc.detail, dict)
+                else {"global": exc.detail}
+            )
+        except ConstraintValidationException as exc:
+            row.fail({exc.column_name: exc.message})
+
+    async def _generate_submission_names(
+        self, form_names: list[str]
+    ) -> list[str]:
+        """
+        Batched version of `_generate_submission_name`.
+        """
+        # pylint: disable = not-callable
+        last_submission_id = await self.session.scalar(
+            select(func.max(SubmissionObj.id))
+        )
+        if last_submission_id is not None:
+            last_submission_id += 1
+        else:
+            last_submission_id = 0
+        return [
+            f"NZDPU-{form_name}-{last_submission_id + i}-{time_ns()}"
+            f"-{random.choice(string.ascii_uppercase)}"
+            for i, form_name in enumerate(form_names)
+        ]
+
+    def _get_loaded_row(
+        self,
+        form_table: Table,
+        row: dict[str, Any],
+        row_id: int,
+        column_defs: dict[str, ColumnDef],
+    ) -> dict[str, Any]:
+        """
+        Converts an inserted row to the row `FormBatchLoader` would
+        fetch from the database for it.
+        """
+        loaded = {column.name: None for column in form_table.columns}
+        for k, v in row.items():
+            sql_type, v = self._get_typed_value(k, v, column_defs)
+            composite_type = COMPOSITE_TYPES_BY_SQL_TYPE.get(sql_type)
+            if composite_type:
+                v, state = self._cast_null_type_value(k, v, composite_type)
+                if state:
+                    v = NullTypeState(state)
+            loaded[k] = v
+        loaded[FormMeta.f_id] = row_id
+
+        return loaded
+
+    async def _insert_form_rows(
+        self, rows: list[BulkSubmissionRow]
+    ) -> dict[int, dict[str, list[dict[str, Any]]]]:
+        """
+        Inserts the form rows of a batch with multi-row statements, one
+        per table and set of columns.
+
+        Returns:
+            dict[int, dict[str, list[dict[str, Any]]]]: The inserted
+                rows as loaded from the database, by submission ID and
+                table name.
+        """
+        column_defs = await self.static_cache.column_defs_by_name()
+        rows_by_table: dict[tuple[str, tuple[str, ...]], list[dict]] = {}
+        for row in rows:
+            for table in row.values_to_insert:
+                for form_name, form_rows in table.items():
+                    for form_row in form_rows:
+                        form_row[FormMeta.f_obj_id] = row.submission_obj.id
+                        rows_by_table.setdefault(
+                            (form_name, tuple(form_row)), []
+                        ).append(form_row)
+
+        loaded_rows: dict[int, dict[str, list[dict[str, Any]]]] = {}
+        for (form_name, _), form_rows in rows_by_table.items():
+            form_table = await self.static_cache.get_form_table(form_name)
+            for start in range(0, len(form_rows), self.insert_chunk_size):
+                chunk = form_rows[start : start + self.insert_chunk_size]
+                stmt = (
+                    insert(form_table)
+                    .values(
+                        [
+                            self._get_insert_params(
+                                form_row, column_defs, suffix=f"_{i}"
+                            )
+                            for i, form_row in enumerate(chunk)
+                        ]
+                    )
+                    .returning(form_table.c[FormMeta.f_id])
+                )
+                row_ids = (await self.session.scalars(stmt)).all()
+                for form_row, row_id in zip(chunk, row_ids):
+                    loaded_rows.setdefault(
+                        form_row[FormMeta.f_obj_id], {}
+                    ).setdefault(form_name, []).append(
+                        self._get_loaded_row(
+                            form_table, form_row, row_id, column_defs
+                        )
+                    )
+
+        return loaded_rows
+
+    async def _build_aggregate(
+        self,
+        row: BulkSubmissionRow,
+        loaded_rows: dict[str, list[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """
+        Builds the aggregate of a new submission from its in-memory
+        rows, ordered as `FormBatchLoader` would return them.
+        """
+        table_defs = await self.static_cache.table_defs()
+        primary_table_def = row.table_view.table_def
+        form_rows = {}
+        for table_def in [
+            primary_table_def
+        ] + FormBatchLoader.collect_subform_table_defs(
+            primary_table_def, table_defs
+        ):
+            table_name = FormBatchLoader.get_form_table_name(table_def)
+            table_rows = loaded_rows.get(table_name, [])
+            table_rows.sort(key=lambda r: r[FormMeta.f_id])
+            if table_def.heritable:
+                table_rows.sort(
+                    key=lambda r: r[FormMeta.f_value_id], reverse=True
+                )
+            form_rows[table_name] = table_rows
+
+        form_manager = FormValuesGetter(
+            self.static_cache,
+            self.redis_cache,
+            form_rows=form_rows,
+            primary_form=primary_table_def,
+        )
+        submission_values, submission_units = await form_manager.get_values()
+        row.submission_obj.values = {}
+        submission = SubmissionGet.model_validate(row.submission_obj)
+        submission.values = submission_values[0] if submission_values else {}
+        submission.units = submission_units[0] if submission_units else {}
+
+        return submission.model_dump(mode="json")
+
+    def _get_submission_obj_params(
+        self, row: BulkSubmissionRow, name: str, now: datetime
+    ) -> dict[str, Any]:
+        """
+        Insert parameters of the submission object of a row.
+        """
+        submission = row.submission
+        empty = not row.values_to_insert
+        return {
+            "table_view_id": submission.table_view_id,
+            "name": name,
+            "revision": submission.revision,
+            "data_source": submission.data_source,
+            "lei": submission.values.get("legal_entity_identifier"),
+            "nz_id": submission.nz_id,
+            "submitted_by": self.current_user.id,
+            "permissions_set_id": submission.permissions_set_id,
+            "status": SubmissionObjStatusEnum.DRAFT,
+            # empty submissions are checked out, as in `create`
+            "user_id": self.current_user.id if empty else None,
+            "checked_out": empty,
+            "checked_out_on": now if empty else None,
+        }
+
+    async def _insert_batch(self, rows: list[BulkSubmissionRow]) -> None:
+        """
+        Inserts submission objects, form rows and aggregates for a batch
+        of validated rows. The caller owns the transaction.
+        """
+        names = await self._generate_submission_names(
+            [row.table_view.table_def.name for row in rows]
+        )
+        now = datetime.now()
+        obj_params = [
+            self._get_submission_obj_params(row, name, now)
+            for row, name in zip(rows, names)
+        ]
+        submission_objs = (
+            await self.session.scalars(
+                insert(SubmissionObj).returning(
+                    SubmissionObj, sort_by_parameter_order=True
+                ),
+                obj_params,
+            )
+        ).all()
+        for row, submission_obj in zip(rows, submission_objs):
+            row.submission_obj = submission_obj
+
+        loaded_rows = await self._insert_form_rows(rows)
+
+        aggregates = []
+        for row in rows:
+            aggregate_data = await self._build_aggregate(
+                row, loaded_rows.get(row.submission_obj.id, {})
+            )
+            aggregates.append(
+                {
+                    "obj_id": row.submission_obj.id,
+                    "data": aggregate_data,
+                    "content_hash": content_hash(aggregate_data),
+                }
+            )
+        await self.session.execute(insert(AggregatedObjectView), aggregates)
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 import orjson
 from fastapi import HTTPException, status
@@ -8,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.redis import RedisClient
 from app.schemas.restatements import AttributePathsModel
 from app.service.core.cache import CoreMemoryCache
+from app.service.core.projection import FieldTree
+from app.service.core.utils import strip_none
 from app.utils import convert_keys_to_str
 
 
@@ -233,106 +235,133 @@ class GetterMixin(CacheMixin, SessionMixin):
     def _strip_fields(
         cls,
         obj: dict,
-        paths: list[AttributePathsModel],
+        paths: list[AttributePathsModel] | FieldTree,
         raise_exception: bool = True,
         export: bool = False,
     ) -> dict:
-        converted_obj = convert_keys_to_str(obj)
-        stripped: dict[str, list | Any] = orjson.loads(
-            orjson.dumps(converted_obj)
+        """
+        Keeps only the requested fields of a dict of submission values.
+
+        The result is built in a single pass over the top-level keys of
+        the values: attributes kept whole are copied through JSON, like
+        the response they end up in, and form rows are projected on the
+        requested attributes, without copying the rest of the values.
+
+        Args:
+            obj (dict): The submission values.
+            paths (list[AttributePathsModel] | FieldTree): The requested
+                paths, preferably compiled once for all rows.
+            raise_exception (bool, optional): Whether to raise if a
+                choice row is missing. Defaults to True.
+            export (bool, optional): Whether to keep the indexed row when
+                a choice row is missing. Defaults to False.
+
+        Returns:
+            dict: The stripped values.
+        """
+        tree = (
+            paths
+            if isinstance(paths, FieldTree)
+            else FieldTree.from_paths(paths)
         )
+        stripped: dict[str, list | Any] = {}
+        kept: dict[str, Any] = {}
         for k, v in obj.items():
-            if k in [path.attribute for path in paths]:
-                # key is wanted attribute: don't strip
+            if k in tree.attributes:
+                # key is wanted attribute: keep its place, copy it below
+                stripped[str(k)] = kept[str(k)] = v
                 continue
-            if k not in [path.form for path in paths] or v is None:
-                del stripped[k]
-            else:
-                stripped[k] = []
-                form_paths = [path for path in paths if path.form == k]
-                for this_path in form_paths:
-                    if this_path.choice.value:
-                        choice_row_index = cls._get_choice_index(
-                            path=this_path,
-                            values=obj,
-                            raise_exception=raise_exception,
-                        )
-                        if export:
-                            if choice_row_index is None:
-                                choice_row_index = this_path.choice.index
-                    else:
+            groups = tree.forms.get(k)
+            if groups is None or v is None:
+                continue
+            rows = []
+            for group in groups:
+                this_path = group.path
+                if this_path.choice.value:
+                    choice_row_index = cls._get_choice_index(
+                        path=this_path,
+                        values=obj,
+                        raise_exception=raise_exception,
+                    )
+                    if export and choice_row_index is None:
                         choice_row_index = this_path.choice.index
-                    values = None
-                    if this_path.sub_path and (choice_row_index is not None):
-                        # values = {}
-                        values = cls._strip_fields(
-                            obj=v[choice_row_index],
-                            paths=[
-                                paths.pop(paths.index(path)).sub_path
-                                for path in form_paths
-                                if path in paths
-                                and path.sub_path
-                                and this_path.choice == path.choice
-                            ],  # type: ignore
-                            export=export,
-                        )
-                        if values:
-                            values[this_path.choice.field] = (
-                                this_path.choice.value
-                            )
-                    elif choice_row_index is not None:
-                        values = {}
-                        for path in [
-                            # remove from paths so we don't come here again
-                            paths.pop(paths.index(path))
-                            # only consider paths of this "form"
-                            for path in form_paths
-                            # cover case in which path in form_paths
-                            # but not in paths
-                            if path in paths
-                            # choice is the same
-                            and this_path.choice == path.choice
-                        ]:
-                            values[path.attribute] = v[choice_row_index].get(
-                                path.attribute, None
-                            )
-                            if path.choice.field:
-                                values[path.choice.field] = path.choice.value
+                else:
+                    choice_row_index = this_path.choice.index
+                if choice_row_index is None:
+                    continue
+                if group.sub_tree is not None:
+                    values = cls._strip_fields(
+                        obj=v[choice_row_index],
+                        paths=group.sub_tree,
+                        export=export,
+                    )
                     if values:
-                        stripped[k].append(values)
-
-                # if no values were appended (there are no requested
-                # fields in the sub-forms), remove the key
-                if not stripped.get(k, []):
-                    del stripped[k]
+                        values[this_path.choice.field] = this_path.choice.value
+                else:
+                    values = {}
+                    for path in group.attributes:
+                        values[path.attribute] = v[choice_row_index].get(
+                            path.attribute, None
+                        )
+                        if path.choice.field:
+                            values[path.choice.field] = path.choice.value
+                if values:
+                    rows.append(values)
+
+            # if no values were appended (there are no requested
+            # fields in the sub-forms), leave the key out
+            if rows:
+                stripped[k] = rows
+        if kept:
+            # updating existing keys keeps their order
+            stripped.update(
+                orjson.loads(orjson.dumps(convert_keys_to_str(kept)))
+            )
         return stripped
 
-    async def _get_restatement_row(
-        self,
-        submission_id: int,
-        path: AttributePathsModel,
-    ) -> int:
+    @classmethod
+    def project_values(
+        cls,
+        obj: dict,
+        tree: FieldTree,
+        raise_exception: bool = True,
+        export: bool = False,
+    ) -> dict:
         """
-        Returns the exact ID in the DB for the requested row.
+        Projects a dict of submission values on a search's fields, or
+        strips its null values if the search requested no fields.
 
         Args:
-            submission_id (int): The submission's ID.
-            path (AttributePathsModel): The path object.
+            obj (dict): The submission values.
+            tree (FieldTree): The compiled fields of the search.
+            raise_exception (bool, optional): Whether to raise if a
+                choice row is missing. Defaults to True.
+            export (bool, optional): Whether to keep the indexed row when
+                a choice row is missing. Defaults to False.
+
+        Returns:
+            dict: The projected values.
+        """
+        if not tree:
+            return strip_none(obj)
+        return cls._strip_fields(
+            obj, tree, raise_exception=raise_exception, export=export
+        )
+
+    async def _restatement_form_name(self, path: AttributePathsModel) -> str:
+        """
+        Returns the name of the form table holding the row of a path
+        section, considering inheritance.
+
+        Args:
+            path (AttributePathsModel): The path section.
 
         Raises:
             HTTPException: If no column definition is found for the attribute.
-            HTTPException: If no rows are found.
-            HTTPException: If no row with the specified index is found.
 
         Returns:
-            int: The row ID from the database.
+            str: The form table name.
         """
-        # Recurse if path has sub-paths
-        if path.sub_path is not None:
-            path.sub_path.row_id = await self._get_restatement_row(
-                submission_id=submission_id,
-                path=path.sub_path,
-            )
         columns = await self.static_cache.column_defs_by_name()
         if path.attribute not in columns:
             raise HTTPException(
@@ -343,44 +372,67 @@ class GetterMixin(CacheMixin, SessionMixin):
                     )
                 },
             )
-        column = columns[path.attribute]
-        table_def = column.table_def
+        table_def = columns[path.attribute].table_def
         if path.form:
             column = columns[path.form]
             table_defs = await self.static_cache.table_defs()
             table_def = table_defs[column.attribute_type_id]
 
-        # Determine the form name, considering inheritance
         form_name = table_def.name
         if table_def.heritable:
             form_name += "_heritable"
+        return form_name
 
-        # Build the SQLAlchemy query
+    async def _load_restatement_rows(
+        self,
+        submission_id: int,
+        form_name: str,
+        choice_fields: set[str],
+    ) -> list[dict]:
+        """
+        Loads the IDs and choice fields of the rows of a submission in a
+        form table, in the same order as `FormBatchLoader`.
+        """
         form_table = await self.static_cache.get_form_table(form_name)
+        stmt = select(
+            form_table.c.id,
+            *[form_table.c[field] for field in sorted(choice_fields)],
+        ).where(form_table.c.obj_id == submission_id)
+        if form_name.endswith("_heritable"):
+            stmt = stmt.order_by(form_table.c.value_id.desc(), form_table.c.id)
+        else:
+            stmt = stmt.order_by(form_table.c.id)
+        return [row._asdict() for row in await self.session.execute(stmt)]
+
+    @staticmethod
+    def _pick_restatement_row(
+        path: AttributePathsModel, form_name: str, rows: list[dict]
+    ) -> int:
+        """
+        Returns the ID of the row of a path section, among the rows of
+        its form table.
 
-        stmt = select(form_table.c.id).where(
-            form_table.c.obj_id == submission_id
-        )
+        Args:
+            path (AttributePathsModel): The path section.
+            form_name (str): The form table name.
+            rows (list[dict]): The submission's rows in the form table.
 
-        if path.choice.value:  # add choice filter
-            stmt = stmt.where(
-                form_table.c[path.choice.field] == path.choice.value
-            )
+        Raises:
+            HTTPException: If no rows are found.
+            HTTPException: If no row with the specified index is found.
 
-        # Execute the query asynchronously
-        rows = await self.session.scalars(
-            stmt,
-            {
-                "submission_id": submission_id,
-                "choice_value": (
-                    path.choice.value if path.choice.value else None
-                ),
-            },
-        )
-        rows = rows.all()
+        Returns:
+            int: The row ID from the database.
+        """
+        row_ids = [
+            row["id"]
+            for row in rows
+            if not path.choice.value
+            or row.get(path.choice.field) == path.choice.value
+        ]
 
         # Consistency checks
-        if not rows:
+        if not row_ids:
             error_message = (
                 "Cannot create revision on an empty submission attribute"
                 f" '{path.attribute}'. Use update submission API instead."
@@ -397,7 +449,7 @@ class GetterMixin(CacheMixin, SessionMixin):
                 detail={"restatements": error_message},
             )
 
-        if len(rows) < path.choice.index:
+        if len(row_ids) <= path.choice.index:
             error_message = (
                 f"No row with index '{path.choice.index}' for table"
                 f" '{form_name}'"
@@ -412,7 +464,73 @@ class GetterMixin(CacheMixin, SessionMixin):
                 detail={"restatements": error_message},
             )
 
-        return rows[path.choice.index]
+        return row_ids[path.choice.index]
+
+    async def resolve_restatement_paths(
+        self,
+        submission_id: int,
+        restatement_paths: Iterable[str],
+        form_rows: dict[str, list[dict]] | None = None,
+    ) -> dict[str, AttributePathsModel]:
+        """
+        Unpacks the restatement paths of a submission, and gets the row
+        IDs of all their sections at once.
+
+        Rows are looked up in `form_rows` when given, i.e. the rows of
+        the submission by form table as loaded by `FormBatchLoader`; the
+        rows of other form tables are loaded with one query per table.
+
+        Args:
+            submission_id (int): The submission ID.
+            restatement_paths (Iterable[str]): The restatement paths as
+                strings.
+            form_rows (dict[str, list[dict]] | None, optional): The
+                submission's rows by form table. Defaults to None.
+
+        Raises:
+            HTTPException: If no column definition is found for an
+                attribute, or no row is found for a path section.
+
+        Returns:
+            dict[str, AttributePathsModel]: The restatement paths as
+                AttributePathsModel objects, by restatement path.
+        """
+        paths = {
+            restatement_path: AttributePathsModel.unpack_field_path(
+                field_path=restatement_path
+            )
+            for restatement_path in restatement_paths
+        }
+        sections: list[tuple[AttributePathsModel, str]] = []
+        for path in paths.values():
+            section = path
+            while section is not None:
+                sections.append(
+                    (section, await self._restatement_form_name(section))
+                )
+                section = section.sub_path
+
+        rows_by_form = dict(form_rows or {})
+        choice_fields: dict[str, set[str]] = {}
+        for section, form_name in sections:
+            if form_name in rows_by_form:
+                continue
+            fields = choice_fields.setdefault(form_name, set())
+            if section.choice.value:
+                fields.add(section.choice.field)
+        for form_name, fields in choice_fields.items():
+            rows_by_form[form_name] = await self._load_restatement_rows(
+                submission_id=submission_id,
+                form_name=form_name,
+                choice_fields=fields,
+            )
+
+        for section, form_name in sections:
+            section.row_id = self._pick_restatement_row(
+                path=section, form_name=form_name, rows=rows_by_form[form_name]
+            )
+
+        return paths
 
     async def _unpack_restatement_path(
         self,
@@ -432,15 +550,12 @@ class GetterMixin(CacheMixin, SessionMixin):
             AttributePathsModel: The restatement path as an
                 AttributePathsModel object.
         """
-        path = AttributePathsModel.unpack_field_path(
-            field_path=restatement_path
-        )
-        path.row_id = await self._get_restatement_row(
+        paths = await self.resolve_restatement_paths(
             submission_id=submission_id,
-            path=path,
+            restatement_paths=[restatement_path],
         )
 
-        return path
+        return paths[restatement_path]
 
     async def unpack_restatement_path_for_restated_col(
         self,
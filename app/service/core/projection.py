@@ -0,0 +1,130 @@
+"""
+Field trees of the submission values requested by a search.
+
+`GetterMixin._strip_fields` keeps only the requested fields of every
+result's values. Grouping the requested paths by form and choice only
+depends on the paths, so it is done once per set of fields, in a
+`FieldTree`: a trie of the kept keys and of the choice filters selecting
+form rows, which `GetterMixin.project_values` applies to every row in a
+single traversal.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable
+
+from app.schemas.restatements import AttributePathsModel
+
+# max distinct sets of search fields kept compiled
+FIELD_TREE_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class FormGroup:
+    """
+    Paths to the same row of a form.
+
+    Attributes:
+        path (AttributePathsModel): The first path of the group, holding
+            the form and choice which identify the row.
+        attributes (tuple[AttributePathsModel, ...]): The paths of the
+            attributes to keep from the row.
+        sub_tree (FieldTree | None): The fields to keep from the row, if
+            the group's paths go through sub-forms.
+    """
+
+    path: AttributePathsModel
+    attributes: tuple[AttributePathsModel, ...] = ()
+    sub_tree: "FieldTree | None" = None
+
+
+@dataclass(frozen=True)
+class FieldTree:
+    """
+    The fields to keep from a dict of submission values.
+
+    Attributes:
+        attributes (frozenset[str]): Keys whose values are kept whole.
+        forms (dict[str, tuple[FormGroup, ...]]): The rows to keep of
+            each form, in order.
+    """
+
+    attributes: frozenset[str] = frozenset()
+    forms: dict[str, tuple[FormGroup, ...]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """
+        Whether the tree keeps any field: searches without fields only
+        strip the null values of their results.
+        """
+        return bool(self.attributes or self.forms)
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[AttributePathsModel]) -> "FieldTree":
+        """
+        Compiles the tree of a list of paths.
+
+        Paths to the same row of a form are grouped in the order they
+        come in: the first path of a group tells whether the row is
+        projected on its attributes, or on the sub-paths of the group.
+
+        Args:
+            paths (Iterable[AttributePathsModel]): The requested paths.
+
+        Returns:
+            FieldTree: The compiled tree.
+        """
+        paths = list(paths)
+        remaining = list(paths)
+        forms: dict[str, tuple[FormGroup, ...]] = {}
+        for form in dict.fromkeys(path.form for path in paths if path.form):
+            form_paths = [path for path in paths if path.form == form]
+            groups = []
+            for this_path in form_paths:
+                members = [
+                    # remove from paths so they are in a single group
+                    remaining.pop(remaining.index(path))
+                    for path in form_paths
+                    if path in remaining
+                    and this_path.choice == path.choice
+                    and (path.sub_path or not this_path.sub_path)
+                ]
+                if not members:
+                    continue
+                if this_path.sub_path:
+                    groups.append(
+                        FormGroup(
+                            path=this_path,
+                            sub_tree=cls.from_paths(
+                                member.sub_path for member in members
+                            ),
+                        )
+                    )
+                else:
+                    groups.append(
+                        FormGroup(path=this_path, attributes=tuple(members))
+                    )
+            forms[form] = tuple(groups)
+        return cls(
+            attributes=frozenset(path.attribute for path in paths),
+            forms=forms,
+        )
+
+
+@lru_cache(maxsize=FIELD_TREE_CACHE_SIZE)
+def compile_fields(fields: tuple[str, ...]) -> FieldTree:
+    """
+    Returns the compiled tree of a search's fields.
+
+    Args:
+        fields (tuple[str, ...]): The field paths, see
+            `AttributePathsModel.unpack_field_path`.
+
+    Returns:
+        FieldTree: The compiled tree, shared by callers with the same
+            fields.
+    """
+    return FieldTree.from_paths(
+        AttributePathsModel.parse_field_path(field_path)
+        for field_path in fields
+    )
@@ -8,6 +8,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import UnaryExpression, and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.database import adhoc_sessions
 from app.db.models import (
     AggregatedObjectView,
     ColumnDef,
@@ -24,6 +25,7 @@ from app.service.core.cache import CoreMemoryCache
 from app.service.core.concurrency import BatchMixin
 from app.service.core.loaders import SubmissionLoader
 from app.service.core.mixins import CacheMixin, SessionMixin
+from app.service.core.projection import FieldTree, compile_fields
 
 
 class QueryDSLTransformer(SessionMixin, CacheMixin):
@@ -278,7 +280,7 @@ class QueryDSLTransformer(SessionMixin, CacheMixin):
         for sort in self.query.sort:
             if isinstance(sort, dict):
                 sort_field, values = list(sort.items())[0]
-                path = AttributePathsModel.unpack_field_path(sort_field)
+                path = AttributePathsModel.parse_field_path(sort_field)
                 order = values.order.upper()
                 columns = await self.static_cache.column_defs_by_name()
                 column = columns.get(path.attribute)
@@ -322,6 +324,8 @@ class SubmissionFinder(SessionMixin, CacheMixin, BatchMixin):
         self.transformer = transformer
         self.export = export
         self.get_restated_columns = get_restated_columns
+        # the requested fields of every result, compiled once
+        self.field_tree = compile_fields(tuple(transformer.query.fields))
 
     async def search(self):
         search_query = await self.transformer.transform()
@@ -365,70 +369,44 @@ class SubmissionFinder(SessionMixin, CacheMixin, BatchMixin):
         restated_fields_data_source = await self.get_restated_list(
             submission_name=submission.name
         )
-        for restated, value in restated_fields_data_source.items():
-            if not restated.endswith("scope_1_greenhouse_gas"):
-                path = await loader.unpack_restatement_path_for_restated_col(
-                    submission_id=submission.id,
-                    restatement_path=restated,
-                )
-                self.update_restated_columns(
-                    loader=loader,
-                    path=path,
-                    values=submission.values,
-                    value=value,
-                )
+        paths = await loader.resolve_restatement_paths(
+            submission_id=submission.id,
+            restatement_paths=[
+                restated
+                for restated in restated_fields_data_source
+                if not restated.endswith("scope_1_greenhouse_gas")
+            ],
+        )
+        for restated, path in paths.items():
+            self.update_restated_columns(
+                loader=loader,
+                path=path,
+                values=submission.values,
+                value=restated_fields_data_source[restated],
+            )
 
     async def prepare_for_export(
         self,
         loader: SubmissionLoader,
         submission: SubmissionGet,
-        paths: List[AttributePathsModel] | None = None,
+        field_tree: FieldTree | None = None,
     ) -> None:
         if self.get_restated_columns:
             await self.set_restatements(loader, submission)
         else:
-            await self.set_null_values(loader, submission, paths)
-
-    def strip_none(self, data: Any) -> Any:
-        """
-        Recursively strips None valued fields from a nested Python dict.
-
-        Args:
-            data (dict): A nested Python dictionary.
-
-        Returns:
-            dict: The Python dict, stripped of None valued fields.
-        """
-        if isinstance(data, dict):
-            return {
-                k: self.strip_none(v)
-                for k, v in data.items()
-                if k is not None
-                and v is not None
-                and k not in ["id", "obj_id", "value_id"]
-            }
-        if isinstance(data, list):
-            return [self.strip_none(item) for item in data if item is not None]
-        if isinstance(data, tuple):
-            return tuple(
-                self.strip_none(item) for item in data if item is not None
-            )
-        if isinstance(data, set):
-            return {self.strip_none(item) for item in data if item is not None}
-        return data
+            await self.set_null_values(loader, submission, field_tree)
 
     async def set_null_values(
         self,
         loader: SubmissionLoader,
         submission: SubmissionGet,
-        paths: list[AttributePathsModel] | None = None,
+        field_tree: FieldTree | None = None,
     ) -> None:
-        if self.transformer.query.fields:
-            submission.values = loader._strip_fields(
-                submission.values, paths, raise_exception=False
-            )
-        else:
-            submission.values = self.strip_none(submission.values)
+        submission.values = loader.project_values(
+            submission.values,
+            field_tree if field_tree is not None else self.field_tree,
+            raise_exception=False,
+        )
 
     async def prepare_submission(
         self,
@@ -436,11 +414,7 @@ class SubmissionFinder(SessionMixin, CacheMixin, BatchMixin):
         submission: SubmissionGet,
         loader: SubmissionLoader,
     ) -> SubmissionGet:
-        paths = [
-            AttributePathsModel.unpack_field_path(field)
-            for field in self.transformer.query.fields
-        ]
-        await self.prepare_for_export(loader, submission, paths)
+        await self.prepare_for_export(loader, submission, self.field_tree)
         fields_to_add = set(self.transformer.meta.keys()) | {
             "legal_name",
             "lei",
@@ -468,7 +442,7 @@ class SubmissionFinder(SessionMixin, CacheMixin, BatchMixin):
     ) -> List[SubmissionGet]:
         results = []
         for search_result in batch_list:
-            async with AsyncSession(self.session.bind) as session:
+            async with adhoc_sessions.session(self.session.bind) as session:
                 loader = SubmissionLoader(
                     session, self.static_cache, self.redis_cache
                 )
@@ -0,0 +1,181 @@
+"""
+Units of submission values.
+
+The unit of an attribute is set by the first action of its column's
+constraint, and is either fixed, or a template naming the attributes
+which hold it: `{tgt_int_units}`, or
+`{tgt_phys_int_units_numerator} / {tgt_phys_int_units_denom}`. The
+templates only depend on the schema, so the static cache extracts them
+once when it loads, and `UnitResolver` resolves them against the form
+rows of a submission which are already loaded, without querying the
+database.
+"""
+
+from functools import lru_cache
+from string import Formatter
+from typing import Any
+
+from app.db.models import Choice, ColumnDef
+from app.db.types import NullTypeState
+
+# max distinct unit templates kept parsed
+UNIT_TEMPLATE_CACHE_SIZE = 1024
+# choice of the attributes holding a unit which is given as free text,
+# in their `<attribute>_other` attribute
+OTHER_CHOICE_VALUE = "Other not listed"
+
+
+def column_unit_template(column: ColumnDef) -> str | None:
+    """
+    Returns the unit template set by the constraint of a column.
+
+    Args:
+        column (ColumnDef): The column definition, with its views.
+
+    Returns:
+        str | None: The unit template, or None if the column has no
+            unit.
+    """
+    if not column.views or not column.views[0].constraint_value:
+        return None
+    try:
+        units = column.views[0].constraint_value[0]["actions"][0]["set"][
+            "units"
+        ]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return units or None
+
+
+@lru_cache(maxsize=UNIT_TEMPLATE_CACHE_SIZE)
+def parse_unit_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """
+    Parses a unit template in its literal text and attribute names.
+
+    Args:
+        template (str): The unit template.
+
+    Returns:
+        tuple[tuple[str, str | None], ...]: The literal text before each
+            attribute name, and the name, None after the last one.
+            Malformed templates are literal text.
+    """
+    try:
+        return tuple(
+            (literal, field_name)
+            for literal, field_name, _, _ in Formatter().parse(template)
+        )
+    except ValueError:
+        return ((template, None),)
+
+
+class UnitResolver:
+    """
+    Resolves the units of submission values from the values of their
+    row, or of its parent rows.
+    """
+
+    def __init__(
+        self, unit_templates: dict[str, str], choices: dict[int, Choice]
+    ):
+        """
+        Inits the resolver.
+
+        Args:
+            unit_templates (dict[str, str]): The unit template of each
+                column, by name, see `CoreMemoryCache.unit_templates`.
+            choices (dict[int, Choice]): The choices, by ID.
+        """
+        self.unit_templates = unit_templates
+        self.choices = choices
+
+    @classmethod
+    async def from_cache(cls, static_cache) -> "UnitResolver":
+        """
+        Returns a resolver for the schema held by the static cache.
+
+        Args:
+            static_cache (CoreMemoryCache): The static cache.
+
+        Returns:
+            UnitResolver: The resolver.
+        """
+        return cls(
+            await static_cache.unit_templates(), await static_cache.choices()
+        )
+
+    def resolve(
+        self,
+        field: str,
+        values: dict[str, Any],
+        parent_values: dict[str, Any] | None = None,
+    ) -> Any:
+        """
+        Returns the unit of an attribute.
+
+        A template naming a single attribute resolves to that
+        attribute's value as it is stored, which is the ID of its
+        choice. Other templates are rendered as text, with the values
+        of the choices of their attributes.
+
+        Args:
+            field (str): The attribute name.
+            values (dict[str, Any]): The values of the attribute's row.
+            parent_values (dict[str, Any] | None): The values of the
+                row's parent, for attributes not in the row.
+
+        Returns:
+            Any: The unit, or None if the attribute has no unit or its
+                template names attributes without a value.
+        """
+        template = self.unit_templates.get(field)
+        if not template:
+            return None
+        parts = parse_unit_template(template)
+        if len(parts) == 1 and parts[0][0] == "" and parts[0][1]:
+            unit = self._lookup(parts[0][1], values, parent_values)
+        elif all(field_name is None for _, field_name in parts):
+            unit = template
+        else:
+            unit = self._render(parts, values, parent_values)
+        return unit if unit and unit not in NullTypeState.values() else None
+
+    def _render(
+        self,
+        parts: tuple[tuple[str, str | None], ...],
+        values: dict[str, Any],
+        parent_values: dict[str, Any] | None,
+    ) -> str | None:
+        rendered = []
+        for literal, field_name in parts:
+            rendered.append(literal)
+            if field_name is None:
+                continue
+            value = self._lookup(field_name, values, parent_values)
+            if value is None or value in NullTypeState.values():
+                return None
+            value = self._choice_value(value)
+            if value == OTHER_CHOICE_VALUE:
+                value = self._lookup(
+                    f"{field_name}_other", values, parent_values
+                )
+                if not value:
+                    return None
+            rendered.append(str(value))
+        return "".join(rendered)
+
+    @staticmethod
+    def _lookup(
+        field_name: str,
+        values: dict[str, Any],
+        parent_values: dict[str, Any] | None,
+    ) -> Any:
+        if field_name in values:
+            return values[field_name]
+        return parent_values.get(field_name) if parent_values else None
+
+    def _choice_value(self, value: Any) -> Any:
+        if isinstance(value, int) and not isinstance(value, bool):
+            choice = self.choices.get(value)
+            return choice.value if choice else value
+        return value
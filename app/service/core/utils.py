@@ -2,6 +2,10 @@
 Utils class module for submission manager.
 """
 
+from hashlib import blake2b
+from typing import Any, AsyncIterable, AsyncIterator
+
+import orjson
 from fastapi import HTTPException, status
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -178,6 +182,10 @@ async def update_form_with_null_values(
         await session.commit()
 
 
+# row identifiers left out of the values returned to clients
+STRIPPED_KEYS = frozenset(["id", "obj_id", "value_id"])
+
+
 def strip_none(data):
     """
     Recursively strips None valued fields from a nested Python dict.
@@ -192,9 +200,7 @@ def strip_none(data):
         return {
             k: strip_none(v)
             for k, v in data.items()
-            if k is not None
-            and v is not None
-            and k not in ["id", "obj_id", "value_id"]
+            if k is not None and v is not None and k not in STRIPPED_KEYS
         }
     if isinstance(data, list):
         return [strip_none(item) for item in data if item is not None]
@@ -203,3 +209,58 @@ def strip_none(data):
     if isinstance(data, set):
         return {strip_none(item) for item in data if item is not None}
     return data
+
+
+async def iter_ndjson(
+    chunks: AsyncIterable[bytes],
+) -> AsyncIterator[tuple[int, Any]]:
+    """
+    Incrementally parses a stream of newline-delimited JSON documents.
+
+    Blank lines are skipped, lines that are not valid JSON are yielded
+    as the `orjson.JSONDecodeError` raised while parsing them, so that
+    callers can report them without interrupting the stream.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The raw byte chunks, e.g. a
+            request body stream.
+
+    Yields:
+        tuple[int, Any]: The 1-based line number and the parsed
+            document (or the decoding error).
+    """
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                yield line_no, orjson.loads(line)
+            except orjson.JSONDecodeError as exc:
+                yield line_no, exc
+    if buffer.strip():
+        line_no += 1
+        try:
+            yield line_no, orjson.loads(buffer)
+        except orjson.JSONDecodeError as exc:
+            yield line_no, exc
+
+
+def content_hash(data: Any) -> str:
+    """
+    Stable fingerprint of a JSON-serializable document: blake2b of its
+    canonical orjson encoding, with sorted keys.
+
+    Args:
+        data (Any): The document, e.g. an aggregated submission.
+
+    Returns:
+        str: The hex digest, 32 characters long.
+    """
+    return blake2b(
+        orjson.dumps(data, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).hexdigest()
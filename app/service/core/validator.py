@@ -1,12 +1,23 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
 from dictdiffer import diff
+from fastapi import HTTPException
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import SubmissionObj
+from app.db.database import DBManager
+from app.db.models import AggregatedObjectView, SubmissionObj
 from app.db.redis import RedisClient
 from app.loggers import get_nzdpu_logger
+from app.schemas.submission import SubmissionGet
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.loaders import SubmissionLoader
+from app.service.core.utils import content_hash
 
 
 class AggregatedObjectViewValidator:
@@ -30,6 +41,11 @@ class AggregatedObjectViewValidator:
             submission_id, use_aggregate=True
         )
 
+        if content_hash(submission_db.model_dump(mode="json")) == (
+            content_hash(submission_aggregated.model_dump(mode="json"))
+        ):
+            return True
+
         differences = list(
             diff(
                 submission_db.model_dump(), submission_aggregated.model_dump()
@@ -74,3 +90,207 @@ class AggregatedObjectViewValidator:
             "total": total,
             "invalid_submissions": invalid_submissions,
         }
+
+
+class ParallelAggregatedObjectViewValidator:
+    """
+    Validates all aggregates against the submissions rebuilt from the
+    form tables.
+
+    Submissions are checked in chunks of IDs, with up to `concurrency`
+    chunks in flight, each on its own session. Documents are compared
+    through their content hash first, using the hash stored with the
+    aggregate: the aggregate itself is only fetched, and the structural
+    diff only runs, on mismatches.
+
+    Progress is saved after every round of chunks, so an interrupted
+    run resumes from the last checked submission ID. It is removed once
+    a run checks every submission, so the next run starts over.
+    """
+
+    def __init__(
+        self,
+        db_manager: DBManager,
+        static_cache: CoreMemoryCache,
+        redis_cache: RedisClient,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        progress_path: Path | None = None,
+    ) -> None:
+        self.logger = get_nzdpu_logger()
+        self.db_manager = db_manager
+        self.static_cache = static_cache
+        self.redis_cache = redis_cache
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.progress_path = progress_path
+
+    def _load_progress(self) -> dict[str, Any]:
+        if self.progress_path and self.progress_path.exists():
+            return json.loads(self.progress_path.read_text(encoding="utf-8"))
+        return {"last_id": 0, "checked": 0, "invalid_submissions": []}
+
+    def _save_progress(self, progress: dict[str, Any]) -> None:
+        if not self.progress_path:
+            return
+        tmp_path = self.progress_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps(progress, indent=2, default=str), encoding="utf-8"
+        )
+        os.replace(tmp_path, self.progress_path)
+
+    def _clear_progress(self) -> None:
+        if self.progress_path:
+            self.progress_path.unlink(missing_ok=True)
+
+    async def _next_chunks(
+        self, session: AsyncSession, last_id: int
+    ) -> list[list[int]]:
+        """
+        IDs of the next round of chunks, by keyset on submission ID.
+        """
+        submission_ids = (
+            await session.scalars(
+                select(SubmissionObj.id)
+                .where(SubmissionObj.id > last_id)
+                .order_by(SubmissionObj.id)
+                .limit(self.chunk_size * self.concurrency)
+            )
+        ).all()
+        return [
+            list(submission_ids[i : i + self.chunk_size])
+            for i in range(0, len(submission_ids), self.chunk_size)
+        ]
+
+    async def validate_chunk(
+        self, submission_ids: list[int]
+    ) -> list[dict[str, Any]]:
+        """
+        Validates a chunk of submissions on a session of its own.
+
+        Returns:
+            list[dict[str, Any]]: The invalid submissions of the chunk.
+        """
+        invalid_submissions = []
+        async with self.db_manager.get_session() as session:
+            # aggregates' data is only fetched when hashes differ
+            stored_hashes = dict(
+                (
+                    await session.execute(
+                        select(
+                            AggregatedObjectView.obj_id,
+                            AggregatedObjectView.content_hash,
+                        ).where(
+                            AggregatedObjectView.obj_id.in_(submission_ids)
+                        )
+                    )
+                ).all()
+            )
+            loader = SubmissionLoader(
+                session, self.static_cache, self.redis_cache
+            )
+            for submission_id in submission_ids:
+                if submission_id not in stored_hashes:
+                    invalid_submissions.append(
+                        {
+                            "submission_id": submission_id,
+                            "error": "Missing aggregate.",
+                        }
+                    )
+                    continue
+                try:
+                    submission_db = await loader.load(
+                        submission_id, db_only=True
+                    )
+                except HTTPException as exc:
+                    invalid_submissions.append(
+                        {"submission_id": submission_id, "error": exc.detail}
+                    )
+                    continue
+                db_hash = content_hash(submission_db.model_dump(mode="json"))
+                if stored_hashes[submission_id] == db_hash:
+                    continue
+                data = await session.scalar(
+                    select(AggregatedObjectView.data).where(
+                        AggregatedObjectView.obj_id == submission_id
+                    )
+                )
+                if isinstance(data, str):
+                    data = orjson.loads(data)
+                if not data:
+                    invalid_submissions.append(
+                        {
+                            "submission_id": submission_id,
+                            "error": "Missing aggregate.",
+                        }
+                    )
+                    continue
+                submission_aggregated = SubmissionGet(**data)
+                # aggregates saved before content hashes were stored
+                if db_hash == content_hash(
+                    submission_aggregated.model_dump(mode="json")
+                ):
+                    continue
+                differences = list(
+                    diff(
+                        submission_db.model_dump(),
+                        submission_aggregated.model_dump(),
+                    )
+                )
+                if differences:
+                    self.logger.error(
+                        "AggregatedObjectViewValidator: Submission is invalid",
+                        submission_id=submission_id,
+                        differences=differences,
+                    )
+                    invalid_submissions.append(
+                        {
+                            "submission_id": submission_id,
+                            "differences": differences,
+                        }
+                    )
+
+        return invalid_submissions
+
+    async def validate_all(self, restart: bool = False) -> dict[str, Any]:
+        """
+        Validates all submissions, resuming from saved progress if any.
+
+        Args:
+            restart (bool): Discard saved progress and check every
+                submission again.
+
+        Returns:
+            dict[str, Any]: The report, with the total of checked
+                submissions and the invalid ones.
+        """
+        if restart:
+            self._clear_progress()
+        progress = self._load_progress()
+        async with self.db_manager.get_session() as session:
+            total = await session.scalar(func.count(SubmissionObj.id))
+            while chunks := await self._next_chunks(
+                session, progress["last_id"]
+            ):
+                results = await asyncio.gather(
+                    *(self.validate_chunk(chunk) for chunk in chunks)
+                )
+                for invalid_submissions in results:
+                    progress["invalid_submissions"].extend(invalid_submissions)
+                progress["last_id"] = chunks[-1][-1]
+                progress["checked"] += sum(len(chunk) for chunk in chunks)
+                self._save_progress(progress)
+                self.logger.info(
+                    "AggregatedObjectViewValidator: progress",
+                    checked=progress["checked"],
+                    total=total,
+                    invalid=len(progress["invalid_submissions"]),
+                )
+        # a complete pass leaves nothing to resume
+        self._clear_progress()
+
+        return {
+            "total": total,
+            "checked": progress["checked"],
+            "invalid_submissions": progress["invalid_submissions"],
+        }
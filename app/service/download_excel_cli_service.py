@@ -107,23 +107,23 @@ class SaveExcelFileService:
                     )
                 )
                 if restated_fields_data_source:
-                    for (
-                        restated,
-                        value_list,
-                    ) in restated_fields_data_source.items():
-                        # need to skip scope_1_greenhouse_gas, got error 422
-                        if not restated.endswith("scope_1_greenhouse_gas"):
-                            # unpack submission restated format
-                            path = await submission_loader.unpack_restatement_path_for_restated_col(
-                                submission_id=submission.get("id"),
-                                restatement_path=restated,
-                            )
-                            # update values for every attribute
-                            submission_with_nulls = submission_manager.update_values_for_restated_columns(
-                                path=path,
-                                values=submission_with_nulls,
-                                value=value_list,
-                            )
+                    # unpack submission restated format, in one go
+                    paths = await submission_loader.resolve_restatement_paths(
+                        submission_id=submission.get("id"),
+                        restatement_paths=[
+                            restated
+                            for restated in restated_fields_data_source
+                            # need to skip scope_1_greenhouse_gas, got error 422
+                            if not restated.endswith("scope_1_greenhouse_gas")
+                        ],
+                    )
+                    for restated, path in paths.items():
+                        # update values for every attribute
+                        submission_with_nulls = submission_manager.update_values_for_restated_columns(
+                            path=path,
+                            values=submission_with_nulls,
+                            value=restated_fields_data_source[restated],
+                        )
                 submission_data = {
                     "id": submission.get("id"),
                     "nz_id": nz_id,
@@ -0,0 +1,164 @@
+"""
+Shared executors for CPU-bound work that must not run on the event
+loop.
+
+`password_executor` is a thread pool for bcrypt, which releases the GIL
+while hashing. `export_executor` is a process pool for openpyxl/pandas
+workbook generation, which does not. Both bound the number of jobs
+handed to the underlying pool, so that its queue cannot grow without
+limit, and keep counters exposed by `GET /metrics/executors`.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from app import settings
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Lazily created pool executor, with bounded submissions and usage
+    metrics.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[int], Executor],
+        max_workers: int,
+        max_queue: int,
+    ):
+        """
+        Inits the instance of this class.
+
+        Args:
+            name (str): Name reported in metrics.
+            factory (Callable[[int], Executor]): Builds the pool, given
+                the number of workers.
+            max_workers (int): Number of workers of the pool.
+            max_queue (int): Max jobs queued in the pool on top of the
+                running ones; further callers wait on the event loop.
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._factory = factory
+        self._executor: Executor | None = None
+        self._slots = asyncio.Semaphore(max_workers + max_queue)
+        self.waiting = 0
+        self.in_flight = 0
+        self.peak_depth = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._factory(self.max_workers)
+        return self._executor
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Runs a function in the pool and awaits its result.
+
+        Args:
+            func (Callable[..., T]): The function; for process pools it
+                and its arguments must be picklable.
+
+        Returns:
+            T: The function's result.
+        """
+        enqueued_at = time.perf_counter()
+        self.waiting += 1
+        self.peak_depth = max(self.peak_depth, self.waiting + self.in_flight)
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        started_at = time.perf_counter()
+        self.wait_seconds += started_at - enqueued_at
+        self.in_flight += 1
+        self.submitted += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), partial(func, *args, **kwargs)
+            )
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self.run_seconds += time.perf_counter() - started_at
+            self._slots.release()
+        return result
+
+    def metrics(self) -> dict:
+        """
+        Returns the executor's usage counters.
+        """
+        return {
+            "name": self.name,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "peak_depth": self.peak_depth,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "wait_seconds": self.wait_seconds,
+            "run_seconds": self.run_seconds,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Shuts the pool down, if it was ever started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_executor = BoundedExecutor(
+    name="password",
+    factory=lambda workers: ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="password"
+    ),
+    max_workers=settings.application.password_hash_workers,
+    max_queue=settings.application.executor_max_queue,
+)
+# spawned rather than forked, as the parent runs threads and an event
+# loop which must not be copied into the workers
+export_executor = BoundedExecutor(
+    name="export",
+    factory=lambda workers: ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ),
+    max_workers=settings.application.export_workers,
+    max_queue=settings.application.executor_max_queue,
+)
+
+executors = (password_executor, export_executor)
+
+
+def shutdown_executors() -> None:
+    """
+    Shuts down all shared executors.
+    """
+    for executor in executors:
+        executor.shutdown()
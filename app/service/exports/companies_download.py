@@ -12,13 +12,11 @@ from app.db.models import (
 )
 from app.db.redis import RedisClient
 from app.db.types import EN_DASH, NullTypeState
-from app.routers.utils import (
-    get_choice_value,
-    scientific_to_float,
-)
+from app.routers.utils import scientific_to_float
 from app.schemas.companies import CompanyEmissions, HistoryItem
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.loaders import SubmissionLoader
+from app.service.executors import export_executor
 from app.service.exports.forms_processor import (
     process_assure_verif_companies,
     process_company_metadata,
@@ -32,6 +30,7 @@ from app.service.exports.headers.headers import (
     ExportOptions,
     get_companies_headers,
 )
+from app.service.exports.lookups import ExportLookups
 from app.service.exports.restatement import RestatementExportManager
 from app.service.exports.utils import (
     combine_units_into_one_list,
@@ -204,6 +203,108 @@ class HeaderConfig:
         return df_list
 
 
+def format_companies_workbook(
+    excel_filename: str, company_type: str | None
+) -> str:
+    """
+    Reorders and styles the sheets of a companies download workbook.
+
+    Module-level so that it can run in the export process pool.
+
+    Args:
+        excel_filename (str): The workbook written by
+            `CompaniesExportManager`.
+        company_type (str | None): The type of the exported company.
+
+    Returns:
+        str: The workbook filename.
+    """
+    year_sheets = [
+        CompaniesSheets.company_metadata.value,
+        CompaniesSheets.main_sheet.value,
+        CompaniesSheets.financed_emissions_sheet.value,
+    ]
+
+    wb = load_workbook(excel_filename)
+    ws_order = [
+        CompaniesSheets.company_metadata.value,
+        CompaniesSheets.main_sheet.value,
+        CompaniesSheets.financed_emissions_sheet.value,
+        CompaniesSheets.assure_verif.value,
+        CompaniesSheets.restatement_sheet.value,
+        CompaniesSheets.emissions_reduction_targets.value,
+        CompaniesSheets.targets_progress_sheet.value,
+        CompaniesSheets.validation_sheet.value,
+    ]
+    if company_type != "Financial":
+        year_sheets.remove(CompaniesSheets.financed_emissions_sheet.value)
+        ws_order.remove(CompaniesSheets.financed_emissions_sheet.value)
+    wb._sheets = [
+        wb[sheet] for sheet in ws_order if sheet in wb.sheetnames
+    ]
+    left_alignment = Alignment(horizontal="left")
+    normal_border = Border(
+        left=Side(style=None),
+        right=Side(style=None),
+        top=Side(style=None),
+        bottom=Side(style=None),
+    )
+    for ws in wb.worksheets:
+        if ws.title in year_sheets:
+            # strip years from headers
+            for cell in ws[2]:
+                if isinstance(cell.value, str) and "_" in cell.value:
+                    cell.value = cell.value.split("_")[0]
+                cell.alignment = left_alignment
+            first_populated_col = None
+            for cell in ws[1]:
+                if cell.value is not None:
+                    first_populated_col = cell.column
+                    break
+            # fill blanks with dash
+            for row in ws.iter_rows(
+                min_row=2,
+                max_row=ws.max_row,
+                min_col=first_populated_col,
+                max_col=ws.max_column,
+            ):
+                for cell in row:
+                    if cell.value is None:
+                        cell.value = EN_DASH
+                        pass
+                    # remove blank with None value for last_updated cols
+                    elif cell.value == "blank":
+                        cell.value = None
+
+        if ws.title in [
+            CompaniesSheets.assure_verif.value,
+            CompaniesSheets.emissions_reduction_targets.value,
+            CompaniesSheets.targets_progress_sheet.value,
+            CompaniesSheets.validation_sheet.value,
+            CompaniesSheets.restatement_sheet.value,
+        ]:
+            if ws.max_row > 2:
+                for row in ws.iter_rows(
+                    min_row=2,
+                    max_row=ws.max_row,
+                    min_col=6,
+                    max_col=ws.max_column,
+                ):
+                    for cell in row:
+                        if cell.value is None:
+                            cell.value = EN_DASH
+                        # remove blank with None value for last_updated cols
+                        elif cell.value == "blank":
+                            cell.value = None
+        for row in ws.iter_rows():
+            for cell in row:
+                cell.border = normal_border
+                if cell.row == 1:
+                    cell.alignment = left_alignment
+    wb.save(excel_filename)
+    return excel_filename
+
+
 @dataclass
 class CompaniesExportManager(HeaderConfig):
     """
@@ -220,6 +321,7 @@ class CompaniesExportManager(HeaderConfig):
     download_option: str = ExportOptions.COMPANIES.value
     forms_group_by: list[FormGroupBy] = field(default_factory=lambda: [])
     history_service: HistoryService = HistoryService()
+    lookups: ExportLookups = field(default_factory=ExportLookups)
 
     @staticmethod
     def _make_default_extra_headers(
@@ -305,9 +407,7 @@ class CompaniesExportManager(HeaderConfig):
             dataframe_full["Units"] = [
                 (
                     transform_subscript_to_normal(
-                        await return_unit_from_field(
-                            key, self.session, self.static_cache, sheet
-                        )
+                        await return_unit_from_field(key, self.lookups, sheet)
                     )
                 )
                 for key in field_names
@@ -407,11 +507,11 @@ class CompaniesExportManager(HeaderConfig):
     async def generate_companies_download(
         self, exclude_classification_forced: bool | None = None
     ):
-        # get source ids for mapping restated and source columns
-        choices = await self.static_cache.choices()
-        source_set = list(
-            filter(lambda x: x.set_name == "source_list", choices.values())
+        self.lookups = await ExportLookups.load(
+            self.session, self.static_cache
         )
+        # get source ids for mapping restated and source columns
+        source_set = self.lookups.choice_sets.get("source_list", [])
         try:
             restatement_list = await self.get_restatements_and_units()
         except Exception:
@@ -566,7 +666,7 @@ class CompaniesExportManager(HeaderConfig):
             source = res_values.get("disclosure_source")
             # get source choice value
             source = (
-                await get_choice_value(source, self.session, self.static_cache)
+                self.lookups.choice_value(source)
                 if isinstance(source, int)
                 else source
             )
@@ -594,8 +694,7 @@ class CompaniesExportManager(HeaderConfig):
                 d=res_values,
                 company=self.company,
                 reporting_year=reporting_year,
-                session=self.session,
-                static_cache=self.static_cache,
+                lookups=self.lookups,
                 exclude_classification_forced=exclude_classification_forced,
             )
             # process scope 1 emissions
@@ -615,9 +714,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 emissions=scope_1_emissions_fields,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             # process scope 1 emissions change type
@@ -637,9 +735,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 emissions=scope_1_change_types_fields,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             # process scope 1 exclusion
@@ -656,9 +753,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 form_name="s1_emissions_exclusion_dict",
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             # process scope 1 ghg breakdown
@@ -678,9 +774,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 emissions=scope_1_ghg_fields,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             # process scope 1 ghg breakdown other
@@ -697,9 +792,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 form_name="s1_other_ghg_emissions_dict",
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             # process scope 2 lb emissions
@@ -719,8 +813,7 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 emissions=scope_2_lb_emissions_fields,
-                static_cache=self.static_cache,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
                 restated=restated_fields,
             )
@@ -739,9 +832,8 @@ class CompaniesExportManager(HeaderConfig):
                 units_list=res_units.get("s2_lb_emissions_exclusion_dict"),
                 source=source,
                 last_updated=last_updated,
-                static_cache=self.static_cache,
                 form_name="s2_lb_emissions_exclusion_dict",
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
                 restated=restated_fields,
             )
@@ -762,9 +854,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 emissions=scope_2_lb_change_types_fields,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             # process scope 2 mb emissions
@@ -782,10 +873,9 @@ class CompaniesExportManager(HeaderConfig):
                 d=res_values,
                 units=res_units,
                 source=source,
-                static_cache=self.static_cache,
                 last_updated=last_updated,
                 emissions=scope_2_mb_emissions_fields,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
                 restated=restated_fields,
             )
@@ -805,8 +895,7 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 form_name="s2_mb_emissions_exclusion_dict",
-                session=self.session,
-                static_cache=self.static_cache,
+                lookups=self.lookups,
                 download_option=self.download_option,
                 restated=restated_fields,
             )
@@ -827,9 +916,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 emissions=scope_2_mb_change_types_fields,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             # process scope 3 ghgp emissions
@@ -849,9 +937,8 @@ class CompaniesExportManager(HeaderConfig):
                 source=source,
                 last_updated=last_updated,
                 emissions=scope_3_fields,
-                session=self.session,
+                lookups=self.lookups,
                 download_option=self.download_option,
-                static_cache=self.static_cache,
                 restated=restated_fields,
             )
             scope_3_categories_data = {}
@@ -885,9 +972,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=scope_3_category_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process scope 3 ghgp category methodology
@@ -908,8 +994,7 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name=f"s3_ghgp_{format_category}_emissions_method_dict",
-                    session=self.session,
-                    static_cache=self.static_cache,
+                    lookups=self.lookups,
                     download_option=self.download_option,
                     restated=restated_fields,
                 )
@@ -933,9 +1018,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=scope_3_category_exc_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process scope 3 ghgp category exclusion
@@ -956,8 +1040,7 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name=f"s3_ghgp_{format_category}_emissions_exclusion_dict",
-                    session=self.session,
-                    static_cache=self.static_cache,
+                    lookups=self.lookups,
                     download_option=self.download_option,
                     restated=restated_fields,
                 )
@@ -981,9 +1064,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=scope_3_category_change_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # data
@@ -1094,9 +1176,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=scope_3_category_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process scope 3 iso category methodology
@@ -1117,8 +1198,7 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name=f"s3_iso_{format_category}_emissions_method_dict",
-                    session=self.session,
-                    static_cache=self.static_cache,
+                    lookups=self.lookups,
                     download_option=self.download_option,
                     restated=restated_fields,
                 )
@@ -1142,9 +1222,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=scope_3_category_exc_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process scope 3 iso category exclusion
@@ -1165,8 +1244,7 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name=f"s3_iso_{format_category}_emissions_exclusion_dict",
-                    session=self.session,
-                    static_cache=self.static_cache,
+                    lookups=self.lookups,
                     download_option=self.download_option,
                     restated=restated_fields,
                 )
@@ -1190,9 +1268,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=scope_3_category_change_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # data
@@ -1283,7 +1360,7 @@ class CompaniesExportManager(HeaderConfig):
                 reporting_year=reporting_year,
                 last_updated=last_updated,
                 source_set=source_set,
-                session=self.session,
+                lookups=self.lookups,
                 restated=restated_fields,
             )
             # append assurance and verification total data
@@ -1307,9 +1384,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=fe_aum_overview_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions coverage aum data
@@ -1326,9 +1402,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name="fin_emissions_aum_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions aum change types data
@@ -1348,9 +1423,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=fe_aum_hange_type_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions intensity aum data
@@ -1386,9 +1460,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name="fin_emissions_int_aum_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions data quality aum data
@@ -1409,9 +1482,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name="fin_emissions_aum_data_quality_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions grossexp root data
@@ -1431,9 +1503,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=fe_ge_overview_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions coverage grossexp data
@@ -1452,9 +1523,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name="fin_emissions_grossexp_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions grossexp change types data
@@ -1474,9 +1544,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     emissions=fe_ge_hange_type_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions intensity grossexp data
@@ -1516,9 +1585,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name="fin_emissions_int_grossexp_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
                 # process financed emissions data quality grossexp data
@@ -1539,9 +1607,8 @@ class CompaniesExportManager(HeaderConfig):
                     source=source,
                     last_updated=last_updated,
                     form_name="fin_emissions_grossexp_data_quality_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                     restated=restated_fields,
                 )
             target_ids = {}
@@ -1564,7 +1631,7 @@ class CompaniesExportManager(HeaderConfig):
                     last_updated=last_updated,
                     units_list=res_units.get("tgt_abs_dict"),
                     form_name="tgt_abs_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     reporting_year=reporting_year,
                     disclosure_year=disclosure_year,
                     target_ids=target_ids,
@@ -1610,7 +1677,7 @@ class CompaniesExportManager(HeaderConfig):
                     last_updated=last_updated,
                     units_list=res_units.get("tgt_int_dict"),
                     form_name="tgt_int_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     reporting_year=reporting_year,
                     disclosure_year=disclosure_year,
                     target_ids=target_ids,
@@ -1644,7 +1711,7 @@ class CompaniesExportManager(HeaderConfig):
                     last_updated=last_updated,
                     units_list=target_units,
                     form_name="tgt_abs_progress_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     reporting_year=reporting_year,
                     disclosure_year=disclosure_year,
                     target_ids=target_ids,
@@ -1706,7 +1773,7 @@ class CompaniesExportManager(HeaderConfig):
                     last_updated=last_updated,
                     units_list=target_units,
                     form_name="tgt_int_progress_dict",
-                    session=self.session,
+                    lookups=self.lookups,
                     reporting_year=reporting_year,
                     disclosure_year=disclosure_year,
                     target_ids=target_ids,
@@ -1724,7 +1791,7 @@ class CompaniesExportManager(HeaderConfig):
                 disclosure_year=disclosure_year,
                 last_updated=last_updated,
                 form_name="tgt_abs_valid_dict",
-                session=self.session,
+                lookups=self.lookups,
                 target_ids=target_ids,
             )
             validation_int_data = await self._handle_process_methods(
@@ -1733,7 +1800,7 @@ class CompaniesExportManager(HeaderConfig):
                 disclosure_year=disclosure_year,
                 last_updated=last_updated,
                 form_name="tgt_int_valid_dict",
-                session=self.session,
+                lookups=self.lookups,
                 target_ids=target_ids,
             )
             validation_target_progress_combine = (
@@ -2269,8 +2336,7 @@ class CompaniesExportManager(HeaderConfig):
                     last_updated,
                     reporting_year,
                     "metadata",
-                    self.session,
-                    static_cache=self.static_cache,
+                    self.lookups,
                 )
             for key in dataframes:
                 dataframes[key] = await update_dataframe(
@@ -2284,8 +2350,7 @@ class CompaniesExportManager(HeaderConfig):
                     last_updated,
                     reporting_year,
                     "scope",
-                    self.session,
-                    self.static_cache,
+                    self.lookups,
                     restated,
                 )
             if self.company.company_type == "Financial":
@@ -2301,8 +2366,7 @@ class CompaniesExportManager(HeaderConfig):
                         last_updated,
                         reporting_year,
                         "fe",
-                        self.session,
-                        self.static_cache,
+                        self.lookups,
                         restated,
                     )
             company_metadata_full = metadata_df["company_metadata_full"]
@@ -2963,87 +3027,8 @@ class CompaniesExportManager(HeaderConfig):
                 sheet_name=CompaniesSheets.validation_sheet.value,
                 index=False,
             )
-        year_sheets = [
-            CompaniesSheets.company_metadata.value,
-            CompaniesSheets.main_sheet.value,
-            CompaniesSheets.financed_emissions_sheet.value,
-        ]
-
-        wb = load_workbook(excel_filename)
-        ws_order = [
-            CompaniesSheets.company_metadata.value,
-            CompaniesSheets.main_sheet.value,
-            CompaniesSheets.financed_emissions_sheet.value,
-            CompaniesSheets.assure_verif.value,
-            CompaniesSheets.restatement_sheet.value,
-            CompaniesSheets.emissions_reduction_targets.value,
-            CompaniesSheets.targets_progress_sheet.value,
-            CompaniesSheets.validation_sheet.value,
-        ]
-        if self.company.company_type != "Financial":
-            year_sheets.remove(CompaniesSheets.financed_emissions_sheet.value)
-            ws_order.remove(CompaniesSheets.financed_emissions_sheet.value)
-        wb._sheets = [
-            wb[sheet] for sheet in ws_order if sheet in wb.sheetnames
-        ]
-        left_alignment = Alignment(horizontal="left")
-        normal_border = Border(
-            left=Side(style=None),
-            right=Side(style=None),
-            top=Side(style=None),
-            bottom=Side(style=None),
+        return await export_executor.run(
+            format_companies_workbook,
+            excel_filename,
+            self.company.company_type,
         )
-        for ws in wb.worksheets:
-            if ws.title in year_sheets:
-                # strip years from headers
-                for cell in ws[2]:
-                    if isinstance(cell.value, str) and "_" in cell.value:
-                        cell.value = cell.value.split("_")[0]
-                    cell.alignment = left_alignment
-                first_populated_col = None
-                for cell in ws[1]:
-                    if cell.value is not None:
-                        first_populated_col = cell.column
-                        break
-                # fill blanks with dash
-                for row in ws.iter_rows(
-                    min_row=2,
-                    max_row=ws.max_row,
-                    min_col=first_populated_col,
-                    max_col=ws.max_column,
-                ):
-                    for cell in row:
-                        if cell.value is None:
-                            cell.value = EN_DASH
-                            pass
-                        # remove blank with None value for last_updated cols
-                        elif cell.value == "blank":
-                            cell.value = None
-
-            if ws.title in [
-                CompaniesSheets.assure_verif.value,
-                CompaniesSheets.emissions_reduction_targets.value,
-                CompaniesSheets.targets_progress_sheet.value,
-                CompaniesSheets.validation_sheet.value,
-                CompaniesSheets.restatement_sheet.value,
-            ]:
-                if ws.max_row > 2:
-                    for row in ws.iter_rows(
-                        min_row=2,
-                        max_row=ws.max_row,
-                        min_col=6,
-                        max_col=ws.max_column,
-                    ):
-                        for cell in row:
-                            if cell.value is None:
-                                cell.value = EN_DASH
-                            # remove blank with None value for last_updated cols
-                            elif cell.value == "blank":
-                                cell.value = None
-            for row in ws.iter_rows():
-                for cell in row:
-                    cell.border = normal_border
-                    if cell.row == 1:
-                        cell.alignment = left_alignment
-        wb.save(excel_filename)
-        return excel_filename
@@ -2,35 +2,30 @@ import datetime
 from typing import Any
 
 import pandas as pd
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Config, Organization
+from app.db.models import Organization
 from app.db.types import EN_DASH, NullTypeState
-from app.routers.utils import get_choice_value, scientific_to_float
-from app.service.core.cache import CoreMemoryCache
+from app.routers.utils import scientific_to_float
 from app.service.exports.headers.headers import (
     ExportOptions,
     SearchSheets,
     get_data_explorer_headers,
     get_default_attributes_for_v40,
 )
+from app.service.exports.lookups import ExportLookups
 from app.service.exports.utils import (
     align_df_data_and_desc,
     clean_targets_int_data,
     format_datetime_for_downloads,
     format_value_download_all,
-    get_prompt_from_key,
 )
-from app.service.utils import load_column_units
 
 
 async def process_company_metadata(
     d: dict,
     company: Organization,
     reporting_year: int,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     exclude_classification_forced: bool | None = None,
 ):
     """
@@ -46,14 +41,7 @@ async def process_company_metadata(
         d.get("date_end_reporting_year", None)
     )
     # check if sics fields are available for download
-    db_config_value = select(Config.value).where(
-        Config.name == "data_download.exclude_classification"
-    )
-    # execute the query and get the result for sics available
-    exclude_classification_value = await session.execute(db_config_value)
-    exclude_classification = exclude_classification_value.scalars().first()
-    if exclude_classification:
-        exclude_classification = int(exclude_classification)
+    exclude_classification = lookups.exclude_classification
     # force to show sics values because this needs to be used in generating the excel file cache
     if exclude_classification_forced is not None:
         exclude_classification = 1 if exclude_classification_forced else 0
@@ -106,7 +94,7 @@ async def process_company_metadata(
     # load choice values for metadata data
     for key, value in metadata_items.items():
         value = (
-            await get_choice_value(value, session, static_cache)
+            lookups.choice_value(value)
             if type(value) is int and key != "reporting_year"
             else value
         )
@@ -118,8 +106,7 @@ async def process_scope_ghg(
     scope_ghg_list: list,
     source: str,
     last_updated: datetime.datetime,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     data_source_list=None,
 ):
     """
@@ -146,19 +133,15 @@ async def process_scope_ghg(
     counter = 1
     for scope in new_data:
         greenhouse_has = scope.get("scope_1_greenhouse_gas")
-        gas_name = await get_choice_value(
-            greenhouse_has, session, static_cache
-        )
+        gas_name = lookups.choice_value(greenhouse_has)
         gas_name = gas_map.get(gas_name, None)
         for k, v in scope.items():
             if k.endswith("_prompt"):
                 continue
             # get attribute short description
-            desc = await get_prompt_from_key(
-                session=session, key=k, values=scope
-            )
+            desc = lookups.prompt(k, scope)
             if k == "scope_1_greenhouse_gas":
-                gas_name = await get_choice_value(v, session, static_cache)
+                gas_name = lookups.choice_value(v)
                 gas_name = gas_map.get(gas_name, None)
             if source:
                 if last_updated:
@@ -168,8 +151,7 @@ async def process_scope_ghg(
                         sample=last_updated,
                         value_index=1,
                         data_source_list=data_source_list,
-                        session=session,
-                        static_cache=static_cache,
+                        lookups=lookups,
                     )
                 else:
                     # format source value
@@ -178,15 +160,10 @@ async def process_scope_ghg(
                         sample=source,
                         value_index=0,
                         data_source_list=data_source_list,
-                        session=session,
-                        static_cache=static_cache,
+                        lookups=lookups,
                     )
             else:
-                v = (
-                    await get_choice_value(v, session, static_cache)
-                    if type(v) is int
-                    else v
-                )
+                v = lookups.choice_value(v) if type(v) is int else v
             if gas_name != "other":
                 if k.startswith("scope_1_greenhouse_gas"):
                     continue
@@ -195,12 +172,7 @@ async def process_scope_ghg(
                 description[f"{k}_{gas_name}"] = desc
                 if k.startswith("scope_1_ghg_emissions"):
                     k_unit = k + f"_{gas_name}_units"
-                    v_unit = await load_column_units(k, session, static_cache)
-                    items[f"{k_unit}"] = (
-                        v_unit[0]["actions"][0]["set"]["units"]
-                        if isinstance(v_unit, (dict, list))
-                        else v_unit
-                    )
+                    items[f"{k_unit}"] = lookups.unit(k)
                     description[f"{k_unit}"] = (
                         desc + " units" if desc else desc
                     )
@@ -219,12 +191,7 @@ async def process_scope_ghg(
                 description[format_key] = desc
                 if k.startswith("scope_1_ghg_emissions"):
                     k_unit = f"{format_key}_units"
-                    v_unit = await load_column_units(k, session, static_cache)
-                    items[f"{k_unit}"] = (
-                        v_unit[0]["actions"][0]["set"]["units"]
-                        if isinstance(v_unit, (dict, list))
-                        else v_unit
-                    )
+                    items[f"{k_unit}"] = lookups.unit(k)
                     description[f"{k_unit}"] = (
                         desc + " units" if desc else desc
                     )
@@ -238,8 +205,7 @@ async def process_data_export(
     source: str,
     last_updated: datetime.datetime,
     form_name: str,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     download_option: str,
     restated: dict,
     data_source_list: list = None,
@@ -317,8 +283,7 @@ async def process_data_export(
                                 sample=last_updated,
                                 value_index=1,
                                 data_source_list=data_export_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         else:
                             # format source value
@@ -327,13 +292,10 @@ async def process_data_export(
                                 sample=source,
                                 value_index=0,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                 # get attribute short description
-                desc = await get_prompt_from_key(
-                    session=session, key=k, values=data
-                )
+                desc = lookups.prompt(k, data)
                 # format description with counter
                 desc_counter = f"{desc} ({counter})"
                 # assign value to items dict
@@ -356,8 +318,7 @@ async def process_scope_emissions(
     source: str,
     last_updated: datetime.datetime,
     emissions: dict,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     download_option: str,
     restated: dict,
     data_source_list: list = None,
@@ -379,7 +340,7 @@ async def process_scope_emissions(
             if v is None:
                 continue
         # get attribute short description
-        desc = await get_prompt_from_key(session=session, key=k, values=d)
+        desc = lookups.prompt(k, d)
         # process attributes type multiple (just for search download still)
         if isinstance(v, list) and v is not None:
             items[k] = ""
@@ -391,8 +352,7 @@ async def process_scope_emissions(
                         sample=last_updated,
                         value_index=1,
                         data_source_list=data_source_list,
-                        session=session,
-                        static_cache=static_cache,
+                        lookups=lookups,
                     )
                 else:
                     # format source value
@@ -401,13 +361,12 @@ async def process_scope_emissions(
                         sample=source,
                         value_index=0,
                         data_source_list=data_source_list,
-                        session=session,
-                        static_cache=static_cache,
+                        lookups=lookups,
                     )
             else:
                 for idx, value in enumerate(v):
                     value = (
-                        await get_choice_value(value, session, static_cache)
+                        lookups.choice_value(value)
                         if type(value) is int
                         else value
                     )
@@ -458,8 +417,7 @@ async def process_scope_emissions(
                             sample=last_updated,
                             value_index=1,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                     else:
                         # format source value
@@ -468,19 +426,13 @@ async def process_scope_emissions(
                             sample=source,
                             value_index=0,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                 items[k] = scientific_to_float(v) if v is not None else EN_DASH
                 description[k] = desc
                 if k.startswith("total_scope"):
                     k_unit = k + "_units"
-                    v_unit = await load_column_units(k, session, static_cache)
-                    items[k_unit] = (
-                        v_unit[0]["actions"][0]["set"]["units"]
-                        if isinstance(v_unit, (dict, list))
-                        else v_unit
-                    )
+                    items[k_unit] = lookups.unit(k)
                     description[k_unit] = desc + " units" if desc else desc
 
     if download_option == ExportOptions.COMPANIES.value:
@@ -500,7 +452,7 @@ async def process_targets_export(
     last_updated: datetime.datetime,
     units_list: list,
     form_name: str,
-    session: AsyncSession,
+    lookups: ExportLookups,
     reporting_year: int = None,
     disclosure_year: int = None,
     target_ids: dict = None,
@@ -573,9 +525,7 @@ async def process_targets_export(
                     else EN_DASH
                 )
                 # get attribute short description
-                desc = await get_prompt_from_key(
-                    session=session, key=k, values=data
-                )
+                desc = lookups.prompt(k, data)
 
                 value = (
                     scientific_to_float(v)
@@ -609,7 +559,7 @@ async def process_assure_verif_companies(
     reporting_year: int,
     last_updated: datetime.datetime,
     source_set: list,
-    session: AsyncSession,
+    lookups: ExportLookups,
     restated: dict,
 ):
     """
@@ -678,9 +628,7 @@ async def process_assure_verif_companies(
                     # get source field form submission values with nulls
                     field_source = value
                     # get attribute short description
-                    desc = await get_prompt_from_key(
-                        session=session, key=key, values=row
-                    )
+                    desc = lookups.prompt(key, row)
                     if key not in ["id", "obj_id", "value_id"]:
                         # check if source is restated and assign new source
                         formatted_source = (
@@ -787,7 +735,7 @@ async def process_target_validation_companies(
     disclosure_year: int,
     last_updated: datetime.datetime,
     form_name: str,
-    session: AsyncSession,
+    lookups: ExportLookups,
     target_ids: dict,
 ):
     """
@@ -812,9 +760,7 @@ async def process_target_validation_companies(
                     # get source field form submission values with nulls
                     field_source = value
                     # get attribute short description
-                    desc = await get_prompt_from_key(
-                        session=session, key=key, values=row
-                    )
+                    desc = lookups.prompt(key, row)
                     if key not in [
                         "id",
                         "obj_id",
@@ -860,8 +806,7 @@ async def process_target_validation_companies(
 async def process_targets_and_progress(
     targets: dict[str, Any],
     target: str,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     source=None,
     last_updated=None,
     data_source_list=None,
@@ -896,7 +841,7 @@ async def process_targets_and_progress(
                     target_id,
                     target_name,
                     target,
-                    session,
+                    lookups,
                     source,
                     last_updated,
                 )
@@ -909,8 +854,7 @@ async def process_targets_and_progress(
             target_id,
             target_name,
             target,
-            session,
-            static_cache,
+            lookups,
             source,
             last_updated,
             targets_progress,
@@ -923,8 +867,7 @@ async def process_targets_and_progress(
             target_id,
             target_name,
             target,
-            session,
-            static_cache,
+            lookups,
             source,
             last_updated,
             targets_progress,
@@ -937,9 +880,7 @@ async def process_targets_and_progress(
             for k, v in targets.items():
                 if k.endswith("_prompt"):
                     continue
-                desc = await get_prompt_from_key(
-                    session=session, key=k, values=targets
-                )
+                desc = lookups.prompt(k, targets)
                 k_with_counter = k
                 if isinstance(v, list):
                     targets_items[k_with_counter] = ""
@@ -951,8 +892,7 @@ async def process_targets_and_progress(
                                 sample=last_updated,
                                 value_index=1,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         else:
                             # format source value
@@ -961,16 +901,13 @@ async def process_targets_and_progress(
                                 sample=source,
                                 value_index=0,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         targets_items[k_with_counter] = i
                     else:
                         for idx, i in enumerate(v):
                             i = (
-                                await get_choice_value(
-                                    i, session, static_cache
-                                )
+                                lookups.choice_value(i)
                                 if type(i) is int
                                 else i
                             )
@@ -990,8 +927,7 @@ async def process_targets_and_progress(
                                 sample=last_updated,
                                 value_index=1,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         else:
                             # format source value
@@ -1000,15 +936,10 @@ async def process_targets_and_progress(
                                 sample=source,
                                 value_index=0,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                     else:
-                        v = (
-                            await get_choice_value(v, session, static_cache)
-                            if type(v) is int
-                            else v
-                        )
+                        v = lookups.choice_value(v) if type(v) is int else v
                     targets_items[k_with_counter] = scientific_to_float(v)
                     targets_desc[k_with_counter] = desc
     elif target == "int_":
@@ -1033,9 +964,7 @@ async def process_targets_and_progress(
                             for key, value in i.items():
                                 if key.endswith("_prompt"):
                                     continue
-                                desc = await get_prompt_from_key(
-                                    session=session, key=key, values=i
-                                )
+                                desc = lookups.prompt(key, i)
                                 if isinstance(value, list):
                                     co_int_phys_thr = 0
                                     co_int_econ_thr = 0
@@ -1049,8 +978,7 @@ async def process_targets_and_progress(
                                                     sample=last_updated,
                                                     value_index=1,
                                                     data_source_list=data_source_list,
-                                                    session=session,
-                                                    static_cache=static_cache,
+                                                    lookups=lookups,
                                                 )
                                             else:
                                                 # format source value
@@ -1059,17 +987,12 @@ async def process_targets_and_progress(
                                                     sample=source,
                                                     value_index=0,
                                                     data_source_list=data_source_list,
-                                                    session=session,
-                                                    static_cache=static_cache,
+                                                    lookups=lookups,
                                                 )
                                         else:
                                             for idx, n in enumerate(value):
                                                 n = (
-                                                    await get_choice_value(
-                                                        n,
-                                                        session,
-                                                        static_cache,
-                                                    )
+                                                    lookups.choice_value(n)
                                                     if type(n) is int
                                                     else n
                                                 )
@@ -1115,8 +1038,7 @@ async def process_targets_and_progress(
                                                 sample=last_updated,
                                                 value_index=1,
                                                 data_source_list=data_source_list,
-                                                session=session,
-                                                static_cache=static_cache,
+                                                lookups=lookups,
                                             )
                                         else:
                                             # format source value
@@ -1125,14 +1047,11 @@ async def process_targets_and_progress(
                                                 sample=source,
                                                 value_index=0,
                                                 data_source_list=data_source_list,
-                                                session=session,
-                                                static_cache=static_cache,
+                                                lookups=lookups,
                                             )
                                     else:
                                         value = (
-                                            await get_choice_value(
-                                                value, session, static_cache
-                                            )
+                                            lookups.choice_value(value)
                                             if type(value) is int
                                             else value
                                         )
@@ -1165,9 +1084,7 @@ async def process_targets_and_progress(
                 else:
                     if k.endswith("_prompt"):
                         continue
-                    desc = await get_prompt_from_key(
-                        session=session, key=k, values=targets
-                    )
+                    desc = lookups.prompt(k, targets)
                     if source and k not in ["tgt_int_id", "tgt_int_name"]:
                         if last_updated:
                             # format last_updated value
@@ -1176,8 +1093,7 @@ async def process_targets_and_progress(
                                 sample=last_updated,
                                 value_index=1,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         else:
                             # format source value
@@ -1186,15 +1102,10 @@ async def process_targets_and_progress(
                                 sample=source,
                                 value_index=0,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                     else:
-                        v = (
-                            await get_choice_value(v, session, static_cache)
-                            if type(v) is int
-                            else v
-                        )
+                        v = lookups.choice_value(v) if type(v) is int else v
                     target_int_physical[k] = str(v)
                     target_int_physical_desc[k] = desc
                     target_int_economic[k] = str(v)
@@ -1250,8 +1161,7 @@ async def process_target_int_data(
     target_id,
     target_name,
     target,
-    session,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     source,
     last_updated,
     targets_progress,
@@ -1271,8 +1181,7 @@ async def process_target_int_data(
                 target_id,
                 target_name,
                 target,
-                session,
-                static_cache,
+                lookups,
                 source,
                 last_updated,
             )
@@ -1285,8 +1194,7 @@ async def process_nested_targets_progress(
     targets_id,
     targets_name,
     spliter,
-    session,
-    static_cache,
+    lookups: ExportLookups,
     source=None,
     last_updated=None,
     data_source_list=None,
@@ -1310,9 +1218,7 @@ async def process_nested_targets_progress(
                     if k.endswith("_prompt"):
                         continue
                     # get attribute prompt
-                    desc = await get_prompt_from_key(
-                        session=session, key=k, values=new_data
-                    )
+                    desc = lookups.prompt(k, new_data)
                     if source and k not in [
                         f"tgt_{spliter}id",
                         f"tgt_{spliter}name",
@@ -1324,8 +1230,7 @@ async def process_nested_targets_progress(
                                 sample=last_updated,
                                 value_index=1,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         else:
                             # format source value
@@ -1334,15 +1239,10 @@ async def process_nested_targets_progress(
                                 sample=source,
                                 value_index=0,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                     else:
-                        v = (
-                            await get_choice_value(v, session, static_cache)
-                            if type(v) is int
-                            else v
-                        )
+                        v = lookups.choice_value(v) if type(v) is int else v
                     if counter_sec == 0:
                         key = f"{k}"
                     else:
@@ -1354,8 +1254,7 @@ async def process_nested_targets_progress(
 
 async def process_financed_emissions(
     d: dict[str, Any],
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     source=None,
     last_updated=None,
     parent_key="",
@@ -1382,14 +1281,14 @@ async def process_financed_emissions(
             counter_dict[new_key] += 1
 
         # get attribute short description
-        desc = await get_prompt_from_key(session=session, key=k, values=d)
+        desc = lookups.prompt(k, d)
 
         if isinstance(v, dict):
             (
                 processed_items,
                 processed_description,
             ) = await process_financed_emissions(
-                v, session, source, last_updated, new_key, counter_dict
+                v, lookups, source, last_updated, new_key, counter_dict
             )
             items.update(processed_items)
             description.update(processed_description)
@@ -1401,7 +1300,7 @@ async def process_financed_emissions(
                         processed_description,
                     ) = await process_financed_emissions(
                         elem,
-                        session,
+                        lookups,
                         source,
                         last_updated,
                         f"{new_key}_{i}",
@@ -1418,8 +1317,7 @@ async def process_financed_emissions(
                                 sample=last_updated,
                                 value_index=1,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         else:
                             # format source value
@@ -1428,12 +1326,11 @@ async def process_financed_emissions(
                                 sample=source,
                                 value_index=0,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                     else:
                         elem = (
-                            await get_choice_value(elem, session, static_cache)
+                            lookups.choice_value(elem)
                             if isinstance(elem, int)
                             else elem
                         )
@@ -1443,13 +1340,8 @@ async def process_financed_emissions(
                     description[f"{new_key}_{counter_dict[new_key]}"] = desc
                     if new_key.endswith("usd"):
                         k_unit = new_key + "_units"
-                        v_unit = await load_column_units(
-                            k, session, static_cache
-                        )
                         items[f"{k_unit}_{counter_dict[new_key]}"] = (
-                            v_unit[0]["actions"][0]["set"]["units"]
-                            if isinstance(v_unit, (dict, list))
-                            else v_unit
+                            lookups.unit(k)
                         )
                         description[f"{k_unit}_{counter_dict[new_key]}"] = (
                             desc + " units" if desc else desc
@@ -1463,8 +1355,7 @@ async def process_financed_emissions(
                         sample=last_updated,
                         value_index=1,
                         data_source_list=data_source_list,
-                        session=session,
-                        static_cache=static_cache,
+                        lookups=lookups,
                     )
                 else:
                     # format source value
@@ -1473,25 +1364,15 @@ async def process_financed_emissions(
                         sample=source,
                         value_index=0,
                         data_source_list=data_source_list,
-                        session=session,
-                        static_cache=static_cache,
+                        lookups=lookups,
                     )
             else:
-                v = (
-                    await get_choice_value(v, session, static_cache)
-                    if isinstance(v, int)
-                    else v
-                )
+                v = lookups.choice_value(v) if isinstance(v, int) else v
             items[new_key] = scientific_to_float(v)
             description[new_key] = desc
             if new_key.endswith("usd") and not new_key.startswith("fn"):
                 k_unit = new_key + "_units"
-                v_unit = await load_column_units(k, session, static_cache)
-                items[k_unit] = (
-                    v_unit[0]["actions"][0]["set"]["units"]
-                    if isinstance(v_unit, (dict, list))
-                    else v_unit
-                )
+                items[k_unit] = lookups.unit(k)
                 description[k_unit] = desc + " units" if desc else desc
 
     return items, description
@@ -1500,8 +1381,7 @@ async def process_financed_emissions(
 async def process_target_validations(
     target_validation: dict,
     rationale_target: str | None,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     source=None,
     last_updated=None,
     data_source_list=None,
@@ -1533,9 +1413,7 @@ async def process_target_validations(
 
                 else:
                     # get attribute short description
-                    desc = await get_prompt_from_key(
-                        session=session, key=k, values=data
-                    )
+                    desc = lookups.prompt(k, data)
                     key_counter = f"{k}_{counter}" if counter != 0 else k
                     if source:
                         if last_updated:
@@ -1545,8 +1423,7 @@ async def process_target_validations(
                                 sample=last_updated,
                                 value_index=1,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                         else:
                             # format source value
@@ -1555,15 +1432,10 @@ async def process_target_validations(
                                 sample=source,
                                 value_index=0,
                                 data_source_list=data_source_list,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                             )
                     else:
-                        v = (
-                            await get_choice_value(v, session, static_cache)
-                            if type(v) is int
-                            else v
-                        )
+                        v = lookups.choice_value(v) if type(v) is int else v
 
                     items[key_counter] = scientific_to_float(v)
                     description[key_counter] = desc
@@ -1593,8 +1465,7 @@ async def process_scope_3_nested_lists(
     scope_list,
     scope_group,
     counter,
-    session,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     category_desc=None,
     source=None,
     last_updated=None,
@@ -1629,9 +1500,7 @@ async def process_scope_3_nested_lists(
                 if k.endswith("_prompt"):
                     continue
                 # get attribute short description
-                desc = await get_prompt_from_key(
-                    session=session, key=k, values=data
-                )
+                desc = lookups.prompt(k, data)
                 desc = (
                     desc.format(scope_3_ghgp_category=category_desc)
                     if scope_group == "ghgp"
@@ -1645,8 +1514,7 @@ async def process_scope_3_nested_lists(
                             sample=last_updated,
                             value_index=1,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                     else:
                         # format source value
@@ -1655,15 +1523,10 @@ async def process_scope_3_nested_lists(
                             sample=source,
                             value_index=0,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                 else:
-                    v = (
-                        await get_choice_value(v, session, static_cache)
-                        if type(v) is int
-                        else v
-                    )
+                    v = lookups.choice_value(v) if type(v) is int else v
                 format_key = k.replace(
                     f"{scope_group}",
                     (
@@ -1695,8 +1558,7 @@ async def process_scope_3(
     scope_list: list,
     scope_source: dict,
     scope_group: str,
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     form_name: str,
     source=None,
     last_updated=None,
@@ -1750,9 +1612,7 @@ async def process_scope_3(
         ):
             category_counter = category_desc_value % 100
 
-        category_desc = await get_choice_value(
-            category_desc_value, session, static_cache
-        )
+        category_desc = lookups.choice_value(category_desc_value)
         # format description for -other = 100016 different from standard
         category_desc = category_desc if category_counter != 16 else "Other"
         methodology_data = data.get(f"scope_3_{scope_group}_methodology", None)
@@ -1765,8 +1625,7 @@ async def process_scope_3(
                 methodology_data,
                 scope_group,
                 category_counter,
-                session,
-                static_cache,
+                lookups,
                 category_desc,
                 source,
                 last_updated,
@@ -1841,8 +1700,7 @@ async def process_scope_3(
                 exclusion_data,
                 scope_group,
                 category_counter,
-                session,
-                static_cache,
+                lookups,
                 category_desc,
                 source,
                 last_updated,
@@ -1913,9 +1771,7 @@ async def process_scope_3(
             if k.endswith("_prompt") or k in keys_to_remove:
                 continue
             # get attribute prompt
-            desc = await get_prompt_from_key(
-                session=session, key=k, values=new_data
-            )
+            desc = lookups.prompt(k, new_data)
             desc = (
                 desc.format(scope_3_ghgp_category=category_desc)
                 if scope_group == "ghgp"
@@ -1939,8 +1795,7 @@ async def process_scope_3(
                             sample=last_updated,
                             value_index=1,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                     else:
                         # format source value
@@ -1949,17 +1804,12 @@ async def process_scope_3(
                             sample=source,
                             value_index=0,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                     scope_emissions_items[k] = scientific_to_float(v)
                 else:
                     for idx, i in enumerate(v):
-                        i = (
-                            await get_choice_value(i, session, static_cache)
-                            if type(i) is int
-                            else i
-                        )
+                        i = lookups.choice_value(i) if type(i) is int else i
                         if i in NullTypeState.values():
                             scope_emissions_items[k] = i
                         else:
@@ -1976,8 +1826,7 @@ async def process_scope_3(
                             sample=last_updated,
                             value_index=1,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                     else:
                         # format source value
@@ -1986,15 +1835,10 @@ async def process_scope_3(
                             sample=source,
                             value_index=0,
                             data_source_list=data_source_list,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                         )
                 else:
-                    v = (
-                        await get_choice_value(v, session, static_cache)
-                        if type(v) is int
-                        else v
-                    )
+                    v = lookups.choice_value(v) if type(v) is int else v
                 if k in disclose_to_remove:
                     # check if field are in disclose and assing them Yes/No
                     v = "Yes" if v else "No" if v is not None else "-"
@@ -2010,14 +1854,7 @@ async def process_scope_3(
                     scope_description[key] = desc
                     if k.endswith("ghg") or k.endswith("co2"):
                         k_unit = key + "_units"
-                        v_unit = await load_column_units(
-                            k, session, static_cache
-                        )
-                        scope_emissions_items[k_unit] = (
-                            v_unit[0]["actions"][0]["set"]["units"]
-                            if isinstance(v_unit, (dict, list))
-                            else v_unit
-                        )
+                        scope_emissions_items[k_unit] = lookups.unit(k)
                         scope_description[k_unit] = desc + " units"
                 else:
                     if k in optional_other:
@@ -2036,14 +1873,7 @@ async def process_scope_3(
                     scope_description[key] = desc
                     if k.endswith("ghg") or k.endswith("co2"):
                         k_unit = key + "_units"
-                        v_unit = await load_column_units(
-                            k, session, static_cache
-                        )
-                        scope_emissions_items[k_unit] = (
-                            v_unit[0]["actions"][0]["set"]["units"]
-                            if isinstance(v_unit, (dict, list))
-                            else v_unit
-                        )
+                        scope_emissions_items[k_unit] = lookups.unit(k)
                         scope_description[k_unit] = desc + " units"
     scopes_list = [
         scope_emissions_items,
@@ -0,0 +1,185 @@
+"""
+Lookup tables of an export.
+
+Export sheets describe every cell with the prompt of its attribute, its
+unit and the values of its choices. `ExportLookups` loads them once per
+export, from the static cache and from a few queries for the columns and
+choices outside of the active views, so filling the sheets does not
+query the database.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import (
+    AttributePrompt,
+    Choice,
+    ColumnDef,
+    ColumnView,
+    Config,
+)
+from app.service.core.cache import CoreMemoryCache
+
+
+@dataclass
+class ExportLookups:
+    """
+    Lookup tables of an export.
+
+    Attributes:
+        prompts (dict[str, str]): The prompt of each column, by name.
+        units (dict[str, list[dict[str, Any]] | str]): The constraint
+            value of each column, by name, as `load_column_units` returns.
+        choices (dict[int, str]): The value of each choice, by ID.
+        choice_sets (dict[str, list[Choice]]): The choices of each set,
+            by set name.
+        exclude_classification (int | None): The
+            `data_download.exclude_classification` configuration.
+    """
+
+    prompts: dict[str, str] = field(default_factory=dict)
+    units: dict[str, list[dict[str, Any]] | str] = field(default_factory=dict)
+    choices: dict[int, str] = field(default_factory=dict)
+    choice_sets: dict[str, list[Choice]] = field(default_factory=dict)
+    exclude_classification: int | None = None
+    _unit_templates: dict[str, str] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    async def load(
+        cls, session: AsyncSession, static_cache: CoreMemoryCache
+    ) -> "ExportLookups":
+        """
+        Loads the lookup tables of an export.
+
+        Values in the static cache take precedence, as they do for
+        `get_choice_value` and `load_column_units`; the database is only
+        queried for the columns of the table definitions, and the
+        choices of the choice sets, which are missing from it.
+
+        Args:
+            session (AsyncSession): The database session.
+            static_cache (CoreMemoryCache): The static cache.
+
+        Returns:
+            ExportLookups: The lookup tables.
+        """
+        lookups = cls()
+        column_defs = await static_cache.column_defs_by_name()
+        for name, column in column_defs.items():
+            if column.prompts:
+                lookups.prompts[name] = column.prompts[0].value
+            if column.views:
+                lookups.units[name] = column.views[0].constraint_value or ""
+        for choice_id, choice in (await static_cache.choices()).items():
+            lookups.choices[choice_id] = choice.value
+            lookups.choice_sets.setdefault(choice.set_name, []).append(choice)
+        # the static cache holds every column of the active table
+        # definitions, and every choice of their choice sets
+        table_def_ids = {
+            column.table_def_id for column in column_defs.values()
+        }
+        choice_set_ids = {
+            column.choice_set_id
+            for column in column_defs.values()
+            if column.choice_set_id is not None
+        }
+        for name, prompt in await session.execute(
+            select(ColumnDef.name, AttributePrompt.value)
+            .join(ColumnDef, ColumnDef.id == AttributePrompt.column_def_id)
+            .where(ColumnDef.table_def_id.not_in(table_def_ids))
+        ):
+            lookups.prompts.setdefault(name, prompt)
+        for name, constraint_value in await session.execute(
+            select(ColumnDef.name, ColumnView.constraint_value)
+            .join(ColumnDef, ColumnDef.id == ColumnView.column_def_id)
+            .where(ColumnDef.table_def_id.not_in(table_def_ids))
+        ):
+            lookups.units.setdefault(name, constraint_value or "")
+        for choice_id, value in await session.execute(
+            select(Choice.choice_id, Choice.value).where(
+                Choice.set_id.not_in(choice_set_ids)
+            )
+        ):
+            lookups.choices.setdefault(choice_id, value)
+        exclude_classification = await session.scalar(
+            select(Config.value).where(
+                Config.name == "data_download.exclude_classification"
+            )
+        )
+        if exclude_classification:
+            lookups.exclude_classification = int(exclude_classification)
+        return lookups
+
+    def prompt(self, key: str, values: dict[str, Any]) -> str:
+        """
+        Returns the prompt of an attribute: its `_prompt` value, if the
+        values hold one, or else the prompt of its column.
+
+        Args:
+            key (str): The attribute name, or the name of its prompt.
+            values (dict[str, Any]): The values holding the attribute,
+                which may hold its prompt.
+
+        Returns:
+            str: The prompt, or an empty string.
+        """
+        is_prompt = key.endswith("_prompt")
+        try:
+            return values[key + "_prompt" if not is_prompt else key]
+        except KeyError:
+            if is_prompt:
+                return ""
+            return self.prompts.get(key, "")
+
+    def choice_value(self, choice_id: Any) -> Any:
+        """
+        Returns the value of a choice, see `get_choice_value`.
+
+        Args:
+            choice_id (Any): The choice ID, or any other value.
+
+        Returns:
+            Any: The choice value, or the argument if it is not the ID
+                of a known choice.
+        """
+        if not isinstance(choice_id, bool) and isinstance(choice_id, int):
+            return self.choices.get(choice_id, choice_id)
+        return choice_id
+
+    def column_units(self, column_name: str) -> list[dict[str, Any]] | str:
+        """
+        Returns the constraint value of a column, see
+        `load_column_units`.
+
+        Args:
+            column_name (str): The column name.
+
+        Returns:
+            list[dict[str, Any]] | str: The constraint value, or an empty
+                string.
+        """
+        return self.units.get(column_name) or ""
+
+    def unit(self, column_name: str) -> str:
+        """
+        Returns the unit template of a column, set by the first action
+        of its constraint.
+
+        Args:
+            column_name (str): The column name.
+
+        Returns:
+            str: The unit template, or an empty string.
+        """
+        unit = self._unit_templates.get(column_name)
+        if unit is None:
+            units = self.column_units(column_name)
+            unit = self._unit_templates[column_name] = (
+                units[0]["actions"][0]["set"]["units"]
+                if isinstance(units, (dict, list))
+                else units
+            )
+        return unit
@@ -11,14 +11,15 @@ from pandas import ExcelWriter
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import AggregatedObjectView, Choice, Config, Restatement
+from app.db.models import AggregatedObjectView, Config, Restatement
 from app.db.redis import RedisClient
-from app.routers.utils import get_choice_value, load_organization_by_lei
+from app.routers.utils import load_organization_by_lei
 from app.schemas.enums import DefaultPromptsEnum, EmissionsUnitsEnum
 from app.schemas.restatements import AttributePathsModel
 from app.schemas.search import SearchQuery
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.loaders import SubmissionLoader
+from app.service.executors import export_executor
 from app.service.exports.forms_processor import (
     process_data_export,
     process_dataframe_data,
@@ -34,18 +35,17 @@ from app.service.exports.headers.headers import (
     SearchSheets,
     get_data_explorer_headers,
 )
+from app.service.exports.lookups import ExportLookups
 from app.service.exports.restatement import RestatementExportManager
 from app.service.exports.utils import (
     extract_data_from_fe,
     format_datetime_for_downloads,
     get_column_names_financed_emissions,
     get_constraint_views,
-    get_prompt_from_key,
     get_scope_emissions_data,
     load_choice_from_root_data,
 )
 from app.service.utils import (
-    load_column_units,
     parse_and_transform_subscripts_to_normal,
     transform_subscript_to_normal,
 )
@@ -55,6 +55,80 @@ logger = logging.getLogger("nzdpu_logger")
 DATA_SOURCE_LIST = []
 
 
+def write_search_sheets(
+    excel_filename: str,
+    sheet_and_df_mapping: list[tuple[str, pd.DataFrame, bool]],
+    metadata_full: pd.DataFrame,
+    financial_lei: list[str],
+    skip_sheets: list,
+    restatements_sheets: list[str],
+    source: bool,
+) -> str:
+    """
+    Writes the data explorer "download all" sheets to a workbook.
+
+    Module-level so that it can run in the export process pool.
+
+    Args:
+        excel_filename (str): The workbook to write.
+        sheet_and_df_mapping (list[tuple[str, pd.DataFrame, bool]]):
+            Sheet name, dataframe and whether to write its header, in
+            sheet order.
+        metadata_full (pd.DataFrame): The metadata sheet, used to fill
+            empty sheets with the companies' identifiers.
+        financial_lei (list[str]): LEIs of financial companies.
+        skip_sheets (list): Sheets never filled from metadata.
+        restatements_sheets (list[str]): Sheets left out of source
+            downloads.
+        source (bool): Whether this is a source download.
+
+    Returns:
+        str: The workbook filename.
+    """
+    thick_border_bottom = Border(bottom=Side(style="thin"))
+    normal_border = Border()
+    # pylint: disable=abstract-class-instantiated
+    with ExcelWriter(excel_filename) as writer:  # pylint: disable=abstract-class-instantiated
+        # add mapped dataframes to excel
+        for sheet_name, df, header in sheet_and_df_mapping:
+            if sheet_name not in skip_sheets:
+                if df.iloc[2:].empty:
+                    data_to_copy = metadata_full.iloc[2:, [0, 1, 6, 7, 10]]
+                    if "FIN" in sheet_name:
+                        data_to_copy = data_to_copy[
+                            data_to_copy.iloc[:, 0].isin(financial_lei)
+                        ]
+                    df = pd.concat(
+                        [
+                            df.iloc[:2],
+                            data_to_copy.reset_index(drop=True),
+                        ],
+                        ignore_index=True,
+                    )
+            if source:
+                # check if we download-all source or timestamp file
+                # skip restatements worksheets
+                if sheet_name in restatements_sheets:
+                    continue
+            df.to_excel(
+                writer,
+                sheet_name=sheet_name,
+                index=False,
+                header=header,
+                float_format="%.2f",
+            )
+            ws = writer.sheets[sheet_name]
+            if not header:
+                for cell in ws[2]:
+                    cell.border = thick_border_bottom
+            else:
+                normal_font = Font(bold=False)
+                for cell in ws[1]:
+                    cell.font = normal_font
+                    cell.border = normal_border
+    return excel_filename
+
+
 @dataclass
 class SubmissionResult:
     nz_id: int
@@ -78,6 +152,8 @@ class SearchExportManager:
         attributes_single_values (list) - list of attribute single values
         classification_information_toggler (bool) - toggler for classification information
         download_option (Enum) - toggler for download option
+        lookups (ExportLookups) - prompts, units and choices of the
+            export, loaded by download_excel
     """
 
     cache: RedisClient
@@ -91,6 +167,7 @@ class SearchExportManager:
     attributes_single_values: list = field(default_factory=list)
     classification_information_toggler: bool = False
     download_option: str = ExportOptions.SEARCH.value
+    lookups: ExportLookups = field(default_factory=ExportLookups)
 
     async def _process_submission_rest(
         self, submission_loader: SubmissionLoader
@@ -164,11 +241,11 @@ class SearchExportManager:
             single_attr_values = {}
             for field in self.query.fields:
                 # unpack attribute path
-                attribute_path = AttributePathsModel.unpack_field_path(
+                attribute_path = AttributePathsModel.parse_field_path(
                     str(field)
                 )
                 # unpack attribute path for _prompt field
-                attribute_path_prompt = AttributePathsModel.unpack_field_path(
+                attribute_path_prompt = AttributePathsModel.parse_field_path(
                     f"{field}_prompt"
                 )
                 # load attribute value
@@ -215,10 +292,8 @@ class SearchExportManager:
                 except (ValueError, Exception):
                     # for root fields we need to add exception and catch
                     # to format it differently
-                    attribute_desc = await get_prompt_from_key(
-                        session=self.session,
-                        key=attribute_path.attribute,
-                        values=result,
+                    attribute_desc = self.lookups.prompt(
+                        attribute_path.attribute, result
                     )
                     # check for default prompt which are not in DB
                     if not attribute_desc:
@@ -260,19 +335,10 @@ class SearchExportManager:
                     single_attr_values[attribute_name] = attribute_value
                 # create units col for emissions attributes
                 if attribute_name.endswith(tuple(EmissionsUnitsEnum.values())):
-                    attribute_value_unit = await load_column_units(
-                        attribute_path.attribute,
-                        self.session,
-                        self.static_cache,
-                    )
                     single_attr_values[attribute_name + "_units"] = (
                         transform_subscript_to_normal(
-                            attribute_value_unit[0]["actions"][0]["set"][
-                                "units"
-                            ]
+                            self.lookups.unit(attribute_path.attribute)
                         )
-                        if isinstance(attribute_value_unit, (dict, list))
-                        else attribute_value_unit
                     )
             self.attributes_single_values.append(single_attr_values)
 
@@ -293,16 +359,12 @@ class SearchExportManager:
         column_names_ge = await get_column_names_financed_emissions(
             "gross_exp"
         )
-        thick_border_bottom = Border(bottom=Side(style="thin"))
-        normal_border = Border()
         if source:
             # get source ids for mapping restated and source columns
-            choice_list = await self.session.execute(
-                select(Choice.choice_id).where(
-                    Choice.set_name == "source_list"
-                )
-            )
-            source_set = choice_list.scalars().all()
+            source_set = [
+                choice.choice_id
+                for choice in self.lookups.choice_sets.get("source_list", [])
+            ]
             DATA_SOURCE_LIST.extend(source_set)
         # create key
         key_data = [
@@ -808,30 +870,22 @@ class SearchExportManager:
                 else None
             )
             if source_value:
-                source_value = await get_choice_value(
-                    source_value, self.session, self.static_cache
-                )
+                source_value = self.lookups.choice_value(source_value)
             unchanged_data = {
                 "legal_entity_identifier": res.get("lei"),
                 "company_name": res.get("company_name"),
-                "data_model": await get_choice_value(
-                    res.get("data_model"), self.session, self.static_cache
-                ),
+                "data_model": self.lookups.choice_value(res.get("data_model")),
                 "reporting_year": res.get("reporting_year"),
                 "org_boundary_approach": (
                     last_updated_value
                     if source and last_updated
                     else (
-                        await get_choice_value(
-                            res.get("source"), self.session, self.static_cache
-                        )
+                        self.lookups.choice_value(res.get("source"))
                         if source
                         and res.get("org_boundary_approach")
                         not in DATA_SOURCE_LIST
-                        else await get_choice_value(
-                            res.get("org_boundary_approach"),
-                            self.session,
-                            self.static_cache,
+                        else self.lookups.choice_value(
+                            res.get("org_boundary_approach")
                         )
                     )
                 ),
@@ -848,7 +902,7 @@ class SearchExportManager:
                 ),
             }
             scope_root_data = await load_choice_from_root_data(
-                unchanged_data, self.session, self.static_cache
+                unchanged_data, self.lookups
             )
             date_start = format_datetime_for_downloads(
                 res.get("date_start_reporting_year")
@@ -873,17 +927,13 @@ class SearchExportManager:
                     "SICS classification information not available for"
                     " download. "
                 ),
-                "data_model": await get_choice_value(
-                    res.get("data_model"), self.session, self.static_cache
-                ),
+                "data_model": self.lookups.choice_value(res.get("data_model")),
                 "reporting_year": res.get("reporting_year"),
                 "date_start_reporting_year": (
                     last_updated_value
                     if source and last_updated
                     else (
-                        await get_choice_value(
-                            res.get("source"), self.session, self.static_cache
-                        )
+                        self.lookups.choice_value(res.get("source"))
                         if source
                         and res.get("org_boundary_approach")
                         not in DATA_SOURCE_LIST
@@ -894,9 +944,7 @@ class SearchExportManager:
                     last_updated_value
                     if source and last_updated
                     else (
-                        await get_choice_value(
-                            res.get("source"), self.session, self.static_cache
-                        )
+                        self.lookups.choice_value(res.get("source"))
                         if source
                         and res.get("org_boundary_approach")
                         not in DATA_SOURCE_LIST
@@ -907,16 +955,12 @@ class SearchExportManager:
                     last_updated_value
                     if source and last_updated
                     else (
-                        await get_choice_value(
-                            res.get("source"), self.session, self.static_cache
-                        )
+                        self.lookups.choice_value(res.get("source"))
                         if source
                         and res.get("org_boundary_approach")
                         not in DATA_SOURCE_LIST
-                        else await get_choice_value(
-                            res.get("org_boundary_approach"),
-                            self.session,
-                            self.static_cache,
+                        else self.lookups.choice_value(
+                            res.get("org_boundary_approach")
                         )
                     )
                 ),
@@ -953,13 +997,12 @@ class SearchExportManager:
                     ) = await process_scope_emissions(
                         d=res,
                         emissions=scope_1_emissions_fields,
-                        session=self.session,
+                        lookups=self.lookups,
                         source=source_value,
                         restated=restated_fields,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
                         download_option=self.download_option,
-                        static_cache=self.static_cache,
                     )
                     # extract rationale for ghg breakdown
                     rationale = scope_emissions_data.pop(
@@ -1000,11 +1043,10 @@ class SearchExportManager:
                         scope_desc,
                     ) = await process_scope_ghg(
                         scope_ghg_list=scope_1_ghgb,
-                        session=self.session,
+                        lookups=self.lookups,
                         source=source_value,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
-                        static_cache=self.static_cache,
                     )
                     scope_ghg_data_new = {
                         **{"rationale_s1_ghg_bd_non_disclose": rationale},
@@ -1059,12 +1101,11 @@ class SearchExportManager:
                     ) = await process_data_export(
                         data_export_list=scope_1_exc,
                         form_name="scope_1_exclusion",
-                        session=self.session,
+                        lookups=self.lookups,
                         source=source_value,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
                         download_option=self.download_option,
-                        static_cache=self.static_cache,
                     )
                 except KeyError:
                     pass
@@ -1088,13 +1129,12 @@ class SearchExportManager:
                 ) = await process_scope_emissions(
                     d=res,
                     emissions=scope_2_mb_emissions_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     source=source_value,
                     last_updated=last_updated_value,
                     restated=restated_fields,
                     data_source_list=DATA_SOURCE_LIST,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                 )
             except KeyError:
                 pass
@@ -1117,12 +1157,11 @@ class SearchExportManager:
                     ) = await process_data_export(
                         data_export_list=scope_2_mbx,
                         form_name="scope_2_mb_exclusion",
-                        session=self.session,
+                        lookups=self.lookups,
                         source=source_value,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
                         download_option=self.download_option,
-                        static_cache=self.static_cache,
                     )
                 except KeyError:
                     pass
@@ -1146,13 +1185,12 @@ class SearchExportManager:
                 ) = await process_scope_emissions(
                     d=res,
                     emissions=scope_2_lb_emissions_fields,
-                    session=self.session,
+                    lookups=self.lookups,
                     source=source_value,
                     restated=restated_fields,
                     last_updated=last_updated_value,
                     data_source_list=DATA_SOURCE_LIST,
                     download_option=self.download_option,
-                    static_cache=self.static_cache,
                 )
             except KeyError:
                 pass
@@ -1175,12 +1213,11 @@ class SearchExportManager:
                     ) = await process_data_export(
                         data_export_list=scope_2_lbx,
                         form_name="scope_2_lb_exclusion",
-                        session=self.session,
+                        lookups=self.lookups,
                         source=source_value,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
                         download_option=self.download_option,
-                        static_cache=self.static_cache,
                     )
                 except KeyError:
                     pass
@@ -1223,12 +1260,11 @@ class SearchExportManager:
                         scope_list=scope_3_ghgp,
                         scope_source=scope_source,
                         scope_group="ghgp",
-                        session=self.session,
+                        lookups=self.lookups,
                         form_name="scope_3_ghg_protocol",
                         source=source_value,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
-                        static_cache=self.static_cache,
                     )
                 except KeyError:
                     pass
@@ -1253,12 +1289,11 @@ class SearchExportManager:
                         scope_list=scope_3_iso,
                         scope_source=scope_source,
                         scope_group="iso",
-                        session=self.session,
+                        lookups=self.lookups,
                         form_name="scope_3_iso",
                         source=source_value,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
-                        static_cache=self.static_cache,
                     )
                 except KeyError:
                     pass
@@ -1434,13 +1469,12 @@ class SearchExportManager:
                     ) = await process_data_export(
                         data_export_list=assure,
                         form_name="assure_verif_valid_statement_dis",
-                        session=self.session,
+                        lookups=self.lookups,
                         source=source_value,
                         last_updated=last_updated_value,
                         data_source_list=DATA_SOURCE_LIST,
                         download_option=self.download_option,
                         rationale_assure=rationale_assure,
-                        static_cache=self.static_cache,
                     )
                 except KeyError:
                     pass
@@ -1468,11 +1502,10 @@ class SearchExportManager:
                                     "rationale_target_valid_non_disclose",
                                     None,
                                 ),
-                                session=self.session,
+                                lookups=self.lookups,
                                 source=source_value,
                                 last_updated=last_updated_value,
                                 data_source_list=DATA_SOURCE_LIST,
-                                static_cache=self.static_cache,
                             )
                         except KeyError:
                             pass
@@ -1497,11 +1530,10 @@ class SearchExportManager:
                             ) = await process_targets_and_progress(
                                 targets=target_abs,
                                 target="abs_",
-                                session=self.session,
+                                lookups=self.lookups,
                                 source=source_value,
                                 last_updated=last_updated,
                                 data_source_list=DATA_SOURCE_LIST,
-                                static_cache=self.static_cache,
                             )
                         except KeyError:
                             targets_abs_data = {}
@@ -1542,11 +1574,10 @@ class SearchExportManager:
                             ) = await process_targets_and_progress(
                                 targets=target_int,
                                 target="int_",
-                                session=self.session,
+                                lookups=self.lookups,
                                 source=source_value,
                                 last_updated=last_updated,
                                 data_source_list=DATA_SOURCE_LIST,
-                                static_cache=self.static_cache,
                             )
                         except KeyError:
                             targets_int_data = {}
@@ -1659,10 +1690,9 @@ class SearchExportManager:
                                             processed_description,
                                         ) = await process_financed_emissions(
                                             d=entry_data,
-                                            session=self.session,
+                                            lookups=self.lookups,
                                             source=source_value,
                                             data_source_list=DATA_SOURCE_LIST,
-                                            static_cache=self.static_cache,
                                         )
                                         processed_description[
                                             "legal_entity_identifier"
@@ -1741,11 +1771,10 @@ class SearchExportManager:
                             ) = await extract_data_from_fe(
                                 d=res,
                                 keys=namespace[column_key],
-                                session=self.session,
+                                lookups=self.lookups,
                                 source=source_value,
                                 last_updated=last_updated,
                                 data_source_list=DATA_SOURCE_LIST,
-                                static_cache=self.static_cache,
                             )
                             fi_mappings = {
                                 "legal_entity_identifier": "Company LEI",
@@ -2039,46 +2068,16 @@ class SearchExportManager:
             SearchSheets.RESTATEMENTS_EMISSIONS_SHEET.value,
             SearchSheets.RESTATEMENTS_TARGETS_SHEET.value,
         ]
-        # pylint: disable=abstract-class-instantiated
-        with ExcelWriter(excel_filename) as writer:  # pylint: disable=abstract-class-instantiated
-            # add mapped dataframes to excel
-            for sheet_name, df, header in fe_sheet_and_df_mapping:
-                if sheet_name not in skip_sheets:
-                    if df.iloc[2:].empty:
-                        data_to_copy = metadata_full.iloc[2:, [0, 1, 6, 7, 10]]
-                        if "FIN" in sheet_name:
-                            data_to_copy = data_to_copy[
-                                data_to_copy.iloc[:, 0].isin(financial_lei)
-                            ]
-                        df = pd.concat(
-                            [
-                                df.iloc[:2],
-                                data_to_copy.reset_index(drop=True),
-                            ],
-                            ignore_index=True,
-                        )
-                if source:
-                    # check if we download-all source or timestamp file
-                    # skip restatements worksheets
-                    if sheet_name in restatements_sheets:
-                        continue
-                df.to_excel(
-                    writer,
-                    sheet_name=sheet_name,
-                    index=False,
-                    header=header,
-                    float_format="%.2f",
-                )
-                ws = writer.sheets[sheet_name]
-                if not header:
-                    for cell in ws[2]:
-                        cell.border = thick_border_bottom
-                else:
-                    normal_font = Font(bold=False)
-                    for cell in ws[1]:
-                        cell.font = normal_font
-                        cell.border = normal_border
-        return excel_filename
+        return await export_executor.run(
+            write_search_sheets,
+            excel_filename,
+            fe_sheet_and_df_mapping,
+            metadata_full,
+            financial_lei,
+            skip_sheets,
+            restatements_sheets,
+            source,
+        )
 
     async def _generate_excel_with_search_query_fields(
         self, filename: str | None = None
@@ -2146,6 +2145,9 @@ class SearchExportManager:
         Returns:
             list: The Excel filename.
         """
+        self.lookups = await ExportLookups.load(
+            self.session, self.static_cache
+        )
         if down_all:
             if not source:
                 submission_loader = SubmissionLoader(
@@ -20,7 +20,7 @@ from app.routers.utils import (
 )
 from app.schemas.restatements import AttributePathsModel
 from app.service.core.cache import CoreMemoryCache
-from app.service.utils import load_column_units
+from app.service.exports.lookups import ExportLookups
 from app.utils import convert_keys_to_str
 
 
@@ -339,32 +339,6 @@ async def format_special_value(
     return value
 
 
-async def get_prompt_from_key(
-    session: AsyncSession, key: str, values: dict[str, Any]
-) -> str:
-    """
-    Get attribute prompt field from the key
-    """
-    is_prompt = key.endswith("_prompt")
-    prompt = ""
-    try:
-        prompt = values[key + "_prompt" if not is_prompt else key]
-    except KeyError:
-        if not is_prompt:
-            col_prompt = await session.scalar(
-                select(AttributePrompt.value)
-                .join(
-                    ColumnDef,
-                    ColumnDef.id == AttributePrompt.column_def_id,
-                )
-                .where(ColumnDef.name == key)
-            )
-            if col_prompt:
-                prompt = col_prompt
-
-    return prompt
-
-
 def clean_companies_targets_int_data(target_key, data, keys_to_remove):
     """
     Clean targets physical and economic lists
@@ -534,18 +508,13 @@ async def update_dataframe(
     last_updated,
     reporting_year,
     sheet,
-    session,
-    static_cache,
+    lookups: ExportLookups,
     restated=False,
 ):
     """
     Return new dataframe
     """
-    source = (
-        await get_choice_value(source, session, static_cache)
-        if type(source) is int
-        else source
-    )
+    source = lookups.choice_value(source) if type(source) is int else source
     if sheet in ["scope", "fe"]:
         if desc:
             new_headers = [
@@ -644,7 +613,7 @@ async def update_dataframe(
 
 
 async def return_unit_from_field(
-    field, session, static_cache, sheet, computed_units=None
+    field, lookups: ExportLookups, sheet, computed_units=None
 ):
     """
     Return unit from the provided field
@@ -669,33 +638,22 @@ async def return_unit_from_field(
         unit = await get_value_from_computed_units(field, computed_units)
         # check if unit is None
         if unit is None:
-            units_full = await load_column_units(field, session, static_cache)
-            unit = (
-                units_full[0]["actions"][0]["set"]["units"]
-                if isinstance(units_full, (dict, list))
-                else ""
-            )
+            unit = lookups.unit(field)
             if "{" in unit:
                 unit = None
         return unit
     for condition, new_field in conditions:
         if condition:
-            unit = await load_column_units(new_field, session, static_cache)
-            return (
-                unit[0]["actions"][0]["set"]["units"]
-                if isinstance(unit, (dict, list))
-                else ""
-            )
+            return lookups.unit(new_field)
 
 
 async def get_attribute_prompt_from_path(
     attribute_path: AttributePathsModel,
     static_cache: CoreMemoryCache,
 ) -> AttributePrompt:
-    columns = (await static_cache.column_defs_by_name()).values()
-    for col in columns:
-        if col.name == attribute_path.attribute:
-            return col.prompts[0]
+    columns = await static_cache.column_defs_by_name()
+    if attribute_path.attribute in columns:
+        return columns[attribute_path.attribute].prompts[0]
 
     raise HTTPException(
         status_code=404,
@@ -838,26 +796,20 @@ async def get_column_names_financed_emissions(fe_name, all_fields=True):
     return column_names
 
 
-async def load_choice_from_root_data(
-    root_data: dict, session: AsyncSession, static_cache
-):
+async def load_choice_from_root_data(root_data: dict, lookups: ExportLookups):
     """
     Return dict with choice values
     """
     items = {}
     for k, v in root_data.items():
-        v = (
-            await get_choice_value(v, session, static_cache)
-            if type(v) is int
-            else v
-        )
+        v = lookups.choice_value(v) if type(v) is int else v
         items[k] = v
 
     return items
 
 
 async def format_value_download_all(
-    value, sample, value_index, data_source_list, session, static_cache
+    value, sample, value_index, data_source_list, lookups: ExportLookups
 ):
     """
     Format source and last_updated value for download-all
@@ -866,9 +818,7 @@ async def format_value_download_all(
     sample_index_value = None
     # check if source=0 or last_updated=1
     if value_index == 0 and isinstance(value, tuple):
-        sample_index_value = await get_choice_value(
-            value[value_index], session, static_cache
-        )
+        sample_index_value = lookups.choice_value(value[value_index])
     elif value_index == 1 and isinstance(value, tuple):
         sample_index_value = format_datetime_for_downloads(value[value_index])
     # render if value is source, restated source or blank
@@ -961,8 +911,7 @@ def clean_targets_int_data(target_key, data, keys_to_remove):
 async def extract_data_from_fe(
     d: dict[str, Any],
     keys: list[str],
-    session: AsyncSession,
-    static_cache: CoreMemoryCache,
+    lookups: ExportLookups,
     source=None,
     last_updated=None,
     data_source_list=None,
@@ -979,7 +928,7 @@ async def extract_data_from_fe(
         if key.endswith("_prompt"):
             continue
         # Extract description for the key
-        desc = await get_prompt_from_key(session=session, key=key, values=d)
+        desc = lookups.prompt(key, d)
         if key in d:
             if isinstance(d[key], list):
                 counter = 1
@@ -992,8 +941,7 @@ async def extract_data_from_fe(
                                     value=v,
                                     sample=last_updated,
                                     value_index=1,
-                                    session=session,
-                                    static_cache=static_cache,
+                                    lookups=lookups,
                                     data_source_list=data_source_list,
                                 )
                             else:
@@ -1002,14 +950,11 @@ async def extract_data_from_fe(
                                     value=v,
                                     sample=source,
                                     value_index=0,
-                                    session=session,
-                                    static_cache=static_cache,
+                                    lookups=lookups,
                                     data_source_list=data_source_list,
                                 )
                         else:
-                            v = await get_choice_value(
-                                v, session, static_cache
-                            )
+                            v = lookups.choice_value(v)
                     new_key = f"{key}_{counter}"
 
                     if source:
@@ -1019,8 +964,7 @@ async def extract_data_from_fe(
                                 value=v,
                                 sample=last_updated,
                                 value_index=1,
-                                session=session,
-                                static_cache=static_cache,
+                                lookups=lookups,
                                 data_source_list=data_source_list,
                             )
                         else:
@@ -1029,29 +973,19 @@ async def extract_data_from_fe(
                                 value=v,
                                 sample=source,
                                 value_index=0,
-                                static_cache=static_cache,
-                                session=session,
+                                lookups=lookups,
                                 data_source_list=data_source_list,
                             )
                     new_dict[new_key] = str(v)
                     description[new_key] = desc
                     if key.endswith("ghg_sum") or key.endswith("co2_sum"):
                         k_unit = new_key + "_units"
-                        v_unit = await load_column_units(
-                            key, session, static_cache
-                        )
-                        new_dict[k_unit] = (
-                            v_unit[0]["actions"][0]["set"]["units"]
-                            if isinstance(v_unit, (dict, list))
-                            else v_unit
-                        )
+                        new_dict[k_unit] = lookups.unit(key)
                         description[k_unit] = desc + " units" if desc else desc
                     counter += 1
             else:
                 if isinstance(d[key], int):
-                    d[key] = await get_choice_value(
-                        d[key], session, static_cache
-                    )
+                    d[key] = lookups.choice_value(d[key])
                 if source:
                     if last_updated:
                         # format last_updated value
@@ -1059,8 +993,7 @@ async def extract_data_from_fe(
                             value=d[key],
                             sample=last_updated,
                             value_index=1,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                             data_source_list=data_source_list,
                         )
                     else:
@@ -1069,22 +1002,14 @@ async def extract_data_from_fe(
                             value=d[key],
                             sample=source,
                             value_index=0,
-                            session=session,
-                            static_cache=static_cache,
+                            lookups=lookups,
                             data_source_list=data_source_list,
                         )
                 new_dict[key] = str(d[key])
                 description[key] = desc
                 if key.endswith("ghg_sum") or key.endswith("co2_sum"):
                     k_unit = key + "_units"
-                    v_unit = await load_column_units(
-                        key, session, static_cache
-                    )
-                    new_dict[k_unit] = (
-                        v_unit[0]["actions"][0]["set"]["units"]
-                        if isinstance(v_unit, (dict, list))
-                        else v_unit
-                    )
+                    new_dict[k_unit] = lookups.unit(key)
                     description[k_unit] = desc + " units" if desc else desc
 
     return new_dict, description
@@ -1113,12 +1038,12 @@ def get_attribute_paths(
         ]
 
     def allowed_restated_key(v: str):
-        return allowed_attr_name(AttributePathsModel.unpack_field_path(v))
+        return allowed_attr_name(AttributePathsModel.parse_field_path(v))
 
     keys = list(
         filter(allowed_restated_key, restated_fields_data_source.keys())
     )
-    values = [AttributePathsModel.unpack_field_path(v) for v in keys]
+    values = [AttributePathsModel.parse_field_path(v) for v in keys]
 
     return dict(zip(keys, values))
 
@@ -11,6 +11,14 @@ class Faker:
     Faker provider class for fake submissions
     """
 
+    def __init__(self, rng: random.Random | None = None):
+        """
+        Args:
+            rng (random.Random | None): Seeded generator of the values,
+                for reproducible data. Defaults to the `random` module.
+        """
+        self.random = rng or random
+
     # pylint: disable = redefined-builtin, unsupported-binary-operation
     def text(
         self, name: str = "text", min: int = 0, max: int | None = None
@@ -25,7 +33,7 @@ class Faker:
         Returns:
             str: A fake string.
         """
-        text = f"Fake {name} {random.randint(1, 999)}"
+        text = f"Fake {name} {self.random.randint(1, 999)}"
         # fulfill constraints
         return text.zfill(min - len(text))[:max]
 
@@ -49,10 +57,11 @@ class Faker:
         Returns:
             Union[int, float]: A random number.
         """
-        number = random.randint(min, max)
+        number = self.random.randint(min, max)
         if is_float:
             number = round(
-                float(number - 1 if number else number) + random.random(), 2
+                float(number - 1 if number else number) + self.random.random(),
+                2,
             )
         return number
 
@@ -76,7 +85,7 @@ class Faker:
         min_epoch = calendar.timegm(min.timetuple())
         max_epoch = calendar.timegm(max.timetuple())
         # use epoch constrainst to get random epoch
-        random_epoch = random.randint(min_epoch, max_epoch)
+        random_epoch = self.random.randint(min_epoch, max_epoch)
         # return random datetime from random epoch
         return datetime.fromtimestamp(random_epoch)
 
@@ -89,9 +98,10 @@ class Faker:
         Returns:
             str: A fake table name.
         """
-        return f"sample_{name}_{str(random.randint(0, 999999)).zfill(6)}"
+        number = self.random.randint(0, 999999)
+        return f"sample_{name}_{str(number).zfill(6)}"
 
     def lei(
         self, size=20, chars=string.ascii_uppercase + string.digits
     ) -> str:
-        return "".join(random.choice(chars) for _ in range(size))
+        return "".join(self.random.choice(chars) for _ in range(size))
@@ -10,6 +10,7 @@ import httpx
 from fastapi import status
 
 from app import settings
+from app.db.redis import RedisClient
 
 from .errors import get_error
 from .models import (
@@ -20,6 +21,7 @@ from .models import (
     UpdateResponseModel,
     VerifyPasswordResetResponseModel,
 )
+from .token_cache import VerifiedTokenCache
 
 
 def check_response(
@@ -50,14 +52,84 @@ def check_response(
 class FirebaseRESTAPIClient:
     """
     Simple client to wrap Firebase REST API calls.
+
+    Token verification on the request path goes through
+    `get_account_info_async`, which shares one pooled
+    `httpx.AsyncClient` and one verified-token cache per process.
     """
 
-    def __init__(self, api_key: str):
+    _async_client: httpx.AsyncClient | None = None
+    token_cache: VerifiedTokenCache = VerifiedTokenCache(
+        ttl=settings.fb.token_cache_ttl,
+        max_size=settings.fb.token_cache_size,
+    )
+
+    def __init__(self, api_key: str, redis_cache: RedisClient | None = None):
         """
         Creates an instance of this class.
+
+        Args:
+            api_key (str): The Firebase API key.
+            redis_cache (RedisClient | None): Shared cache for verified
+                tokens, used on top of the in-process one.
         """
         self.api_key = api_key
         self.base_url = settings.fb.api_url
+        self.redis_cache = redis_cache
+
+    @classmethod
+    def get_async_client(cls) -> httpx.AsyncClient:
+        """
+        Returns the process-wide pooled async HTTP client, creating it
+        on first use.
+        """
+        if cls._async_client is None or cls._async_client.is_closed:
+            cls._async_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.fb.max_connections,
+                    max_keepalive_connections=settings.fb.max_connections,
+                ),
+                timeout=httpx.Timeout(10.0),
+            )
+        return cls._async_client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Closes the pooled async HTTP client, if any.
+        """
+        if cls._async_client is not None:
+            await cls._async_client.aclose()
+            cls._async_client = None
+
+    async def get_account_info_async(
+        self, token: str
+    ) -> GetAccountInfoResponseModel:
+        """
+        Async variant of `get_account_info`, answering from the
+        verified-token cache when possible.
+
+        Args:
+            token (str): The Firebase ID token of the account.
+
+        Returns:
+            GetAccountInfoResponseModel: The account associated with the
+                given Firebase ID token.
+        """
+        cached = await self.token_cache.get(token, self.redis_cache)
+        if cached is not None:
+            return GetAccountInfoResponseModel(**cached)
+
+        url = f"{self.base_url}/accounts:lookup"
+        response = await self.get_async_client().post(
+            url=url,
+            params={"key": self.api_key},
+            json={"idToken": token},
+        )
+        data = check_response(response, status.HTTP_200_OK, url)
+        await self.token_cache.set(token, data, self.redis_cache)
+
+        return GetAccountInfoResponseModel(**data)
 
     def get_account_info(self, token: str) -> GetAccountInfoResponseModel:
         """
@@ -0,0 +1,155 @@
+"""
+Cache of Firebase ID tokens already verified against the REST API.
+
+Entries are keyed by a SHA-256 digest of the token, so raw tokens are
+never kept in memory or written to Redis, and never outlive the
+token's own ``exp`` claim.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+import jwt
+import orjson
+
+from app.db.redis import RedisClient
+
+
+def hash_token(token: str) -> str:
+    """
+    Returns the cache key digest for an ID token.
+
+    Args:
+        token (str): The Firebase ID token.
+
+    Returns:
+        str: The hex SHA-256 digest of the token.
+    """
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_token_expiry(token: str) -> float | None:
+    """
+    Reads the ``exp`` claim of an ID token, without verifying it.
+
+    Args:
+        token (str): The Firebase ID token.
+
+    Returns:
+        float | None: The expiry timestamp, or None if unreadable.
+    """
+    try:
+        exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+    except jwt.PyJWTError:
+        return None
+    return float(exp) if exp is not None else None
+
+
+class VerifiedTokenCache:
+    """
+    In-process LRU cache of verified ID tokens, optionally backed by
+    Redis so that verifications are shared across workers.
+    """
+
+    def __init__(self, ttl: int, max_size: int):
+        """
+        Inits the instance of this class.
+
+        Args:
+            ttl (int): Max seconds an entry is kept for.
+            max_size (int): Max number of entries kept in process.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    def _get_expiry(self, token: str) -> float | None:
+        """
+        Returns the timestamp an entry for the token should expire at,
+        or None if the token must not be cached.
+        """
+        now = time.time()
+        expires_at = now + self.ttl
+        token_exp = get_token_expiry(token)
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        return expires_at if expires_at > now else None
+
+    async def get(
+        self, token: str, redis_cache: RedisClient | None = None
+    ) -> dict | None:
+        """
+        Returns the cached account info for a token, if still valid.
+
+        Args:
+            token (str): The Firebase ID token.
+            redis_cache (RedisClient | None): Shared cache to fall back
+                to on a local miss.
+
+        Returns:
+            dict | None: The raw account info response, if cached.
+        """
+        if self.ttl <= 0:
+            return None
+        key = hash_token(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, data = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                return data
+            del self._entries[key]
+        if redis_cache is None:
+            return None
+        cached = await redis_cache.get(
+            redis_cache.wis_keys.firebase_token + key
+        )
+        if not cached:
+            return None
+        data = orjson.loads(cached)
+        self._store(key, token, data)
+        return data
+
+    async def set(
+        self, token: str, data: dict, redis_cache: RedisClient | None = None
+    ) -> None:
+        """
+        Caches the account info for a verified token.
+
+        Args:
+            token (str): The Firebase ID token.
+            data (dict): The raw account info response.
+            redis_cache (RedisClient | None): Shared cache to also write
+                the entry to.
+        """
+        if self.ttl <= 0:
+            return
+        key = hash_token(token)
+        expires_at = self._store(key, token, data)
+        if expires_at is None or redis_cache is None:
+            return
+        await redis_cache.set(
+            redis_cache.wis_keys.firebase_token + key,
+            orjson.dumps(data).decode(),
+            ttl=max(1, int(expires_at - time.time())),
+        )
+
+    def _store(self, key: str, token: str, data: dict) -> float | None:
+        """
+        Stores an entry in the local LRU, evicting the oldest entries.
+        """
+        expires_at = self._get_expiry(token)
+        if expires_at is None:
+            return None
+        self._entries[key] = (expires_at, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return expires_at
+
+    def clear(self) -> None:
+        """
+        Drops all local entries.
+        """
+        self._entries.clear()
@@ -0,0 +1,283 @@
+"""
+Process-wide cache of authenticated users, and coalesced writes of
+their last access time.
+
+Authentication dependencies resolve the same `User` with its groups on
+every request; `PrincipalCache` keeps a column snapshot of it keyed by
+the credential (token subject and `iat`, or API key digest) and hands
+out a fresh detached `User` on every hit, so callers can keep treating
+it as one loaded by a closed session. Invalidations are published to the
+other workers through the invalidation channel of the Redis client the
+cache is bound to.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Hashable
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app import settings
+from app.db.database import DBManager
+from app.db.models import Group, User
+from app.db.redis import RedisClient
+from app.loggers import get_nzdpu_logger
+
+logger = get_nzdpu_logger()
+
+
+def api_key_principal_key(api_key: str) -> tuple[str, str]:
+    """
+    Returns the principal cache key for an API key.
+    """
+    return ("api_key", hashlib.sha256(api_key.encode()).hexdigest())
+
+
+def token_principal_key(
+    auth_mode: str, subject: str, iat: float | int
+) -> tuple[str, str, float]:
+    """
+    Returns the principal cache key for an access token.
+
+    Args:
+        auth_mode (str): The token's auth mode ("local" or "firebase").
+        subject (str): The user name or Firebase user ID.
+        iat (float | int): The token's `iat` claim.
+    """
+    return (auth_mode, subject, float(iat))
+
+
+def _column_values(obj: User | Group) -> dict:
+    return {
+        attr.key: getattr(obj, attr.key)
+        for attr in obj.__mapper__.column_attrs
+    }
+
+
+def _detached(model: type[User] | type[Group], values: dict):
+    obj = model(**values)
+    make_transient_to_detached(obj)
+    return obj
+
+
+class PrincipalCache:
+    """
+    LRU cache of `User` snapshots, with their groups.
+    """
+
+    def __init__(self, ttl: int, max_size: int):
+        """
+        Inits the instance of this class.
+
+        Args:
+            ttl (int): Seconds an entry is kept for; 0 disables caching.
+            max_size (int): Max number of entries.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[
+            Hashable, tuple[float, dict, list[dict]]
+        ] = OrderedDict()
+        self._keys_by_user: dict[int, set[Hashable]] = {}
+        self._redis: RedisClient | None = None
+
+    def bind(self, redis_client: RedisClient) -> None:
+        """
+        Shares invalidations with the other workers, through the
+        invalidation channel of a Redis client. Must be called before
+        the client starts its invalidation listener.
+
+        Args:
+            redis_client (RedisClient): The Redis client.
+        """
+        self._redis = redis_client
+        redis_client.add_invalidation_handler(self._apply_invalidation)
+
+    def get(self, key: Hashable) -> User | None:
+        """
+        Returns a detached copy of the cached user for a credential.
+
+        Args:
+            key (Hashable): The credential key.
+
+        Returns:
+            User | None: The user, with groups loaded, if cached.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, user_values, groups_values = entry
+        if expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        user = _detached(User, user_values)
+        set_committed_value(
+            user,
+            "groups",
+            [_detached(Group, values) for values in groups_values],
+        )
+        return user
+
+    def set(self, key: Hashable, user: User) -> None:
+        """
+        Stores a snapshot of a user loaded with its groups.
+
+        Args:
+            key (Hashable): The credential key.
+            user (User): The loaded user.
+        """
+        if self.ttl <= 0:
+            return
+        self._discard(key)
+        self._entries[key] = (
+            time.monotonic() + self.ttl,
+            _column_values(user),
+            [_column_values(group) for group in user.groups],
+        )
+        self._keys_by_user.setdefault(user.id, set()).add(key)
+        while len(self._entries) > self.max_size:
+            oldest, (_, user_values, _) = self._entries.popitem(last=False)
+            self._unindex(oldest, user_values["id"])
+
+    async def invalidate_user(self, user_id: int) -> None:
+        """
+        Drops all entries of a user in every worker, e.g. after a change
+        to its roles, status, API key or token.
+        """
+        self._drop_user(user_id)
+        await self._publish(principal_user_ids=[user_id])
+
+    async def clear(self) -> None:
+        """
+        Drops all entries in every worker, e.g. after a change to a
+        group.
+        """
+        self._drop_all()
+        await self._publish(principal_clear=True)
+
+    async def _publish(self, **fields) -> None:
+        if self._redis is not None:
+            await self._redis.publish_invalidation(**fields)
+
+    def _apply_invalidation(self, message: dict) -> None:
+        if message.get("flush") or message.get("principal_clear"):
+            self._drop_all()
+            return
+        for user_id in message.get("principal_user_ids", []):
+            self._drop_user(user_id)
+
+    def _drop_user(self, user_id: int) -> None:
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+
+    def _drop_all(self) -> None:
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry[1]["id"])
+
+    def _unindex(self, key: Hashable, user_id: int) -> None:
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
+
+
+class LastAccessRecorder:
+    """
+    Coalesces users' `data_last_accessed` updates into one periodic
+    batched UPDATE, instead of a write per request.
+    """
+
+    def __init__(self, interval: int):
+        """
+        Inits the instance of this class.
+
+        Args:
+            interval (int): Seconds between flushes.
+        """
+        self.interval = interval
+        self._pending: dict[int, datetime] = {}
+        self._task: asyncio.Task | None = None
+
+    def record(self, user_id: int, accessed_on: datetime) -> None:
+        """
+        Records an access, keeping only the latest per user.
+        """
+        self._pending[user_id] = accessed_on
+
+    async def flush(self) -> int:
+        """
+        Writes all pending accesses in a single statement.
+
+        Returns:
+            int: The number of users updated.
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        db_manager = DBManager()
+        try:
+            async with db_manager.get_session() as session:
+                await session.execute(
+                    update(User.__table__)
+                    .where(User.__table__.c.id == bindparam("user_id"))
+                    .values(data_last_accessed=bindparam("accessed_on")),
+                    [
+                        {"user_id": user_id, "accessed_on": accessed_on}
+                        for user_id, accessed_on in pending.items()
+                    ],
+                )
+                await session.commit()
+        except Exception as exc:
+            # keep the accesses for the next flush, unless newer ones
+            # were recorded meanwhile
+            for user_id, accessed_on in pending.items():
+                self._pending.setdefault(user_id, accessed_on)
+            logger.error(f"Failed to flush users' last access: {exc}")
+            return 0
+        return len(pending)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """
+        Starts the periodic flush task.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the periodic flush task and writes what is left.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+principal_cache = PrincipalCache(
+    ttl=settings.application.principal_cache_ttl,
+    max_size=settings.application.principal_cache_size,
+)
+last_access_recorder = LastAccessRecorder(
+    interval=settings.application.last_access_flush_interval
+)
@@ -0,0 +1,102 @@
+"""
+Read-your-writes guard of the reads routed to the followers.
+
+Followers replicate the leader asynchronously, so right after a write,
+e.g. publishing a submission, its author could read stale data from a
+follower. Successful writes mark their caller's credential in Redis for
+`settings.db.read_your_writes_window` seconds, during which the caller's
+reads go to the leader. Routes reading through POST, e.g. to take a query
+body, declare the `read_only_route` dependency so that they do not mark
+their callers.
+"""
+
+import hashlib
+
+from fastapi import Request
+from redis.exceptions import RedisError
+
+from app import settings
+from app.db.database import follower_pool
+from app.db.redis import RedisClient
+from app.loggers import get_nzdpu_logger
+
+logger = get_nzdpu_logger()
+
+# methods which do not write
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def _writer_key(request: Request) -> str | None:
+    """
+    Returns the cache key marking recent writes of the request's caller,
+    by digest of its access token or API key.
+    """
+    credential = request.headers.get("Authorization") or request.headers.get(
+        "access_key"
+    )
+    if not credential:
+        return None
+    return (
+        RedisClient.wis_keys.recent_write
+        + hashlib.sha256(credential.encode()).hexdigest()
+    )
+
+
+async def read_only_route(request: Request) -> None:
+    """
+    Dependency of the routes which do not write despite their method,
+    so that `mark_write` skips their requests.
+    """
+    request.state.read_only = True
+
+
+async def mark_write(
+    request: Request, status_code: int, cache: RedisClient
+) -> None:
+    """
+    Marks a successful write of the request's caller, if reads can be
+    routed to followers. Requests of routes declaring `read_only_route`
+    are skipped.
+
+    Args:
+        request (Request): The handled request.
+        status_code (int): The status code of its response.
+        cache (RedisClient): The Redis client.
+    """
+    if (
+        not follower_pool.engines
+        or request.method in SAFE_METHODS
+        or getattr(request.state, "read_only", False)
+        or status_code >= 400
+    ):
+        return
+    key = _writer_key(request)
+    if key is None:
+        return
+    try:
+        await cache.set(key, "1", ttl=settings.db.read_your_writes_window)
+    except RedisError as exc:
+        logger.warning(f"Failed to mark recent write: {exc}")
+
+
+async def wrote_recently(request: Request, cache: RedisClient) -> bool:
+    """
+    Tells whether the request's caller wrote within the read-your-writes
+    window.
+
+    Args:
+        request (Request): The request about to read.
+        cache (RedisClient): The Redis client.
+
+    Returns:
+        bool: True if the caller's reads must go to the leader.
+    """
+    key = _writer_key(request)
+    if key is None:
+        return False
+    try:
+        return bool(await cache.exists(cache.key_prefix + key))
+    except RedisError as exc:
+        # cannot tell, read from the leader
+        logger.warning(f"Failed to check recent writes: {exc}")
+        return True
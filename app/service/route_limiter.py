@@ -0,0 +1,126 @@
+"""
+Concurrency limits of heavy routes.
+
+Downloads and unbounded searches each hold database connections and
+build large results in memory, so a burst of them would slow every other
+route down. Each group of heavy routes gets a `RouteLimiter`, a route
+dependency letting a fixed number of its requests run at once per worker
+process. Further requests wait in a bounded queue, and are shed with a
+`Retry-After` header when the queue is full (429) or when they waited too
+long (503). The limits are configured in `settings.application`, and the
+counters of every limiter are exposed by `GET /metrics/limiters`.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import HTTPException, status
+
+from app import settings
+from app.settings import DEFAULT_ROUTE_LIMITS
+
+
+class RouteLimiter:
+    """
+    Route dependency bounding the requests handled at once.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+        retry_after: int,
+    ):
+        """
+        Inits the instance of this class.
+
+        Args:
+            name (str): Name reported in metrics.
+            max_concurrent (int): Requests handled at once.
+            max_queue (int): Max requests waiting for a slot; further
+                requests are rejected with 429.
+            queue_timeout (float): Seconds a request waits for a slot
+                before it is rejected with 503.
+            retry_after (int): Seconds returned in the `Retry-After`
+                header of rejected requests.
+        """
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._slots = asyncio.Semaphore(max_concurrent)
+        self.waiting = 0
+        self.in_flight = 0
+        self.peak_depth = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    def _reject(self, status_code: int, reason: str) -> HTTPException:
+        return HTTPException(
+            status_code=status_code,
+            detail={"global": reason},
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+    async def __call__(self) -> AsyncIterator[None]:
+        """
+        Holds a slot while the route handles the request.
+
+        Raises:
+            HTTPException: 429 if the queue is full, 503 if no slot freed
+                up in time.
+        """
+        if self._slots.locked() and self.waiting >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise self._reject(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                "Too many concurrent requests, retry later.",
+            )
+        self.waiting += 1
+        self.peak_depth = max(self.peak_depth, self.waiting + self.in_flight)
+        try:
+            async with asyncio.timeout(self.queue_timeout):
+                await self._slots.acquire()
+        except TimeoutError as exc:
+            self.rejected_timeout += 1
+            raise self._reject(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "The service is busy, retry later.",
+            ) from exc
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def metrics(self) -> dict:
+        """
+        Returns the limiter's counters.
+        """
+        return {
+            "name": self.name,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "peak_depth": self.peak_depth,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
+
+
+route_limiters = {
+    name: RouteLimiter(name=name, **limits.model_dump())
+    for name, limits in (
+        DEFAULT_ROUTE_LIMITS | settings.application.route_limits
+    ).items()
+}
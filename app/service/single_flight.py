@@ -0,0 +1,177 @@
+"""
+Coalescing of concurrent computations of the same expensive result.
+
+When a hot cache entry is missing, e.g. after a deploy or its TTL
+expiry, every concurrent request would otherwise recompute it at once.
+`SingleFlight.run` lets the first caller in the process compute, and the
+others await its result. `SingleFlight.fill` additionally takes a Redis
+lease, so that across workers a single caller computes and writes the
+entry, while the others wait for it to appear in the cache.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+from app import instrumentation, settings
+from app.db.redis import RedisClient
+from app.loggers import get_nzdpu_logger
+
+logger = get_nzdpu_logger()
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Map of in-flight computations, by key.
+    """
+
+    def __init__(
+        self, lease_ttl: int, lease_wait: float, poll_interval: float = 0.05
+    ):
+        """
+        Inits the instance of this class.
+
+        Args:
+            lease_ttl (int): Seconds a Redis lease is held for at most,
+                should its holder die before releasing it.
+            lease_wait (float): Max seconds to wait for another worker's
+                result before computing it anyway.
+            poll_interval (float): Seconds between cache reads while
+                waiting for another worker's result.
+        """
+        self.lease_ttl = lease_ttl
+        self.lease_wait = lease_wait
+        self.poll_interval = poll_interval
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.computed = 0
+        self.coalesced = 0
+        self.lease_waits = 0
+
+    async def run(
+        self, key: Hashable, compute: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Computes a result, unless it is already being computed in this
+        process, in which case that computation's result is awaited.
+
+        The result is shared with all awaiting callers, so it must not be
+        mutated by them.
+
+        Args:
+            key (Hashable): Identifies the result.
+            compute (Callable[[], Awaitable[T]]): Computes the result.
+
+        Returns:
+            T: The result, or the exception raised computing it.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            started = time.monotonic()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # the computing caller was cancelled, not this one
+                if not future.cancelled():
+                    raise
+            finally:
+                instrumentation.record_lock_wait(time.monotonic() - started)
+        future = asyncio.get_running_loop().create_future()
+        # waiters may be gone by the time the result is set
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        self.computed += 1
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def fill(
+        self,
+        cache: RedisClient,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        read: Callable[[], Awaitable[T | None]],
+    ) -> T:
+        """
+        Fills a missing cache entry, once across processes.
+
+        The caller holding the lease computes, and `compute` must write
+        the entry to the cache before returning. The others poll `read`
+        until it returns the entry, the lease is released, or
+        `lease_wait` is over, and compute themselves in the latter cases.
+
+        Args:
+            cache (RedisClient): The cache holding the entry.
+            key (str): The cache key of the entry.
+            compute (Callable[[], Awaitable[T]]): Computes the result and
+                writes it to the cache.
+            read (Callable[[], Awaitable[T | None]]): Reads the result
+                from the cache.
+
+        Returns:
+            T: The result.
+        """
+        return await self.run(
+            key, lambda: self._fill(cache, key, compute, read)
+        )
+
+    async def _fill(
+        self,
+        cache: RedisClient,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        read: Callable[[], Awaitable[T | None]],
+    ) -> T:
+        if not settings.cache.enabled or cache.cache_control == "no-cache":
+            # the entry could not be read back by the waiters
+            return await compute()
+        lease_token = await cache.acquire_lease(key, self.lease_ttl)
+        if lease_token is None:
+            self.lease_waits += 1
+            started = time.monotonic()
+            deadline = started + self.lease_wait
+            try:
+                while time.monotonic() < deadline:
+                    await asyncio.sleep(self.poll_interval)
+                    result = await read()
+                    if result is not None:
+                        return result
+                    if not await cache.lease_held(key):
+                        break
+            finally:
+                instrumentation.record_lock_wait(time.monotonic() - started)
+            logger.debug(f"No cache entry from lease holder for {key}")
+        try:
+            return await compute()
+        finally:
+            if lease_token is not None:
+                await cache.release_lease(key, lease_token)
+
+    def metrics(self) -> dict:
+        """
+        Returns the coalescing counters.
+        """
+        return {
+            "in_flight": len(self._inflight),
+            "computed": self.computed,
+            "coalesced": self.coalesced,
+            "lease_waits": self.lease_waits,
+        }
+
+
+single_flight = SingleFlight(
+    lease_ttl=settings.cache.lease_ttl, lease_wait=settings.cache.lease_wait
+)
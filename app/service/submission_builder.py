@@ -50,6 +50,12 @@ class SubmissionBuilder:
     cache: RedisClient
     session: AsyncSession
     static_cache: CoreMemoryCache
+    # seeded generator of the values, for reproducible data; defaults
+    # to the `random` module
+    rng: random.Random | None = None
+
+    def __post_init__(self):
+        self.random = self.rng or random
 
     async def _get_choice_set(self, choice_set_id: int) -> list[Choice]:
         """
@@ -199,12 +205,12 @@ class SubmissionBuilder:
                 column.choice_set_id
             ] = await self._get_choice_set(column.choice_set_id)
         # generate random length list of unique random choices IDs
-        choices = random.sample(
+        choices = self.random.sample(
             [
                 choice.id
                 for choice in self.loaded_choice_sets[column.choice_set_id]
             ],
-            k=random.randint(
+            k=self.random.randint(
                 1, len(self.loaded_choice_sets[column.choice_set_id])
             ),
         )
@@ -252,7 +258,7 @@ class SubmissionBuilder:
         for k, v in tpl.items():
 
             def generate():
-                return bool(random.getrandbits(1))
+                return bool(self.random.getrandbits(1))
 
             column = columns[k]
             if column.attribute_type == AttributeType.TEXT:
@@ -263,7 +269,7 @@ class SubmissionBuilder:
             elif column.attribute_type == AttributeType.DATETIME:
                 tpl[k] = await self._generate_datetime_data(column)
             elif column.attribute_type == AttributeType.BOOL:
-                tpl[k] = bool(random.getrandbits(1))
+                tpl[k] = bool(self.random.getrandbits(1))
             elif column.attribute_type in [
                 AttributeType.INT,
                 AttributeType.FLOAT,
@@ -296,7 +302,7 @@ class SubmissionBuilder:
                 tpl[k] = await self._generate_multiple_data(column)
             elif column.attribute_type == AttributeType.SINGLE:
                 result = await self._generate_single_data(column)
-                tpl[k] = random.choice(result)
+                tpl[k] = self.random.choice(result)
         return tpl
 
     async def generate(
@@ -346,7 +352,7 @@ class SubmissionBuilder:
 
         self.loaded_choice_sets = {}
         self.constraints = {}
-        self.fake = Faker()
+        self.fake = Faker(self.rng)
 
         # load last submission to get last submitting user
         last_submission = await self.session.scalar(
@@ -0,0 +1,544 @@
+"""
+Synthetic submissions for load and benchmark runs.
+
+`SyntheticValues` fills a submission template with fake values drawn
+from the constraints in the static cache. Every submission draws from
+its own generator, seeded with the dataset seed, its company and its
+reporting year, so the same dataset is built whatever the batch size or
+the number of companies generated.
+
+`SyntheticDataGenerator` writes the submissions of many companies and
+years through the batched inserts of `BulkSubmissionManager`: form rows
+with multi-row statements, aggregates built from the in-memory values.
+A share of the submissions gets a second revision restating some of its
+emissions, stored with its restatements in the same batch.
+"""
+
+import json
+import random
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import ColumnDef, Organization, Restatement, User
+from app.db.redis import RedisClient
+from app.forms.form_meta import FormMeta
+from app.schemas.column_def import AttributeType
+from app.schemas.enums import SICSSectorEnum, SubmissionObjStatusEnum
+from app.schemas.restatements import RestatementCreate
+from app.schemas.submission import BulkSubmissionResponse, SubmissionCreate
+from app.service.core.cache import CoreMemoryCache
+from app.service.core.managers import BulkSubmissionManager, BulkSubmissionRow
+from app.service.core.types import ColumnDefsDataByName
+from app.service.faker import Faker
+
+# attributes set from the company and reporting year of a submission
+COMPANY_YEAR_ATTRIBUTES = {
+    "organization_identifier",
+    "legal_entity_identifier",
+    "disclosure_source",
+    "filing_year",
+    "reporting_year",
+    "date_start_reporting_year",
+    "date_end_reporting_year",
+    "reporting_datetime",
+}
+# attributes keeping the template value, as searches filter on them
+TEMPLATE_ATTRIBUTES = {"data_model"}
+NUMBER_TYPES = {
+    AttributeType.INT,
+    AttributeType.FLOAT,
+    AttributeType.INT_OR_NULL,
+    AttributeType.FLOAT_OR_NULL,
+}
+# max attributes restated by a revision
+MAX_RESTATED_ATTRIBUTES = 3
+
+
+class SyntheticValues:
+    """
+    Deterministic fake values of a submission template.
+    """
+
+    def __init__(
+        self,
+        columns: ColumnDefsDataByName,
+        template: dict[str, Any],
+        seed: int,
+        reference_date: datetime,
+    ):
+        """
+        Args:
+            columns (ColumnDefsDataByName): All column definitions by
+                name, from the static cache.
+            template (dict[str, Any]): The submission values to fill.
+            seed (int): Seed of the dataset.
+            reference_date (datetime): Replaces `{currentDate}` in date
+                constraints, so values do not depend on the run date.
+        """
+        self.columns = columns
+        self.template = template
+        self.seed = seed
+        self.reference_date = reference_date
+        self._constraints: dict[str, dict[str, Any]] = {}
+        # top-level numbers of the primary form, which revisions restate
+        self.restatable = sorted(
+            name
+            for name, value in template.items()
+            if not isinstance(value, (list, dict))
+            and name not in COMPANY_YEAR_ATTRIBUTES
+            and columns[name].attribute_type in NUMBER_TYPES
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        columns: ColumnDefsDataByName,
+        path: Path,
+        seed: int,
+        reference_date: datetime,
+    ) -> "SyntheticValues":
+        with open(path, encoding="utf-8") as f:
+            template = json.load(f)
+        return cls(columns, template, seed, reference_date)
+
+    def _get_constraints(self, column: ColumnDef) -> dict[str, Any]:
+        """
+        The `min` and `max` constraints of a column, as read by
+        `SubmissionBuilder` from its view.
+        """
+        if column.name not in self._constraints:
+            constraints = {}
+            for view in column.views[:1]:
+                for constraint in view.constraint_value or []:
+                    for action in constraint.get("actions", []):
+                        constraints.update(action.get("set", {}))
+            constraints = {
+                k: v for k, v in constraints.items() if k in ["min", "max"]
+            }
+            if column.attribute_type == AttributeType.DATETIME:
+                constraints = {
+                    k: (
+                        self.reference_date
+                        if v == "{currentDate}"
+                        else datetime.fromisoformat(v).replace(tzinfo=None)
+                    )
+                    for k, v in constraints.items()
+                }
+            self._constraints[column.name] = constraints
+
+        return self._constraints[column.name]
+
+    def _generate_value(
+        self, column: ColumnDef, value: Any, fake: Faker, heritable: bool
+    ) -> Any:
+        """
+        A fake value for an attribute, as `SubmissionBuilder` generates
+        it. Nullable numbers, booleans and sub-forms are generated too,
+        unless the template holds a null state; nullable texts keep the
+        template value.
+        """
+        rng = fake.random
+        attribute_type = column.attribute_type
+        if column.name in TEMPLATE_ATTRIBUTES or (
+            attribute_type.endswith("_or_null") and isinstance(value, str)
+        ):
+            return value
+        # sub-form values are left empty at random
+        skippable = heritable and not rng.getrandbits(1)
+        match attribute_type:
+            case AttributeType.TEXT:
+                if skippable:
+                    return None
+                return fake.text(column.name, **self._get_constraints(column))
+            case number_type if number_type in NUMBER_TYPES:
+                if skippable:
+                    return None
+                return fake.number(
+                    is_float=number_type
+                    in [AttributeType.FLOAT, AttributeType.FLOAT_OR_NULL],
+                    **self._get_constraints(column),
+                )
+            case AttributeType.DATETIME:
+                return fake.datetime(
+                    **self._get_constraints(column)
+                ).isoformat()
+            case AttributeType.BOOL | AttributeType.BOOL_OR_NULL:
+                return bool(rng.getrandbits(1))
+            case AttributeType.SINGLE:
+                return rng.choice(
+                    [choice.choice_id for choice in column.choices]
+                )
+            case AttributeType.MULTIPLE:
+                choice_ids = [choice.choice_id for choice in column.choices]
+                return rng.sample(
+                    choice_ids, k=rng.randint(1, len(choice_ids))
+                )
+            case AttributeType.FORM | AttributeType.FORM_OR_NULL:
+                if skippable:
+                    return None
+                if isinstance(value, list):
+                    return [
+                        self._generate(row, fake, heritable=True)
+                        for row in value
+                    ]
+                if isinstance(value, dict):
+                    return self._generate(value, fake, heritable=True)
+        return deepcopy(value)
+
+    def _generate(
+        self, tpl: dict[str, Any], fake: Faker, heritable: bool = False
+    ) -> dict[str, Any]:
+        return {
+            name: self._generate_value(
+                self.columns[name], value, fake, heritable
+            )
+            for name, value in tpl.items()
+        }
+
+    def get_rng(self, nz_id: int, reporting_year: int) -> random.Random:
+        return random.Random(f"{self.seed}:{nz_id}:{reporting_year}")
+
+    def generate(
+        self,
+        rng: random.Random,
+        nz_id: int,
+        reporting_year: int,
+        lei: str,
+        data_source: str,
+    ) -> dict[str, Any]:
+        """
+        Fake values of the submission of a company for a reporting year.
+
+        Args:
+            rng (random.Random): Generator of the submission, from
+                `get_rng`.
+            nz_id (int): The company's nz_id.
+            reporting_year (int): The reporting year.
+            lei (str): The company's LEI.
+            data_source (str): The disclosure source.
+
+        Returns:
+            dict[str, Any]: The submission values.
+        """
+        values = self._generate(self.template, Faker(rng))
+        period_end = datetime(reporting_year, 12, 31).isoformat()
+        values |= {
+            "organization_identifier": nz_id,
+            "filing_year": reporting_year + 1,
+            "reporting_year": reporting_year,
+            "date_start_reporting_year": datetime(
+                reporting_year, 1, 1
+            ).isoformat(),
+            "date_end_reporting_year": period_end,
+            "reporting_datetime": period_end,
+            "legal_entity_identifier": lei,
+            "disclosure_source": data_source,
+        }
+
+        return values
+
+    def restate(
+        self, rng: random.Random, values: dict[str, Any]
+    ) -> tuple[dict[str, Any], list[RestatementCreate]]:
+        """
+        Restates some numbers of a submission.
+
+        Returns:
+            tuple[dict[str, Any], list[RestatementCreate]]: The values
+                of the new revision, and its restatements.
+        """
+        fake = Faker(rng)
+        names = rng.sample(
+            self.restatable,
+            k=rng.randint(
+                1, min(MAX_RESTATED_ATTRIBUTES, len(self.restatable))
+            ),
+        )
+        restatements = [
+            RestatementCreate(
+                path=name,
+                reason=fake.text("restatement reason"),
+                value=self._generate_value(
+                    self.columns[name], None, fake, heritable=False
+                ),
+            )
+            for name in sorted(names)
+        ]
+        revised_values = deepcopy(values)
+        for restatement in restatements:
+            revised_values[restatement.path] = restatement.value
+
+        return revised_values, restatements
+
+
+@dataclass(slots=True)
+class SyntheticSubmissionRow(BulkSubmissionRow):
+    """
+    A generated submission, or a revision restating one.
+    """
+
+    previous: "SyntheticSubmissionRow | None" = None
+    restatements: list[RestatementCreate] = field(default_factory=list)
+    name: str | None = None
+    active: bool = True
+
+
+class SyntheticDataGenerator(BulkSubmissionManager):
+    """
+    Writes a seeded synthetic dataset of submissions, with revisions
+    and restatements, in batches.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        core_cache: CoreMemoryCache,
+        redis_cache: RedisClient,
+        current_user: User,
+        values: SyntheticValues,
+        restated_share: float = 0.1,
+        table_view_id: int = 1,
+        batch_size: int = 200,
+    ):
+        """
+        Args:
+            session (AsyncSession): The database session.
+            core_cache (CoreMemoryCache): The static cache.
+            redis_cache (RedisClient): The Redis client.
+            current_user (User): The submitting user, an administrator.
+            values (SyntheticValues): Generator of the values.
+            restated_share (float): Share of submissions with a second
+                revision. Defaults to 0.1.
+            table_view_id (int): Table view of the submissions.
+                Defaults to 1.
+            batch_size (int): Submissions stored in a transaction.
+                Defaults to 200.
+        """
+        super().__init__(
+            session,
+            core_cache,
+            redis_cache,
+            current_user,
+            batch_size=batch_size,
+        )
+        self.synthetic_values = values
+        self.restated_share = restated_share
+        self.table_view_id = table_view_id
+        self.revisions_created = 0
+        self.restatements_created = 0
+
+    async def create_companies(
+        self, count: int, first_nz_id: int
+    ) -> list[Organization]:
+        """
+        Creates the companies of the dataset, keeping the ones already
+        created by a previous run.
+
+        Args:
+            count (int): Number of companies.
+            first_nz_id (int): nz_id of the first company.
+
+        Returns:
+            list[Organization]: The companies, by nz_id.
+        """
+        nz_ids = range(first_nz_id, first_nz_id + count)
+        existing = {
+            organization.nz_id: organization
+            for organization in await self.session.scalars(
+                select(Organization).where(Organization.nz_id.in_(nz_ids))
+            )
+        }
+        sectors = list(SICSSectorEnum)
+        for nz_id in nz_ids:
+            if nz_id in existing:
+                continue
+            fake = Faker(
+                random.Random(f"{self.synthetic_values.seed}:{nz_id}")
+            )
+            existing[nz_id] = Organization(
+                lei=fake.lei(),
+                legal_name=f"Synthetic company {nz_id}",
+                jurisdiction="US-MA",
+                sics_sector=fake.random.choice(sectors),
+                sics_sub_sector="subsector",
+                sics_industry="sics_industry",
+                nz_id=nz_id,
+            )
+            self.session.add(existing[nz_id])
+        await self.session.commit()
+        # new companies must be known to the static cache
+        await self.static_cache.refresh_values()
+
+        return [existing[nz_id] for nz_id in nz_ids]
+
+    def _get_rows(
+        self, line: int, organization: Organization, reporting_year: int
+    ) -> list[SyntheticSubmissionRow]:
+        """
+        The submission of a company for a reporting year, and its
+        revision if it is restated.
+        """
+        synthetic_values = self.synthetic_values
+        rng = synthetic_values.get_rng(organization.nz_id, reporting_year)
+        data_source = f"CDP Climate Change {reporting_year + 1}"
+        values = synthetic_values.generate(
+            rng,
+            organization.nz_id,
+            reporting_year,
+            organization.lei,
+            data_source,
+        )
+        row = SyntheticSubmissionRow(
+            line=line,
+            submission=SubmissionCreate(
+                nz_id=organization.nz_id,
+                table_view_id=self.table_view_id,
+                data_source=data_source,
+                status=SubmissionObjStatusEnum.PUBLISHED,
+                values=values,
+            ),
+        )
+        if (
+            not synthetic_values.restatable
+            or rng.random() >= self.restated_share
+        ):
+            return [row]
+        revised_values, restatements = synthetic_values.restate(rng, values)
+        revision = SyntheticSubmissionRow(
+            line=line,
+            submission=row.submission.model_copy(
+                update={"revision": 2, "values": revised_values}
+            ),
+            previous=row,
+            restatements=restatements,
+        )
+
+        return [row, revision]
+
+    async def generate(
+        self, organizations: Sequence[Organization], reporting_years: range
+    ) -> BulkSubmissionResponse:
+        """
+        Writes the submissions of the companies for the reporting years.
+        Company years already submitted are reported as failed.
+
+        Args:
+            organizations (Sequence[Organization]): The companies.
+            reporting_years (range): The reporting years.
+
+        Returns:
+            BulkSubmissionResponse: The per-row status report, the
+                revisions sharing the line of their submission.
+        """
+        await self._init_column_required_column()
+        batch: list[SyntheticSubmissionRow] = []
+        line = 0
+        for organization in organizations:
+            for reporting_year in reporting_years:
+                line += 1
+                batch.extend(
+                    self._get_rows(line, organization, reporting_year)
+                )
+                if len(batch) >= self.batch_size:
+                    await self._process_batch(batch)
+                    batch = []
+        if batch:
+            await self._process_batch(batch)
+
+        return self._get_response()
+
+    async def _process_batch(
+        self, batch: list[SyntheticSubmissionRow]
+    ) -> None:
+        # revisions are inserted after the submissions they restate
+        batch.sort(key=lambda row: row.previous is not None)
+        await super()._process_batch(batch)
+        for row in batch:
+            if row.previous and row.submission_obj and not row.errors:
+                self.revisions_created += 1
+                self.restatements_created += len(row.restatements)
+
+    async def _check_duplicates(
+        self, rows: list[SyntheticSubmissionRow]
+    ) -> None:
+        # revisions share the company and year of their submission
+        await super()._check_duplicates(
+            [row for row in rows if row.previous is None]
+        )
+
+    def _get_submission_obj_params(
+        self, row: SyntheticSubmissionRow, name: str, now: datetime
+    ) -> dict[str, Any]:
+        params = super()._get_submission_obj_params(row, name, now)
+        # revisions keep the name of the submission they restate
+        row.name = row.previous.name if row.previous else name
+        params |= {
+            "name": row.name,
+            "status": row.submission.status,
+            "active": row.active,
+        }
+
+        return params
+
+    async def _insert_batch(self, rows: list[SyntheticSubmissionRow]) -> None:
+        for row in rows:
+            if row.previous and row.previous.errors:
+                row.fail({"global": "The restated submission was not stored."})
+        rows = [row for row in rows if not row.errors]
+        if not rows:
+            return
+        for row in rows:
+            if row.previous:
+                row.previous.active = False
+        await super()._insert_batch(rows)
+        await self._insert_restatements([row for row in rows if row.previous])
+
+    async def _insert_restatements(
+        self, revisions: list[SyntheticSubmissionRow]
+    ) -> None:
+        """
+        Stores the restatements of the revisions of a batch, pointing at
+        the primary form rows of the submissions they restate.
+        """
+        if not revisions:
+            return
+        form_table = await self.static_cache.get_form_table()
+        row_ids = dict(
+            (
+                await self.session.execute(
+                    select(
+                        form_table.c[FormMeta.f_obj_id],
+                        form_table.c[FormMeta.f_id],
+                    ).where(
+                        form_table.c[FormMeta.f_obj_id].in_(
+                            [
+                                row.previous.submission_obj.id
+                                for row in revisions
+                            ]
+                        )
+                    )
+                )
+            ).all()
+        )
+        restatements = [
+            {
+                "obj_id": row.submission_obj.id,
+                "group_id": row.previous.submission_obj.id,
+                "attribute_name": restatement.path,
+                "attribute_row": row_ids[row.previous.submission_obj.id],
+                "reason_for_restatement": restatement.reason,
+                "data_source": row.submission.data_source,
+                "reporting_datetime": datetime.fromisoformat(
+                    row.submission.values["reporting_datetime"]
+                ),
+            }
+            for row in revisions
+            for restatement in row.restatements
+        ]
+        await self.session.execute(insert(Restatement), restatements)
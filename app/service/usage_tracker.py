@@ -0,0 +1,135 @@
+"""
+Batched, asynchronous writes of API usage tracking.
+
+`track_api_usage` records a `Tracking` row per tracked download; instead
+of a session and a commit on the request's critical path, rows are
+queued and written by a background task in multi-row inserts.
+"""
+
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from app import settings
+from app.db.database import DBManager
+from app.db.models import Tracking
+from app.loggers import get_nzdpu_logger
+from app.schemas.tracking import TrackingCreate
+
+logger = get_nzdpu_logger()
+
+
+class UsageTracker:
+    """
+    Bounded queue of tracked API usages, flushed periodically or as
+    soon as a batch is full.
+    """
+
+    def __init__(self, interval: int, batch_size: int, max_queue: int):
+        """
+        Inits the instance of this class.
+
+        Args:
+            interval (int): Max seconds between flushes.
+            batch_size (int): Rows per insert; as many queued rows
+                trigger a flush before the interval is over.
+            max_queue (int): Max rows queued; when full, recording
+                waits for the queue to be flushed.
+        """
+        self.interval = interval
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue)
+        self._batch_ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self.written = 0
+        self.failed = 0
+
+    async def record(self, tracking: TrackingCreate) -> None:
+        """
+        Queues a tracked API usage, timestamped now.
+
+        Args:
+            tracking (TrackingCreate): The usage to track.
+        """
+        row = tracking.model_dump()
+        row["date_time"] = datetime.now()
+        # waits while the queue is full, until the task flushes it
+        await self._queue.put(row)
+        if self._task is None:
+            # no background task, e.g. outside of the app's lifespan
+            await self.flush()
+        elif self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    async def flush(self) -> int:
+        """
+        Writes all queued rows, in batches.
+
+        Returns:
+            int: The number of rows written.
+        """
+        rows = []
+        while not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        if not rows:
+            return 0
+        written = 0
+        db_manager = DBManager()
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start : start + self.batch_size]
+            try:
+                async with db_manager.get_session() as session:
+                    await session.execute(insert(Tracking), batch)
+                    await session.commit()
+            except Exception as exc:
+                # tracking is best effort, do not let failed rows pile up
+                self.failed += len(batch)
+                logger.error(
+                    f"Failed to write {len(batch)} API usage rows: {exc}"
+                )
+                continue
+            written += len(batch)
+        self.written += written
+        return written
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(
+                    self._batch_ready.wait(), timeout=self.interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """
+        Starts the background flush task.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stops the background flush task and writes what is left.
+
+        The task is woken up rather than cancelled, so that a flush in
+        progress does not drop the rows it already took off the queue.
+        """
+        if self._task is not None:
+            self._stopping = True
+            self._batch_ready.set()
+            await self._task
+            self._task = None
+            self._stopping = False
+        await self.flush()
+
+
+usage_tracker = UsageTracker(
+    interval=settings.application.tracking_flush_interval,
+    batch_size=settings.application.tracking_batch_size,
+    max_queue=settings.application.tracking_max_queue,
+)
@@ -4,8 +4,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import ColumnDef, ColumnView
-from app.db.types import NullTypeState
 from app.service.core.cache import CoreMemoryCache
+from app.service.core.units import UnitResolver
 
 
 async def load_column_units(
@@ -45,13 +45,12 @@ async def load_column_units(
 async def format_units(
     values: dict,
     field: str,
-    session: AsyncSession,
     static_cache: CoreMemoryCache,
     parent_values: dict = None,
 ):
     """
-    Given values and field returns the corresponding unit
-    DB.
+    Given values and field returns the corresponding unit, from the
+    unit templates of the static cache: see `UnitResolver.resolve`.
 
     Parameters
     ----------
@@ -62,21 +61,8 @@ async def format_units(
     -------
         formatted unit
     """
-    v_unit = await load_column_units(field, session, static_cache)
-    if v_unit:
-        try:
-            v_unit = v_unit[0]["actions"][0]["set"]["units"]
-        except KeyError:
-            return None
-        if v_unit.startswith("{") and v_unit.endswith("}"):
-            v_unit_key = v_unit.strip("{}")
-            # check if field is not in form values and use parent values
-            v_unit = (
-                parent_values.get(v_unit_key)
-                if v_unit_key not in values
-                else values.get(v_unit_key)
-            )
-    return v_unit if v_unit and v_unit not in NullTypeState.values() else None
+    unit_resolver = await UnitResolver.from_cache(static_cache)
+    return unit_resolver.resolve(field, values, parent_values)
 
 
 # Dictionary mapping subscript Unicode characters to normal characters
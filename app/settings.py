@@ -39,6 +39,46 @@ GZIP_MIN_SIZE = 102400  # minimum size in bytes to return gzip payoad
 DEFAULT_SA_ENGINE_OPTIONS = {"future": True, "pool_pre_ping": True}
 
 
+class RouteLimitSettings(BaseModel):
+    """
+    Concurrency limit of a group of heavy routes
+    """
+
+    max_concurrent: Annotated[
+        int,
+        Field(description="Requests handled at once per worker process"),
+    ]
+    max_queue: Annotated[
+        int,
+        Field(
+            default=16,
+            description="Requests waiting for a slot, beyond which requests are rejected with 429",
+        ),
+    ]
+    queue_timeout: Annotated[
+        float,
+        Field(
+            default=10.0,
+            description="Seconds a request waits for a slot before it is rejected with 503",
+        ),
+    ]
+    retry_after: Annotated[
+        int,
+        Field(
+            default=5,
+            description="Seconds returned in the Retry-After header of rejected requests",
+        ),
+    ]
+
+
+DEFAULT_ROUTE_LIMITS = {
+    "search": RouteLimitSettings(max_concurrent=16),
+    "search_download": RouteLimitSettings(max_concurrent=2, max_queue=8),
+    "companies_download": RouteLimitSettings(max_concurrent=2, max_queue=8),
+    "submissions": RouteLimitSettings(max_concurrent=8),
+}
+
+
 class AppSettings(BaseSettings):
     """
     App configuration
@@ -73,6 +113,83 @@ class AppSettings(BaseSettings):
             description="Flag that says if we will save the companies generated files to bucket via save_excel.py script",
         ),
     ]
+    principal_cache_ttl: Annotated[
+        int,
+        Field(
+            default=30,
+            description="Seconds an authenticated user is cached for; 0 disables the cache",
+        ),
+    ]
+    principal_cache_size: Annotated[
+        int,
+        Field(
+            default=10000,
+            description="Max authenticated users kept in the process cache",
+        ),
+    ]
+    last_access_flush_interval: Annotated[
+        int,
+        Field(
+            default=30,
+            description="Seconds between batched writes of users' data_last_accessed",
+        ),
+    ]
+    password_hash_workers: Annotated[
+        int,
+        Field(
+            default=4,
+            description="Threads hashing and checking passwords",
+        ),
+    ]
+    export_workers: Annotated[
+        int,
+        Field(
+            default=2,
+            description="Processes generating export workbooks",
+        ),
+    ]
+    executor_max_queue: Annotated[
+        int,
+        Field(
+            default=32,
+            description="Max jobs queued per CPU-bound executor beyond its running ones",
+        ),
+    ]
+    tracking_flush_interval: Annotated[
+        int,
+        Field(
+            default=5,
+            description="Seconds between batched writes of API usage tracking",
+        ),
+    ]
+    tracking_batch_size: Annotated[
+        int,
+        Field(
+            default=500,
+            description="Tracked API usages per insert, and queued usages triggering an early write",
+        ),
+    ]
+    tracking_max_queue: Annotated[
+        int,
+        Field(
+            default=10000,
+            description="Max API usages queued for writing, beyond which requests wait",
+        ),
+    ]
+    server_timing: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Return the time spent on DB queries and cache reads by each request in a Server-Timing header",
+        ),
+    ]
+    route_limits: Annotated[
+        dict[str, RouteLimitSettings],
+        Field(
+            default_factory=dict,
+            description="Concurrency limits of the heavy routes by limiter name, overriding DEFAULT_ROUTE_LIMITS",
+        ),
+    ]
 
     model_config = SettingsConfigDict(
         env_prefix="APP_", env_file=local_dotenv_path, extra="allow"
@@ -234,6 +351,63 @@ class DBTestSettings(BaseModel):
     ]
 
 
+class PoolSettings(BaseModel):
+    """
+    Connection pool configuration of the database engines
+    """
+
+    size: Annotated[
+        int,
+        Field(default=35, description="Connections kept open per engine"),
+    ]
+    max_overflow: Annotated[
+        int,
+        Field(
+            default=15,
+            description="Connections opened beyond the pool size under load",
+        ),
+    ]
+    timeout: Annotated[
+        float,
+        Field(
+            default=30.0,
+            description="Seconds to wait for a connection of a full pool",
+        ),
+    ]
+    recycle: Annotated[
+        int,
+        Field(
+            default=-1,
+            description="Seconds after which a connection is replaced, -1 for never",
+        ),
+    ]
+    pre_ping: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Test connections for liveness when checked out",
+        ),
+    ]
+    connect_timeout: Annotated[
+        float,
+        Field(default=120.0, description="Seconds to wait to connect"),
+    ]
+    prepared_statement_cache_size: Annotated[
+        int,
+        Field(
+            default=100,
+            description="Prepared statements cached per asyncpg connection, 0 to disable",
+        ),
+    ]
+    adhoc_session_limit: Annotated[
+        int,
+        Field(
+            default=20,
+            description="Sessions opened at once outside of requests' scoped sessions, e.g. to load submissions in parallel",
+        ),
+    ]
+
+
 class DBSettings(BaseSettings):
     """
     Database configuration
@@ -259,6 +433,34 @@ class DBSettings(BaseSettings):
             description="List containing settings for multiple secondary Postgres nodes",
         ),
     ]
+    pool: Annotated[
+        PoolSettings,
+        Field(
+            default_factory=PoolSettings,
+            description="Connection pool settings of the main and secondary nodes",
+        ),
+    ]
+    follower_check_interval: Annotated[
+        int,
+        Field(
+            default=10,
+            description="Seconds between health checks of the secondary nodes",
+        ),
+    ]
+    follower_max_lag: Annotated[
+        float,
+        Field(
+            default=30.0,
+            description="Seconds of replication lag beyond which a secondary node is not read from",
+        ),
+    ]
+    read_your_writes_window: Annotated[
+        int,
+        Field(
+            default=30,
+            description="Seconds after a write during which the writer reads from the main node",
+        ),
+    ]
 
     model_config = SettingsConfigDict(
         env_prefix="DB__",
@@ -321,6 +523,34 @@ class FirebaseSettings(BaseSettings):
     api_url: Annotated[
         str | None, Field(default=None, description="Firebase api url")
     ]
+    token_cache_ttl: Annotated[
+        int,
+        Field(
+            default=60,
+            description="Max seconds a verified ID token is cached for",
+        ),
+    ]
+    token_cache_size: Annotated[
+        int,
+        Field(
+            default=10000,
+            description="Max verified ID tokens kept in the process cache",
+        ),
+    ]
+    token_cache_redis: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Share verified ID tokens across workers via Redis",
+        ),
+    ]
+    max_connections: Annotated[
+        int,
+        Field(
+            default=100,
+            description="Max pooled connections to the Firebase REST API",
+        ),
+    ]
 
     model_config = SettingsConfigDict(
         env_prefix="FIREBASE_", env_file=local_dotenv_path, extra="allow"
@@ -379,6 +609,19 @@ class RedisSettings(BaseSettings):
     host: Annotated[str, Field(default="localhost")]
     port: Annotated[int, Field(default=6379)]
     ttl: Annotated[int, Field(default=3600 * 24 * 7)]  # seven days
+    # TTL of cached totals of paginated listings
+    count_ttl: Annotated[int, Field(default=60)]
+    # zstd level of binary-encoded entries, see app.db.cache_codec
+    compression_level: Annotated[int, Field(default=3)]
+    # in-process tier in front of Redis, see app.db.local_cache;
+    # a TTL of 0 disables it
+    local_ttl: Annotated[int, Field(default=30)]
+    local_max_entries: Annotated[int, Field(default=1024)]
+    local_max_bytes: Annotated[int, Field(default=64 * 1024 * 1024)]
+    # single-flight leases on filling missing entries, see
+    # app.service.single_flight
+    lease_ttl: Annotated[int, Field(default=30)]
+    lease_wait: Annotated[float, Field(default=10.0)]
     enabled: Annotated[int, Field(default=1)]
     password: Annotated[str | None, Field(default=None)]
 
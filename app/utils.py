@@ -23,6 +23,8 @@ from app.schemas.token import (
     RefreshTokenData,
     TokenValidationErrorEnum,
 )
+from app.service.executors import password_executor
+from app.service.principal_cache import principal_cache, token_principal_key
 
 # pylint: disable = unsupported-binary-operation
 
@@ -64,6 +66,25 @@ def check_password(pwd: str, hashed_pwd):
     return valid
 
 
+async def encrypt_password_async(pwd: str) -> str:
+    """
+    Same as `encrypt_password`, off the event loop
+    :param pwd: the clear password to encrypt
+    :return: the encrypted password
+    """
+    return await password_executor.run(encrypt_password, pwd)
+
+
+async def check_password_async(pwd: str, hashed_pwd) -> bool:
+    """
+    Same as `check_password`, off the event loop
+    :param pwd: the clear password to check
+    :param hashed_pwd: the hashed password to check against
+    :return: true if the passwords match, false otherwise
+    """
+    return await password_executor.run(check_password, pwd, hashed_pwd)
+
+
 def create_access_token(data: AccessTokenData):
     """
     Creates an access token for JWT authentication
@@ -120,6 +141,12 @@ async def verify_local_token(token: str, session: AsyncSession) -> User | None:
             code=TokenValidationErrorEnum.VERIFICATION_FAILED
         ) from ex
 
+    principal_key = token_principal_key(
+        AuthMode.LOCAL, decoded_token["sub"], decoded_token["iat"]
+    )
+    user = principal_cache.get(principal_key)
+    if user:
+        return user
     user = await session.scalar(
         select(User)
         .options(selectinload(User.groups))
@@ -133,6 +160,7 @@ async def verify_local_token(token: str, session: AsyncSession) -> User | None:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={"token": "Invalid token"},
         )
+    principal_cache.set(principal_key, user)
     return user
 
 
@@ -252,6 +280,7 @@ async def increment_login_attempts_and_get_error_message(
     ):
         user.enabled = False
         await session.commit()
+        await principal_cache.invalidate_user(user.id)
 
         error_message = {
             "password": (
@@ -0,0 +1,90 @@
+"""
+Minimal stand-in for the Firebase Auth REST API, for benchmarking the
+token verification path without hitting Google's servers.
+
+Point the app at it with
+FIREBASE_AUTH_EMULATOR_HOST=<host>:<port>, then run e.g.:
+
+    python -m cli.firebase_stub_server serve --port 9199 --latency-ms 50
+"""
+
+import asyncio
+
+import typer
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+app = typer.Typer()
+
+
+def create_stub_app(latency_ms: int, local_id: str) -> FastAPI:
+    """
+    Creates the stub ASGI app.
+
+    Args:
+        latency_ms (int): Simulated upstream latency per request.
+        local_id (str): Firebase user ID returned for every token.
+
+    Returns:
+        FastAPI: The stub app.
+    """
+    stub = FastAPI()
+    stub.state.lookups = 0
+
+    @stub.post("/identitytoolkit.googleapis.com/v1/accounts:lookup")
+    async def lookup(request: Request):
+        body = await request.json()
+        stub.state.lookups += 1
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        if not body.get("idToken"):
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "error": {"code": 400, "message": "INVALID_ID_TOKEN"}
+                },
+            )
+        return {
+            "kind": "identitytoolkit#GetAccountInfoResponse",
+            "users": [
+                {
+                    "localId": local_id,
+                    "email": f"{local_id}@example.com",
+                    "emailVerified": True,
+                    "providerUserInfo": [],
+                    "passwordHash": "",
+                    "passwordUpdatedAt": 0,
+                    "validSince": "0",
+                    "lastLoginAt": "0",
+                    "createdAt": "0",
+                }
+            ],
+        }
+
+    @stub.get("/stats")
+    async def stats():
+        return {"lookups": stub.state.lookups}
+
+    return stub
+
+
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", help="Host to bind."),
+    port: int = typer.Option(9199, help="Port to bind."),
+    latency_ms: int = typer.Option(
+        50, help="Simulated upstream latency in milliseconds."
+    ),
+    local_id: str = typer.Option(
+        "stub-user", help="Firebase user ID returned for every token."
+    ),
+):
+    """
+    Serve the Firebase Auth REST API stub.
+    """
+    uvicorn.run(create_stub_app(latency_ms, local_id), host=host, port=port)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,152 @@
+"""CLI command generating a synthetic dataset for load tests"""
+
+import asyncio
+from datetime import datetime
+from time import perf_counter
+
+import typer
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from typing_extensions import Annotated
+
+import app.settings as settings
+from app.db.database import DBManager
+from app.db.models import User
+from app.db.redis import RedisClient
+from app.service.access_manager import AccessManager
+from app.service.core.cache import CoreMemoryCache
+from app.service.synthetic_data import SyntheticDataGenerator, SyntheticValues
+from tests.constants import SUBMISSION_SCHEMA_FULL_FILE_NAME
+
+# create CLI app
+app = typer.Typer()
+
+data_dir = settings.BASE_DIR.parent / "tests" / "data"
+
+
+async def async_generate_dataset(
+    username: str,
+    companies: int,
+    years: int,
+    first_year: int,
+    first_nz_id: int,
+    seed: int,
+    restated_share: float,
+    batch_size: int,
+    tpl: str,
+) -> None:
+    """
+    Asynchronous function to generate a synthetic dataset.
+    """
+    s = perf_counter()
+    db_manager = DBManager()
+    redis_cache = RedisClient(
+        host=settings.cache.host,
+        port=settings.cache.port,
+        password=settings.cache.password,
+    )
+    async with db_manager.get_session() as session:
+        user = await session.scalar(
+            select(User)
+            .filter_by(name=username)
+            .options(selectinload(User.groups))
+        )
+        if not user or not AccessManager.is_admin(user):
+            print(f"ERROR: '{username}' is not an administrator.")
+            return
+        static_cache = CoreMemoryCache(session)
+        await static_cache.load_data()
+        reporting_years = range(first_year, first_year + years)
+        synthetic_values = SyntheticValues.from_file(
+            columns=await static_cache.column_defs_by_name(),
+            path=data_dir / tpl,
+            seed=seed,
+            reference_date=datetime(reporting_years[-1], 12, 31),
+        )
+        generator = SyntheticDataGenerator(
+            session=session,
+            core_cache=static_cache,
+            redis_cache=redis_cache,
+            current_user=user,
+            values=synthetic_values,
+            restated_share=restated_share,
+            batch_size=batch_size,
+        )
+        organizations = await generator.create_companies(
+            companies, first_nz_id
+        )
+        print(f"Generating {companies * years} submissions...")
+        report = await generator.generate(organizations, reporting_years)
+
+    elapsed = perf_counter() - s
+    print(
+        f"Created {report.created} submissions, of which"
+        f" {generator.revisions_created} revisions with"
+        f" {generator.restatements_created} restatements, in {elapsed:.1f}s"
+        f" ({report.created / elapsed:.1f} submissions/s)."
+    )
+    if report.failed:
+        failed = [item for item in report.items if item.errors]
+        print(f"{report.failed} failed, first error: {failed[0].errors}")
+
+
+# pylint: disable = invalid-name
+@app.command()
+def generate_dataset(
+    username: Annotated[
+        str, typer.Argument(help="Name of the submitting administrator")
+    ],
+    companies: Annotated[int, typer.Option(help="Number of companies")] = 1000,
+    years: Annotated[
+        int, typer.Option(help="Reporting years of each company")
+    ] = 5,
+    first_year: Annotated[
+        int, typer.Option(help="First reporting year")
+    ] = 2018,
+    first_nz_id: Annotated[
+        int, typer.Option(help="nz_id of the first company")
+    ] = 100000,
+    seed: Annotated[int, typer.Option(help="Seed of the dataset")] = 0,
+    restated_share: Annotated[
+        float,
+        typer.Option(help="Share of submissions restated by a revision"),
+    ] = 0.1,
+    batch_size: Annotated[
+        int, typer.Option(help="Submissions stored in a transaction")
+    ] = 200,
+    tpl: Annotated[
+        str,
+        typer.Option(
+            help=(
+                "Specify the filename of a JSON file containing submission"
+                " values to use it as a template"
+            ),
+        ),
+    ] = SUBMISSION_SCHEMA_FULL_FILE_NAME,
+) -> None:
+    """
+    Generates a seeded synthetic dataset: the submissions of a range of
+    companies for consecutive reporting years, a share of them restated
+    by a second revision. The same options always generate the same
+    values; company years already submitted are reported as failed and
+    left unchanged.
+    """
+
+    asyncio.run(
+        async_generate_dataset(
+            username,
+            companies,
+            years,
+            first_year,
+            first_nz_id,
+            seed,
+            restated_share,
+            batch_size,
+            tpl,
+        )
+    )
+
+
+if __name__ == "__main__":
+    # start CLI App
+    app()
@@ -4,8 +4,10 @@ import json
 import traceback
 from os import listdir
 from os.path import isdir, isfile, join
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+import httpx
+import orjson
 import requests
 import typer
 
@@ -96,6 +98,93 @@ async def ingest_submissions_async(
         await handle_submission_insertion(submissions, url, access_token, file)
 
 
+async def stream_submissions(submissions: list[dict]) -> AsyncIterator[bytes]:
+    for submission in submissions:
+        yield orjson.dumps({"table_view_id": 1, "values": submission}) + b"\n"
+
+
+async def handle_bulk_submission_insertion(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    file_path: str,
+    batch_size: int,
+):
+    async with semaphore:
+        submissions = await asyncio.to_thread(
+            read_submissions_from_file, file_path
+        )
+        if not submissions:
+            return
+
+        result = await client.post(
+            "/submissions/bulk",
+            params={"batch_size": batch_size},
+            headers={"Content-Type": "application/x-ndjson"},
+            content=stream_submissions(submissions),
+        )
+
+    if result.status_code != 200:
+        print(
+            f"ERROR: could not insert submissions on file {file_path} error: ",
+            result.text,
+        )
+        return
+
+    data = result.json()
+    for item in data["items"]:
+        if item["status"] != "created":
+            print(
+                f"ERROR: could not insert submission with lei {item['lei']}"
+                f" on file {file_path} line {item['line']} error: ",
+                item["errors"],
+            )
+    print(
+        f"INFO: {file_path}: {data['created']} created,"
+        f" {data['failed']} failed out of {data['total']}"
+    )
+
+
+async def ingest_submissions_bulk_async(
+    path: str,
+    username: str,
+    password: str,
+    url: str,
+    concurrency: int,
+    batch_size: int,
+):
+    access_token = get_access_token(url, username, password)
+    if access_token:
+        print("INFO: Successfully logged in.")
+    else:
+        print("ERROR: Invalid login credentials.")
+        return
+
+    if not isdir(path):
+        print(f"ERROR: Path must be a folder: {path}")
+        return
+    only_files = [f for f in listdir(path) if isfile(join(path, f))]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(
+        base_url=url,
+        headers={"Authorization": f"Bearer {access_token}"},
+        limits=httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        ),
+        # a single request stores a whole file
+        timeout=httpx.Timeout(10.0, read=None),
+    ) as client:
+        await asyncio.gather(
+            *(
+                handle_bulk_submission_insertion(
+                    client, semaphore, join(path, file), batch_size
+                )
+                for file in only_files
+            )
+        )
+
+
 @app.command()
 def ingest_submissions(
     folder_path: str,
@@ -111,5 +200,28 @@ def ingest_submissions(
         traceback.print_exc()
 
 
+@app.command()
+def ingest_submissions_bulk(
+    folder_path: str,
+    username: str,
+    password: str,
+    url: Optional[str | None] = "http://localhost:8000",
+    concurrency: int = 4,
+    batch_size: int = 50,
+):
+    """
+    Streams every file of the folder to the bulk submissions endpoint,
+    with at most `concurrency` requests in flight.
+    """
+    try:
+        asyncio.run(
+            ingest_submissions_bulk_async(
+                folder_path, username, password, url, concurrency, batch_size
+            )
+        )
+    except Exception:
+        traceback.print_exc()
+
+
 if __name__ == "__main__":
     app()
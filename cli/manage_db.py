@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from pathlib import Path
 
 import pandas as pd
 import structlog
@@ -35,6 +36,8 @@ from app.schemas.submission import SubmissionGet
 from app.service.core.cache import CoreMemoryCache
 from app.service.core.forms import FormValuesGetter
 from app.service.core.loaders import FormBatchLoader
+from app.service.core.utils import content_hash
+from app.service.core.validator import ParallelAggregatedObjectViewValidator
 from app.utils import encrypt_password, get_engine_from_session
 from cli.manage_forms import async_create
 
@@ -544,12 +547,82 @@ async def async_create_aggregated_forms():
             new_aggregate = AggregatedObjectView(
                 obj_id=submission.id,
                 data=submission.model_dump_json(),
+                content_hash=content_hash(submission.model_dump(mode="json")),
             )
             session.add(new_aggregate)
         await session.commit()
         print("Aggregates are loaded.")
 
 
+async def async_validate_aggregates(
+    report_path: Path,
+    progress_path: Path,
+    chunk_size: int,
+    concurrency: int,
+    restart: bool,
+) -> None:
+    db_manager = DBManager()
+
+    async with db_manager.get_session() as session:
+        static_cache = CoreMemoryCache(session)
+        await static_cache.load_data()
+    redis_cache = RedisClient(
+        host=settings.cache.host,
+        port=settings.cache.port,
+        password=settings.cache.password,
+    )
+    validator = ParallelAggregatedObjectViewValidator(
+        db_manager,
+        static_cache,
+        redis_cache,
+        chunk_size=chunk_size,
+        concurrency=concurrency,
+        progress_path=progress_path,
+    )
+    report = await validator.validate_all(restart=restart)
+    report_path.write_text(
+        json.dumps(report, indent=2, default=str), encoding="utf-8"
+    )
+    print(
+        f"Checked {report['checked']} of {report['total']} submissions,"
+        f" {len(report['invalid_submissions'])} invalid."
+        f" Report saved to {report_path}."
+    )
+
+
+async def async_backfill_aggregate_hashes(batch_size: int) -> None:
+    db_manager = DBManager()
+
+    async with db_manager.get_session() as session:
+        last_id = 0
+        updated = 0
+        while aggregates := (
+            await session.scalars(
+                select(AggregatedObjectView)
+                .where(
+                    AggregatedObjectView.id > last_id,
+                    AggregatedObjectView.content_hash.is_(None),
+                )
+                .order_by(AggregatedObjectView.id)
+                .limit(batch_size)
+            )
+        ).all():
+            for aggregate in aggregates:
+                data = aggregate.data
+                if isinstance(data, str):
+                    data = json.loads(data)
+                if not data:
+                    continue
+                # hash the document as `save_aggregate` stores it
+                aggregate.content_hash = content_hash(
+                    SubmissionGet(**data).model_dump(mode="json")
+                )
+            last_id = aggregates[-1].id
+            updated += len(aggregates)
+            await session.commit()
+        print(f"Stored content hash for {updated} aggregates.")
+
+
 async def get_nz_id_by_legal_name(
     session: AsyncSession, legal_name: str, lei: str | None = None
 ) -> int | None:
@@ -682,6 +755,37 @@ def create_aggregated_forms():
     asyncio.run(async_create_aggregated_forms())
 
 
+@app.command()
+def backfill_aggregate_hashes(batch_size: int = typer.Option(500)):
+    """
+    Store the content hash of aggregates saved without one
+    """
+    asyncio.run(async_backfill_aggregate_hashes(batch_size))
+
+
+@app.command()
+def validate_aggregates(
+    report_path: Path = typer.Argument(Path("aggregates-report.json")),
+    progress_path: Path = typer.Option(
+        Path("aggregates-progress.json"),
+        help="Progress file, an interrupted run resumes from it.",
+    ),
+    chunk_size: int = typer.Option(100),
+    concurrency: int = typer.Option(4),
+    restart: bool = typer.Option(
+        False, help="Discard the progress file and check every submission."
+    ),
+):
+    """
+    Validate aggregates against submissions in the form tables
+    """
+    asyncio.run(
+        async_validate_aggregates(
+            report_path, progress_path, chunk_size, concurrency, restart
+        )
+    )
+
+
 @app.command()
 def create_organizations_aliases():
     """
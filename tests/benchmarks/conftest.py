@@ -0,0 +1,197 @@
+"""
+Fixtures of the benchmarks reading submissions from the database.
+
+`seeded_submissions` fills the test Postgres database with
+`BENCHMARK_SUBMISSIONS` synthetic submissions, generated by
+`SubmissionBuilder` from the full v40 example with a fixed random seed,
+`BENCHMARK_YEARS` reporting years for each company. The form tables rely
+on Postgres composite types, so these benchmarks do not run on SQLite.
+
+When the benchmarks are run on their own, with `pytest tests/benchmarks`,
+pytest-benchmark stores its runs in `BASELINES_DIR`, and each run is
+compared with the last saved baseline, failing on a regression of more
+than `BENCHMARK_COMPARE_FAIL`, see the developer guide.
+"""
+
+import asyncio
+import os
+import random
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from pytest_benchmark.utils import parse_compare_fail
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import settings
+from app.db.models import Organization, SubmissionObj, User
+from app.db.redis import RedisClient
+from app.schemas.enums import SICSSectorEnum
+from app.service.core.cache import CoreMemoryCache
+from app.service.core.loaders import SubmissionLoader
+from app.service.core.managers import SubmissionManager
+from app.service.faker import Faker
+from app.service.submission_builder import SubmissionBuilder
+from app.utils import encrypt_password
+from tests.constants import SCHEMA_FILE_NAME, SUBMISSION_SCHEMA_FULL_FILE_NAME
+from tests.routers.utils import create_test_form
+
+data_dir: Path = settings.BASE_DIR.parent / "tests/data"
+BASELINES_DIR: Path = Path(__file__).parent / "baselines"
+# regression of a benchmark against the last baseline which fails it
+BENCHMARK_COMPARE_FAIL = "mean:15%"
+
+# submissions seeded, and reporting years of each company
+BENCHMARK_SUBMISSIONS = int(os.environ.get("BENCHMARK_SUBMISSIONS", 20))
+BENCHMARK_YEARS = int(os.environ.get("BENCHMARK_YEARS", 5))
+BENCHMARK_SEED = int(os.environ.get("BENCHMARK_SEED", 0))
+# timed rounds of the database benchmarks
+BENCHMARK_ROUNDS = int(os.environ.get("BENCHMARK_ROUNDS", 5))
+# nz_id of the first seeded company
+FIRST_NZ_ID = 5000
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Stores the benchmark runs in `BASELINES_DIR`, and compares them with
+    the last saved baseline, unless the command line sets other options
+    or saves a new baseline. Runs before the pytest-benchmark session is
+    created, which is last.
+    """
+    option = config.option
+    if option.benchmark_storage == "file://./.benchmarks":
+        option.benchmark_storage = f"file://{BASELINES_DIR}"
+    saving = option.benchmark_save or option.benchmark_autosave
+    if (
+        not option.benchmark_compare
+        and not saving
+        and any(BASELINES_DIR.rglob("*.json"))
+    ):
+        option.benchmark_compare = True
+    if option.benchmark_compare and not option.benchmark_compare_fail:
+        option.benchmark_compare_fail = [
+            parse_compare_fail(BENCHMARK_COMPARE_FAIL)
+        ]
+
+
+def run_async(
+    benchmark,
+    func: Callable[[], Awaitable[Any]],
+    setup: Callable[[], Any] | None = None,
+) -> Any:
+    """
+    Benchmarks a coroutine function on the running event loop, which
+    nest_asyncio lets the synchronous benchmark fixture re-enter.
+
+    Args:
+        benchmark: The pytest-benchmark fixture.
+        func (Callable[[], Awaitable[Any]]): Returns the coroutine to
+            time, once per round.
+        setup (Callable[[], Any] | None): Run before each round,
+            untimed.
+
+    Returns:
+        Any: The result of the last round.
+    """
+    loop = asyncio.get_event_loop()
+
+    def run_setup():
+        if setup is not None:
+            loop.run_until_complete(setup())
+
+    return benchmark.pedantic(
+        lambda: loop.run_until_complete(func()),
+        setup=run_setup,
+        rounds=BENCHMARK_ROUNDS,
+        iterations=1,
+        warmup_rounds=1,
+    )
+
+
+async def create_companies(session: AsyncSession, count: int) -> list[int]:
+    """
+    Creates the companies of the seeded submissions, with a submitting
+    user.
+
+    Returns:
+        list[int]: The nz_id of the companies.
+    """
+    fake = Faker()
+    organizations = [
+        Organization(
+            lei=fake.lei(),
+            legal_name=f"benchmark company {i}",
+            jurisdiction="US-MA",
+            sics_sector=SICSSectorEnum.INFRASTRUCTURE,
+            sics_sub_sector="subsector",
+            sics_industry="sics_industry",
+            nz_id=FIRST_NZ_ID + i,
+        )
+        for i in range(count)
+    ]
+    session.add_all(organizations)
+    await session.flush()
+    session.add(
+        User(
+            name="benchmark",
+            first_name="Bench",
+            last_name="Mark",
+            email="benchmark@example.com",
+            email_verified=True,
+            password=encrypt_password("B3nchmark"),
+            api_key=str(uuid4()),
+            organization_id=organizations[0].id,
+        )
+    )
+    await session.commit()
+    return [organization.nz_id for organization in organizations]
+
+
+@pytest_asyncio.fixture
+async def seeded_submissions(
+    session: AsyncSession,
+    static_cache: CoreMemoryCache,
+    redis_client: RedisClient,
+) -> list[int]:
+    """
+    Seeds the synthetic submissions, with their aggregates.
+
+    Returns:
+        list[int]: The IDs of the submissions.
+    """
+    await create_test_form(data_dir / SCHEMA_FILE_NAME, session)
+    companies = -(-BENCHMARK_SUBMISSIONS // BENCHMARK_YEARS)
+    nz_ids = await create_companies(session, companies)
+    builder = SubmissionBuilder(
+        cache=redis_client,
+        session=session,
+        static_cache=static_cache,
+        rng=random.Random(BENCHMARK_SEED),
+    )
+    for i in range(BENCHMARK_SUBMISSIONS):
+        # duplicate years of a company are moved to another year
+        await builder.generate(
+            table_view_id=1,
+            nz_id=nz_ids[i // BENCHMARK_YEARS],
+            tpl_file=SUBMISSION_SCHEMA_FULL_FILE_NAME,
+        )
+    submission_ids = list(
+        await session.scalars(
+            select(SubmissionObj.id).order_by(SubmissionObj.id)
+        )
+    )
+    loader = SubmissionLoader(session, static_cache, redis_client)
+    manager = SubmissionManager(
+        session=session, core_cache=static_cache, redis_cache=redis_client
+    )
+    for submission_id in submission_ids:
+        submission = await loader.load(submission_id, db_only=True)
+        await manager.save_aggregate(
+            submission_id, submission.model_dump(mode="json")
+        )
+    await session.commit()
+    await redis_client.flushdb()
+    return submission_ids
@@ -0,0 +1,101 @@
+"""Benchmarks for constraint validators"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app import settings
+from app.constraint_validator import (
+    CompiledConstraintValidator,
+    ConstraintValidator,
+)
+from app.db.models import ColumnDef
+from app.schemas.constraint import Constraint
+
+data_dir: Path = settings.BASE_DIR.parent / "tests/data"
+
+
+def _walk_schema(attributes: list[dict], columns: dict[str, tuple]) -> None:
+    for attribute in attributes:
+        constraints = attribute.get("view", {}).get("constraint_value")
+        if constraints:
+            columns[attribute["name"]] = (
+                ColumnDef(
+                    name=attribute["name"],
+                    attribute_type=attribute["type"],
+                ),
+                # as stored by the forms API
+                [
+                    Constraint.model_validate(constraint).model_dump()
+                    for constraint in constraints
+                ],
+            )
+        if "form" in attribute:
+            _walk_schema(attribute["form"]["attributes"], columns)
+
+
+def _walk_values(values: Any, pairs: list[tuple[str, Any]]) -> None:
+    if isinstance(values, list):
+        for item in values:
+            _walk_values(item, pairs)
+    elif isinstance(values, dict):
+        for key, value in values.items():
+            pairs.append((key, value))
+            _walk_values(value, pairs)
+
+
+@pytest.fixture(scope="module")
+def v40_submission() -> tuple[dict[str, tuple], list[tuple[str, Any]]]:
+    """
+    Constrained columns of the v40 schema, and the values of the full
+    v40 submission example for them.
+    """
+    with open(data_dir / "nzdpu-v40.json", encoding="utf-8") as f:
+        schema = json.load(f)
+    with open(
+        data_dir / "nzdpu-v40-sub-full-example.json", encoding="utf-8"
+    ) as f:
+        submission = json.load(f)
+    columns: dict[str, tuple] = {}
+    _walk_schema(schema["attributes"], columns)
+    pairs: list[tuple[str, Any]] = []
+    _walk_values(submission, pairs)
+
+    return columns, [(name, v) for name, v in pairs if name in columns]
+
+
+def _validate(validate, pairs):
+    for name, value in pairs:
+        try:
+            validate(name, value)
+        except Exception:  # pylint: disable = broad-except
+            pass
+
+
+@pytest.mark.benchmark(group="constraint-validator")
+def test_interpreted_constraint_validator(benchmark, v40_submission):
+    columns, pairs = v40_submission
+
+    def validate(name, value):
+        column, constraints = columns[name]
+        ConstraintValidator(
+            constraints=constraints, value=value, column=column
+        ).validate()
+
+    benchmark(_validate, validate, pairs)
+
+
+@pytest.mark.benchmark(group="constraint-validator")
+def test_compiled_constraint_validator(benchmark, v40_submission):
+    columns, pairs = v40_submission
+    validators = {
+        name: CompiledConstraintValidator(constraints, column)
+        for name, (column, constraints) in columns.items()
+    }
+
+    def validate(name, value):
+        validators[name].validate(value)
+
+    benchmark(_validate, validate, pairs)
@@ -0,0 +1,77 @@
+"""Benchmarks for company history grouping and downloads"""
+
+from copy import deepcopy
+
+import pytest
+
+from app.service.core.loaders import SubmissionLoader
+from app.service.download_excel_cli_service import SaveExcelFileService
+from app.service.history_service import HistoryService
+from app.service.schema_service import SchemaService
+from tests.benchmarks.conftest import (
+    BENCHMARK_ROUNDS,
+    BENCHMARK_YEARS,
+    FIRST_NZ_ID,
+    run_async,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="history")
+async def test_group_form_items(
+    benchmark, session, static_cache, redis_client, seeded_submissions
+):
+    """
+    Groups the sub-form rows of a company's history by reporting year.
+    """
+    forms_group_by = await SchemaService(
+        static_cache=static_cache
+    ).get_group_by_forms_and_attributes()
+    loader = SubmissionLoader(session, static_cache, redis_client)
+    history = []
+    # the submissions of the first company
+    for submission_id in seeded_submissions[:BENCHMARK_YEARS]:
+        submission = await loader.load(submission_id, use_aggregate=True)
+        history.append(
+            {
+                "reporting_year": submission.values.get("reporting_year"),
+                "submission": submission,
+            }
+        )
+    history.sort(key=lambda item: item["reporting_year"])
+    history_service = HistoryService()
+
+    # grouping replaces the sub-form values in place
+    benchmark.pedantic(
+        history_service.group_form_items,
+        setup=lambda: ((forms_group_by, deepcopy(history)), {}),
+        rounds=BENCHMARK_ROUNDS,
+        iterations=1,
+        warmup_rounds=1,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="export")
+async def test_companies_export(
+    benchmark,
+    monkeypatch,
+    tmp_path,
+    session,
+    static_cache,
+    redis_client,
+    seeded_submissions,
+):
+    """
+    Writes the Excel download of a company's history.
+    """
+    # the download is written to the working directory
+    monkeypatch.chdir(tmp_path)
+    export_service = SaveExcelFileService(session, static_cache, redis_client)
+
+    excel_filename = run_async(
+        benchmark,
+        lambda: export_service.download_company_history_cli(FIRST_NZ_ID),
+    )
+
+    assert excel_filename
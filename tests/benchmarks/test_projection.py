@@ -0,0 +1,105 @@
+"""Benchmarks for the projection of search results on their fields"""
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from app import settings
+from app.schemas.restatements import AttributePathsModel
+from app.service.core.mixins import GetterMixin
+from app.service.core.projection import FieldTree, compile_fields
+
+data_dir: Path = settings.BASE_DIR.parent / "tests/data"
+
+# rows of a search results page
+ROWS = 1000
+# requested fields, part of them in sub-forms
+FIELDS = 50
+FORM_FIELDS = 10
+
+
+@pytest.fixture(scope="module")
+def rows() -> list[dict]:
+    """
+    Search results, as the values of the full v40 submission example.
+    """
+    with open(
+        data_dir / "nzdpu-v40-sub-full-example.json", encoding="utf-8"
+    ) as f:
+        values = json.load(f)
+    return [copy.deepcopy(values) for _ in range(ROWS)]
+
+
+@pytest.fixture(scope="module")
+def fields(rows: list[dict]) -> tuple[str, ...]:
+    """
+    Attributes of the root form, and of the first row of sub-forms.
+    """
+    values = rows[0]
+    form_fields = [
+        f"{form}.{{::0}}.{attribute}"
+        for form, form_rows in values.items()
+        if isinstance(form_rows, list) and form_rows
+        for attribute in list(form_rows[0])[:1]
+    ][:FORM_FIELDS]
+    attributes = [
+        attribute
+        for attribute, value in values.items()
+        if not isinstance(value, list)
+    ][: FIELDS - len(form_fields)]
+    return tuple(attributes + form_fields)
+
+
+@pytest.mark.benchmark(group="search-projection")
+def test_project_per_row(benchmark, rows, fields):
+    """
+    Previous behaviour: the fields are grouped again for every row.
+    """
+
+    def project():
+        return [
+            GetterMixin._strip_fields(
+                values,
+                FieldTree.from_paths(
+                    AttributePathsModel.unpack_field_path(field_path)
+                    for field_path in fields
+                ),
+                raise_exception=False,
+            )
+            for values in rows
+        ]
+
+    benchmark(project)
+
+
+@pytest.mark.benchmark(group="search-projection")
+def test_project_compiled(benchmark, rows, fields):
+    """
+    The fields are compiled once, and each row is walked once.
+    """
+    tree = compile_fields(fields)
+
+    projected = benchmark(
+        lambda: [
+            GetterMixin.project_values(values, tree, raise_exception=False)
+            for values in rows
+        ]
+    )
+    assert len(projected[0]) == FIELDS
+
+
+@pytest.mark.benchmark(group="search-projection")
+def test_project_no_fields(benchmark, rows):
+    """
+    Searches without fields only strip the null values of their rows.
+    """
+    tree = compile_fields(())
+
+    benchmark(
+        lambda: [
+            GetterMixin.project_values(values, tree, raise_exception=False)
+            for values in rows
+        ]
+    )
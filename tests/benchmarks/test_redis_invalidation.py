@@ -0,0 +1,128 @@
+"""Benchmarks for Redis cache invalidation"""
+
+import asyncio
+import os
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app import settings
+from app.db.redis import RedisClient
+
+# size of the keyspace the invalidated entries are hidden in
+KEYSPACE_SIZE = int(os.environ.get("BENCHMARK_REDIS_KEYS", 1_000_000))
+SUBMISSION_ID = 42
+NZ_ID = 1042
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """
+    Event loop shared by the module's Redis client.
+    """
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+@pytest.fixture(scope="module")
+def redis_client(loop):
+    """
+    Client on a scratch database, filled with `KEYSPACE_SIZE` keys.
+    """
+    client = RedisClient(
+        host=settings.cache.host,
+        port=settings.cache.port,
+        password=settings.cache.password,
+        db=15,
+    )
+    client.key_prefix = "bench:"
+    try:
+        loop.run_until_complete(client.ping())
+    except RedisConnectionError:
+        pytest.skip("Redis is not available")
+
+    async def fill():
+        await client.flushdb()
+        for start in range(0, KEYSPACE_SIZE, 10_000):
+            async with client.pipeline(transaction=False) as pipe:
+                for i in range(start, min(start + 10_000, KEYSPACE_SIZE)):
+                    pipe.set(f"bench:companies/{i}/history", "{}")
+                await pipe.execute()
+
+    loop.run_until_complete(fill())
+    yield client
+    loop.run_until_complete(client.flushdb())
+    loop.run_until_complete(client.close())
+
+
+def _seed(client: RedisClient, loop) -> None:
+    """
+    Caches a submission and an entry of its company, both tagged.
+    """
+
+    async def seed():
+        tags = [
+            client.wis_keys.submission_tag(SUBMISSION_ID),
+            client.wis_keys.nz_id_tag(NZ_ID),
+        ]
+        await client.set(
+            client.wis_keys.submission + str(SUBMISSION_ID), "{}", tags=tags
+        )
+        await client.set(f"companies/{NZ_ID}/targets", "{}", tags=tags)
+
+    loop.run_until_complete(seed())
+
+
+@pytest.mark.benchmark(group="redis-invalidation")
+def test_keys_invalidation(benchmark, redis_client, loop):
+    """
+    Previous implementation: KEYS, then one DELETE per key.
+    """
+
+    async def invalidate():
+        keys = await redis_client.keys(
+            redis_client.key_prefix
+            + redis_client.wis_keys.submission
+            + str(SUBMISSION_ID)
+        )
+        for key in keys:
+            await redis_client.delete(key)
+
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(invalidate()),
+        setup=lambda: _seed(redis_client, loop),
+        rounds=10,
+    )
+
+
+@pytest.mark.benchmark(group="redis-invalidation")
+def test_scan_invalidation(benchmark, redis_client, loop):
+    """
+    Fallback for untagged keys: SCAN with batched UNLINK.
+    """
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(
+            redis_client.del_pattern(f"companies/{NZ_ID}/*")
+        ),
+        setup=lambda: _seed(redis_client, loop),
+        rounds=10,
+    )
+
+
+@pytest.mark.benchmark(group="redis-invalidation")
+def test_tag_invalidation(benchmark, redis_client, loop):
+    """
+    Tag sets: SMEMBERS, then UNLINK of the members.
+    """
+
+    def invalidate():
+        return loop.run_until_complete(
+            redis_client.invalidate_submission(SUBMISSION_ID, NZ_ID)
+        )
+
+    deleted = benchmark.pedantic(
+        invalidate, setup=lambda: _seed(redis_client, loop), rounds=10
+    )
+    # the submission, the company entry and both tag sets
+    assert deleted == 4
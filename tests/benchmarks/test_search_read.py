@@ -0,0 +1,135 @@
+"""Benchmarks for searching submissions and exporting the results"""
+
+import pytest
+
+from app.schemas.search import SearchQuery
+from app.service.core.search import QueryDSLTransformer, SubmissionFinder
+from app.service.exports.search_download import SearchExportManager
+from tests.benchmarks.conftest import BENCHMARK_SUBMISSIONS, run_async
+
+SEARCH_FIELDS = [
+    "reporting_year",
+    "total_s1_emissions_ghg",
+    "total_s2_lb_emissions_co2",
+]
+
+
+@pytest.fixture
+def search_query() -> SearchQuery:
+    return SearchQuery(fields=SEARCH_FIELDS)
+
+
+async def make_transformer(
+    session, static_cache, redis_client, query: SearchQuery
+) -> QueryDSLTransformer:
+    """
+    A new transformer for each round, as `transform` builds its query in
+    place.
+    """
+    table_views = await static_cache.table_views()
+    return QueryDSLTransformer(
+        session=session,
+        cache=static_cache,
+        redis_cache=redis_client,
+        table_view=table_views[1],
+        query=query,
+        limit=BENCHMARK_SUBMISSIONS,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="search")
+async def test_transform(
+    benchmark,
+    session,
+    static_cache,
+    redis_client,
+    seeded_submissions,
+    search_query,
+):
+    """
+    Builds the SQL statement of a search query.
+    """
+
+    async def transform():
+        transformer = await make_transformer(
+            session, static_cache, redis_client, search_query
+        )
+        return await transformer.transform()
+
+    statement = run_async(benchmark, transform)
+
+    assert statement is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="search")
+async def test_load_all(
+    benchmark,
+    session,
+    static_cache,
+    redis_client,
+    seeded_submissions,
+    search_query,
+):
+    """
+    Runs a search query and loads the results from the aggregates.
+    """
+
+    async def load_all():
+        finder = SubmissionFinder(
+            session=session,
+            cache=static_cache,
+            redis_cache=redis_client,
+            transformer=await make_transformer(
+                session, static_cache, redis_client, search_query
+            ),
+        )
+        return await finder.load_all()
+
+    results = run_async(benchmark, load_all)
+
+    assert len(results) == len(seeded_submissions)
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="export")
+async def test_search_export(
+    benchmark,
+    tmp_path,
+    session,
+    static_cache,
+    redis_client,
+    seeded_submissions,
+    search_query,
+):
+    """
+    Writes the Excel download of the search results.
+    """
+    finder = SubmissionFinder(
+        session=session,
+        cache=static_cache,
+        redis_cache=redis_client,
+        transformer=await make_transformer(
+            session, static_cache, redis_client, search_query
+        ),
+        export=True,
+    )
+    results = await finder.load_all()
+
+    def download_excel():
+        export_manager = SearchExportManager(
+            cache=redis_client,
+            session=session,
+            query_results=results,
+            query=search_query,
+            static_cache=static_cache,
+        )
+        return export_manager.download_excel(
+            filename=str(tmp_path / "nzdpu_data_explorer_table.xlsx"),
+            down_all=len(search_query.fields) <= 1,
+        )
+
+    excel_filename = run_async(benchmark, download_excel)
+
+    assert excel_filename
@@ -0,0 +1,64 @@
+"""Benchmarks for cached submission serialization"""
+
+import json
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app import settings
+from app.db import cache_codec
+from app.schemas.submission import SubmissionGet
+from app.service.core.loaders import SubmissionLoader
+
+data_dir: Path = settings.BASE_DIR.parent / "tests/data"
+
+
+@pytest.fixture(scope="module")
+def v40_submission() -> SubmissionGet:
+    """
+    The full v40 submission example, as loaded by SubmissionLoader.
+    """
+    with open(
+        data_dir / "nzdpu-v40-sub-full-example.json", encoding="utf-8"
+    ) as f:
+        values = json.load(f)
+    return SubmissionGet(
+        id=1,
+        name="benchmark",
+        lei="000012345678",
+        nz_id=1,
+        submitted_by=1,
+        table_view_id=1,
+        values=values,
+        units={},
+    )
+
+
+@pytest.mark.benchmark(group="submission-cache-hit")
+def test_json_cache_hit(benchmark, v40_submission):
+    """
+    Previous format: orjson text, read through the decoding connection.
+    """
+    cached = orjson.dumps(v40_submission.model_dump(mode="json")).decode()
+    benchmark.extra_info["size"] = len(cached.encode())
+
+    benchmark(lambda: SubmissionGet(**orjson.loads(cached)))
+
+
+@pytest.mark.benchmark(group="submission-cache-hit")
+def test_binary_cache_hit(benchmark, v40_submission):
+    """
+    Binary codec payload, read as bytes, rebuilt without validation.
+    """
+    cached = cache_codec.encode(v40_submission.model_dump(mode="json"))
+    benchmark.extra_info["size"] = len(cached)
+
+    submission = benchmark(
+        lambda: SubmissionLoader.submission_from_cache(
+            cache_codec.decode(cached)
+        )
+    )
+    assert submission == SubmissionGet.model_validate(
+        cache_codec.decode(cached)
+    )
@@ -0,0 +1,88 @@
+"""Benchmarks for loading submissions from the database"""
+
+import pytest
+
+from app.service.core.forms import FormValuesGetter
+from app.service.core.loaders import FormBatchLoader, SubmissionLoader
+from tests.benchmarks.conftest import run_async
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="submission-load")
+async def test_load_cold(
+    benchmark, session, static_cache, redis_client, seeded_submissions
+):
+    """
+    Loads a submission from its form tables, skipping Redis.
+    """
+    loader = SubmissionLoader(session, static_cache, redis_client)
+    submission_id = seeded_submissions[0]
+
+    submission = run_async(
+        benchmark, lambda: loader.load(submission_id, db_only=True)
+    )
+
+    assert submission.id == submission_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="submission-load")
+async def test_load_redis(
+    benchmark, session, static_cache, redis_client, seeded_submissions
+):
+    """
+    Loads a submission cached in Redis.
+    """
+    loader = SubmissionLoader(session, static_cache, redis_client)
+    submission_id = seeded_submissions[0]
+    await loader.load(submission_id)
+
+    submission = run_async(benchmark, lambda: loader.load(submission_id))
+
+    assert submission.id == submission_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="submission-load")
+async def test_load_aggregate(
+    benchmark, session, static_cache, redis_client, seeded_submissions
+):
+    """
+    Loads a submission from its aggregate, on a Redis miss.
+    """
+    loader = SubmissionLoader(session, static_cache, redis_client)
+    submission_id = seeded_submissions[0]
+
+    submission = run_async(
+        benchmark,
+        lambda: loader.load(submission_id, use_aggregate=True),
+        setup=redis_client.flushdb,
+    )
+
+    assert submission.id == submission_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.benchmark(group="submission-form-values")
+async def test_form_values(
+    benchmark, session, static_cache, redis_client, seeded_submissions
+):
+    """
+    Builds the values and units of a submission from its prefetched form
+    rows.
+    """
+    batch_loader = FormBatchLoader(
+        session, static_cache, redis_client, seeded_submissions[0]
+    )
+    form_rows = await batch_loader.fetch_form_row_data()
+    primary_form = batch_loader.primary_form_table_def
+
+    def get_values():
+        getter = FormValuesGetter(
+            static_cache, redis_client, form_rows, primary_form
+        )
+        return getter.get_values()
+
+    values, _ = run_async(benchmark, get_values)
+
+    assert values
@@ -42,11 +42,19 @@ from app.dependencies import (
 )
 from app.main import app
 from app.service.core.cache import CoreMemoryCache
+from app.service.principal_cache import principal_cache
 from app.settings import DEFAULT_SA_ENGINE_OPTIONS
 from cli.manage_db import get_init_config
 
 nest_asyncio.apply()
 
+# tests change users and groups straight through the session, bypassing
+# the routers which invalidate cached principals
+principal_cache.ttl = 0
+# tests read and flush Redis through several clients, whose in-process
+# tiers are only invalidated asynchronously
+settings.cache.local_ttl = 0
+
 """
 Pytest config section
 """
@@ -21,6 +21,7 @@ from app.service.exports.forms_processor import (
     process_scope_emissions,
 )
 from app.service.exports.headers.headers import ExportOptions
+from app.service.exports.lookups import ExportLookups
 from app.service.exports.utils import (
     format_datetime_for_downloads,
     scope_emissions_formatter,
@@ -139,8 +140,7 @@ class TestCompaniesExport(AuthTest):
             d=results,
             company=organization,
             reporting_year=reporting_year,
-            session=session,
-            static_cache=static_cache,
+            lookups=await ExportLookups.load(session, static_cache),
         )
         # Expected keys for items and description
         expected_keys = {
@@ -219,9 +219,8 @@ class TestCompaniesExport(AuthTest):
             source=source,
             last_updated=last_updated,
             emissions=scope_1_emissions_fields,
-            session=session,
+            lookups=await ExportLookups.load(session, static_cache),
             download_option=ExportOptions.COMPANIES.value,
-            static_cache=static_cache,
             restated=restated_fields,
             units=res_units,
         )
@@ -314,9 +313,8 @@ class TestCompaniesExport(AuthTest):
             source=source,
             last_updated=last_updated,
             form_name="s1_emissions_exclusion_dict",
-            session=session,
+            lookups=await ExportLookups.load(session, static_cache),
             download_option=ExportOptions.COMPANIES.value,
-            static_cache=static_cache,
             restated=restated_fields,
             units_list=units_list,
         )
@@ -196,3 +196,54 @@ class TestUserMetrics(AuthTest):
             },
         )
         assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.asyncio
+    async def test_executors_metrics_accessible_by_admin(
+        self, client: AsyncClient, session: AsyncSession
+    ):
+        response = await client.get(
+            url="/metrics/executors",
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        names = [e["name"] for e in response.json()["executors"]]
+        assert names == ["password", "export"]
+
+    @pytest.mark.asyncio
+    async def test_cache_metrics_accessible_by_admin(
+        self, client: AsyncClient, session: AsyncSession
+    ):
+        response = await client.get(
+            url="/metrics/cache",
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.json()) == {"local", "redis", "single_flight"}
+
+    @pytest.mark.asyncio
+    async def test_runtime_metrics_accessible_by_admin(
+        self, client: AsyncClient, session: AsyncSession
+    ):
+        response = await client.get(
+            url="/metrics/users",
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+        assert "db;dur=" in response.headers["Server-Timing"]
+
+        response = await client.get(
+            url="/metrics/runtime",
+            headers={
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert (
+            'nzdpu_db_queries_total{method="GET",route="/metrics/users"}'
+            in response.text
+        )
@@ -5,12 +5,14 @@ from pathlib import Path
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import settings
-from app.db.models import AuthRole, Permission
+from app.db.models import AggregatedObjectView, AuthRole, Permission
 from app.schemas.enums import SubmissionObjStatusEnum
 from app.service.core.cache import CoreMemoryCache
+from app.service.core.managers import SubmissionManager
 from app.service.core.utils import strip_none
 from app.service.submission_builder import SubmissionBuilder
 from tests.constants import SCHEMA_FILE_NAME, SUBMISSION_SCHEMA_FILE_NAME
@@ -560,6 +562,103 @@ class TestRevisionsCreate(AuthTest):
         strip_none(submission.values)
         strip_none(first_revision["values"])
 
+    @pytest.mark.asyncio
+    async def test_create_revision_patches_changed_revisions(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        redis_client,
+        static_cache: CoreMemoryCache,
+        monkeypatch,
+        submission_payload_revision,
+        submission_payload_revision_second,
+    ):
+        """
+        GIVEN a submission with two revisions
+        WHEN a third revision is created
+        THEN check only the aggregate of the formerly active revision is
+            patched, and the one of the first revision is left as is
+        """
+        # arrange
+        await create_test_form(self.data_dir / SCHEMA_FILE_NAME, session)
+        set_id = await self.create_test_permissions(session)
+        await self.add_role_to_user(session, AuthRole.DATA_PUBLISHER)
+        builder = SubmissionBuilder(
+            cache=redis_client, session=session, static_cache=static_cache
+        )
+        submission = await builder.generate(
+            nz_id=NZ_ID,
+            table_view_id=1,
+            permissions_set_id=set_id,
+            tpl_file=SUBMISSION_SCHEMA_FILE_NAME,
+            no_change=True,
+        )
+        headers = {
+            "content-type": "application/json",
+            "accept": "application/json",
+            "Authorization": f"Bearer {self.access_token}",
+        }
+        response = await client.post(
+            url=f"{BASE_ENDPOINT}/{submission.name}/edit", headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        response = await client.post(
+            url=f"{BASE_ENDPOINT}/{submission.name}",
+            json=submission_payload_revision,
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK, response.text
+        second_id = response.json()["id"]
+
+        async def aggregates():
+            return dict(
+                (
+                    await session.execute(
+                        select(
+                            AggregatedObjectView.obj_id,
+                            AggregatedObjectView.content_hash,
+                        ).where(
+                            AggregatedObjectView.obj_id.in_(
+                                [submission.id, second_id]
+                            )
+                        )
+                    )
+                ).all()
+            )
+
+        hashes = await aggregates()
+        patched = []
+        patch_aggregate_metadata = SubmissionManager.patch_aggregate_metadata
+
+        async def spy(manager, submissions, **kwargs):
+            patched.extend(sub.id for sub in submissions)
+            return await patch_aggregate_metadata(
+                manager, submissions, **kwargs
+            )
+
+        monkeypatch.setattr(SubmissionManager, "patch_aggregate_metadata", spy)
+
+        # act
+        response = await client.post(
+            url=f"{BASE_ENDPOINT}/{submission.name}",
+            json=submission_payload_revision_second,
+            headers=headers,
+        )
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK, response.text
+        assert patched == [second_id]
+        new_hashes = await aggregates()
+        assert new_hashes[submission.id] == hashes[submission.id]
+        assert new_hashes[second_id] != hashes[second_id]
+        second_data = await session.scalar(
+            select(AggregatedObjectView.data).where(
+                AggregatedObjectView.obj_id == second_id
+            )
+        )
+        assert second_data["active"] is False
+        assert second_data["checked_out"] is False
+
     @pytest.mark.asyncio
     async def test_create_revision_no_data_raises_422(
         self,
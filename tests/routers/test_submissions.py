@@ -18,8 +18,12 @@ from app.db.models import (
     SubmissionObj,
     TableView,
 )
+from app.db.redis import RedisClient
 from app.schemas.enums import SubmissionObjStatusEnum
 from app.service.core.cache import CoreMemoryCache
+from app.service.core.errors import SubmissionError
+from app.service.core.loaders import SubmissionLoader
+from app.service.core.managers import SubmissionManager
 from app.service.submission_builder import SubmissionBuilder
 from tests.constants import SCHEMA_FILE_NAME, SUBMISSION_SCHEMA_FILE_NAME
 from tests.routers.auth_test import AuthTest
@@ -235,6 +239,30 @@ class TestSubmissionsList(AuthTest):
         assert j_resp["start"] == 1
         assert j_resp["end"] == 3
 
+        # Test cursor pagination
+        response = await client.get(
+            url=f"{BASE_ENDPOINT}?limit=2",
+            headers={
+                "accept": "application/json",
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+        j_resp = response.json()
+        assert [item["id"] for item in j_resp["items"]] == [1, 2]
+        assert j_resp["next_cursor"] == 2
+        response = await client.get(
+            url=f"{BASE_ENDPOINT}?limit=2&cursor={j_resp['next_cursor']}",
+            headers={
+                "accept": "application/json",
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+        j_resp = response.json()
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in j_resp["items"]] == [3]
+        assert j_resp["next_cursor"] is None
+        assert j_resp["total"] == 3
+
         # Test invalid pagination
         response = await client.get(
             url=f"{BASE_ENDPOINT}?start=5&limit=2",
@@ -249,6 +277,16 @@ class TestSubmissionsList(AuthTest):
         assert response.status_code == status.HTTP_200_OK
         assert len(j_resp["items"]) == 0
 
+        # Test empty page
+        response = await client.get(
+            url=f"{BASE_ENDPOINT}?limit=0",
+            headers={
+                "accept": "application/json",
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     # 1. Test case for an empty list of submissions
     @pytest.mark.asyncio
     async def test_list_submissions_empty(
@@ -276,6 +314,7 @@ class TestSubmissionsList(AuthTest):
             "start": 0,
             "end": 0,
             "total": 0,
+            "next_cursor": None,
             "items": [],
         }
 
@@ -356,6 +395,59 @@ class TestGetSubmissions(AuthTest):
         assert j_resp["submitted_by"] == 1
         assert j_resp["status"] == SubmissionObjStatusEnum.DRAFT
 
+    @pytest.mark.asyncio
+    async def test_get_submission_etag(
+        self,
+        static_cache: CoreMemoryCache,
+        client: AsyncClient,
+        session: AsyncSession,
+        redis_client,
+    ):
+        """
+        Test get Submission API returns the aggregate's ETag, and 304
+        when revalidating with it.
+        """
+        # arrange
+        set_id: int = await self.create_test_permissions(session)
+        await create_test_form(data_dir / SCHEMA_FILE_NAME, session)
+        builder = SubmissionBuilder(
+            cache=redis_client, session=session, static_cache=static_cache
+        )
+        await builder.generate(
+            table_view_id=1,
+            nz_id=NZ_ID,
+            permissions_set_id=set_id,
+            tpl_file=SUBMISSION_SCHEMA_FILE_NAME,
+            no_change=True,
+        )
+        await self.add_role_to_user(session, AuthRole.DATA_EXPLORER)
+        await static_cache.refresh_values()
+        submission_loader = SubmissionLoader(
+            session, static_cache, redis_client
+        )
+        submission = await submission_loader.load(1, db_only=True)
+        await SubmissionManager(
+            session, static_cache, redis_client
+        ).save_aggregate(1, submission.model_dump(mode="json"), commit=True)
+        headers = {
+            "accept": "application/json",
+            "Authorization": f"Bearer {self.access_token}",
+        }
+
+        # act
+        response = await client.get(url=f"{BASE_ENDPOINT}/1", headers=headers)
+        etag = response.headers.get("etag")
+        not_modified = await client.get(
+            url=f"{BASE_ENDPOINT}/1",
+            headers={**headers, "If-None-Match": etag},
+        )
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK
+        assert etag
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.headers["etag"] == etag
+
     @pytest.mark.asyncio
     async def test_get_submission_not_found(
         self,
@@ -1266,6 +1358,139 @@ class TestCreateSubmissions(AuthTest):
         assert j_resp["detail"]["table_view_id"] == "Table view not found."
 
 
+class TestCreateSubmissionsBulk(AuthTest):
+    """
+    Unit tests for bulk submissions API
+    """
+
+    @pytest.mark.asyncio
+    async def test_create_submissions_bulk(
+        self,
+        static_cache: CoreMemoryCache,
+        client: AsyncClient,
+        session: AsyncSession,
+        redis_client: RedisClient,
+        submission_payload,
+    ):
+        """
+        Test bulk create Submissions API: valid rows are stored with
+        their aggregate, invalid rows are reported with their line, and
+        the cached data of the company is invalidated.
+        """
+        # arrange
+        await create_test_form(data_dir / SCHEMA_FILE_NAME, session)
+        await self.create_test_permissions(session)
+        await self.add_admin_permissions_to_user(session)
+        await create_organization(
+            session=session,
+            lei="0EEB8GF0W0NPCIHZX097",
+            legal_name="Test Org 1",
+            jurisdiction="Test Org 1",
+            nz_id=1001,
+        )
+        await static_cache.refresh_values()
+        company_key = f"test-company:{NZ_ID}"
+        await redis_client.set(
+            company_key,
+            "stale",
+            tags=[redis_client.wis_keys.nz_id_tag(NZ_ID)],
+        )
+        invalid_view_payload = {**submission_payload, "table_view_id": 9999}
+        body = b"\n".join(
+            [
+                json.dumps(submission_payload).encode(),
+                b"",
+                b"{not json",
+                json.dumps(invalid_view_payload).encode(),
+            ]
+        )
+
+        # act
+        response = await client.post(
+            url=f"{BASE_ENDPOINT}/bulk",
+            content=body,
+            headers={
+                "content-type": "application/x-ndjson",
+                "accept": "application/json",
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK, response.text
+        j_resp = response.json()
+        assert j_resp["total"] == 3
+        assert j_resp["created"] == 1
+        assert j_resp["failed"] == 2
+        created, invalid_json, invalid_view = j_resp["items"]
+        assert created["line"] == 1
+        assert created["status"] == "created"
+        assert invalid_json["line"] == 3
+        assert invalid_json["status"] == "failed"
+        assert invalid_view["line"] == 4
+        assert invalid_view["errors"] == {
+            "table_view_id": "Table view not found."
+        }
+        submission = await session.scalar(
+            select(SubmissionObj).where(SubmissionObj.id == created["id"])
+        )
+        assert submission
+        assert submission.status == SubmissionObjStatusEnum.DRAFT
+        aggregate = await session.scalar(
+            select(AggregatedObjectView).where(
+                AggregatedObjectView.obj_id == created["id"]
+            )
+        )
+        assert aggregate
+        assert aggregate.data["name"] == created["name"]
+        assert await redis_client.get(company_key) is None
+
+    @pytest.mark.asyncio
+    async def test_create_submissions_bulk_duplicate_in_batch(
+        self,
+        static_cache: CoreMemoryCache,
+        client: AsyncClient,
+        session: AsyncSession,
+        submission_payload,
+    ):
+        """
+        Test bulk create Submissions API rejects a duplicate of a row of
+        the same batch.
+        """
+        # arrange
+        await create_test_form(data_dir / SCHEMA_FILE_NAME, session)
+        await self.create_test_permissions(session)
+        await self.add_admin_permissions_to_user(session)
+        await create_organization(
+            session=session,
+            lei="0EEB8GF0W0NPCIHZX097",
+            legal_name="Test Org 1",
+            jurisdiction="Test Org 1",
+            nz_id=1001,
+        )
+        await static_cache.refresh_values()
+        body = b"\n".join([json.dumps(submission_payload).encode()] * 2)
+
+        # act
+        response = await client.post(
+            url=f"{BASE_ENDPOINT}/bulk",
+            content=body,
+            headers={
+                "content-type": "application/x-ndjson",
+                "accept": "application/json",
+                "Authorization": f"Bearer {self.access_token}",
+            },
+        )
+
+        # assert
+        assert response.status_code == status.HTTP_200_OK, response.text
+        j_resp = response.json()
+        assert j_resp["created"] == 1
+        assert j_resp["items"][1]["errors"] == {
+            "submissions": SubmissionError.SUBMISSION_ALREADY_EXISTS
+        }
+
+
 class TestSubmissionUpdate(AuthTest):
     """
     Test Submission Update API.
@@ -0,0 +1,137 @@
+"""Test patching the revision metadata of aggregated submissions"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.models import AggregatedObjectView
+from app.service.core.managers import SubmissionManager
+from app.service.core.utils import content_hash
+
+VALUES = {"reporting_year": 2023, "total_s1_emissions_ghg": 1094881}
+UNITS = {"total_s1_emissions_ghg": "tCO₂e"}
+
+
+def revision(obj_id: int, **metadata) -> SimpleNamespace:
+    """
+    A revision as loaded from the database, without its values.
+    """
+    return SimpleNamespace(
+        id=obj_id,
+        name="nzdpu-1",
+        lei="000012345678",
+        nz_id=1000,
+        table_view_id=1,
+        revision=obj_id,
+        submitted_by=1,
+        created_on=datetime(2024, 1, 1),
+        activated_on=datetime(2024, 1, 1),
+        permissions_set_id=None,
+        data_source=None,
+        status=None,
+        values={},
+        units={},
+        **{
+            "active": True,
+            "checked_out": False,
+            "checked_out_on": None,
+            "user_id": None,
+            **metadata,
+        },
+    )
+
+
+class FakeSession:
+    """
+    Returns the stored aggregates, and counts flushes and commits.
+    """
+
+    def __init__(self, aggregates: list[AggregatedObjectView]):
+        self.aggregates = aggregates
+        self.flushed = self.committed = 0
+
+    async def scalars(self, statement):
+        return iter(self.aggregates)
+
+    async def flush(self):
+        self.flushed += 1
+
+    async def commit(self):
+        self.committed += 1
+
+
+def stored_aggregate(obj_id: int) -> AggregatedObjectView:
+    data = {
+        "id": obj_id,
+        "active": True,
+        "checked_out": True,
+        "checked_out_on": "2024-01-02T00:00:00",
+        "user_id": 1,
+        "status": None,
+        "values": VALUES,
+        "units": UNITS,
+    }
+    return AggregatedObjectView(
+        obj_id=obj_id, data=data, content_hash=content_hash(data)
+    )
+
+
+class TestPatchAggregateMetadata:
+    """
+    Unit tests for SubmissionManager.patch_aggregate_metadata
+    """
+
+    @pytest.mark.asyncio
+    async def test_patches_existing_aggregate(self):
+        """
+        GIVEN the stored aggregate of a checked out revision
+        WHEN its revision is deactivated and released
+        THEN check the metadata of the aggregate is updated, its values
+            and units are kept, and its content hash is recomputed
+        """
+        aggregate = stored_aggregate(1)
+        previous_hash = aggregate.content_hash
+        session = FakeSession([aggregate])
+        manager = SubmissionManager(session, None, None)
+
+        aggregates = await manager.patch_aggregate_metadata(
+            [revision(1, active=False)], commit=True
+        )
+
+        assert aggregates[1] is aggregate
+        assert aggregate.data["active"] is False
+        assert aggregate.data["checked_out"] is False
+        assert aggregate.data["checked_out_on"] is None
+        assert aggregate.data["user_id"] is None
+        assert aggregate.data["values"] == VALUES
+        assert aggregate.data["units"] == UNITS
+        assert aggregate.content_hash == content_hash(aggregate.data)
+        assert aggregate.content_hash != previous_hash
+        assert session.committed == 1
+
+    @pytest.mark.asyncio
+    async def test_builds_missing_aggregate(self, monkeypatch):
+        """
+        GIVEN a revision without an aggregate
+        WHEN its metadata is patched
+        THEN check a full aggregate is built instead
+        """
+        session = FakeSession([stored_aggregate(1)])
+        manager = SubmissionManager(session, None, None)
+        built = []
+
+        async def save_aggregate(obj_id, submission_data, **kwargs):
+            built.append((obj_id, submission_data["active"]))
+            return AggregatedObjectView(obj_id=obj_id, data=submission_data)
+
+        monkeypatch.setattr(manager, "save_aggregate", save_aggregate)
+
+        aggregates = await manager.patch_aggregate_metadata(
+            [revision(1), revision(2, active=False)], flush=True
+        )
+
+        assert built == [(2, False)]
+        assert aggregates[2].data["id"] == 2
+        assert aggregates[1].data["values"] == VALUES
+        assert session.flushed == 1
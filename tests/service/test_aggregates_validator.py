@@ -0,0 +1,94 @@
+"""Test the progress of the parallel aggregates validator"""
+
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.service.core.validator import ParallelAggregatedObjectViewValidator
+
+SUBMISSION_IDS = [1, 2, 3, 4, 5]
+
+
+class FakeSession:
+    """
+    Counts the submissions, and returns their IDs after the last one
+    checked, as the database would.
+    """
+
+    async def scalar(self, _):
+        return len(SUBMISSION_IDS)
+
+    async def scalars(self, statement):
+        last_id = statement.whereclause.right.value
+        limit = statement._limit
+        ids = [i for i in SUBMISSION_IDS if i > last_id][:limit]
+        return SimpleNamespace(all=lambda: ids)
+
+
+class FakeDBManager:
+    @asynccontextmanager
+    async def get_session(self):
+        yield FakeSession()
+
+
+@pytest.fixture
+def validator(tmp_path, monkeypatch) -> ParallelAggregatedObjectViewValidator:
+    validator = ParallelAggregatedObjectViewValidator(
+        FakeDBManager(),
+        static_cache=None,
+        redis_cache=None,
+        chunk_size=2,
+        concurrency=1,
+        progress_path=tmp_path / "progress.json",
+    )
+    validator.validated = []
+
+    async def validate_chunk(submission_ids):
+        validator.validated.extend(submission_ids)
+        return []
+
+    monkeypatch.setattr(validator, "validate_chunk", validate_chunk)
+    return validator
+
+
+class TestParallelAggregatedObjectViewValidator:
+    """
+    Unit tests for ParallelAggregatedObjectViewValidator
+    """
+
+    @pytest.mark.asyncio
+    async def test_resumes_progress(self, validator):
+        """
+        GIVEN the progress file of an interrupted run
+        WHEN the validation runs again
+        THEN check it resumes after the last checked submission, and
+            removes the progress file once every submission is checked
+        """
+        validator.progress_path.write_text(
+            json.dumps({"last_id": 2, "checked": 2, "invalid_submissions": []})
+        )
+
+        report = await validator.validate_all()
+
+        assert validator.validated == [3, 4, 5]
+        assert (report["checked"], report["total"]) == (5, 5)
+        assert not validator.progress_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_restart(self, validator):
+        """
+        GIVEN the progress file of an interrupted run
+        WHEN the validation runs with restart
+        THEN check every submission is checked again
+        """
+        validator.progress_path.write_text(
+            json.dumps({"last_id": 2, "checked": 2, "invalid_submissions": []})
+        )
+
+        report = await validator.validate_all(restart=True)
+
+        assert validator.validated == SUBMISSION_IDS
+        assert report["checked"] == 5
+        assert not validator.progress_path.exists()
@@ -0,0 +1,76 @@
+"""Test the binary cache codec"""
+
+from datetime import datetime, timezone
+
+import orjson
+
+from app.db import cache_codec
+from app.schemas.enums import SubmissionObjStatusEnum
+from app.schemas.submission import SubmissionGet
+from app.service.core.loaders import SubmissionLoader
+
+
+class TestCacheCodec:
+    """
+    Unit tests for the cache codec
+    """
+
+    def test_round_trip(self):
+        """
+        GIVEN a JSON document
+        WHEN it is encoded and decoded
+        THEN check it is unchanged, and stored compressed
+        """
+        data = {"values": {"name": "x" * 1000, "items": list(range(100))}}
+        payload = cache_codec.encode(data)
+
+        assert payload.startswith(cache_codec.HEADER)
+        assert len(payload) < len(orjson.dumps(data))
+        assert cache_codec.decode(payload) == data
+
+    def test_foreign_payloads_are_misses(self):
+        """
+        GIVEN plain JSON, another codec version and a corrupted payload
+        WHEN they are decoded
+        THEN check they all decode to None
+        """
+        other_version = (
+            cache_codec.MAGIC
+            + bytes([cache_codec.VERSION + 1])
+            + cache_codec.encode({})[len(cache_codec.HEADER) :]
+        )
+
+        assert cache_codec.decode(b'{"values": {}}') is None
+        assert cache_codec.decode(other_version) is None
+        assert cache_codec.decode(cache_codec.HEADER + b"garbage") is None
+
+    def test_submission_from_cache(self):
+        """
+        GIVEN the cache entry of a submission
+        WHEN the submission is rebuilt from it without validation
+        THEN check it equals the validated submission
+        """
+        submission = SubmissionGet(
+            id=1,
+            name="submission",
+            lei="000012345678",
+            nz_id=1000,
+            submitted_by=1,
+            table_view_id=1,
+            status=SubmissionObjStatusEnum.PUBLISHED,
+            created_on=datetime(2024, 1, 1, 12, 30),
+            checked_out_on=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            values={"reporting_year": 2023, "targets": [{"name": "x"}]},
+            units={"total_s1_emissions_ghg": "tCO2e"},
+        )
+        payload = cache_codec.encode(submission.model_dump(mode="json"))
+
+        cached = SubmissionLoader.submission_from_cache(
+            cache_codec.decode(payload)
+        )
+
+        assert cached == SubmissionGet.model_validate(
+            cache_codec.decode(payload)
+        )
+        assert cached.status is SubmissionObjStatusEnum.PUBLISHED
+        assert cached.created_on == submission.created_on
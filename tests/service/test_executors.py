@@ -0,0 +1,56 @@
+"""Test the CPU-bound work executors"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.service.executors import BoundedExecutor
+
+
+class TestBoundedExecutor:
+    """
+    Unit tests for BoundedExecutor
+    """
+
+    @pytest.mark.asyncio
+    async def test_bounded_submissions_and_metrics(self):
+        """
+        GIVEN an executor with one worker and a queue of one
+        WHEN four blocking jobs are run concurrently
+        THEN check the event loop keeps ticking, no more than two jobs
+            are handed to the pool at once, and the counters add up
+        """
+        executor = BoundedExecutor(
+            name="test",
+            factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+            max_workers=1,
+            max_queue=1,
+        )
+        max_in_flight = 0
+        ticks = 0
+
+        async def watch():
+            nonlocal max_in_flight, ticks
+            while True:
+                max_in_flight = max(max_in_flight, executor.in_flight)
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        watcher = asyncio.create_task(watch())
+        results = await asyncio.gather(
+            *(executor.run(time.sleep, 0.05) for _ in range(4))
+        )
+        watcher.cancel()
+        executor.shutdown()
+
+        metrics = executor.metrics()
+        assert results == [None] * 4
+        assert ticks > 10
+        assert max_in_flight == 2
+        assert metrics["peak_depth"] == 4
+        assert metrics["submitted"] == metrics["completed"] == 4
+        assert metrics["waiting"] == metrics["in_flight"] == 0
+        assert metrics["wait_seconds"] > 0
+        assert metrics["run_seconds"] >= 0.2
@@ -0,0 +1,107 @@
+"""Test the lookup tables of exports"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.service.exports.lookups import ExportLookups
+
+UNITS = [{"actions": [{"set": {"units": "tCO₂e"}}]}]
+
+
+class SessionStub:
+    """
+    Returns the prompts, the constraints and the choices of the
+    database outside of the static cache, in the order
+    `ExportLookups.load` selects them.
+    """
+
+    def __init__(self):
+        self.results = [
+            [("legacy", "Old")],
+            [("legacy", [{"actions": [{"set": {"units": "kg"}}]}])],
+            [(1, "Other set"), (99, "Archived")],
+        ]
+        self.statements = []
+        self.queries = 0
+
+    async def execute(self, statement):
+        self.queries += 1
+        self.statements.append(
+            str(statement.compile(compile_kwargs={"literal_binds": True}))
+        )
+        return iter(self.results.pop(0))
+
+    async def scalar(self, statement):
+        self.queries += 1
+        return "1"
+
+
+class StaticCacheStub:
+    """
+    An emissions column with units, and the choices of the source list.
+    """
+
+    async def column_defs_by_name(self):
+        return {
+            "total_s1_emissions_ghg": SimpleNamespace(
+                table_def_id=1,
+                choice_set_id=None,
+                prompts=[SimpleNamespace(value="Total Scope 1")],
+                views=[SimpleNamespace(constraint_value=UNITS)],
+            ),
+            "source": SimpleNamespace(
+                table_def_id=1, choice_set_id=7, prompts=[], views=[]
+            ),
+        }
+
+    async def choices(self):
+        return {
+            1: SimpleNamespace(
+                choice_id=1, value="CDP", set_name="source_list"
+            ),
+            2: SimpleNamespace(
+                choice_id=2, value="NZDPU", set_name="source_list"
+            ),
+        }
+
+
+class TestExportLookups:
+    """
+    Unit tests for ExportLookups
+    """
+
+    @pytest.mark.asyncio
+    async def test_lookups_without_queries(self):
+        """
+        GIVEN the static cache and the database
+        WHEN the lookups of an export are loaded
+        THEN check prompts, units and choices are read from the cache
+            first, then from the database for the table definitions and
+            choice sets outside of it, in a fixed number of queries
+        """
+        session = SessionStub()
+
+        lookups = await ExportLookups.load(session, StaticCacheStub())
+        queries = session.queries
+
+        assert lookups.prompt("total_s1_emissions_ghg", {}) == "Total Scope 1"
+        assert lookups.prompt("legacy", {"legacy_prompt": "Own"}) == "Own"
+        assert lookups.prompt("missing", {}) == ""
+        assert lookups.unit("total_s1_emissions_ghg") == "tCO₂e"
+        assert lookups.unit("legacy") == "kg"
+        assert lookups.unit("missing") == ""
+        assert lookups.choice_value(1) == "CDP"
+        assert lookups.choice_value(99) == "Archived"
+        assert lookups.choice_value(100) == 100
+        assert lookups.choice_value(True) is True
+        assert [
+            choice.choice_id for choice in lookups.choice_sets["source_list"]
+        ] == [1, 2]
+        assert lookups.exclude_classification == 1
+        assert session.queries == queries == 4
+        assert all(
+            "table_def_id NOT IN (1)" in statement
+            for statement in session.statements[:2]
+        )
+        assert "set_id NOT IN (7)" in session.statements[2]
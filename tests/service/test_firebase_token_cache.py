@@ -0,0 +1,51 @@
+"""Test the verified Firebase ID token cache"""
+
+import time
+
+import jwt
+import pytest
+
+from app.service.firebase_rest_api_client.token_cache import (
+    VerifiedTokenCache,
+)
+
+
+def make_token(exp: float, sub: str = "user") -> str:
+    return jwt.encode({"sub": sub, "exp": int(exp)}, "secret")
+
+
+class TestVerifiedTokenCache:
+    """
+    Unit tests for VerifiedTokenCache
+    """
+
+    @pytest.mark.asyncio
+    async def test_hit_and_lru_eviction(self):
+        """
+        GIVEN a cache bounded to two entries
+        WHEN three verified tokens are stored
+        THEN check the least recently used one is evicted
+        """
+        cache = VerifiedTokenCache(ttl=60, max_size=2)
+        tokens = [make_token(time.time() + 3600, sub=str(i)) for i in range(3)]
+        await cache.set(tokens[0], {"users": [0]})
+        await cache.set(tokens[1], {"users": [1]})
+        assert await cache.get(tokens[0]) == {"users": [0]}
+        await cache.set(tokens[2], {"users": [2]})
+
+        assert await cache.get(tokens[1]) is None
+        assert await cache.get(tokens[0]) == {"users": [0]}
+        assert await cache.get(tokens[2]) == {"users": [2]}
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_not_cached(self):
+        """
+        GIVEN a token whose exp claim is in the past
+        WHEN it is stored
+        THEN check it is never served from the cache
+        """
+        cache = VerifiedTokenCache(ttl=60, max_size=10)
+        token = make_token(time.time() - 1)
+        await cache.set(token, {"users": []})
+
+        assert await cache.get(token) is None
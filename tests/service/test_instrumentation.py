@@ -0,0 +1,61 @@
+"""Test the per-request instrumentation"""
+
+import contextvars
+
+from app import instrumentation
+
+
+class TestInstrumentation:
+    """
+    Unit tests for request metrics
+    """
+
+    def test_records_only_within_request(self):
+        """
+        GIVEN queries and cache reads outside and within a request
+        WHEN they are recorded
+        THEN check only those within the request are counted, and the
+            slowest query is kept
+        """
+
+        def handle_request() -> instrumentation.RequestMetrics:
+            metrics = instrumentation.start_request()
+            instrumentation.record_query("SELECT 1", 0.002)
+            instrumentation.record_query("SELECT 2", 0.005)
+            instrumentation.record_cache_read(hit=True, local=True)
+            instrumentation.record_cache_read(hit=False)
+            instrumentation.record_lock_wait(0.01)
+            return metrics
+
+        instrumentation.record_query("SELECT 0", 1.0)
+        metrics = contextvars.copy_context().run(handle_request)
+
+        assert metrics.db_queries == 2
+        assert metrics.db_seconds == 0.007
+        assert metrics.slowest_query == "SELECT 2"
+        assert (metrics.local_hits, metrics.redis_hits) == (1, 0)
+        assert metrics.redis_misses == 1
+        assert metrics.server_timing(0.02).startswith(
+            'total;dur=20.0, db;dur=7.0;desc="2 queries"'
+        )
+
+    def test_runtime_metrics_by_route(self):
+        """
+        GIVEN two requests to the same route
+        WHEN their metrics are aggregated
+        THEN check the route's counters add up in the exposition format
+        """
+        runtime = instrumentation.RuntimeMetrics()
+        for _ in range(2):
+            metrics = instrumentation.RequestMetrics(
+                db_queries=3, slowest_query_seconds=0.5
+            )
+            runtime.observe("GET", "/companies/{nz_id}", metrics, 1.0)
+
+        rendered = runtime.render()
+
+        assert (
+            'nzdpu_db_queries_total{method="GET",route="/companies/{nz_id}"} 6'
+            in rendered
+        )
+        assert "# TYPE nzdpu_slowest_query_seconds gauge" in rendered
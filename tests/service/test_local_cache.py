@@ -0,0 +1,160 @@
+"""Test the in-process cache tier"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import orjson
+import pytest
+
+from app.db.local_cache import LocalCache
+from app.db.redis import RedisClient
+
+
+class TestLocalCache:
+    """
+    Unit tests for LocalCache
+    """
+
+    def test_bounds_and_counters(self):
+        """
+        GIVEN a cache bounded to two entries and ten bytes
+        WHEN values are stored past either bound
+        THEN check the least recently used ones are evicted, and hits
+            and misses are counted
+        """
+        cache = LocalCache(ttl=60, max_entries=2, max_bytes=10)
+        cache.set("a", "1234")
+        cache.set("b", "1234")
+        assert cache.get("a") == "1234"
+        cache.set("c", "1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1234"
+        cache.set("d", "123456")
+
+        assert cache.get("c") is None
+        assert cache.get("a") == "1234"
+        assert cache.metrics() == {
+            "hits": 3,
+            "misses": 2,
+            "entries": 2,
+            "bytes": 10,
+        }
+
+    def test_expiry_and_pattern_eviction(self):
+        """
+        GIVEN cached keys of two companies
+        WHEN the keys of one are evicted by pattern, and time passes
+        THEN check only the other is left, until its TTL expires
+        """
+        cache = LocalCache(ttl=1, max_entries=10, max_bytes=100)
+        cache.set("cached:companies/1/history", "{}")
+        cache.set("cached:companies/2/history", "{}")
+        cache.discard_matching("cached:companies/1/*")
+
+        assert cache.get("cached:companies/1/history") is None
+        assert cache.get("cached:companies/2/history") == "{}"
+        cache._entries["cached:companies/2/history"] = (
+            time.monotonic() - 1,
+            "{}",
+        )
+        assert cache.get("cached:companies/2/history") is None
+
+
+class FakePipeline:
+    """
+    Runs the commands of a pipeline: publications are delivered to the
+    listener of another worker.
+    """
+
+    def __init__(self, subscriber: RedisClient):
+        self.subscriber = subscriber
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __getattr__(self, command):
+        return lambda *args, **kwargs: self.commands.append((command, args))
+
+    async def execute(self):
+        for command, args in self.commands:
+            if command == "publish":
+                self.subscriber._apply_invalidation(orjson.loads(args[1]))
+        return [True] * len(self.commands)
+
+
+class TestRedisClientLocalTier:
+    """
+    Unit tests for the local tier of RedisClient
+    """
+
+    @pytest.mark.asyncio
+    async def test_set_evicts_other_workers(self, monkeypatch):
+        """
+        GIVEN a key cached in the local tier of two workers
+        WHEN one worker overwrites it
+        THEN check both workers evict their local copy
+        """
+        writer, reader = (
+            RedisClient(host="localhost", port=1, password="")
+            for _ in range(2)
+        )
+        monkeypatch.setattr(
+            writer, "pipeline", lambda **kwargs: FakePipeline(reader)
+        )
+        for worker in (writer, reader):
+            worker.local.set("cached:companies", "old")
+
+        await writer.set("companies", "new")
+
+        assert writer.local.get("cached:companies") is None
+        assert reader.local.get("cached:companies") is None
+
+    @pytest.mark.asyncio
+    async def test_listener_skips_bad_messages(self):
+        """
+        GIVEN invalidations which are not JSON, have no sender, or make
+            a handler fail
+        WHEN the listener receives them, then a valid one
+        THEN check the valid one is still applied
+        """
+        client = RedisClient(host="localhost", port=1, password="")
+        client.local.set("cached:companies", "old")
+
+        def handler(message):
+            if message.get("fail"):
+                raise RuntimeError("handler failed")
+
+        client.add_invalidation_handler(handler)
+        valid = {"sender": "other", "keys": ["cached:companies"]}
+        payloads = [
+            b"not json",
+            orjson.dumps({"keys": ["cached:companies"]}),
+            orjson.dumps({**valid, "fail": True}),
+            orjson.dumps({**valid, "pattern": None, "flush": False}),
+        ]
+
+        class FakePubSub:
+            async def subscribe(self, channel):
+                pass
+
+            async def listen(self):
+                for payload in payloads:
+                    yield {"type": "message", "data": payload}
+                raise asyncio.CancelledError
+
+        @asynccontextmanager
+        async def pubsub():
+            yield FakePubSub()
+
+        client.pubsub = pubsub
+
+        with pytest.raises(asyncio.CancelledError):
+            await client._listen()
+
+        assert client.local.get("cached:companies") is None
@@ -0,0 +1,117 @@
+"""Test the authenticated users cache"""
+
+from datetime import datetime
+
+import orjson
+import pytest
+from sqlalchemy import inspect
+
+from app.db.models import Group, User
+from app.db.redis import RedisClient
+from app.service.principal_cache import (
+    PrincipalCache,
+    api_key_principal_key,
+    token_principal_key,
+)
+
+
+def make_user(user_id: int, name: str) -> User:
+    return User(
+        id=user_id,
+        name=name,
+        token_iat=datetime(2024, 1, 1),
+        groups=[Group(id=1, name="admin")],
+    )
+
+
+class TestPrincipalCache:
+    """
+    Unit tests for PrincipalCache
+    """
+
+    def test_hit_returns_detached_copy(self):
+        """
+        GIVEN a cached user with its groups
+        WHEN it is looked up by its credential key
+        THEN check a new detached user is returned, groups included
+        """
+        cache = PrincipalCache(ttl=60, max_size=10)
+        key = token_principal_key("LOCAL", "testuser", 1704067200)
+        cache.set(key, make_user(1, "testuser"))
+
+        first = cache.get(key)
+        second = cache.get(key)
+        assert first is not second
+        assert first.id == 1 and first.name == "testuser"
+        assert [g.name for g in first.groups] == ["admin"]
+        assert inspect(first).detached
+        assert inspect(first.groups[0]).detached
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user(self):
+        """
+        GIVEN a user cached under a token key and an API key
+        WHEN the user is invalidated
+        THEN check both entries are gone, other users are kept
+        """
+        cache = PrincipalCache(ttl=60, max_size=10)
+        token_key = token_principal_key("LOCAL", "testuser", 1)
+        api_key = api_key_principal_key("secret")
+        other_key = token_principal_key("LOCAL", "other", 1)
+        cache.set(token_key, make_user(1, "testuser"))
+        cache.set(api_key, make_user(1, "testuser"))
+        cache.set(other_key, make_user(2, "other"))
+
+        await cache.invalidate_user(1)
+
+        assert cache.get(token_key) is None
+        assert cache.get(api_key) is None
+        assert cache.get(other_key).id == 2
+
+    def test_disabled_and_bounded(self):
+        """
+        GIVEN a disabled cache and a cache bounded to one entry
+        WHEN two users are stored
+        THEN check nothing is kept, respectively only the latest
+        """
+        disabled = PrincipalCache(ttl=0, max_size=10)
+        disabled.set("key", make_user(1, "testuser"))
+        assert disabled.get("key") is None
+
+        bounded = PrincipalCache(ttl=60, max_size=1)
+        bounded.set("first", make_user(1, "testuser"))
+        bounded.set("second", make_user(2, "other"))
+        assert bounded.get("first") is None
+        assert bounded.get("second").id == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidations_reach_other_workers(self, monkeypatch):
+        """
+        GIVEN the caches of two workers, bound to their Redis clients
+        WHEN a user is invalidated, then all users, in the first worker
+        THEN check the invalidations are applied in the second worker
+        """
+        workers = []
+        for _ in range(2):
+            redis_client = RedisClient(host="localhost", port=1, password="")
+            cache = PrincipalCache(ttl=60, max_size=10)
+            cache.bind(redis_client)
+            workers.append((redis_client, cache))
+
+        async def publish(_, data):
+            # what the listener of the second worker receives
+            workers[1][0]._apply_invalidation(orjson.loads(data))
+
+        monkeypatch.setattr(workers[0][0], "publish", publish)
+        cache = workers[1][1]
+        cache.set("first", make_user(1, "testuser"))
+        cache.set("second", make_user(2, "other"))
+
+        await workers[0][1].invalidate_user(1)
+
+        assert cache.get("first") is None
+        assert cache.get("second").id == 2
+
+        await workers[0][1].clear()
+
+        assert cache.get("second") is None
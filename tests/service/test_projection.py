@@ -0,0 +1,83 @@
+"""Test the compiled field trees of search results"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.restatements import AttributePathsModel
+from app.service.core.mixins import GetterMixin
+from app.service.core.projection import compile_fields
+
+
+class TestFieldTree:
+    """
+    Unit tests for FieldTree
+    """
+
+    def test_parsed_paths_are_shared_and_immutable(self):
+        """
+        GIVEN a field path parsed twice
+        WHEN the parsed path is updated
+        THEN check both parses returned the same path, which is rejected
+            from being updated
+        """
+        field_path = "emissions.{scope:2:0}.value"
+        path = AttributePathsModel.parse_field_path(field_path)
+
+        assert AttributePathsModel.parse_field_path(field_path) is path
+        assert path == AttributePathsModel.unpack_field_path(field_path)
+        with pytest.raises(ValidationError):
+            path.row_id = 1
+
+    def test_strip_fields(self):
+        """
+        GIVEN submission values, and fields on the root form and on a
+            choice row of a sub-form
+        WHEN the values are stripped with the compiled fields
+        THEN check only the requested fields are kept
+        """
+        values = {
+            "reporting_year": 2023,
+            "legal_name": "Company",
+            "emissions": [
+                {"scope": 1, "value": 10, "unit": "t"},
+                {"scope": 2, "value": 20, "unit": "t"},
+            ],
+            "targets": [{"name": "net zero"}],
+        }
+        fields = (
+            "reporting_year",
+            "emissions.{scope:2:0}.value",
+            "emissions.{scope:2:0}.unit",
+        )
+
+        tree = compile_fields(fields)
+
+        assert compile_fields(fields) is tree
+        assert GetterMixin._strip_fields(values, tree) == {
+            "reporting_year": 2023,
+            "emissions": [{"value": 20, "unit": "t", "scope": 2}],
+        }
+
+    def test_project_values(self):
+        """
+        GIVEN submission values holding null values and row identifiers
+        WHEN they are projected on no fields, and on a nested attribute
+        THEN check null values and identifiers are stripped without
+            fields, and the kept attribute is a copy
+        """
+        values = {
+            "id": 1,
+            "reporting_year": None,
+            "details": {"sector": "energy", "region": None},
+            "emissions": [{"id": 10, "scope": 1, "value": None}],
+        }
+
+        assert GetterMixin.project_values(values, compile_fields(())) == {
+            "details": {"sector": "energy"},
+            "emissions": [{"scope": 1}],
+        }
+        projected = GetterMixin.project_values(
+            values, compile_fields(("details",))
+        )
+        assert projected == {"details": {"sector": "energy", "region": None}}
+        assert projected["details"] is not values["details"]
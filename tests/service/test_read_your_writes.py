@@ -0,0 +1,66 @@
+"""Test the marking of recent writes for follower reads"""
+
+import pytest
+from fastapi import Request
+
+from app.service import read_your_writes
+from app.service.read_your_writes import mark_write, read_only_route
+
+
+class FakeCache:
+    def __init__(self):
+        self.keys = []
+
+    async def set(self, key, data, ttl):
+        self.keys.append(key)
+
+
+def make_request(method: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": method,
+            "headers": [(b"authorization", b"Bearer token")],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def followers(monkeypatch):
+    monkeypatch.setattr(read_your_writes.follower_pool, "engines", [object()])
+
+
+class TestMarkWrite:
+    """
+    Unit tests for mark_write
+    """
+
+    @pytest.mark.asyncio
+    async def test_marks_writes(self):
+        """
+        GIVEN successful and failed POST requests, and a GET request
+        WHEN their writes are marked
+        THEN check only the successful POST marks its caller
+        """
+        cache = FakeCache()
+
+        await mark_write(make_request("POST"), 200, cache)
+        await mark_write(make_request("POST"), 422, cache)
+        await mark_write(make_request("GET"), 200, cache)
+
+        assert len(cache.keys) == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_read_only_routes(self):
+        """
+        GIVEN a POST request of a route declaring `read_only_route`
+        WHEN its write is marked
+        THEN check its caller is not marked
+        """
+        cache = FakeCache()
+        request = make_request("POST")
+        await read_only_route(request)
+
+        await mark_write(request, 200, cache)
+
+        assert cache.keys == []
@@ -0,0 +1,90 @@
+"""Test the batch resolution of restatement paths"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.service.core.mixins import GetterMixin
+
+
+class StaticCacheStub:
+    """
+    Column and table definitions of a root form with a multiple sub-form.
+    """
+
+    async def column_defs_by_name(self):
+        root = SimpleNamespace(name="root_form", heritable=False)
+        emissions = SimpleNamespace(name="emissions_form", heritable=True)
+        return {
+            "reporting_year": SimpleNamespace(table_def=root),
+            "emissions": SimpleNamespace(table_def=root, attribute_type_id=2),
+            "value": SimpleNamespace(table_def=emissions),
+        }
+
+    async def table_defs(self):
+        return {2: SimpleNamespace(name="emissions_form", heritable=True)}
+
+
+@pytest.fixture
+def getter() -> GetterMixin:
+    return GetterMixin(
+        session=None, core_cache=StaticCacheStub(), redis_cache=None
+    )
+
+
+class TestResolveRestatementPaths:
+    """
+    Unit tests for GetterMixin.resolve_restatement_paths
+    """
+
+    @pytest.mark.asyncio
+    async def test_resolves_against_loaded_rows(self, getter: GetterMixin):
+        """
+        GIVEN the loaded form rows of a submission
+        WHEN restatement paths are resolved
+        THEN check each gets the ID of the indexed row with its choice,
+            without querying the database
+        """
+        form_rows = {
+            "root_form": [{"id": 1}],
+            "emissions_form_heritable": [
+                {"id": 10, "scope": 1},
+                {"id": 11, "scope": 2},
+                {"id": 12, "scope": 2},
+            ],
+        }
+
+        paths = await getter.resolve_restatement_paths(
+            submission_id=1,
+            restatement_paths=[
+                "reporting_year",
+                "emissions.{scope:2:1}.value",
+                "emissions.{::0}.value",
+            ],
+            form_rows=form_rows,
+        )
+
+        assert {path: model.row_id for path, model in paths.items()} == {
+            "reporting_year": 1,
+            "emissions.{scope:2:1}.value": 12,
+            "emissions.{::0}.value": 10,
+        }
+
+    @pytest.mark.asyncio
+    async def test_missing_row(self, getter: GetterMixin):
+        """
+        GIVEN a restatement path past the rows with its choice
+        WHEN it is resolved
+        THEN check it is rejected
+        """
+        with pytest.raises(HTTPException) as exc_info:
+            await getter.resolve_restatement_paths(
+                submission_id=1,
+                restatement_paths=["emissions.{scope:1:1}.value"],
+                form_rows={
+                    "emissions_form_heritable": [{"id": 10, "scope": 1}]
+                },
+            )
+
+        assert exc_info.value.status_code == 422
@@ -0,0 +1,96 @@
+"""Test the concurrency limits of heavy routes"""
+
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.service.route_limiter import RouteLimiter
+
+
+def limited_app(limiter: RouteLimiter, release: asyncio.Event) -> FastAPI:
+    """
+    An app with a download route held until `release` is set.
+    """
+    app = FastAPI()
+
+    @app.get("/download", dependencies=[Depends(limiter)])
+    async def download():
+        await release.wait()
+        return {"done": True}
+
+    return app
+
+
+class TestRouteLimiter:
+    """
+    Unit tests for RouteLimiter
+    """
+
+    @pytest.mark.asyncio
+    async def test_sheds_load(self):
+        """
+        GIVEN a route handling one request at once, with a queue of one
+        WHEN four requests come in at once
+        THEN check the first is handled, the second waits and is
+            rejected with 503 once its queue timeout is up, the others
+            are rejected right away with 429, all with Retry-After
+        """
+        limiter = RouteLimiter(
+            name="download",
+            max_concurrent=1,
+            max_queue=1,
+            queue_timeout=0.05,
+            retry_after=7,
+        )
+        release = asyncio.Event()
+        transport = ASGITransport(app=limited_app(limiter, release))
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            first = asyncio.create_task(client.get("/download"))
+            await asyncio.sleep(0.01)
+            queued = asyncio.create_task(client.get("/download"))
+            await asyncio.sleep(0.01)
+            rejected = await asyncio.gather(
+                client.get("/download"), client.get("/download")
+            )
+            timed_out = await queued
+            release.set()
+            handled = await first
+
+        assert handled.status_code == 200
+        assert [response.status_code for response in rejected] == [429, 429]
+        assert timed_out.status_code == 503
+        assert timed_out.headers["Retry-After"] == "7"
+        assert rejected[0].headers["Retry-After"] == "7"
+        metrics = limiter.metrics()
+        assert (metrics["admitted"], metrics["in_flight"]) == (1, 0)
+        assert metrics["rejected_queue_full"] == 2
+        assert metrics["rejected_timeout"] == 1
+
+    @pytest.mark.asyncio
+    async def test_releases_slot(self):
+        """
+        GIVEN a route handling one request at once
+        WHEN requests come in one after the other
+        THEN check each is handled once the previous one is done
+        """
+        limiter = RouteLimiter(
+            name="download",
+            max_concurrent=1,
+            max_queue=0,
+            queue_timeout=0.05,
+            retry_after=1,
+        )
+        release = asyncio.Event()
+        release.set()
+        transport = ASGITransport(app=limited_app(limiter, release))
+        async with AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            responses = [await client.get("/download") for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [200] * 3
+        assert limiter.metrics()["admitted"] == 3
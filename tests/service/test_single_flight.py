@@ -0,0 +1,100 @@
+"""Test the coalescing of concurrent computations"""
+
+import asyncio
+
+import pytest
+
+from app import settings
+from app.service.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """
+    Unit tests for SingleFlight
+    """
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_computation(self):
+        """
+        GIVEN ten concurrent callers for the same key
+        WHEN they run the same slow computation
+        THEN check it runs once, and all get its result
+        """
+        single_flight = SingleFlight(lease_ttl=30, lease_wait=1)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"items": [1, 2, 3]}
+
+        results = await asyncio.gather(
+            *(single_flight.run("companies", compute) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert single_flight.metrics()["coalesced"] == 9
+        assert single_flight.metrics()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_and_not_cached(self):
+        """
+        GIVEN concurrent callers of a computation which fails
+        WHEN the computation is run again afterwards
+        THEN check all callers got the error, and it is computed again
+        """
+        single_flight = SingleFlight(lease_ttl=30, lease_wait=1)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            if calls == 1:
+                raise ValueError("database is down")
+            return "ok"
+
+        results = await asyncio.gather(
+            *(single_flight.run("history", compute) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert await single_flight.run("history", compute) == "ok"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_releases_own_lease(self, monkeypatch):
+        """
+        GIVEN a cache entry filled under a Redis lease
+        WHEN the computation is done
+        THEN check the lease is released with the token it was taken
+            with, so that a lease taken by another worker meanwhile is
+            kept
+        """
+        monkeypatch.setattr(settings.cache, "enabled", True)
+        released = []
+
+        class FakeCache:
+            cache_control = None
+
+            async def acquire_lease(self, key, ttl):
+                return "token"
+
+            async def release_lease(self, key, token):
+                released.append((key, token))
+
+        async def compute():
+            return "value"
+
+        async def read():
+            return None
+
+        result = await SingleFlight(lease_ttl=30, lease_wait=1).fill(
+            FakeCache(), "companies", compute, read
+        )
+
+        assert result == "value"
+        assert released == [("companies", "token")]
@@ -0,0 +1,168 @@
+"""Test the deterministic values of synthetic submissions"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.column_def import AttributeType
+from app.service.synthetic_data import SyntheticValues
+
+
+def column(
+    name: str,
+    attribute_type: AttributeType,
+    constraints: dict | None = None,
+    choice_ids: list[int] | None = None,
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        attribute_type=attribute_type,
+        views=[
+            SimpleNamespace(
+                constraint_value=(
+                    [{"actions": [{"set": constraints}]}]
+                    if constraints
+                    else None
+                )
+            )
+        ],
+        choices=[
+            SimpleNamespace(choice_id=choice_id)
+            for choice_id in choice_ids or []
+        ],
+    )
+
+
+@pytest.fixture
+def synthetic_values() -> SyntheticValues:
+    columns = [
+        column("reporting_year", AttributeType.INT),
+        column("date_end_reporting_year", AttributeType.DATETIME),
+        column("legal_entity_identifier", AttributeType.TEXT),
+        column("disclosure_source", AttributeType.TEXT),
+        column(
+            "total_s1_emissions_ghg",
+            AttributeType.FLOAT,
+            {"min": 0, "max": 10000, "units": "tCO₂e"},
+        ),
+        column("s1_ch4_emissions", AttributeType.INT, {"min": 0, "max": 99}),
+        column(
+            "date_start_target",
+            AttributeType.DATETIME,
+            {"min": "2000-01-01T00:00:00", "max": "{currentDate}"},
+        ),
+        column("total_s2_lb_emissions_ghg", AttributeType.FLOAT_OR_NULL),
+        column("s1_emissions_method", AttributeType.TEXT_OR_NULL),
+        column("data_model", AttributeType.TEXT),
+        column("verified", AttributeType.BOOL),
+        column("method", AttributeType.SINGLE, choice_ids=[1, 2, 3]),
+        column("targets", AttributeType.FORM),
+        column("tgt_name", AttributeType.TEXT, {"max": 12}),
+    ]
+    return SyntheticValues(
+        columns={c.name: c for c in columns},
+        template={
+            "reporting_year": 2015,
+            "date_end_reporting_year": "2015-12-31T00:00:00",
+            "legal_entity_identifier": "LEI",
+            "disclosure_source": "source",
+            "total_s1_emissions_ghg": 1.5,
+            "s1_ch4_emissions": 1,
+            "total_s2_lb_emissions_ghg": "N/A",
+            "s1_emissions_method": "method",
+            "data_model": "NZDPU Core",
+            "date_start_target": "2015-01-01T00:00:00",
+            "verified": True,
+            "method": 1,
+            "targets": [{"tgt_name": "name"}, {"tgt_name": "name"}],
+        },
+        seed=7,
+        reference_date=datetime(2022, 12, 31),
+    )
+
+
+def generate(synthetic_values: SyntheticValues, nz_id: int, year: int):
+    return synthetic_values.generate(
+        synthetic_values.get_rng(nz_id, year), nz_id, year, "LEI1", "CDP"
+    )
+
+
+class TestSyntheticValues:
+    """
+    Unit tests for SyntheticValues
+    """
+
+    def test_deterministic(self, synthetic_values: SyntheticValues):
+        """
+        GIVEN a seeded generator of values
+        WHEN the values of a company year are generated twice, in
+            between other company years
+        THEN check they are the same, and other company years differ
+        """
+        values = generate(synthetic_values, 1000, 2020)
+        others = [
+            generate(synthetic_values, nz_id, year)
+            for nz_id in [1000, 1001]
+            for year in [2019, 2021]
+        ]
+
+        assert generate(synthetic_values, 1000, 2020) == values
+        assert all(other != values for other in others)
+
+    def test_values(self, synthetic_values: SyntheticValues):
+        """
+        GIVEN a seeded generator of values
+        WHEN the values of a company year are generated
+        THEN check the reporting period and company are set, null
+            states, nullable texts and data model are kept, and the
+            other values meet their constraints
+        """
+        values = generate(synthetic_values, 1000, 2020)
+
+        assert values["reporting_year"] == 2020
+        assert values["date_end_reporting_year"] == "2020-12-31T00:00:00"
+        assert values["legal_entity_identifier"] == "LEI1"
+        assert values["disclosure_source"] == "CDP"
+        assert values["total_s2_lb_emissions_ghg"] == "N/A"
+        assert values["s1_emissions_method"] == "method"
+        assert values["data_model"] == "NZDPU Core"
+        assert 0 <= values["s1_ch4_emissions"] <= 99
+        assert 0 <= values["total_s1_emissions_ghg"] <= 10000
+        assert (
+            "2000-01-01"
+            <= values["date_start_target"]
+            <= "2022-12-31T00:00:00"
+        )
+        assert values["method"] in [1, 2, 3]
+        assert len(values["targets"]) == 2
+        for target in values["targets"]:
+            assert target["tgt_name"] is None or len(target["tgt_name"]) <= 12
+
+    def test_restate(self, synthetic_values: SyntheticValues):
+        """
+        GIVEN the values of a submission
+        WHEN they are restated
+        THEN check only top-level numbers are restated, with the values
+            of the revision, and the submission is left unchanged
+        """
+        rng = synthetic_values.get_rng(1000, 2020)
+        values = synthetic_values.generate(rng, 1000, 2020, "LEI1", "CDP")
+        original = dict(values)
+
+        revised, restatements = synthetic_values.restate(rng, values)
+
+        assert synthetic_values.restatable == [
+            "s1_ch4_emissions",
+            "total_s1_emissions_ghg",
+            "total_s2_lb_emissions_ghg",
+        ]
+        assert restatements
+        assert values == original
+        for restatement in restatements:
+            assert restatement.path in synthetic_values.restatable
+            assert revised[restatement.path] == restatement.value
+        restated = {restatement.path for restatement in restatements}
+        assert {k: v for k, v in revised.items() if k not in restated} == {
+            k: v for k, v in values.items() if k not in restated
+        }
@@ -0,0 +1,110 @@
+"""Test the resolution of units from loaded form rows"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.service.core.units import UnitResolver, column_unit_template
+
+
+def units_column(units: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        views=[
+            SimpleNamespace(
+                constraint_value=[{"actions": [{"set": {"units": units}}]}]
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def resolver() -> UnitResolver:
+    return UnitResolver(
+        unit_templates={
+            "total_s1_emissions_ghg": "tCO₂e",
+            "tgt_int_target": "{tgt_int_units}",
+            "tgt_phys_int_target": (
+                "{tgt_phys_int_units_numerator} / {tgt_phys_int_units_denom}"
+            ),
+        },
+        choices={
+            400001: SimpleNamespace(value="tCO₂e"),
+            400002: SimpleNamespace(value="Other not listed"),
+        },
+    )
+
+
+class TestColumnUnitTemplate:
+    """
+    Unit tests for column_unit_template
+    """
+
+    def test_templates(self):
+        """
+        GIVEN columns with and without a units action
+        WHEN their unit template is extracted
+        THEN check only the units action sets one
+        """
+        assert column_unit_template(units_column("{tgt_int_units}")) == (
+            "{tgt_int_units}"
+        )
+        assert column_unit_template(SimpleNamespace(views=[])) is None
+        assert (
+            column_unit_template(
+                SimpleNamespace(
+                    views=[SimpleNamespace(constraint_value=[{"actions": []}])]
+                )
+            )
+            is None
+        )
+
+
+class TestUnitResolver:
+    """
+    Unit tests for UnitResolver.resolve
+    """
+
+    def test_fixed_unit(self, resolver: UnitResolver):
+        """
+        GIVEN an attribute with a fixed unit
+        WHEN its unit is resolved
+        THEN check it is the unit, and attributes without one have None
+        """
+        assert resolver.resolve("total_s1_emissions_ghg", {}) == "tCO₂e"
+        assert resolver.resolve("reporting_year", {}) is None
+
+    def test_single_attribute(self, resolver: UnitResolver):
+        """
+        GIVEN a unit held by an attribute of the row, or of its parent
+        WHEN the unit is resolved
+        THEN check it is the stored value, and None for null values
+        """
+        assert resolver.resolve("tgt_int_target", {"tgt_int_units": 1}) == 1
+        assert (
+            resolver.resolve("tgt_int_target", {}, {"tgt_int_units": 2}) == 2
+        )
+        assert resolver.resolve("tgt_int_target", {"tgt_int_units": "-"}) is (
+            None
+        )
+        assert resolver.resolve("tgt_int_target", {}) is None
+
+    def test_composite(self, resolver: UnitResolver):
+        """
+        GIVEN a unit template naming several attributes, one of them
+            with the "other" choice
+        WHEN the unit is resolved
+        THEN check it is rendered with the choice values, and the text
+            of the "other" choice
+        """
+        values = {
+            "tgt_phys_int_units_numerator": 400001,
+            "tgt_phys_int_units_denom": 400002,
+            "tgt_phys_int_units_denom_other": "tonne of steel",
+        }
+
+        assert (
+            resolver.resolve("tgt_phys_int_target", values)
+            == "tCO₂e / tonne of steel"
+        )
+        del values["tgt_phys_int_units_denom_other"]
+        assert resolver.resolve("tgt_phys_int_target", values) is None
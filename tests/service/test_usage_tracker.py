@@ -0,0 +1,67 @@
+"""Test the batched writes of API usage tracking"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.schemas.tracking import TrackingCreate
+from app.service import usage_tracker as usage_tracker_module
+from app.service.usage_tracker import UsageTracker
+
+
+class FakeSession:
+    """
+    Stores inserted rows, slowly, so that a flush is still writing when
+    the tracker stops.
+    """
+
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+
+    async def execute(self, _, batch):
+        await asyncio.sleep(0.01)
+        self.rows.extend(batch)
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def written_rows(monkeypatch) -> list[dict]:
+    rows = []
+
+    class FakeDBManager:
+        @asynccontextmanager
+        async def get_session(self):
+            yield FakeSession(rows)
+
+    monkeypatch.setattr(usage_tracker_module, "DBManager", FakeDBManager)
+    return rows
+
+
+class TestUsageTracker:
+    """
+    Unit tests for UsageTracker
+    """
+
+    @pytest.mark.asyncio
+    async def test_stop_during_flush(self, written_rows):
+        """
+        GIVEN a background task flushing queued usages
+        WHEN the tracker stops while the flush is writing
+        THEN check every queued usage is written
+        """
+        tracker = UsageTracker(interval=60, batch_size=2, max_queue=100)
+        tracker.start()
+        for i in range(5):
+            await tracker.record(TrackingCreate(api_endpoint=f"/{i}"))
+        # let the task take the full batches off the queue
+        await asyncio.sleep(0.005)
+
+        await tracker.stop()
+
+        assert sorted(row["api_endpoint"] for row in written_rows) == [
+            f"/{i}" for i in range(5)
+        ]
+        assert tracker.written == 5
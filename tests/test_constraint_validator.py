@@ -0,0 +1,140 @@
+"""Unit tests for constraint validators"""
+
+import re
+
+import pytest
+from fastapi import HTTPException
+
+from app.constraint_validator import (
+    CompiledConstraintValidator,
+    ConstraintValidationException,
+    ConstraintValidator,
+)
+from app.db.models import ColumnDef
+from app.schemas.column_def import AttributeType
+
+# pylint: disable = too-few-public-methods
+
+CONSTRAINTS_BY_TYPE = {
+    AttributeType.INT: [
+        {
+            "code": "range",
+            "conditions": [],
+            "actions": [{"set": {"required": True, "min": 0, "max": 10}}],
+        }
+    ],
+    AttributeType.FLOAT: [
+        {
+            "code": "range",
+            "conditions": [],
+            "actions": [{"set": {"min": 0.5}}],
+        },
+    ],
+    AttributeType.TEXT: [
+        {
+            "code": "format",
+            "conditions": [],
+            "actions": [{"set": {"format": "^[A-Z]+$", "max": 5}}],
+        }
+    ],
+    AttributeType.DATETIME: [
+        {
+            "code": "range",
+            "conditions": [],
+            "actions": [
+                {
+                    "set": {
+                        "min": "2000-01-01T00:00:00Z",
+                        "max": "{currentDate}",
+                    }
+                }
+            ],
+        }
+    ],
+}
+
+VALUES_BY_TYPE = {
+    AttributeType.INT: [0, 5, 10, -1, 11, None, "5"],
+    AttributeType.FLOAT: [0.5, 1e6, 0.1, None, "x"],
+    AttributeType.TEXT: ["ABC", "ABCDEF", "abc", "", None, 1],
+    AttributeType.DATETIME: [
+        "2020-01-01T00:00:00",
+        "1999-12-31T00:00:00Z",
+        "2999-01-01T00:00:00Z",
+        "not a date",
+    ],
+}
+
+
+def _outcome(validate, value):
+    try:
+        validate(value)
+    except ConstraintValidationException as exc:
+        return ("constraint", exc.column_name, exc.message, exc.value)
+    except HTTPException as exc:
+        return ("http", exc.status_code, exc.detail)
+    return ("valid",)
+
+
+class TestCompiledConstraintValidator:
+    """
+    Unit tests for the compiled constraint validator
+    """
+
+    @pytest.mark.parametrize("attribute_type", list(CONSTRAINTS_BY_TYPE))
+    def test_compiled_matches_interpreted(self, attribute_type):
+        """
+        GIVEN constraints on a column
+        WHEN values are validated with the compiled validator
+        THEN check the outcome is the same as the interpreted one
+        """
+        column = ColumnDef(name="field", attribute_type=attribute_type)
+        constraints = CONSTRAINTS_BY_TYPE[attribute_type]
+        compiled = CompiledConstraintValidator(constraints, column)
+
+        for value in VALUES_BY_TYPE[attribute_type]:
+            expected = _outcome(
+                lambda v: ConstraintValidator(
+                    constraints=constraints, value=v, column=column
+                ).validate(),
+                value,
+            )
+            assert _outcome(compiled.validate, value) == expected, value
+
+    def test_conditions(self):
+        """
+        GIVEN a constraint with conditions
+        WHEN values are validated with the compiled validator
+        THEN check values fulfilling no condition are rejected
+        """
+        column = ColumnDef(name="field", attribute_type=AttributeType.INT)
+        conditions = [
+            {"set": {"value": {"lt": 3}}},
+            {"set": {"value": {"eq": 10}}},
+        ]
+        compiled = CompiledConstraintValidator(
+            [{"conditions": conditions, "actions": []}], column
+        )
+
+        compiled.validate_many([1, 2, 10])
+        with pytest.raises(ConstraintValidationException) as exc_info:
+            compiled.validate_many([1, 5])
+        assert exc_info.value.value == 5
+        assert exc_info.value.condition == conditions
+
+    def test_invalid_format_falls_back(self):
+        """
+        GIVEN a text constraint with an invalid format pattern
+        WHEN the compiled validator is built
+        THEN check it is built, and the constraint fails at validation
+            time, as it does when interpreted
+        """
+        column = ColumnDef(name="field", attribute_type=AttributeType.TEXT)
+        constraints = [
+            {"conditions": [], "actions": [{"set": {"format": "^[A-Z"}}]}
+        ]
+
+        compiled = CompiledConstraintValidator(constraints, column)
+
+        with pytest.raises(re.error):
+            compiled.validate("ABC")
@@ -1,5 +1,6 @@
 """Test utility functions"""
 
+from app.service.core.utils import content_hash
 from app.utils import check_password, encrypt_password
 
 
@@ -18,3 +19,16 @@ class TestUtils:
         pwd: str = "testpassword"
         encrypted_pwd: str = encrypt_password(pwd)
         assert check_password(pwd, encrypted_pwd)
+
+    def test_content_hash_is_canonical(self):
+        """
+        GIVEN two documents differing only in key order
+        WHEN they are hashed
+        THEN check the hashes match, and differ for a changed value
+        """
+
+        document = {"id": 1, "values": {"a": 1, "b": [1, 2]}}
+        reordered = {"values": {"b": [1, 2], "a": 1}, "id": 1}
+        changed = {"id": 1, "values": {"a": 2, "b": [1, 2]}}
+        assert content_hash(document) == content_hash(reordered)
+        assert content_hash(document) != content_hash(changed)